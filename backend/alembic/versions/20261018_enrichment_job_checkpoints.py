@@ -0,0 +1,65 @@
+"""Resumable bulk enrichment: job checkpoints and per-coin results
+
+- enrichment_jobs: request_params, coin_ids, checkpointed_at
+- enrichment_job_items: per-coin result rows written at each checkpoint
+
+Revision ID: 20261018_enrich_checkpoints
+Revises: 29b93cec2c4d
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261018_enrich_checkpoints'
+down_revision = '29b93cec2c4d'
+branch_labels = None
+depends_on = None
+
+
+def column_exists(table: str, column: str) -> bool:
+    """Check if column exists (idempotent migration)."""
+    conn = op.get_bind()
+    result = conn.execute(sa.text(f"PRAGMA table_info({table})"))
+    return any(row[1] == column for row in result)
+
+
+def table_exists(table: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text("SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name=:name"),
+        {"name": table}
+    )
+    return result.scalar() > 0
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('enrichment_jobs', schema=None) as batch_op:
+        if not column_exists('enrichment_jobs', 'request_params'):
+            batch_op.add_column(sa.Column('request_params', sa.Text(), nullable=True))
+        if not column_exists('enrichment_jobs', 'coin_ids'):
+            batch_op.add_column(sa.Column('coin_ids', sa.Text(), nullable=True))
+        if not column_exists('enrichment_jobs', 'checkpointed_at'):
+            batch_op.add_column(sa.Column('checkpointed_at', sa.DateTime(), nullable=True))
+
+    if not table_exists('enrichment_job_items'):
+        op.create_table(
+            'enrichment_job_items',
+            sa.Column('job_id', sa.String(length=36), nullable=False),
+            sa.Column('coin_id', sa.Integer(), nullable=False),
+            sa.Column('status', sa.String(length=20), nullable=False),
+            sa.Column('result', sa.Text(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(['job_id'], ['enrichment_jobs.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('job_id', 'coin_id'),
+        )
+
+
+def downgrade() -> None:
+    if table_exists('enrichment_job_items'):
+        op.drop_table('enrichment_job_items')
+
+    with op.batch_alter_table('enrichment_jobs', schema=None) as batch_op:
+        for column in ('checkpointed_at', 'coin_ids', 'request_params'):
+            if column_exists('enrichment_jobs', column):
+                batch_op.drop_column(column)
@@ -0,0 +1,120 @@
+"""
+Benchmark per-lookup latency: new httpx client per call vs the shared catalog pool.
+
+Fetches the same catalog URL --requests times in each mode and reports
+mean/p50/p95 latency. Against a real catalog host (default: an OCRE JSON-LD
+type) the pooled mode saves the TCP + TLS handshake on every lookup after the
+first. --local runs against a throwaway HTTP server on 127.0.0.1 (no network;
+shows the TCP connect cost only).
+
+Run from backend directory:
+  uv run python scripts/benchmark_catalog_http.py --requests 20
+  uv run python scripts/benchmark_catalog_http.py --local --requests 500
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Ensure backend src is on path when run as script
+backend_dir = Path(__file__).resolve().parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from src.infrastructure.services.catalogs.http_pool import (  # noqa: E402
+    CatalogHTTPConfig,
+    CatalogHTTPPool,
+    catalog_http_client,
+)
+
+DEFAULT_URL = "http://numismatics.org/ocre/id/ric.2.tr.128.jsonld"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True
+    wbufsize = 64 * 1024  # Headers + body in one write
+
+    def do_GET(self):
+        body = b'{"@graph": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_local_server() -> tuple[ThreadingHTTPServer, str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/ocre/id/ric.2.tr.128.jsonld"
+
+
+async def _measure(url: str, requests: int, pool: CatalogHTTPPool | None) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    for _ in range(requests):
+        started = time.perf_counter()
+        try:
+            async with catalog_http_client(url, pool) as client:
+                response = await client.get(url)
+                response.raise_for_status()
+        except Exception:
+            errors += 1
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+    return {
+        "mean_ms": round(statistics.mean(latencies), 2),
+        "p50_ms": round(latencies[len(latencies) // 2], 2),
+        "p95_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 2),
+        "errors": errors,
+    }
+
+
+async def run(args: argparse.Namespace, url: str) -> dict:
+    per_call = await _measure(url, args.requests, None)
+    pool = CatalogHTTPPool(CatalogHTTPConfig(http2=args.http2))
+    try:
+        pooled = await _measure(url, args.requests, pool)
+    finally:
+        await pool.aclose()
+    return {
+        "url": url,
+        "requests": args.requests,
+        "client_per_call": per_call,
+        "pooled": pooled,
+        "speedup_mean": round(per_call["mean_ms"] / pooled["mean_ms"], 2) if pooled["mean_ms"] else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-call vs pooled catalog HTTP latency.")
+    parser.add_argument("--url", default=DEFAULT_URL, help="Catalog URL to fetch.")
+    parser.add_argument("--requests", type=int, default=20, help="Lookups per mode (be polite to real hosts).")
+    parser.add_argument("--local", action="store_true", help="Use a local HTTP server instead of --url.")
+    parser.add_argument("--http2", action="store_true", help="Enable HTTP/2 for the pooled mode (needs h2).")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if args.local:
+        server, url = _start_local_server()
+    try:
+        report = asyncio.run(run(args, url))
+    finally:
+        if server:
+            server.shutdown()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
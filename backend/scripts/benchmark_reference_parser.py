@@ -0,0 +1,89 @@
+"""
+Benchmark ReferenceParser throughput over a corpus of real reference strings.
+
+Compares three modes on the same inputs:
+  sequential  every SYSTEM_PARSERS entry in order (the pre-dispatch behaviour)
+  dispatch    prefix dispatch only (memo disabled)
+  memoized    prefix dispatch + LRU memo (the default parser)
+
+Each pass parses the corpus --repeat times. --min-speedup makes the script exit
+non-zero when the default (memoized) parser is not at least that much faster
+than sequential, so it can guard throughput in CI.
+
+Run from backend directory:
+  uv run python scripts/benchmark_reference_parser.py
+  uv run python scripts/benchmark_reference_parser.py --repeat 200 --min-speedup 2
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Ensure backend src is on path when run as script
+backend_dir = Path(__file__).resolve().parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from src.infrastructure.services.catalogs.parser import (  # noqa: E402
+    ParseResult,
+    ReferenceParser,
+    _looks_like_reference,
+    _parsed_ref_to_result,
+)
+from src.infrastructure.services.catalogs.parsers import SYSTEM_PARSERS  # noqa: E402
+
+DEFAULT_CORPUS = backend_dir / "tests" / "fixtures" / "reference_corpus.txt"
+
+
+def load_corpus(path: Path) -> list:
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+
+
+def parse_sequential(raw: str) -> ParseResult:
+    """Baseline: try every parser in precedence order (ReferenceParser.parse before dispatch)."""
+    text = ReferenceParser._normalize(raw)
+    for parse_fn in SYSTEM_PARSERS.values():
+        parsed = parse_fn(text)
+        if parsed is not None:
+            return _parsed_ref_to_result(parsed, raw)
+    if _looks_like_reference(text):
+        return ParseResult(raw=raw, confidence=0.2, needs_llm=True)
+    return ParseResult(raw=raw, confidence=0.0, needs_llm=False)
+
+
+def run(label: str, fn, corpus: list, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in corpus:
+            fn(text)
+    elapsed = time.perf_counter() - start
+    rate = len(corpus) * repeat / elapsed
+    print(f"  {label:<11} {elapsed * 1000:9.1f} ms  {rate:12,.0f} refs/s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark reference parser throughput.")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="One reference per line.")
+    parser.add_argument("--repeat", type=int, default=100, help="Passes over the corpus per mode.")
+    parser.add_argument("--min-speedup", type=float, default=None, help="Fail if memoized/sequential is below this.")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    print(f"{len(corpus)} references x {args.repeat} passes")
+    sequential = run("sequential", parse_sequential, corpus, args.repeat)
+    dispatch = run("dispatch", ReferenceParser(cache_size=0).parse, corpus, args.repeat)
+    memoized_parser = ReferenceParser()
+    memoized = run("memoized", memoized_parser.parse, corpus, args.repeat)
+    print(f"  speedup: dispatch {sequential / dispatch:.1f}x, memoized {sequential / memoized:.1f}x")
+    print(f"  memo: {memoized_parser.cache_info()}")
+
+    if args.min_speedup is not None and sequential / memoized < args.min_speedup:
+        print(f"FAIL: memoized speedup below {args.min_speedup}x")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
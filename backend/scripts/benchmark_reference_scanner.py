@@ -0,0 +1,100 @@
+"""
+Benchmark catalog reference extraction over multi-kilobyte lot descriptions.
+
+Builds synthetic auction descriptions (filler prose with references from the
+reference corpus mixed in) and compares:
+  sequential  finditer for every REFERENCE_PATTERNS entry (pre-scanner behaviour)
+  scanner     one ReferenceScanner pass (memo disabled)
+
+--min-speedup makes the script exit non-zero when the scanner is not at least
+that much faster than sequential, so it can guard throughput in CI.
+
+Run from backend directory:
+  uv run python scripts/benchmark_reference_scanner.py
+  uv run python scripts/benchmark_reference_scanner.py --size 16000 --min-speedup 3
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Ensure backend src is on path when run as script
+backend_dir = Path(__file__).resolve().parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from src.infrastructure.scrapers.shared.reference_patterns import (  # noqa: E402
+    REFERENCE_PATTERNS,
+    ReferenceScanner,
+)
+
+DEFAULT_CORPUS = backend_dir / "tests" / "fixtures" / "reference_corpus.txt"
+
+FILLER = (
+    "Roman Empire denarius silver obverse laureate draped and cuirassed bust right "
+    "reverse Victory standing left holding wreath and palm struck at Rome mint "
+    "Good Very Fine attractively toned minor flan flaws from the collection of "
+    "acquired from previously sold in 3.45g 19mm 6h"
+).split()
+
+
+def load_corpus(path: Path) -> list:
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+
+
+def build_descriptions(refs: list, count: int, size: int, density: float, seed: int) -> list:
+    rng = random.Random(seed)
+    descriptions = []
+    for _ in range(count):
+        words, length = [], 0
+        while length < size:
+            word = rng.choice(refs) if rng.random() < density else rng.choice(FILLER)
+            words.append(word)
+            length += len(word) + 1
+        descriptions.append(" ".join(words))
+    return descriptions
+
+
+def scan_sequential(text: str) -> list:
+    return [m for pattern, _, _ in REFERENCE_PATTERNS for m in pattern.finditer(text)]
+
+
+def run(label: str, fn, descriptions: list, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in descriptions:
+            fn(text)
+    elapsed = time.perf_counter() - start
+    mb = sum(len(t) for t in descriptions) * repeat / 1e6
+    print(f"  {label:<11} {elapsed * 1000:9.1f} ms  {mb / elapsed:8.1f} MB/s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark single-pass reference extraction.")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="One reference per line.")
+    parser.add_argument("--count", type=int, default=200, help="Descriptions to generate.")
+    parser.add_argument("--size", type=int, default=6000, help="Characters per description.")
+    parser.add_argument("--density", type=float, default=0.01, help="Fraction of words that are references.")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the descriptions per mode.")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--min-speedup", type=float, default=None, help="Fail if scanner/sequential is below this.")
+    args = parser.parse_args()
+
+    descriptions = build_descriptions(load_corpus(args.corpus), args.count, args.size, args.density, args.seed)
+    print(f"{len(descriptions)} descriptions x ~{args.size} chars x {args.repeat} passes")
+    scanner = ReferenceScanner([(pattern, catalog) for pattern, catalog, _ in REFERENCE_PATTERNS], cache_size=0)
+    sequential = run("sequential", scan_sequential, descriptions, args.repeat)
+    single = run("scanner", scanner.scan, descriptions, args.repeat)
+    print(f"  speedup: {sequential / single:.1f}x")
+
+    if args.min_speedup is not None and sequential / single < args.min_speedup:
+        print(f"FAIL: scanner speedup below {args.min_speedup}x")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
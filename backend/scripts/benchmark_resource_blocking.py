@@ -0,0 +1,95 @@
+"""
+Measure what request interception saves on real lot pages.
+
+Loads each URL twice in fresh Chromium contexts, once with the source's
+ResourcePolicy (see src/infrastructure/scrapers/resource_policy.py) and once
+without, and reports per page:
+  bytes     response bytes of every finished request (headers + body)
+  requests  finished requests
+  load      time until the page's load event
+plus the blocked request count and the bytes/time saved.
+
+Run from backend directory:
+  uv run python scripts/benchmark_resource_blocking.py --source heritage URL [URL ...]
+  uv run python scripts/benchmark_resource_blocking.py --source cng --repeat 3 URL
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Ensure backend src is on path when run as script
+backend_dir = Path(__file__).resolve().parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from playwright.async_api import async_playwright  # noqa: E402
+
+from src.infrastructure.scrapers.browser_pool import launch_browser, new_stealth_context  # noqa: E402
+from src.infrastructure.scrapers.resource_policy import (  # noqa: E402
+    ResourcePolicy,
+    install_resource_policy,
+    policy_for,
+    route_stats,
+)
+
+
+async def load(browser, url: str, source: str, policy) -> dict:
+    context = await new_stealth_context(browser)
+    if policy is not None:
+        await install_resource_policy(context, source, policy)
+    page = await context.new_page()
+    finished = []
+    page.on("requestfinished", finished.append)
+    try:
+        start = time.perf_counter()
+        await page.goto(url, wait_until="load", timeout=90000)
+        elapsed = time.perf_counter() - start
+        total = 0
+        for request in finished:
+            try:
+                sizes = await request.sizes()
+                total += sizes["responseHeadersSize"] + sizes["responseBodySize"]
+            except Exception:
+                pass  # Redirected or detached requests report no sizes
+        return {"bytes": total, "requests": len(finished), "load": elapsed}
+    finally:
+        await context.close()
+
+
+async def run(args) -> None:
+    policy = policy_for(args.source) or ResourcePolicy()
+    async with async_playwright() as playwright:
+        browser = await launch_browser(playwright, headless=True)
+        try:
+            for url in args.urls:
+                for _ in range(args.repeat):
+                    route_stats.reset()
+                    full = await load(browser, url, args.source, None)
+                    blocked = await load(browser, url, args.source, policy)
+                    aborted = route_stats.snapshot().get(args.source, {}).get("blocked_total", 0)
+                    print(url)
+                    for label, r in (("full", full), ("blocked", blocked)):
+                        print(f"  {label:<8} {r['bytes'] / 1024:9.1f} KiB  {r['requests']:4d} req  {r['load'] * 1000:8.0f} ms")
+                    saved = full["bytes"] - blocked["bytes"]
+                    pct = 100 * saved / full["bytes"] if full["bytes"] else 0.0
+                    print(
+                        f"  saved    {saved / 1024:9.1f} KiB ({pct:.0f}%)  "
+                        f"{(full['load'] - blocked['load']) * 1000:8.0f} ms  ({aborted} requests aborted)"
+                    )
+        finally:
+            await browser.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bytes and time saved by scraper request interception.")
+    parser.add_argument("urls", nargs="+", help="Lot page URLs")
+    parser.add_argument("--source", required=True, help="Scraper source whose policy to apply (heritage, cng, ...)")
+    parser.add_argument("--repeat", type=int, default=1, help="Measurements per URL")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -20,7 +20,19 @@ CREATE TABLE IF NOT EXISTS enrichment_jobs (
     error_message TEXT,
     started_at DATETIME,
     completed_at DATETIME,
-    created_at DATETIME NOT NULL DEFAULT (datetime('now'))
+    created_at DATETIME NOT NULL DEFAULT (datetime('now')),
+    request_params TEXT,
+    coin_ids TEXT,
+    checkpointed_at DATETIME
 );
 
 CREATE INDEX IF NOT EXISTS ix_enrichment_jobs_status ON enrichment_jobs(status);
+
+CREATE TABLE IF NOT EXISTS enrichment_job_items (
+    job_id VARCHAR(36) NOT NULL REFERENCES enrichment_jobs(id) ON DELETE CASCADE,
+    coin_id INTEGER NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    result TEXT NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (job_id, coin_id)
+);
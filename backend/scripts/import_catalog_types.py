@@ -0,0 +1,54 @@
+"""
+Import Nomisma bulk type dumps into the local OCRE/CRRO type mirror.
+
+Once imported, RIC and Crawford lookups resolve from the mirror and only go to
+numismatics.org on a miss. Re-running with a newer dump writes only types whose
+content changed; cached get-by-id results for those types are dropped.
+
+Run from backend directory:
+    uv run python scripts/import_catalog_types.py ric dumps/ocre.jsonld
+    uv run python scripts/import_catalog_types.py crawford dumps/crro/ --prune
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Ensure backend src is on path when run as script
+backend_dir = Path(__file__).resolve().parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from src.infrastructure.config import get_settings
+from src.infrastructure.services.catalogs.crro import CRROService
+from src.infrastructure.services.catalogs.ocre import OCREService
+from src.infrastructure.services.catalogs.registry import CatalogRegistry
+from src.infrastructure.services.catalogs.result_cache import get_catalog_result_cache
+from src.infrastructure.services.catalogs.type_import import import_type_dump
+from src.infrastructure.services.catalogs.type_store import LocalTypeStore
+
+SERVICES = {"ric": OCREService, "crawford": CRROService}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import OCRE/CRRO type dumps into the local type mirror.")
+    parser.add_argument("system", choices=sorted(SERVICES), help="Catalog system of the dump.")
+    parser.add_argument("paths", nargs="+", help="Dump files or directories (JSON-LD; RDF/XML/Turtle with rdflib).")
+    parser.add_argument("--db", default=None, help="Type store path (default: CATALOG_TYPE_STORE_PATH).")
+    parser.add_argument("--prune", action="store_true", help="Remove stored types missing from a complete dump.")
+    args = parser.parse_args()
+
+    store = LocalTypeStore(args.db or get_settings().CATALOG_TYPE_STORE_PATH)
+    service = SERVICES[args.system]()
+    stats = import_type_dump(store, service, args.paths, prune=args.prune)
+
+    cache = get_catalog_result_cache()
+    for external_id in stats.changed_ids:
+        cache.delete(CatalogRegistry._cache_key_get_by_id(args.system, external_id))
+
+    print(f"{args.system}: {stats.added} added, {stats.updated} updated, {stats.unchanged} unchanged, {stats.removed} removed")
+    print(f"  Types in store: {store.count(args.system)} ({store.db_path})")
+
+
+if __name__ == "__main__":
+    main()
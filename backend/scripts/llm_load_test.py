@@ -0,0 +1,100 @@
+"""
+LLM load / throughput test against the local stub provider.
+
+Drives BaseLLMClient.execute_prompt with the `loadtest` profile (every
+capability routed to the `local-stub` model, no network) and reports
+throughput, latency percentiles, cache hits, errors, and recorded cost.
+Cache and cost databases go to a temporary directory unless --data-dir is set.
+
+Run from backend directory:
+  uv run python scripts/llm_load_test.py --capability vocab_normalize --requests 500 --concurrency 25 --unique 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ensure backend src is on path when run as script
+backend_dir = Path(__file__).resolve().parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+
+async def run(args: argparse.Namespace, data_dir: Path) -> dict:
+    os.environ["LLM_PROFILE"] = args.profile
+
+    from src.domain.llm import LLMCapability
+    from src.infrastructure.services.llm.base_client import BaseLLMClient, CostTracker, LLMCache
+    from src.infrastructure.services.llm.model_health import percentile
+
+    client = BaseLLMClient()
+    client.cache = None if args.no_cache else LLMCache(str(data_dir / "llm_cache.sqlite"))
+    client.cost_tracker = CostTracker(str(data_dir / "llm_costs.sqlite"))
+    capability = LLMCapability(args.capability)
+
+    latencies: list[float] = []
+    errors: dict[str, int] = {}
+    cached = 0
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def one(i: int) -> None:
+        nonlocal cached
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await client.execute_prompt(capability, f"{args.input} #{i % args.unique}")
+                cached += 1 if result["cached"] else 0
+            except Exception as e:
+                errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "profile": args.profile,
+        "capability": args.capability,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(args.requests / elapsed, 1) if elapsed else None,
+        "latency_ms": {
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+        },
+        "cached": cached,
+        "errors": errors,
+        "cost_usd": round(client.cost_tracker.get_monthly_cost(), 6),
+        "model_health": client.model_health.snapshot(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test LLM paths against the local stub provider.")
+    parser.add_argument("--capability", default="vocab_normalize", help="LLMCapability value.")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--unique", type=int, default=50, help="Distinct prompts (lower = more cache hits).")
+    parser.add_argument("--input", default="Vocab type: issuer\nRaw text: \"TRAIANVS\"", help="Base user input.")
+    parser.add_argument("--profile", default="loadtest")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the response cache.")
+    parser.add_argument("--data-dir", help="Directory for cache/cost databases (default: temp dir).")
+    args = parser.parse_args()
+
+    if args.data_dir:
+        report = asyncio.run(run(args, Path(args.data_dir)))
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            report = asyncio.run(run(args, Path(tmp)))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
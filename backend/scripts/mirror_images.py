@@ -0,0 +1,75 @@
+"""
+Download remote coin and auction lot images into data/coin_images.
+
+Files are stored once per content hash (sha256/ab/<sha256>.<ext>) and
+coin_images_v2 rows are pointed at the local /images/... copies (legacy
+/images/<name> rows too, so every URL is content-versioned), and WebP
+thumb/medium/large renditions are written next to each new file. Safe to
+interrupt and rerun: mirrored URLs are skipped and rows are committed per batch.
+
+Run from backend directory:
+  uv run python scripts/mirror_images.py
+  uv run python scripts/mirror_images.py --coins-only --limit 500
+  uv run python scripts/mirror_images.py --concurrency 32 --per-host 8
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Ensure backend src is on path when run as script
+backend_dir = Path(__file__).resolve().parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from src.infrastructure.config import get_settings  # noqa: E402
+from src.infrastructure.persistence.database import SessionLocal  # noqa: E402
+from src.infrastructure.services.image_derivatives import get_image_derivatives  # noqa: E402
+from src.infrastructure.services.image_mirror import ImageMirror, backend_path, mirror_coin_images  # noqa: E402
+
+
+def _mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+async def run(args) -> None:
+    settings = get_settings()
+    mirror = ImageMirror(
+        root=backend_path(settings.IMAGE_MIRROR_DIR),
+        index_path=backend_path(settings.IMAGE_MIRROR_INDEX_PATH),
+        max_concurrency=args.concurrency or settings.IMAGE_MIRROR_CONCURRENCY,
+        per_host=args.per_host or settings.IMAGE_MIRROR_PER_HOST,
+        derivatives=get_image_derivatives(),
+    )
+    session = SessionLocal()
+    start = time.perf_counter()
+    try:
+        report = await mirror_coin_images(session, mirror, include_lots=not args.coins_only, limit=args.limit)
+    finally:
+        session.close()
+        await mirror.aclose()
+        mirror.derivatives.shutdown(wait=True)  # Finish queued renditions
+
+    print(f"{report.requested} image URLs in {time.perf_counter() - start:.1f}s: "
+          f"{report.downloaded} downloaded, {report.already_mirrored} already mirrored, {report.failed} failed")
+    print(f"{_mb(report.bytes_downloaded)} downloaded, {_mb(report.bytes_written)} written, "
+          f"{_mb(report.bytes_saved)} saved by deduplication ({report.deduplicated} duplicates)")
+    print(f"{report.rows_updated} coin_images_v2 rows now point at local copies "
+          f"({report.adopted} legacy local files moved to content-addressed URLs)")
+    for url, error in report.errors[:20]:
+        print(f"  {url}: {error}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mirror remote coin and lot images locally.")
+    parser.add_argument("--coins-only", action="store_true", help="Skip auction_data_v2 lot images.")
+    parser.add_argument("--limit", type=int, default=None, help="At most this many rows per table.")
+    parser.add_argument("--concurrency", type=int, default=None, help="Downloads in flight (default: IMAGE_MIRROR_CONCURRENCY).")
+    parser.add_argument("--per-host", type=int, default=None, help="Downloads in flight per host (default: IMAGE_MIRROR_PER_HOST).")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Re-run the current auction parsers over stored lot HTML and update auction_data_v2.
+
+Use after fixing a parser in scrapers/heritage, cng, biddr, ebay or agora: the
+newest HTML snapshot of every lot that has an auction_data_v2 row is parsed
+again in a process pool and the rows are bulk-updated. No network access.
+
+Run from backend directory:
+  uv run python scripts/reparse_snapshots.py
+  uv run python scripts/reparse_snapshots.py --source cng --since 2025-01-01 --workers 4
+  uv run python scripts/reparse_snapshots.py --dry-run
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Ensure backend src is on path when run as script
+backend_dir = Path(__file__).resolve().parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from src.infrastructure.config import get_settings  # noqa: E402
+from src.infrastructure.persistence.database import SessionLocal  # noqa: E402
+from src.infrastructure.scrapers.reparse import reparse_snapshots  # noqa: E402
+from src.infrastructure.scrapers.snapshot_store import HtmlSnapshotStore  # noqa: E402
+
+SOURCES = ["heritage", "cng", "biddr", "ebay", "agora"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-parse stored lot HTML into auction_data_v2.")
+    parser.add_argument("--source", choices=SOURCES, help="Only lots from this scraper.")
+    parser.add_argument("--since", help="Only snapshots fetched on/after this date (YYYY-MM-DD).")
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count; 0 = inline).")
+    parser.add_argument("--dir", default=None, help="Snapshot directory (default: SCRAPER_SNAPSHOT_DIR).")
+    parser.add_argument("--dry-run", action="store_true", help="Parse but do not write.")
+    args = parser.parse_args()
+
+    store = HtmlSnapshotStore(args.dir or get_settings().SCRAPER_SNAPSHOT_DIR)
+    since = datetime.strptime(args.since, "%Y-%m-%d").timestamp() if args.since else None
+
+    session = SessionLocal()
+    start = time.perf_counter()
+    try:
+        stats = reparse_snapshots(session, store, source=args.source, since=since,
+                                  workers=args.workers, dry_run=args.dry_run)
+    finally:
+        session.close()
+
+    verb = "would update" if args.dry_run else "updated"
+    print(f"{stats.snapshots} snapshots: {stats.updated} rows {verb}, {stats.failed} failed, "
+          f"{stats.without_row} without an auction_data_v2 row ({time.perf_counter() - start:.1f}s)")
+    for url, error in stats.errors:
+        print(f"  {url}: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from typing import AsyncIterator, Dict, List, Optional
+
+from src.domain.auction import AuctionLot
+from src.domain.services.scraper_orchestrator import ScraperOrchestrator
+from src.domain.services.scraper_service import IScraper, ScrapeStatus
+
+
+@dataclass
+class BatchScrapeDTO:
+    urls: List[str]
+
+
+@dataclass
+class BatchScrapeItem:
+    """Outcome of one URL in a batch, emitted as soon as it finishes."""
+    index: int  # Position of the URL in the request
+    url: str
+    scraper: Optional[str]
+    status: ScrapeStatus
+    lot: Optional[AuctionLot] = None
+    error_message: Optional[str] = None
+    elapsed_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "url": self.url,
+            "scraper": self.scraper,
+            "status": self.status.value,
+            "error_message": self.error_message,
+            "elapsed_ms": round(self.elapsed_ms, 1),
+            "lot": asdict(self.lot) if self.lot is not None else None,
+        }
+
+
+@dataclass
+class BatchScrapeSummary:
+    total: int = 0
+    by_status: Dict[str, int] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+
+    def add(self, item: BatchScrapeItem) -> None:
+        self.total += 1
+        self.by_status[item.status.value] = self.by_status.get(item.status.value, 0) + 1
+
+    def to_dict(self) -> dict:
+        return {"total": self.total, "by_status": dict(self.by_status), "elapsed_ms": round(self.elapsed_ms, 1)}
+
+
+class BatchScrapeUseCase:
+    """
+    Use Case: Scrape many auction URLs, one worker per auction house.
+
+    URLs are grouped by ScraperOrchestrator.get_scraper. Each house's URLs
+    run one after another, so the scraper's own per-source rate limiter
+    (SCRAPER_RATE_LIMITS) paces it, while different houses overlap. Results
+    are yielded in completion order, not request order.
+    """
+
+    def __init__(self, orchestrator: ScraperOrchestrator):
+        self.orchestrator = orchestrator
+
+    def group(self, urls: List[str]) -> tuple[List[tuple[IScraper, List[tuple[int, str]]]], List[tuple[int, str]]]:
+        """(scraper, [(index, url)]) per house in first-seen order, plus URLs no scraper handles."""
+        groups: Dict[int, tuple[IScraper, List[tuple[int, str]]]] = {}
+        unhandled: List[tuple[int, str]] = []
+        for index, url in enumerate(urls):
+            scraper = self.orchestrator.get_scraper(url)
+            if scraper is None:
+                unhandled.append((index, url))
+            else:
+                groups.setdefault(id(scraper), (scraper, []))[1].append((index, url))
+        return list(groups.values()), unhandled
+
+    async def stream(self, dto: BatchScrapeDTO) -> AsyncIterator[BatchScrapeItem]:
+        groups, unhandled = self.group(dto.urls)
+        for index, url in unhandled:
+            yield BatchScrapeItem(
+                index=index, url=url, scraper=None, status=ScrapeStatus.ERROR,
+                error_message=f"No scraper found for URL: {url}",
+            )
+
+        queue: asyncio.Queue = asyncio.Queue()
+        workers = [asyncio.create_task(self._run_house(scraper, items, queue)) for scraper, items in groups]
+        try:
+            for _ in range(sum(len(items) for _, items in groups)):
+                yield await queue.get()
+        finally:
+            # Client went away (or the batch finished): stop the remaining houses
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _run_house(self, scraper: IScraper, items: List[tuple[int, str]], queue: asyncio.Queue) -> None:
+        name = type(scraper).__name__
+        for index, url in items:
+            start = time.perf_counter()
+            try:
+                result = await scraper.scrape(url)
+                item = BatchScrapeItem(
+                    index=index, url=url, scraper=name, status=result.status,
+                    lot=result.data, error_message=result.error_message,
+                )
+            except Exception as e:
+                item = BatchScrapeItem(
+                    index=index, url=url, scraper=name, status=ScrapeStatus.ERROR, error_message=str(e),
+                )
+            item.elapsed_ms = (time.perf_counter() - start) * 1000
+            await queue.put(item)
+
+    async def execute(self, dto: BatchScrapeDTO) -> tuple[List[BatchScrapeItem], BatchScrapeSummary]:
+        """Run the whole batch; items in request order."""
+        start = time.perf_counter()
+        summary = BatchScrapeSummary()
+        items = []
+        async for item in self.stream(dto):
+            summary.add(item)
+            items.append(item)
+        summary.elapsed_ms = (time.perf_counter() - start) * 1000
+        return sorted(items, key=lambda i: i.index), summary
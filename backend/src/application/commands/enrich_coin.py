@@ -1,7 +1,8 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 from src.domain.repositories import ICoinRepository, IAuctionDataRepository
 from src.domain.services.scraper_orchestrator import ScraperOrchestrator
+from src.domain.services.scraper_service import ScrapeStatus
 from src.domain.auction import AuctionLot
 
 @dataclass
@@ -14,19 +15,24 @@ class EnrichCoinUseCase:
     Use Case: Scrape auction data for a coin and persist it.
     
     1. Resolve URL (from input or Coin record).
-    2. Scrape data.
-    3. Update/Create AuctionData record linked to the Coin.
+    2. Scrape data (conditionally when the lot is already stored).
+    3. Update/Create AuctionData record linked to the Coin, unless the
+       page is unchanged since the last refresh (then only make sure the
+       stored record is linked to the Coin).
+    4. Commit, then mark the page version as seen for the next refresh.
     """
     
     def __init__(
         self, 
         coin_repo: ICoinRepository,
         auction_repo: IAuctionDataRepository,
-        orchestrator: ScraperOrchestrator
+        orchestrator: ScraperOrchestrator,
+        commit: Optional[Callable[[], None]] = None,
     ):
         self.coin_repo = coin_repo
         self.auction_repo = auction_repo
         self.orchestrator = orchestrator
+        self.commit = commit
 
     async def execute(self, dto: EnrichCoinDTO) -> AuctionLot:
         # 1. Get Coin
@@ -44,11 +50,25 @@ class EnrichCoinUseCase:
             raise ValueError(f"No acquisition URL found for Coin {dto.coin_id}")
             
         # 3. Scrape
-        auction_lot = await self.orchestrator.scrape(url)
-        if not auction_lot:
-             raise RuntimeError(f"Failed to scrape {url}")
+        stored = self.auction_repo.get_by_url(url)
+        result = await self.orchestrator.scrape(url, if_changed=stored is not None)
+        if result.status == ScrapeStatus.UNCHANGED:
+            linked = self.auction_repo.get_by_coin_id(dto.coin_id)
+            if linked is None or linked.url != url:
+                self.auction_repo.upsert(stored, coin_id=dto.coin_id)
+                self._commit()
+            return stored
+        if result.status != ScrapeStatus.SUCCESS or not result.data:
+            raise RuntimeError(f"Failed to scrape {url}: {result.error_message or result.status.value}")
              
         # 4. Persist
-        self.auction_repo.upsert(auction_lot, coin_id=dto.coin_id)
+        self.auction_repo.upsert(result.data, coin_id=dto.coin_id)
+        self._commit()
+        if result.on_persisted:
+            result.on_persisted()
         
-        return auction_lot
+        return result.data
+
+    def _commit(self) -> None:
+        if self.commit:
+            self.commit()
@@ -0,0 +1,150 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.application.commands.batch_scrape import BatchScrapeUseCase
+from src.domain.repositories import IAuctionDataRepository
+from src.domain.services.scraper_orchestrator import ScraperOrchestrator
+from src.domain.services.scraper_service import IScraper, ScrapeResult, ScrapeStatus
+
+
+@dataclass
+class EnrichmentProgress:
+    total: int = 0
+    enriched: int = 0
+    failed: int = 0
+    by_source: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def done(self) -> int:
+        return self.enriched + self.failed
+
+    def add(self, source: str, ok: bool) -> None:
+        counts = self.by_source.setdefault(source, {"enriched": 0, "failed": 0})
+        counts["enriched" if ok else "failed"] += 1
+        if ok:
+            self.enriched += 1
+        else:
+            self.failed += 1
+
+    def summary(self) -> str:
+        elapsed = time.perf_counter() - self.started_at
+        rate = self.done / elapsed * 60 if elapsed else 0.0
+        sources = ", ".join(f"{name} {c['enriched']}/{c['enriched'] + c['failed']}"
+                            for name, c in sorted(self.by_source.items()))
+        return (f"{self.done}/{self.total} coins ({self.enriched} enriched, {self.failed} failed, "
+                f"{rate:.1f}/min){' - ' + sources if sources else ''}")
+
+
+class EnrichPendingCoinsUseCase:
+    """
+    Use Case: Enrich many coins from their acquisition URLs as a pipeline.
+
+    Producers are one scrape worker per auction house (each house runs its
+    URLs in order, paced by its own rate limiter) with at most `concurrency`
+    scrapes in flight across houses. A single consumer persists and commits
+    each finished lot while the houses keep fetching and parsing, so an
+    interrupted run loses only lots still in flight. The bounded queue
+    between them applies backpressure if persisting falls behind.
+    """
+
+    def __init__(
+        self,
+        auction_repo: IAuctionDataRepository,
+        orchestrator: ScraperOrchestrator,
+        commit: Callable[[], None],
+        rollback: Callable[[], None],
+        concurrency: int = 4,
+    ):
+        self.auction_repo = auction_repo
+        self.orchestrator = orchestrator
+        self.commit = commit
+        self.rollback = rollback
+        self.concurrency = max(1, concurrency)
+
+    async def execute(
+        self,
+        coins: List[Tuple[int, str]],
+        on_failed: Optional[Callable[[int, str], None]] = None,
+        on_progress: Optional[Callable[[EnrichmentProgress], None]] = None,
+        progress_every: float = 10.0,
+    ) -> EnrichmentProgress:
+        """Enrich (coin_id, url) pairs; on_progress is called every progress_every seconds."""
+        progress = EnrichmentProgress(total=len(coins))
+        groups, unhandled = BatchScrapeUseCase(self.orchestrator).group([url for _, url in coins])
+        for index, url in unhandled:
+            self._fail(progress, coins[index][0], "unknown", f"No scraper found for URL: {url}", on_failed)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        slots = asyncio.Semaphore(self.concurrency)
+        producers = [
+            asyncio.create_task(self._scrape_house(scraper, [(coins[i][0], url) for i, url in items], slots, queue))
+            for scraper, items in groups
+        ]
+        consumer = asyncio.create_task(self._persist(queue, progress, on_failed))
+        reporter = asyncio.create_task(self._report(progress, on_progress, progress_every)) if on_progress else None
+        stop = None
+        try:
+            # Watch the consumer with the producers: if it dies they would block on the full queue
+            running = {*producers, consumer}
+            while running - {consumer}:
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()  # Re-raise a failed producer or consumer
+            stop = asyncio.create_task(queue.put(None))
+            await asyncio.wait([stop, consumer], return_when=asyncio.FIRST_EXCEPTION)
+            consumer.result()
+        finally:
+            tasks = [task for task in (*producers, consumer, stop, reporter) if task is not None]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return progress
+
+    async def _scrape_house(self, scraper: IScraper, items: List[Tuple[int, str]],
+                            slots: asyncio.Semaphore, queue: asyncio.Queue) -> None:
+        source = type(scraper).__name__
+        for coin_id, url in items:
+            async with slots:
+                try:
+                    result = await scraper.scrape(url)
+                except Exception as e:
+                    result = ScrapeResult(status=ScrapeStatus.ERROR, error_message=str(e))
+            await queue.put((coin_id, source, result))
+
+    async def _persist(self, queue: asyncio.Queue, progress: EnrichmentProgress,
+                       on_failed: Optional[Callable[[int, str], None]]) -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            coin_id, source, result = item
+            if result.status != ScrapeStatus.SUCCESS or not result.data:
+                self._fail(progress, coin_id, source, result.error_message or result.status.value, on_failed)
+                continue
+            try:
+                self.auction_repo.upsert(result.data, coin_id=coin_id)
+                self.commit()
+            except Exception as e:
+                self.rollback()
+                self._fail(progress, coin_id, source, f"Persist failed: {e}", on_failed)
+                continue
+            if result.on_persisted:
+                result.on_persisted()
+            progress.add(source, ok=True)
+
+    def _fail(self, progress: EnrichmentProgress, coin_id: int, source: str, error: str,
+              on_failed: Optional[Callable[[int, str], None]]) -> None:
+        progress.add(source, ok=False)
+        progress.errors.append((coin_id, error))
+        if on_failed:
+            on_failed(coin_id, error)
+
+    async def _report(self, progress: EnrichmentProgress, on_progress: Callable[[EnrichmentProgress], None],
+                      every: float) -> None:
+        while True:
+            await asyncio.sleep(every)
+            on_progress(progress)
@@ -0,0 +1,63 @@
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+from src.domain.repositories import IAuctionDataRepository
+from src.domain.services.scraper_orchestrator import ScraperOrchestrator
+from src.domain.services.scraper_service import ScrapeStatus
+
+@dataclass
+class RefreshReport:
+    checked: int = 0
+    updated: int = 0
+    unchanged: int = 0  # Skipped: page not modified, nothing parsed or written
+    failed: int = 0
+    errors: List[Tuple[str, str]] = field(default_factory=list)
+
+class RefreshAuctionDataUseCase:
+    """
+    Use Case: Re-scrape stored auction lots and write only the ones that changed.
+
+    Every lot is fetched with if_changed, so pages answered with 304 or whose
+    normalized content hash matches the last refresh are neither parsed nor
+    written. Each changed lot is committed on its own before its page version
+    is marked as seen, so a lot that fails to parse or save is fetched in full
+    on the next refresh.
+    """
+
+    def __init__(
+        self,
+        auction_repo: IAuctionDataRepository,
+        orchestrator: ScraperOrchestrator,
+        commit: Optional[Callable[[], None]] = None,
+        rollback: Optional[Callable[[], None]] = None,
+    ):
+        self.auction_repo = auction_repo
+        self.orchestrator = orchestrator
+        self.commit = commit
+        self.rollback = rollback
+
+    async def execute(self, targets: List[Tuple[int, str]]) -> RefreshReport:
+        """Refresh (coin_id, url) pairs; coin_id may be None for unlinked lots."""
+        report = RefreshReport()
+        for coin_id, url in targets:
+            report.checked += 1
+            result = await self.orchestrator.scrape(url, if_changed=True)
+            if result.status == ScrapeStatus.UNCHANGED:
+                report.unchanged += 1
+            elif result.status == ScrapeStatus.SUCCESS and result.data:
+                try:
+                    self.auction_repo.upsert(result.data, coin_id=coin_id)
+                    if self.commit:
+                        self.commit()
+                except Exception as e:
+                    if self.rollback:
+                        self.rollback()
+                    report.failed += 1
+                    report.errors.append((url, f"Persist failed: {e}"))
+                    continue
+                if result.on_persisted:
+                    result.on_persisted()
+                report.updated += 1
+            else:
+                report.failed += 1
+                report.errors.append((url, result.error_message or result.status.value))
+        return report
@@ -17,9 +17,18 @@ from typing import Optional, List
 from src.domain.coin import WishlistItem, WishlistMatch
 from src.domain.auction import AuctionLot
 from src.domain.repositories import IWishlistItemRepository, IWishlistMatchRepository
+from src.infrastructure.scrapers.shared.reference_patterns import get_reference_scanner
 
 logger = logging.getLogger(__name__)
 
+# Leading number of a catalog number: "207" of "207a", "44/5" of "44/5b"
+_BASE_NUMBER = re.compile(r'\d+(?:/\d+)?')
+
+
+def _base_number(number: str) -> str:
+    match = _BASE_NUMBER.match(number)
+    return match.group(0) if match else number.lower()
+
 
 @dataclass(frozen=True, slots=True)
 class MatchScore:
@@ -281,6 +290,9 @@ class WishlistMatchingService:
 
         Note: AuctionLot doesn't currently have a references field.
         This method searches the lot description for catalog references.
+        References the shared scanner recognises are compared by catalog,
+        volume and number against one (memoized) scan of the description, so
+        scoring many wishlist items against a lot reads its text once.
         """
         if not item.catalog_ref:
             return Decimal("0")
@@ -302,6 +314,23 @@ class WishlistMatchingService:
         if item_ref in desc_upper.replace(" ", ""):
             return Decimal(self.WEIGHT_CATALOG_REF)
 
+        scanner = get_reference_scanner()
+        wanted = scanner.scan(item.catalog_ref)
+        if wanted:
+            wanted = wanted[0]
+            partial = False
+            for ref in scanner.scan(lot.description):
+                if ref.catalog != wanted.catalog:
+                    continue
+                same_volume = (ref.volume or "").upper() == (wanted.volume or "").upper()
+                if same_volume and ref.number.lower() == wanted.number.lower():
+                    return Decimal(self.WEIGHT_CATALOG_REF)
+                if _base_number(ref.number) == _base_number(wanted.number):
+                    partial = True
+            if partial:
+                return Decimal(self.WEIGHT_CATALOG_REF * 0.6)
+
+        # Formats the scanner does not cover (SG/SGCV, RPC supplements, RIC without volume)
         # Check for Crawford fraction notation (e.g., "44/5", "494/42a")
         crawford_match = re.search(r'(\d+)/(\d+[a-z]?)', item_ref)
         if crawford_match:
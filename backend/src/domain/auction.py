@@ -35,6 +35,7 @@ class AuctionLot:
     # Grading
     grade: Optional[str] = None
     service: Optional[str] = None
+    certification: Optional[str] = None
     
     # Description
     description: Optional[str] = None
@@ -1,4 +1,4 @@
-from typing import Protocol, Optional, List, Dict, Any, Union
+from typing import AbstractSet, Protocol, Optional, List, Dict, Any, Tuple, Union
 from datetime import date
 from src.domain.coin import (
     Coin, ProvenanceEntry, ProvenanceEventType, GradingHistoryEntry,
@@ -104,6 +104,12 @@ class IAuctionDataRepository(Protocol):
         """Get auction data by unique URL."""
         ...
 
+    def get_pending_enrichment(
+        self, limit: Optional[int] = None, exclude_coin_ids: AbstractSet[int] = frozenset()
+    ) -> List[Tuple[int, str]]:
+        """(coin_id, acquisition_url) of coins with a URL but no linked auction data."""
+        ...
+
     def get_comparables(
         self,
         issuer: Optional[str] = None,
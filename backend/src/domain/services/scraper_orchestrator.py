@@ -16,10 +16,10 @@ class ScraperOrchestrator:
                 return scraper
         return None
 
-    async def scrape(self, url: str) -> ScrapeResult:
+    async def scrape(self, url: str, if_changed: bool = False) -> ScrapeResult:
         """
         Orchestrate the scraping of a URL.
-        Returns a structured ScrapeResult.
+        Returns a structured ScrapeResult (UNCHANGED only when if_changed is set).
         """
         logger.info(f"Orchestrating scrape for: {url}")
         
@@ -31,6 +31,8 @@ class ScraperOrchestrator:
             )
         
         try:
+            if if_changed:
+                return await scraper.scrape(url, if_changed=True)
             return await scraper.scrape(url)
         except Exception as e:
             logger.exception(f"Unhandled error in scraper {type(scraper).__name__}: {e}")
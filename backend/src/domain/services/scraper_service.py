@@ -1,4 +1,4 @@
-from typing import Protocol, Optional, TypeVar, Generic
+from typing import Callable, Protocol, Optional, TypeVar, Generic
 from enum import Enum
 from dataclasses import dataclass
 from src.domain.auction import AuctionLot
@@ -10,12 +10,17 @@ class ScrapeStatus(str, Enum):
     NOT_FOUND = "not_found"
     BLOCKED = "blocked"
     ERROR = "error"
+    UNCHANGED = "unchanged"  # Refresh found the page as last seen; nothing parsed
 
 @dataclass
 class ScrapeResult(Generic[T]):
     status: ScrapeStatus
     data: Optional[T] = None
     error_message: Optional[str] = None
+    # Set on change-tracked (if_changed) fetches: call once data is stored, so
+    # the next refresh treats this page version as seen. Never called if
+    # parsing or saving fails, so that page is re-scraped.
+    on_persisted: Optional[Callable[[], None]] = None
 
 class IScraper(Protocol):
     """Interface for an auction scraper."""
@@ -24,6 +29,11 @@ class IScraper(Protocol):
         """Checks if this scraper handles the given URL."""
         ...
 
-    async def scrape(self, url: str) -> ScrapeResult[AuctionLot]:
-        """Scrapes the URL and returns a ScrapeResult."""
+    async def scrape(self, url: str, if_changed: bool = False) -> ScrapeResult[AuctionLot]:
+        """
+        Scrapes the URL and returns a ScrapeResult.
+
+        With if_changed, may return UNCHANGED (no data) when the page is the
+        same as on the last if_changed scrape.
+        """
         ...
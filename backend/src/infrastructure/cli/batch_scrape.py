@@ -0,0 +1,72 @@
+"""
+Batch lot scraping CLI.
+
+Scrapes many auction URLs with one worker per auction house (houses run in
+parallel, each at its SCRAPER_RATE_LIMITS pace) and prints one JSON line per
+URL as it finishes, then a summary on stderr.
+
+  python -m src.infrastructure.cli.batch_scrape URL [URL ...]
+  python -m src.infrastructure.cli.batch_scrape --file lots.txt > results.jsonl
+"""
+import sys
+import json
+import asyncio
+import argparse
+import logging
+from src.application.commands.batch_scrape import BatchScrapeUseCase, BatchScrapeDTO, BatchScrapeSummary
+from src.infrastructure.config import get_settings
+from src.infrastructure.scrapers.browser_pool import BrowserPool, BrowserPoolConfig, set_browser_pool
+from src.infrastructure.scrapers.static_fetch import StaticPageFetcher, set_static_fetcher
+from src.infrastructure.web.routers.scrape_v2 import get_scraper_orchestrator
+
+logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+logger = logging.getLogger("batch_scrape_cli")
+
+
+def read_urls(paths, file_path=None):
+    urls = list(paths)
+    if file_path:
+        handle = sys.stdin if file_path == "-" else open(file_path, encoding="utf-8")
+        with handle:
+            urls.extend(line.strip() for line in handle if line.strip() and not line.startswith("#"))
+    # Keep the first occurrence of each URL
+    return list(dict.fromkeys(urls))
+
+
+async def run_batch(urls):
+    settings = get_settings()
+    # Same shared resources the API installs in its lifespan
+    pool = BrowserPool(BrowserPoolConfig.from_settings(settings))
+    fetcher = StaticPageFetcher(timeout=settings.SCRAPER_TIMEOUT)
+    set_browser_pool(pool)
+    set_static_fetcher(fetcher)
+    summary = BatchScrapeSummary()
+    try:
+        use_case = BatchScrapeUseCase(get_scraper_orchestrator())
+        async for item in use_case.stream(BatchScrapeDTO(urls=urls)):
+            summary.add(item)
+            print(json.dumps(item.to_dict(), default=str), flush=True)
+            logger.info(f"[{summary.total}/{len(urls)}] {item.status.value} {item.url} ({item.elapsed_ms:.0f} ms)")
+    finally:
+        set_static_fetcher(None)
+        set_browser_pool(None)
+        await fetcher.aclose()
+        await pool.aclose()
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CoinStack batch lot scraper")
+    parser.add_argument("urls", nargs="*", help="Lot URLs")
+    parser.add_argument("--file", help="File with one URL per line ('-' for stdin)")
+    args = parser.parse_args()
+
+    urls = read_urls(args.urls, args.file)
+    if not urls:
+        parser.error("no URLs given")
+    summary = asyncio.run(run_batch(urls))
+    logger.info(f"Batch Complete. {summary.total} URLs: {summary.by_status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Whole-sale crawl CLI.
+
+Walks each sale's index pages, fetches every lot politely (robots.txt, per-host
+crawl delay) into the local lot store, and prints one JSON report per sale.
+Re-running a finished sale re-checks it and only writes new or changed lots;
+re-running an interrupted one resumes from its checkpoint. With --match, lots
+new or changed in this run are scored against active wishlist items.
+
+  python -m src.infrastructure.cli.crawl_sale https://www.agoraauctions.com/auction/123
+  python -m src.infrastructure.cli.crawl_sale SALE_URL [SALE_URL ...] --max-lots 200 --match
+"""
+import sys
+import json
+import time
+import asyncio
+import argparse
+import logging
+from src.application.services.wishlist_matching_service import WishlistMatchingService
+from src.infrastructure.config import get_settings
+from src.infrastructure.persistence.database import SessionLocal
+from src.infrastructure.repositories.wishlist_item_repository import SqlAlchemyWishlistItemRepository
+from src.infrastructure.repositories.wishlist_match_repository import SqlAlchemyWishlistMatchRepository
+from src.infrastructure.scrapers.browser_pool import BrowserPool, BrowserPoolConfig, set_browser_pool
+from src.infrastructure.scrapers.lot_store import get_lot_store
+from src.infrastructure.scrapers.sale_crawler import SaleCrawler
+from src.infrastructure.scrapers.static_fetch import StaticPageFetcher, set_static_fetcher
+from src.infrastructure.web.routers.scrape_v2 import get_scraper_orchestrator
+
+logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+logger = logging.getLogger("crawl_sale_cli")
+
+
+async def run_crawls(sale_urls, max_lots=None):
+    settings = get_settings()
+    pool = BrowserPool(BrowserPoolConfig.from_settings(settings))
+    fetcher = StaticPageFetcher(timeout=settings.SCRAPER_TIMEOUT)
+    set_browser_pool(pool)
+    set_static_fetcher(fetcher)
+    store = get_lot_store()
+    orchestrator = get_scraper_orchestrator()
+    try:
+        # Sales on different hosts crawl concurrently; the crawl scheduler
+        # serializes requests to the same host.
+        crawls = [SaleCrawler(orchestrator.get_scraper(url), store).crawl(url, max_lots) for url in sale_urls]
+        return await asyncio.gather(*crawls)
+    finally:
+        set_static_fetcher(None)
+        set_browser_pool(None)
+        await fetcher.aclose()
+        await pool.aclose()
+
+
+def match_wishlist(changed_since):
+    """Score lots new or changed since changed_since against the wishlist."""
+    lots = get_lot_store().lots(changed_since=changed_since)
+    db = SessionLocal()
+    try:
+        service = WishlistMatchingService(SqlAlchemyWishlistItemRepository(db), SqlAlchemyWishlistMatchRepository(db))
+        matches = service.find_matches(lots)
+        db.commit()
+        return len(lots), len(matches)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CoinStack whole-sale crawler")
+    parser.add_argument("sales", nargs="+", help="Sale (catalog index) URLs")
+    parser.add_argument("--max-lots", type=int, default=None, help="Lot fetches per sale in this run")
+    parser.add_argument("--match", action="store_true", help="Match new/changed lots against the wishlist")
+    args = parser.parse_args()
+
+    orchestrator = get_scraper_orchestrator()
+    for url in args.sales:
+        scraper = orchestrator.get_scraper(url)
+        if scraper is None or not getattr(scraper, "LOT_LINK_PATTERN", None):
+            parser.error(f"no crawl mode for {url}")
+
+    started = time.time()
+    reports = asyncio.run(run_crawls(args.sales, args.max_lots))
+    for report in reports:
+        print(json.dumps(report.to_dict()), flush=True)
+
+    if args.match:
+        lots, matches = match_wishlist(started)
+        logger.info(f"Wishlist: {matches} matches in {lots} new or changed lots")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,63 +1,114 @@
-import sys
+import json
 import asyncio
 import argparse
 import logging
+from pathlib import Path
 from src.infrastructure.persistence.database import SessionLocal
-from src.infrastructure.repositories.coin_repository import SqlAlchemyCoinRepository
 from src.infrastructure.repositories.auction_data_repository import SqlAlchemyAuctionDataRepository
-from src.application.commands.enrich_coin import EnrichCoinUseCase, EnrichCoinDTO
+from src.application.commands.enrich_pending import EnrichPendingCoinsUseCase
+from src.application.commands.refresh_auction_data import RefreshAuctionDataUseCase
 from src.infrastructure.web.routers.scrape_v2 import get_scraper_orchestrator
-from src.infrastructure.persistence.orm import AuctionDataModel, CoinModel
+from src.infrastructure.persistence.orm import AuctionDataModel
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("enrichment_cli")
 
-async def run_batch(batch_size=50):
+DEFAULT_CHECKPOINT = "data/enrichment_checkpoint.json"
+
+
+def load_checkpoint(path):
+    """Coin ids that failed in the run being resumed."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return set(json.load(f).get("failed", []))
+    except (OSError, ValueError):
+        return set()
+
+
+def save_checkpoint(path, failed):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"failed": sorted(failed)}, f)
+
+
+async def run_batch(batch_size=50, concurrency=4, resume=False, progress_every=10.0,
+                    checkpoint_path=DEFAULT_CHECKPOINT):
     db = SessionLocal()
     try:
-        # Find coins that need enrichment
-        coins_with_url = db.query(CoinModel).filter(CoinModel.acquisition_url.isnot(None)).all()
-        
-        pending_coins = []
-        for coin in coins_with_url:
-            exists = db.query(AuctionDataModel).filter(AuctionDataModel.coin_id == coin.id).first()
-            if not exists:
-                pending_coins.append(coin)
-                
-        logger.info(f"Found {len(pending_coins)} coins pending enrichment.")
+        # With --resume, skip coins that already failed in the interrupted run;
+        # otherwise start over and retry them.
+        failed = load_checkpoint(checkpoint_path) if resume else set()
+        auction_repo = SqlAlchemyAuctionDataRepository(db)
+        pending = auction_repo.get_pending_enrichment(limit=batch_size or None, exclude_coin_ids=failed)
+        logger.info(f"Processing batch of {len(pending)} coins pending enrichment "
+                    f"(concurrency {concurrency}{', resuming' if resume else ''})...")
+        save_checkpoint(checkpoint_path, failed)
+
+        def on_failed(coin_id, error):
+            logger.error(f"  Coin {coin_id} failed: {error}")
+            failed.add(coin_id)
+            save_checkpoint(checkpoint_path, failed)
+
+        use_case = EnrichPendingCoinsUseCase(
+            auction_repo, get_scraper_orchestrator(), commit=db.commit, rollback=db.rollback,
+            concurrency=concurrency,
+        )
+        progress = await use_case.execute(
+            pending,
+            on_failed=on_failed,
+            on_progress=lambda p: logger.info(f"Progress: {p.summary()}"),
+            progress_every=progress_every,
+        )
+        logger.info(f"Batch Complete. {progress.summary()}")
         
-        to_process = pending_coins[:batch_size]
-        logger.info(f"Processing batch of {len(to_process)}...")
+    finally:
+        db.close()
+
+async def run_refresh(batch_size=50):
+    """Re-scrape stored auction lots, writing only pages that changed."""
+    db = SessionLocal()
+    try:
+        targets = (
+            db.query(AuctionDataModel.coin_id, AuctionDataModel.url)
+            .filter(AuctionDataModel.url.isnot(None))
+            .order_by(AuctionDataModel.scraped_at)
+            .limit(batch_size)
+            .all()
+        )
+        logger.info(f"Refreshing {len(targets)} stored auction lots...")
         
-        orchestrator = get_scraper_orchestrator()
-        coin_repo = SqlAlchemyCoinRepository(db)
         auction_repo = SqlAlchemyAuctionDataRepository(db)
-        use_case = EnrichCoinUseCase(coin_repo, auction_repo, orchestrator)
-        
-        success = 0
-        failed = 0
+        use_case = RefreshAuctionDataUseCase(
+            auction_repo, get_scraper_orchestrator(), commit=db.commit, rollback=db.rollback
+        )
+        report = await use_case.execute([(coin_id, url) for coin_id, url in targets])
         
-        for coin in to_process:
-            try:
-                logger.info(f"Enriching Coin {coin.id} ({coin.acquisition_url})...")
-                await use_case.execute(EnrichCoinDTO(coin_id=coin.id))
-                success += 1
-                logger.info("  Success")
-            except Exception as e:
-                logger.error(f"  Failed: {e}")
-                failed += 1
-                
-        logger.info(f"Batch Complete. Success: {success}, Failed: {failed}")
+        for url, error in report.errors:
+            logger.error(f"  {url}: {error}")
+        logger.info(
+            f"Refresh Complete. Checked: {report.checked}, Updated: {report.updated}, "
+            f"Unchanged (skipped): {report.unchanged}, Failed: {report.failed}"
+        )
         
     finally:
         db.close()
 
 def main():
     parser = argparse.ArgumentParser(description="CoinStack Enrichment CLI")
-    parser.add_argument("--batch-size", type=int, default=10, help="Batch size")
+    parser.add_argument("--batch-size", type=int, default=10, help="Batch size (0 = every pending coin)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Lot scrapes in flight across auction houses")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted run, skipping coins that already failed in it")
+    parser.add_argument("--progress-every", type=float, default=10.0, help="Seconds between progress summaries")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="Failed-coin checkpoint file")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Re-check already stored lots, skipping unchanged pages")
     args = parser.parse_args()
     
-    asyncio.run(run_batch(args.batch_size))
+    if args.refresh:
+        asyncio.run(run_refresh(args.batch_size))
+    else:
+        asyncio.run(run_batch(args.batch_size, args.concurrency, args.resume, args.progress_every, args.checkpoint))
 
 if __name__ == "__main__":
     main()
@@ -28,6 +28,8 @@ class Settings(BaseSettings):
     ANTHROPIC_API_KEY: str = ""
     LLM_MODEL: str = "claude-sonnet-4-20250514"
     LLM_RATE_LIMIT_PER_MINUTE: int = 10
+    # Fixture directory for provider: stub models (<capability>.json); None = synthetic responses only
+    LLM_STUB_FIXTURES_DIR: str | None = None
     
     # Scraper settings
     SCRAPER_TIMEOUT: float = 30.0  # HTTP request timeout in seconds
@@ -45,10 +47,67 @@ class Settings(BaseSettings):
         "default": 2.0    # Fallback for unknown sources
     }
 
+    # Shared Playwright browser for the API (one browser, a warm context per source)
+    SCRAPER_BROWSER_POOL_ENABLED: bool = True
+    SCRAPER_BROWSER_HEADLESS: bool = True
+    SCRAPER_BROWSER_MAX_PAGES: int = 4  # Concurrent pages across all sources
+    SCRAPER_BROWSER_CONTEXT_MAX_USES: int = 50  # Pages per context before it is replaced
+    SCRAPER_BROWSER_IDLE_PAGES: int = 2  # Open pages kept per context for reuse
+    # Plain GET before Chromium for scrapers with STATIC_MARKERS (CNG, Biddr, Agora)
+    SCRAPER_HTTP_FIRST_ENABLED: bool = True
+    # Raw HTML of every fetched lot page, for offline re-parsing (scripts/reparse_snapshots.py)
+    SCRAPER_SNAPSHOTS_ENABLED: bool = True
+    SCRAPER_SNAPSHOT_DIR: str = "data/html_snapshots"
+    # ETag / Last-Modified / content hash per lot URL for change-detecting refreshes
+    SCRAPER_PAGE_VALIDATORS_PATH: str = "data/page_validators.sqlite"
+    # Whole-sale crawls (src/infrastructure/cli/crawl_sale.py): lots + checkpoints, robots.txt user agent
+    SCRAPER_LOT_STORE_PATH: str = "data/lot_store.sqlite"
+    SCRAPER_CRAWL_USER_AGENT: str = "CoinStack/1.0 (Numismatic collection manager; sale crawl)"
+    # Request interception on scraper browser contexts (see scrapers/resource_policy.py)
+    SCRAPER_BLOCK_RESOURCES_ENABLED: bool = True
+    SCRAPER_BLOCKED_RESOURCE_TYPES: list[str] = ["image", "font", "media"]
+    # Hosts each source may load from; anything else is aborted as third-party.
+    # Sources not listed only lose blocked types and ad/analytics hosts.
+    SCRAPER_RESOURCE_ALLOWED_DOMAINS: dict[str, list[str]] = {
+        "heritage": ["ha.com"],
+        "cng": ["cngcoins.com", "auctionmobility.com"],
+        "biddr": ["biddr.com"],
+        "agora": ["agoraauctions.com"],
+    }
+
     # Catalog scrapers (no-API catalogs like RPC Online)
     CATALOG_SCRAPER_RPC_ENABLED: bool = False  # Set True to fetch type data from RPC HTML
     CATALOG_SCRAPER_RPC_RATE_LIMIT_SEC: float = 10.0  # Seconds between RPC requests
     CATALOG_SCRAPER_USER_AGENT: str = "CoinStack/1.0 (Numismatic collection manager; catalog lookup)"
+    CATALOG_ROBOTS_CACHE_PATH: str = "data/robots_cache.sqlite"  # robots.txt per host, kept across restarts
+
+    # Shared catalog HTTP pool (one keep-alive client per catalog host)
+    CATALOG_HTTP_MAX_CONNECTIONS: int = 10  # Per host
+    CATALOG_HTTP_MAX_KEEPALIVE: int = 5  # Idle connections kept open per host
+    CATALOG_HTTP_KEEPALIVE_EXPIRY_SEC: float = 30.0
+    CATALOG_HTTP_TIMEOUT_SEC: float = 30.0
+    CATALOG_HTTP2_ENABLED: bool = False  # Requires the h2 package
+
+    # Persistent catalog lookup cache (matches use each service's CACHE_TTL_DAYS)
+    CATALOG_CACHE_PATH: str = "data/catalog_cache.sqlite"
+    CATALOG_CACHE_MAX_ENTRIES: int = 20000  # LRU-evicted beyond this
+    CATALOG_CACHE_NEGATIVE_TTL_HOURS: float = 24.0  # not_found / deferred results
+    CATALOG_CACHE_STALE_GRACE_DAYS: float = 30.0  # Serve expired entries while refreshing
+    # Local OCRE/CRRO type mirror (scripts/import_catalog_types.py); unused until imported
+    CATALOG_TYPE_STORE_PATH: str = "data/catalog_types.sqlite"
+
+    # NGC certificate lookups, kept across restarts (NGC data rarely changes)
+    NGC_CACHE_PATH: str = "data/ngc_cache.sqlite"
+    NGC_CACHE_TTL_DAYS: float = 30.0
+
+    # Local image mirror (scripts/mirror_images.py): content-addressed files under /images
+    IMAGE_MIRROR_DIR: str = "data/coin_images"  # Relative to backend/, like the /images mount
+    IMAGE_MIRROR_INDEX_PATH: str = "data/image_mirror.sqlite"  # Relative to backend/
+    IMAGE_MIRROR_CONCURRENCY: int = 16  # Downloads in flight across all hosts
+    IMAGE_MIRROR_PER_HOST: int = 4  # Downloads in flight per host
+    # WebP thumb/medium/large renditions next to each local image (services/image_derivatives.py)
+    IMAGE_DERIVATIVE_WORKERS: int = 2  # Threads encoding renditions in the background
+    IMAGE_DERIVATIVE_QUALITY: int = 80  # WebP quality 0-100
     
     # Logging
     LOG_LEVEL: str = "INFO"
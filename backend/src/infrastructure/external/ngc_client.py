@@ -1,14 +1,21 @@
 """NGC Ancients certificate lookup client with caching and rate limiting."""
 import re
+import time
 import asyncio
 import logging
-from typing import Optional
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Optional
 from datetime import datetime, timedelta
 from decimal import Decimal
 from bs4 import BeautifulSoup
 from pydantic import BaseModel
 from playwright.async_api import async_playwright, Browser, BrowserContext, TimeoutError as PlaywrightTimeoutError
 
+from src.infrastructure.config import get_settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,6 +77,16 @@ class NGCCertificateData(BaseModel):
     verification_url: str = ""
 
 
+@dataclass
+class NGCLookupItem:
+    """Outcome of one certificate in a bulk lookup."""
+    cert_number: str  # As requested (first spelling if duplicated)
+    indexes: list[int] = field(default_factory=list)  # Positions of this certificate in the request
+    data: Optional[NGCCertificateData] = None
+    error: Optional[NGCError] = None
+    cached: bool = False
+
+
 # ============================================================================
 # RATE LIMITER
 # ============================================================================
@@ -148,6 +165,61 @@ class SimpleCache:
             del self._cache[key]
 
 
+class SQLiteCache:
+    """
+    SimpleCache with the same interface, persisted to SQLite so certificate
+    lookups survive restarts.
+    """
+
+    def __init__(self, db_path: str = "data/ngc_cache.sqlite", clock=time.time):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._local = threading.local()
+        conn = self._get_conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.commit()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if not hasattr(self._local, "conn"):
+            self._local.conn = sqlite3.connect(str(self.db_path))
+        return self._local.conn
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get value from cache if not expired."""
+        row = self._get_conn().execute(
+            "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, self._clock())
+        ).fetchone()
+        if row:
+            logger.debug(f"Cache hit for {key}")
+            return row[0]
+        return None
+
+    async def set(self, key: str, value: str, ttl: int):
+        """Set value in cache with TTL in seconds."""
+        conn = self._get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, self._clock() + ttl),
+        )
+        conn.commit()
+        logger.debug(f"Cached {key} for {ttl}s")
+
+    def clear(self):
+        """Clear all cached entries."""
+        conn = self._get_conn()
+        conn.execute("DELETE FROM cache")
+        conn.commit()
+
+    def cleanup_expired(self):
+        """Remove expired entries."""
+        conn = self._get_conn()
+        conn.execute("DELETE FROM cache WHERE expires_at <= ?", (self._clock(),))
+        conn.commit()
+
+
 # ============================================================================
 # NGC CLIENT
 # ============================================================================
@@ -158,7 +230,8 @@ class NGCClient:
     
     Features:
     - Rate limiting (5 requests/minute by default)
-    - 30-day caching of successful lookups
+    - 30-day caching of successful lookups (persistent with SQLiteCache)
+    - Bulk lookup over one warm browser context
     - Certificate format validation
     - Robust error handling with specific exception types
     - Image extraction (PhotoVision)
@@ -194,21 +267,25 @@ class NGCClient:
         cache: Optional[SimpleCache] = None,
         rate_limit: int = RATE_LIMIT,
         timeout: float = TIMEOUT,
+        cache_ttl: int = CACHE_TTL,
     ):
         """
         Initialize NGC client.
         
         Args:
-            cache: Cache instance (uses global cache if None)
+            cache: Cache instance (SimpleCache or SQLiteCache; in-memory if None)
             rate_limit: Max requests per minute
             timeout: Request timeout in seconds
+            cache_ttl: Seconds a successful lookup stays cached
         """
         self.cache = cache or SimpleCache()
         self.rate_limiter = AsyncRateLimiter(rate_limit, self.RATE_PERIOD)
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
         self._playwright = None
+        self._session_warm = False  # ngccoin.com visited in the current context
     
     async def _ensure_browser(self) -> bool:
         """Ensure browser is started."""
@@ -263,6 +340,7 @@ class NGCClient:
                             originalQuery(parameters)
                     );
                 """)
+                self._session_warm = False
                 return True
             except Exception as e:
                 logger.error(f"Failed to start browser: {e}")
@@ -280,6 +358,72 @@ class NGCClient:
         if self._playwright:
             await self._playwright.stop()
             self._playwright = None
+        self._session_warm = False
+
+    @staticmethod
+    def clean_cert_number(cert_number: str) -> str:
+        """
+        Digits-only form of a cert number (the cache key).
+        
+        Raises:
+            InvalidCertificateError: Not 7-10 digits (with optional dash)
+        """
+        cert_number = cert_number.strip()
+        cert_clean = cert_number.replace('-', '')
+        if not re.match(r'^\d{7,10}$', cert_clean):
+            raise InvalidCertificateError(
+                f"Invalid NGC cert format: {cert_number}. Must be 7-10 digits (with optional dash)."
+            )
+        return cert_clean
+
+    async def get_cached(self, cert_number: str) -> Optional[NGCCertificateData]:
+        """Cached lookup for cert_number, without touching NGC."""
+        cached = await self.cache.get(f"ngc:{self.clean_cert_number(cert_number)}")
+        return NGCCertificateData.model_validate_json(cached) if cached else None
+
+    async def lookup_many(self, cert_numbers: Iterable[str]) -> AsyncIterator[NGCLookupItem]:
+        """
+        Look up many certificates, yielding each result as it is ready.
+        
+        Duplicates (same digits, with or without dash) are looked up once and
+        reported with every index they appear at. Cached certificates come
+        first; the rest are fetched one by one through the rate limiter in the
+        same warm browser context. Errors are returned per item, except
+        NGCRateLimitError, which stops the batch: every remaining certificate
+        is reported with it.
+        """
+        pending: dict[str, NGCLookupItem] = {}
+        for index, cert_number in enumerate(cert_numbers):
+            try:
+                key = self.clean_cert_number(cert_number)
+            except InvalidCertificateError as e:
+                yield NGCLookupItem(cert_number=cert_number, indexes=[index], error=e)
+                continue
+            if key in pending:
+                pending[key].indexes.append(index)
+            else:
+                pending[key] = NGCLookupItem(cert_number=cert_number.strip(), indexes=[index])
+
+        to_fetch = []
+        for item in pending.values():
+            item.data = await self.get_cached(item.cert_number)
+            if item.data is not None:
+                item.cached = True
+                yield item
+            else:
+                to_fetch.append(item)
+
+        for position, item in enumerate(to_fetch):
+            try:
+                item.data = await self.lookup_certificate(item.cert_number)
+            except NGCRateLimitError as e:
+                for rest in to_fetch[position:]:
+                    rest.error = e
+                    yield rest
+                return
+            except NGCError as e:
+                item.error = e
+            yield item
     
     async def lookup_certificate(self, cert_number: str) -> NGCCertificateData:
         """
@@ -301,11 +445,7 @@ class NGCClient:
         cert_number = cert_number.strip()
         # Keep dashes in URL - NGC uses format like "2167888-014"
         # Remove dashes only for validation
-        cert_clean = cert_number.replace('-', '')
-        if not re.match(r'^\d{7,10}$', cert_clean):
-            raise InvalidCertificateError(
-                f"Invalid NGC cert format: {cert_number}. Must be 7-10 digits (with optional dash)."
-            )
+        cert_clean = self.clean_cert_number(cert_number)
         # Keep original format with dash for URL (NGC expects it)
         cert_number_for_url = cert_number  # Keep dashes
         
@@ -330,18 +470,21 @@ class NGCClient:
             self.BASE_URL_ALT.format(cert=cert_number_for_url),
         ]
         
-        # First, visit main NGC site to establish session (helps bypass some protections)
-        try:
-            page = await self._context.new_page()
+        # First, visit main NGC site to establish session (helps bypass some protections).
+        # Once per browser context: later lookups reuse its cookies.
+        if not self._session_warm:
             try:
-                await page.goto("https://www.ngccoin.com", wait_until='domcontentloaded', timeout=10000)
-                await asyncio.sleep(1)  # Brief pause
+                page = await self._context.new_page()
+                try:
+                    await page.goto("https://www.ngccoin.com", wait_until='domcontentloaded', timeout=10000)
+                    await asyncio.sleep(1)  # Brief pause
+                    self._session_warm = True
+                except Exception:
+                    pass  # Continue even if main site visit fails
+                finally:
+                    await page.close()
             except Exception:
-                pass  # Continue even if main site visit fails
-            finally:
-                await page.close()
-        except Exception:
-            pass  # Continue with certificate lookup
+                pass  # Continue with certificate lookup
         
         html_content = None
         for url in urls_to_try:
@@ -448,8 +591,8 @@ class NGCClient:
         data = self._parse_certificate_page(html_content, cert_clean)
         
         # 7. Cache successful lookup
-        await self.cache.set(cache_key, data.model_dump_json(), self.CACHE_TTL)
-        logger.info(f"NGC lookup successful for cert {cert_number}, cached for 30 days")
+        await self.cache.set(cache_key, data.model_dump_json(), self.cache_ttl)
+        logger.info(f"NGC lookup successful for cert {cert_number}, cached for {self.cache_ttl // 86400} days")
         
         return data
     
@@ -598,18 +741,19 @@ class NGCClient:
 # DEPENDENCY INJECTION
 # ============================================================================
 
-# Global cache instance
-_ngc_cache = SimpleCache()
-
-# Global client instance (reuses rate limiter and cache)
+# Global client instance (reuses rate limiter, cache and browser)
 _ngc_client: Optional[NGCClient] = None
 
 
 def get_ngc_client() -> NGCClient:
-    """Get NGC client instance (singleton for rate limiting)."""
+    """Get NGC client instance (singleton for rate limiting), cached at NGC_CACHE_PATH."""
     global _ngc_client
     if _ngc_client is None:
-        _ngc_client = NGCClient(cache=_ngc_cache)
+        settings = get_settings()
+        _ngc_client = NGCClient(
+            cache=SQLiteCache(settings.NGC_CACHE_PATH),
+            cache_ttl=int(settings.NGC_CACHE_TTL_DAYS * 86400),
+        )
     return _ngc_client
 
 
@@ -607,6 +607,26 @@ class EnrichmentJobModel(Base):
     started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    # Resume support: request and resolved coin list are stored when the job starts
+    request_params: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON BulkEnrichRequest
+    coin_ids: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON list, in processing order
+    checkpointed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class EnrichmentJobItemModel(Base):
+    """
+    Per-coin result of a bulk enrichment job, written at each checkpoint.
+    Coins with a row here are skipped when an interrupted job resumes.
+    """
+    __tablename__ = "enrichment_job_items"
+
+    job_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("enrichment_jobs.id", ondelete="CASCADE"), primary_key=True
+    )
+    coin_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    status: Mapped[str] = mapped_column(String(20))  # success, unchanged, no_fills, not_found, no_reference, error, ...
+    result: Mapped[str] = mapped_column(Text)  # JSON result entry (as in result_summary)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
 
 
 # =============================================================================
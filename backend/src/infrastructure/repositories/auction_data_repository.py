@@ -1,10 +1,10 @@
 from sqlalchemy.orm import Session
-from datetime import datetime
-from typing import Optional, List
+from datetime import date, datetime
+from typing import AbstractSet, Optional, List, Tuple
 import json
 from decimal import Decimal
 from src.domain.auction import AuctionLot
-from src.infrastructure.persistence.orm import AuctionDataModel
+from src.infrastructure.persistence.orm import AuctionDataModel, CoinModel
 
 
 class SqlAlchemyAuctionDataRepository:
@@ -49,6 +49,46 @@ class SqlAlchemyAuctionDataRepository:
             self.session.flush()
             return new_record.id
 
+    def bulk_update(self, updates: List[Tuple[int, AuctionLot, date]]) -> int:
+        """
+        Update existing rows by id from re-parsed lots: (id, lot, scraped_at).
+
+        Like upsert's UPDATE, only non-None lot fields overwrite the row;
+        url and coin_id are left alone. Does not commit.
+        """
+        mappings = []
+        for row_id, lot, scraped_at in updates:
+            data_dict = self._map_to_model_dict(lot)
+            data_dict.pop('url')
+            mapping = {key: value for key, value in data_dict.items() if value is not None}
+            mapping['id'] = row_id
+            mapping['scraped_at'] = scraped_at
+            mappings.append(mapping)
+        if mappings:
+            self.session.bulk_update_mappings(AuctionDataModel, mappings)
+        return len(mappings)
+
+    def get_pending_enrichment(
+        self, limit: Optional[int] = None, exclude_coin_ids: AbstractSet[int] = frozenset()
+    ) -> List[Tuple[int, str]]:
+        """
+        (coin_id, acquisition_url) of coins with a URL but no linked auction
+        data, oldest coin first. One anti-join query; excluded ids (e.g. coins
+        that already failed in a resumed run) are skipped after the query to
+        stay clear of SQLite's bound-parameter limit.
+        """
+        query = (
+            self.session.query(CoinModel.id, CoinModel.acquisition_url)
+            .outerjoin(AuctionDataModel, AuctionDataModel.coin_id == CoinModel.id)
+            .filter(CoinModel.acquisition_url.isnot(None), CoinModel.acquisition_url != "")
+            .filter(AuctionDataModel.id.is_(None))
+            .order_by(CoinModel.id)
+        )
+        if limit and not exclude_coin_ids:
+            query = query.limit(limit)
+        pending = [(coin_id, url) for coin_id, url in query if coin_id not in exclude_coin_ids]
+        return pending[:limit] if limit else pending
+
     def get_by_coin_id(self, coin_id: int) -> Optional[AuctionLot]:
         """Get auction data linked to a coin."""
         model = self.session.query(AuctionDataModel).filter(
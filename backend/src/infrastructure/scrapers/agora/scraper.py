@@ -23,6 +23,10 @@ class AgoraScraper(PlaywrightScraperBase, IScraper):
     """
 
     BASE_URL = "https://agoraauctions.com"
+    # Title ("Lot N. ...") in an h1, description in an h3
+    STATIC_MARKERS = (r'<h1[^>]*>\s*Lot\s*\d+', r'<h3')
+    LOT_LINK_PATTERN = r'/listing/viewdetail/\d+'
+    INDEX_PAGE_PARAM = "page"
 
     def __init__(self, headless: bool = True):
         super().__init__(headless=headless, source="agora")
@@ -31,17 +35,19 @@ class AgoraScraper(PlaywrightScraperBase, IScraper):
     def can_handle(self, url: str) -> bool:
         return "agoraauctions.com" in url or "agora-auctions" in url
     
-    async def scrape(self, url: str) -> ScrapeResult:
+    async def scrape(self, url: str, if_changed: bool = False) -> ScrapeResult:
         """Scrape an Agora lot URL with automatic rate limiting and retry."""
         try:
             logger.info(f"Fetching Agora URL: {url}")
             
-            # Use fetch_page (no special wait logic needed usually for Agora, but wait_until=domcontentloaded is default)
-            html = await self.fetch_page(url)
+            # Use fetch_lot_page (no special wait logic needed usually for Agora, but wait_until=domcontentloaded is default)
+            page = await self.fetch_lot_page(url, if_changed=if_changed)
+            if page is None:
+                return ScrapeResult(status=ScrapeStatus.UNCHANGED)
             
-            data = self.parser.parse(html, url)
+            data = self.parser.parse(page.html, url)
             lot = self._map_to_domain(data)
-            return ScrapeResult(status=ScrapeStatus.SUCCESS, data=lot)
+            return ScrapeResult(status=ScrapeStatus.SUCCESS, data=lot, on_persisted=page.on_persisted)
             
         except Exception as e:
             logger.exception(f"Error scraping Agora URL {url}: {e}")
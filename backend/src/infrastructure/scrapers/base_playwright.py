@@ -1,27 +1,39 @@
 import asyncio
 import logging
+import re
 import time
 import random
 from abc import ABC
+from dataclasses import dataclass
 from typing import Optional, Callable, TypeVar, Dict, List
+from contextlib import asynccontextmanager
 from functools import wraps
-from playwright.async_api import async_playwright, Browser, BrowserContext, TimeoutError as PlaywrightTimeoutError
+from urllib.parse import parse_qsl, urldefrag, urlencode, urljoin, urlsplit, urlunsplit
+import httpx
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
 from src.infrastructure.config import get_settings
+from src.infrastructure.scrapers.browser_pool import (
+    USER_AGENTS,  # noqa: F401  (re-exported for existing imports)
+    get_browser_pool,
+    launch_browser,
+    new_stealth_context,
+)
+from src.infrastructure.scrapers.change_detection import get_change_tracker
+from src.infrastructure.scrapers.resource_policy import install_resource_policy
+from src.infrastructure.scrapers.snapshot_store import get_snapshot_store
+from src.infrastructure.scrapers.static_fetch import (
+    BROWSER_HEADERS,
+    fetch_stats,
+    get_static_fetcher,
+    has_markers,
+    static_http_client,
+)
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 T = TypeVar('T')
 
-# Common User Agents for rotation
-USER_AGENTS = [
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
-    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36 Edg/119.0.0.0"
-]
-
 def retry_with_exponential_backoff(
     max_retries: int = 3,
     base_delay: float = 1.0,
@@ -62,6 +74,16 @@ def retry_with_exponential_backoff(
         return wrapper
     return decorator
 
+@dataclass
+class FetchedPage:
+    """A fetched lot page; call on_persisted (if set) once its lot is stored."""
+    html: str
+    on_persisted: Optional[Callable[[], None]] = None
+
+
+_HREF = re.compile(r'href\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+_REL_NEXT = re.compile(r'<(?:a|link)\b[^>]*\brel\s*=\s*["\']?next\b[^>]*>', re.IGNORECASE)
+
 class PlaywrightScraperBase(ABC):
     """
     Base class for Playwright-based scrapers with rate limiting and anti-bot measures.
@@ -75,6 +97,17 @@ class PlaywrightScraperBase(ABC):
     # Class-level tracking of last request time per source
     _last_request_times: Dict[str, float] = {}
 
+    # Regexes a server-rendered lot page must contain for the parser to work.
+    # When set, fetch_page tries a plain HTTP GET first and only launches the
+    # browser if the response lacks one of them.
+    STATIC_MARKERS: tuple = ()
+
+    # Crawl mode (scrapers/sale_crawler.py): lot links on a sale's index pages,
+    # and the query parameter stepped to page through an index that has no
+    # rel="next" link. Sources without LOT_LINK_PATTERN cannot be crawled.
+    LOT_LINK_PATTERN: Optional[str] = None
+    INDEX_PAGE_PARAM: Optional[str] = None
+
     def __init__(self, headless: bool = True, source: str = "default"):
         self.headless = headless
         self.source = source.lower()
@@ -98,41 +131,9 @@ class PlaywrightScraperBase(ABC):
             return
 
         self._playwright = await async_playwright().start()
-        
-        # Launch options for stealth
-        launch_args = [
-            '--disable-blink-features=AutomationControlled',
-            '--no-sandbox',
-            '--disable-infobars',
-            '--disable-dev-shm-usage',
-            '--disable-browser-side-navigation',
-            '--disable-features=VizDisplayCompositor',
-        ]
-        
-        self._browser = await self._playwright.chromium.launch(
-            headless=self.headless,
-            args=launch_args
-        )
-        
-        # Rotate UA
-        user_agent = random.choice(USER_AGENTS)
-        
-        self._context = await self._browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent=user_agent,
-            locale='en-US',
-            timezone_id='America/New_York',
-            # basic permissions to look more real
-            permissions=['geolocation'],
-            geolocation={'latitude': 40.7128, 'longitude': -74.0060},
-        )
-        
-        # Inject stealth scripts to mask webdriver
-        await self._context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
+        self._browser = await launch_browser(self._playwright, self.headless)
+        self._context = await new_stealth_context(self._browser)
+        await install_resource_policy(self._context, self.source)
 
     async def stop(self):
         """Stop the browser."""
@@ -145,7 +146,9 @@ class PlaywrightScraperBase(ABC):
         self._playwright = None
 
     async def ensure_browser(self) -> bool:
-        """Ensure browser is started."""
+        """Ensure browser is started (the shared pool launches its own on demand)."""
+        if get_browser_pool() is not None:
+            return True
         try:
             if not self._browser or not self._context:
                 await self.start()
@@ -159,6 +162,26 @@ class PlaywrightScraperBase(ABC):
         """Public accessor for browser context."""
         return self._context
 
+    @asynccontextmanager
+    async def open_page(self):
+        """
+        Page for one request: leased from the shared browser pool when the app
+        installed one, otherwise opened in this scraper's own browser.
+        """
+        pool = get_browser_pool()
+        if pool is not None:
+            async with pool.page(self.source) as page:
+                yield page
+            return
+
+        if not self._context:
+            await self.start()
+        page: Page = await self._context.new_page()
+        try:
+            yield page
+        finally:
+            await page.close()
+
     async def _enforce_rate_limit(self):
         """Enforce rate limiting with jitter."""
         rate_limit = settings.SCRAPER_RATE_LIMITS.get(
@@ -182,21 +205,148 @@ class PlaywrightScraperBase(ABC):
 
         self._last_request_times[self.source] = time.time()
 
-    @retry_with_exponential_backoff(max_retries=3, base_delay=1.0)
     async def fetch_page(self, url: str, wait_selector: str = None) -> str:
-        """Fetch a page and return its HTML content."""
-        await self._enforce_rate_limit()
+        """Fetch a page and return its HTML content (HTTP first when STATIC_MARKERS is set)."""
+        return (await self.fetch_lot_page(url, wait_selector)).html
 
-        if not self._context:
-            await self.start()
+    async def fetch_lot_page(self, url: str, wait_selector: str = None, if_changed: bool = False) -> Optional[FetchedPage]:
+        """
+        Fetch a lot page like fetch_page.
+
+        With if_changed, returns None when the page is unchanged since the last
+        tracked fetch (HTTP 304 or the same normalized content hash); a changed
+        page's validators are recorded by its on_persisted.
+        """
+        tracker = get_change_tracker() if if_changed else None
+        if self.STATIC_MARKERS and settings.SCRAPER_HTTP_FIRST_ENABLED:
+            fetched = await self._fetch_static(url, tracker)
+            if fetched is not None:
+                status, html, headers = fetched
+                fetch_stats.record(self.source, "http")
+                if status == 304:
+                    tracker.not_modified(url)
+                    fetch_stats.record(self.source, "unchanged")
+                    return None
+                return self._track_page(url, status, html, headers, tracker)
+        status, html, headers = await self._fetch_with_browser(url, wait_selector)
+        fetch_stats.record(self.source, "browser")
+        return self._track_page(url, status, html, headers, tracker)
+
+    def _track_page(self, url: str, status: int, html: str, headers, tracker) -> Optional[FetchedPage]:
+        """
+        Snapshot a successfully fetched page and, when tracking changes, check
+        it against its validators; None if the page is unchanged since the last
+        refresh. New validators are recorded only through on_persisted, so a
+        page that fails to parse or save is fetched in full next time.
+        Error pages are returned as-is.
+        """
+        if status >= 400:
+            return FetchedPage(html)
+        on_persisted = None
+        if tracker is not None:
+            changed, validators = tracker.check(url, html, headers)
+            if not changed:
+                tracker.record(validators)  # Same content as stored; refresh ETag / checked_at
+                fetch_stats.record(self.source, "unchanged")
+                return None
+            on_persisted = lambda: tracker.record(validators)  # noqa: E731
+        self._save_snapshot(url, html)
+        return FetchedPage(html, on_persisted)
+
+    def _save_snapshot(self, url: str, html: str) -> None:
+        """Keep the raw page for offline re-parsing; never fails the scrape."""
+        store = get_snapshot_store()
+        if store is None:
+            return
+        try:
+            store.put(url, html, self.source)
+        except Exception as e:
+            logger.warning(f"Could not store HTML snapshot of {url}: {e}")
+
+    def parse_html(self, html: str, url: str):
+        """Run this source's parser over page HTML and map it to an AuctionLot."""
+        return self._map_to_domain(self.parser.parse(html, url))
+
+    async def fetch_index_page(self, url: str) -> str:
+        """
+        Fetch a sale index page for crawl mode: HTTP first for server-rendered
+        sources (usable when it contains lot links), else the browser.
+        Not snapshotted or change-tracked.
+        """
+        if self.STATIC_MARKERS and settings.SCRAPER_HTTP_FIRST_ENABLED:
+            fetched = await self._fetch_static(url, markers=(self.LOT_LINK_PATTERN,))
+            if fetched is not None:
+                fetch_stats.record(self.source, "http")
+                return fetched[1]
+        status, html, _ = await self._fetch_with_browser(url)
+        fetch_stats.record(self.source, "browser")
+        if status >= 400:
+            raise ConnectionError(f"HTTP {status} for sale index {url}")
+        return html
 
-        page = await self._context.new_page()
+    def discover_lot_urls(self, html: str, page_url: str) -> List[str]:
+        """Absolute lot URLs linked from a sale index page, in page order."""
+        lot_link = re.compile(self.LOT_LINK_PATTERN)
+        urls = []
+        for href in _HREF.findall(html):
+            url = urldefrag(urljoin(page_url, href.replace("&amp;", "&")))[0]
+            if lot_link.search(url):
+                urls.append(url)
+        return list(dict.fromkeys(urls))
+
+    def next_index_url(self, html: str, page_url: str) -> Optional[str]:
+        """The following index page: rel="next" link, else INDEX_PAGE_PARAM + 1."""
+        for tag in _REL_NEXT.findall(html):
+            href = _HREF.search(tag)
+            if href:
+                return urljoin(page_url, href.group(1).replace("&amp;", "&"))
+        if not self.INDEX_PAGE_PARAM:
+            return None
+        parts = urlsplit(page_url)
+        query = dict(parse_qsl(parts.query))
         try:
+            page = int(query.get(self.INDEX_PAGE_PARAM, 1))
+        except ValueError:
+            return None
+        query[self.INDEX_PAGE_PARAM] = str(page + 1)
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    async def _fetch_static(self, url: str, tracker=None, markers: tuple = None) -> Optional[tuple]:
+        """
+        Plain GET of url (conditional when a change tracker is given):
+        (status, html, headers), or None (and an escalation count) if the
+        browser is needed. markers default to STATIC_MARKERS.
+        """
+        await self._enforce_rate_limit()
+        headers = {**BROWSER_HEADERS, **(tracker.conditional_headers(url) if tracker else {})}
+        try:
+            async with static_http_client(self.source, settings.SCRAPER_TIMEOUT) as client:
+                response = await client.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            logger.debug(f"HTTP fetch failed for {url}, escalating to browser: {e}")
+            fetch_stats.record(self.source, "escalated_error")
+            return None
+        if response.status_code >= 400:
+            logger.debug(f"HTTP {response.status_code} for {url}, escalating to browser")
+            fetch_stats.record(self.source, "escalated_status")
+            return None
+        if response.status_code == 304 and tracker is not None:
+            return 304, "", response.headers
+        html = response.text
+        if not has_markers(html, markers or self.STATIC_MARKERS):
+            logger.debug(f"Static HTML of {url} lacks lot markers, escalating to browser")
+            fetch_stats.record(self.source, "escalated_markers")
+            return None
+        return response.status_code, html, response.headers
+
+    @retry_with_exponential_backoff(max_retries=3, base_delay=1.0)
+    async def _fetch_with_browser(self, url: str, wait_selector: str = None) -> tuple:
+        """Fetch a page in Chromium: (status, HTML content, response headers)."""
+        await self._enforce_rate_limit()
+
+        async with self.open_page() as page:
             # Set extra headers
-            await page.set_extra_http_headers({
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            })
+            await page.set_extra_http_headers(BROWSER_HEADERS)
             
             response = await page.goto(url, wait_until='domcontentloaded', timeout=45000)
             
@@ -215,6 +365,8 @@ class PlaywrightScraperBase(ABC):
                     logger.warning(f"Timeout waiting for selector {wait_selector} on {url}")
 
             content = await page.content()
-            return content
-        finally:
-            await page.close()
\ No newline at end of file
+            fetcher = get_static_fetcher()
+            if self.STATIC_MARKERS and fetcher is not None:
+                # Let the next plain GET reuse whatever session the browser earned
+                fetcher.absorb_cookies(self.source, await page.context.cookies())
+            return response.status, content, response.headers
@@ -16,6 +16,7 @@ from .models import (
     BiddrProvenance, BiddrProvenanceEntry, BiddrImage, 
     BiddrAuctionInfo, BiddrMetal, BiddrSubHouse
 )
+from src.infrastructure.scrapers.shared.reference_patterns import ReferenceScanner, build_references
 
 logger = logging.getLogger(__name__)
 
@@ -44,26 +45,27 @@ class BiddrParser:
     # Reference patterns
     REFERENCE_PATTERNS = [
         # RIC with volume
-        (re.compile(r'RIC\s+([IVX]+(?:\.\d)?)\s+(\d+[a-z]?)(?:\s*\(([^)]+)\))?', re.I), 'RIC'),
+        (re.compile(r'RIC\s+(?P<vol>[IVX]+(?:\.\d)?)\s+(?P<num>\d+[a-z]?)(?:\s*\((?P<suffix>[^)]+)\))?', re.I), 'RIC'),
         # Crawford for Roman Republic
-        (re.compile(r'(?:Crawford|Cr\.?)\s*(\d+/\d+[a-z]?)', re.I), 'Crawford'),
+        (re.compile(r'(?:Crawford|Cr\.?)\s*(?P<num>\d+/\d+[a-z]?)', re.I), 'Crawford'),
         # Sydenham
-        (re.compile(r'Sydenham\s+(\d+[a-z]?)', re.I), 'Sydenham'),
+        (re.compile(r'Sydenham\s+(?P<num>\d+[a-z]?)', re.I), 'Sydenham'),
         # RSC
-        (re.compile(r'RSC\s+(\d+[a-z]?)', re.I), 'RSC'),
+        (re.compile(r'RSC\s+(?P<num>\d+[a-z]?)', re.I), 'RSC'),
         # RPC
-        (re.compile(r'RPC\s+([IVX]+)\s+(\d+)', re.I), 'RPC'),
+        (re.compile(r'RPC\s+(?P<vol>[IVX]+)\s+(?P<num>\d+)', re.I), 'RPC'),
         # Sear
-        (re.compile(r'Sear\s+(\d+)', re.I), 'Sear'),
+        (re.compile(r'Sear\s+(?P<num>\d+)', re.I), 'Sear'),
         # SNG
-        (re.compile(r'SNG\s+(\w+)\s+(\d+)', re.I), 'SNG'),
+        (re.compile(r'SNG\s+(?P<vol>\w+)\s+(?P<num>\d+)', re.I), 'SNG'),
         # BMC
-        (re.compile(r'BMC\s+(\d+)', re.I), 'BMC'),
+        (re.compile(r'BMC\s+(?P<num>\d+)', re.I), 'BMC'),
         # Cohen
-        (re.compile(r'Cohen\s+(\d+)', re.I), 'Cohen'),
+        (re.compile(r'Cohen\s+(?P<num>\d+)', re.I), 'Cohen'),
         # Calicó
-        (re.compile(r'Calicó\s+(\d+[a-z]?)', re.I), 'Calicó'),
+        (re.compile(r'Calicó\s+(?P<num>\d+[a-z]?)', re.I), 'Calicó'),
     ]
+    _REFERENCE_SCANNER = ReferenceScanner(REFERENCE_PATTERNS)
     
     # Grade patterns (English and German)
     GRADE_PATTERNS = [
@@ -380,47 +382,7 @@ class BiddrParser:
     
     def _extract_references(self, description: str) -> list[BiddrCatalogReference]:
         """Extract all catalog references"""
-        references = []
-        
-        for pattern, catalog in self.REFERENCE_PATTERNS:
-            for match in pattern.finditer(description):
-                raw = match.group(0)
-                groups = match.groups()
-                
-                if catalog == 'RIC' and len(groups) >= 2:
-                    ref = BiddrCatalogReference(
-                        catalog='RIC',
-                        volume=groups[0],
-                        number=groups[1],
-                        suffix=groups[2] if len(groups) > 2 else None,
-                        raw_text=raw
-                    )
-                elif catalog == 'RPC' and len(groups) >= 2:
-                    ref = BiddrCatalogReference(
-                        catalog='RPC',
-                        volume=groups[0],
-                        number=groups[1],
-                        raw_text=raw
-                    )
-                elif catalog == 'SNG' and len(groups) >= 2:
-                    ref = BiddrCatalogReference(
-                        catalog='SNG',
-                        volume=groups[0],
-                        number=groups[1],
-                        raw_text=raw
-                    )
-                else:
-                    ref = BiddrCatalogReference(
-                        catalog=catalog,
-                        number=groups[0] if groups else raw.split()[-1],
-                        raw_text=raw
-                    )
-                
-                # Avoid duplicates
-                if not any(r.raw_text == ref.raw_text for r in references):
-                    references.append(ref)
-        
-        return references
+        return build_references(self._REFERENCE_SCANNER, description, BiddrCatalogReference, unique_raw_text=True)
     
     def _extract_grade(self, description: str) -> dict:
         """Extract grade information"""
@@ -23,6 +23,15 @@ class BiddrScraper(PlaywrightScraperBase, IScraper):
     """
 
     BASE_URL = "https://www.biddr.com"
+    # Rendered lot markup the parser reads: the "Description" section heading
+    # (element text, not the description meta tag) and the lot images
+    STATIC_MARKERS = (
+        r'>\s*Description\s*<',
+        r'<img\b[^>]*\b(?:data-)?src=["\'][^"\']*(?:auction_lots|media\.biddr)',
+    )
+    # Lot pages are ...?a=<auction>&l=<lot> (&amp; in raw index HTML)
+    LOT_LINK_PATTERN = r'[?&](?:amp;)?l=\d+'
+    INDEX_PAGE_PARAM = "page"
 
     def __init__(self, headless: bool = True):
         super().__init__(headless=headless, source="biddr")
@@ -31,21 +40,24 @@ class BiddrScraper(PlaywrightScraperBase, IScraper):
     def can_handle(self, url: str) -> bool:
         return "biddr.com" in url or "biddr" in url.lower()
     
-    async def scrape(self, url: str) -> ScrapeResult:
+    async def scrape(self, url: str, if_changed: bool = False) -> ScrapeResult:
         """Scrape a Biddr lot URL with automatic rate limiting and retry."""
         try:
             logger.info(f"Fetching Biddr URL: {url}")
             
-            # Use fetch_page with selector
-            html = await self.fetch_page(
+            # Use fetch_lot_page with selector
+            page = await self.fetch_lot_page(
                 url, 
-                wait_selector='h1, h2, .lot-info, [class*="lot"], [class*="description"]'
+                wait_selector='h1, h2, .lot-info, [class*="lot"], [class*="description"]',
+                if_changed=if_changed,
             )
+            if page is None:
+                return ScrapeResult(status=ScrapeStatus.UNCHANGED)
             
             # Parse
-            data: BiddrCoinData = self.parser.parse(html, url)
+            data: BiddrCoinData = self.parser.parse(page.html, url)
             lot = self._map_to_domain(data)
-            return ScrapeResult(status=ScrapeStatus.SUCCESS, data=lot)
+            return ScrapeResult(status=ScrapeStatus.SUCCESS, data=lot, on_persisted=page.on_persisted)
             
         except Exception as e:
             logger.exception(f"Error scraping Biddr URL {url}: {e}")
@@ -0,0 +1,262 @@
+"""Shared Playwright browser pool for auction scrapers.
+
+Each PlaywrightScraperBase used to launch its own Chromium, and the scrape
+routers build fresh scrapers per request, so every scrape paid a multi-second
+browser launch. BrowserPool keeps one browser for the app lifetime with one
+warm context per source (cookies stay per auction house) and reuses idle pages.
+Contexts are recycled after `context_max_uses` pages or when a page crashes,
+the browser is relaunched if it disconnects, and a semaphore caps concurrent
+pages. The app creates the pool in the FastAPI lifespan; scrapers running
+without a pool (scripts, tests) keep launching their own browser.
+"""
+import asyncio
+import logging
+import random
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional
+
+from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+
+from src.infrastructure.scrapers.resource_policy import install_resource_policy
+
+logger = logging.getLogger(__name__)
+
+# Common User Agents for rotation
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36 Edg/119.0.0.0"
+]
+
+# Launch options for stealth
+LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--no-sandbox',
+    '--disable-infobars',
+    '--disable-dev-shm-usage',
+    '--disable-browser-side-navigation',
+    '--disable-features=VizDisplayCompositor',
+]
+
+# Mask navigator.webdriver in every page of a context
+STEALTH_INIT_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+"""
+
+
+async def launch_browser(playwright, headless: bool = True) -> Browser:
+    """Launch Chromium with the stealth arguments."""
+    return await playwright.chromium.launch(headless=headless, args=LAUNCH_ARGS)
+
+
+async def new_stealth_context(browser: Browser) -> BrowserContext:
+    """New context with a rotated user agent and the webdriver mask."""
+    context = await browser.new_context(
+        viewport={'width': 1920, 'height': 1080},
+        user_agent=random.choice(USER_AGENTS),
+        locale='en-US',
+        timezone_id='America/New_York',
+        # basic permissions to look more real
+        permissions=['geolocation'],
+        geolocation={'latitude': 40.7128, 'longitude': -74.0060},
+    )
+    await context.add_init_script(STEALTH_INIT_SCRIPT)
+    return context
+
+
+@dataclass
+class BrowserPoolConfig:
+    """Limits for the shared browser."""
+    headless: bool = True
+    max_pages: int = 4  # Concurrent pages across all sources
+    context_max_uses: int = 50  # Pages served before a context is replaced
+    idle_pages_per_context: int = 2  # Open pages kept for reuse
+
+    @classmethod
+    def from_settings(cls, settings) -> "BrowserPoolConfig":
+        return cls(
+            headless=settings.SCRAPER_BROWSER_HEADLESS,
+            max_pages=settings.SCRAPER_BROWSER_MAX_PAGES,
+            context_max_uses=settings.SCRAPER_BROWSER_CONTEXT_MAX_USES,
+            idle_pages_per_context=settings.SCRAPER_BROWSER_IDLE_PAGES,
+        )
+
+
+@dataclass
+class _PooledContext:
+    context: BrowserContext
+    uses: int = 0
+    active: int = 0
+    retired: bool = False
+    crashed: bool = False
+    idle_pages: List[Page] = field(default_factory=list)
+
+
+class BrowserPool:
+    """One browser, a warm context per source and recycled pages."""
+
+    def __init__(self, config: Optional[BrowserPoolConfig] = None):
+        self.config = config or BrowserPoolConfig()
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._contexts: Dict[str, _PooledContext] = {}
+        self._lock = asyncio.Lock()
+        self._pages = asyncio.Semaphore(max(1, self.config.max_pages))
+        self._stats = {
+            "browser_launches": 0,
+            "contexts_created": 0,
+            "contexts_recycled": 0,
+            "pages_created": 0,
+            "pages_reused": 0,
+        }
+
+    async def _launch(self) -> Browser:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        return await launch_browser(self._playwright, self.config.headless)
+
+    async def _new_context(self, browser: Browser, source: str) -> BrowserContext:
+        context = await new_stealth_context(browser)
+        await install_resource_policy(context, source)
+        return context
+
+    async def _ensure_browser(self) -> Browser:
+        if self._browser is None or not self._browser.is_connected():
+            if self._browser is not None:
+                logger.warning("Shared scraper browser disconnected; relaunching")
+            # Contexts of a dead browser are unusable
+            self._contexts = {}
+            self._browser = await self._launch()
+            self._stats["browser_launches"] += 1
+        return self._browser
+
+    async def start(self) -> None:
+        """Launch the browser now instead of on the first scrape."""
+        async with self._lock:
+            await self._ensure_browser()
+
+    async def _checkout(self, source: str) -> _PooledContext:
+        async with self._lock:
+            browser = await self._ensure_browser()
+            slot = self._contexts.get(source)
+            if slot is None:
+                slot = _PooledContext(await self._new_context(browser, source))
+                self._contexts[source] = slot
+                self._stats["contexts_created"] += 1
+            slot.uses += 1
+            slot.active += 1
+            if slot.uses >= self.config.context_max_uses:
+                # Later callers get a fresh context; this one closes once idle
+                self._retire(source, slot)
+            return slot
+
+    def _retire(self, source: str, slot: _PooledContext) -> None:
+        slot.retired = True
+        if self._contexts.get(source) is slot:
+            del self._contexts[source]
+
+    async def _open_page(self, slot: _PooledContext) -> Page:
+        while slot.idle_pages:
+            page = slot.idle_pages.pop()
+            if not page.is_closed():
+                self._stats["pages_reused"] += 1
+                return page
+        page = await slot.context.new_page()
+        page.on("crash", lambda _page: setattr(slot, "crashed", True))
+        self._stats["pages_created"] += 1
+        return page
+
+    async def _release(self, source: str, slot: _PooledContext, page: Page, failed: bool) -> None:
+        slot.active -= 1
+        if slot.crashed and not slot.retired:
+            logger.warning("Scraper page crashed for %s; recycling its browser context", source)
+            self._retire(source, slot)
+        keep = not (failed or slot.retired or page.is_closed())
+        if keep and len(slot.idle_pages) < self.config.idle_pages_per_context:
+            slot.idle_pages.append(page)
+        else:
+            await _close_quietly(page)
+        if slot.retired and slot.active == 0:
+            pages, slot.idle_pages = slot.idle_pages, []
+            for idle in pages:
+                await _close_quietly(idle)
+            await _close_quietly(slot.context)
+            self._stats["contexts_recycled"] += 1
+
+    @asynccontextmanager
+    async def page(self, source: str = "default") -> AsyncIterator[Page]:
+        """
+        Lease a page in the context for source.
+
+        The page goes back to the pool on exit; a page whose block raised is
+        closed rather than reused.
+        """
+        async with self._pages:
+            slot = await self._checkout(source)
+            try:
+                page = await self._open_page(slot)
+            except BaseException:
+                slot.crashed = True  # The context cannot open pages; replace it
+                await self._release_failed_open(source, slot)
+                raise
+            failed = False
+            try:
+                yield page
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                await self._release(source, slot, page, failed)
+
+    async def _release_failed_open(self, source: str, slot: _PooledContext) -> None:
+        slot.active -= 1
+        self._retire(source, slot)
+        if slot.active == 0:
+            await _close_quietly(slot.context)
+            self._stats["contexts_recycled"] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Launch/context/page counters plus open contexts."""
+        return {**self._stats, "open_contexts": len(self._contexts)}
+
+    async def aclose(self) -> None:
+        """Close every context and the browser (app shutdown)."""
+        async with self._lock:
+            slots, self._contexts = list(self._contexts.values()), {}
+            for slot in slots:
+                await _close_quietly(slot.context)
+            if self._browser is not None:
+                await _close_quietly(self._browser)
+                self._browser = None
+            if self._playwright is not None:
+                try:
+                    await self._playwright.stop()
+                except Exception as e:
+                    logger.debug("Error stopping Playwright: %s", e)
+                self._playwright = None
+
+
+async def _close_quietly(target) -> None:
+    try:
+        await target.close()
+    except Exception as e:
+        logger.debug("Error closing %s: %s", type(target).__name__, e)
+
+
+_browser_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> Optional[BrowserPool]:
+    """The app-wide pool, or None when scrapers should launch their own browser."""
+    return _browser_pool
+
+
+def set_browser_pool(pool: Optional[BrowserPool]) -> None:
+    """Install (or clear, with None) the app-wide pool."""
+    global _browser_pool
+    _browser_pool = pool
@@ -0,0 +1,179 @@
+"""Change detection for auction page refreshes.
+
+For each tracked lot URL we keep the server's ETag and Last-Modified plus a
+hash of the page with volatile markup removed (scripts, styles, comments,
+hidden inputs such as CSRF tokens, whitespace). A refresh sends conditional
+request headers on the plain HTTP path and treats a 304, or a 200 whose
+normalized hash matches, as unchanged; browser-only sources compare the hash.
+Scrapers then skip parsing and the caller skips DB writes.
+
+Validators are only read for fetches made with if_changed=True (refreshes of
+lots already stored), and a changed page's validators are only written once
+its lot has been parsed and stored (ScrapeResult.on_persisted), so a scrape
+that fails or is never persisted cannot make a stale row look current. A
+store other than auction_data_v2 (the crawl lot store) keeps its own
+validators via use_change_tracker.
+"""
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Mapping, Optional, Tuple
+
+from src.infrastructure.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_VOLATILE = re.compile(
+    r"<script\b.*?</script\s*>"
+    r"|<style\b.*?</style\s*>"
+    r"|<noscript\b.*?</noscript\s*>"
+    r"|<!--.*?-->"
+    r"|<input\b[^>]*\btype\s*=\s*[\"']?hidden[^>]*>"
+    r"|<meta\b[^>]*\b(?:name|property)\s*=\s*[\"']?(?:csrf|_token|request-id)[^>]*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_html(html: str) -> str:
+    """Page markup without parts that change on every request."""
+    return _WHITESPACE.sub(" ", _VOLATILE.sub("", html)).strip()
+
+
+def content_hash(html: str) -> str:
+    return hashlib.sha256(normalize_html(html).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class PageValidators:
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: str
+    checked_at: float
+    changed_at: float
+
+
+class PageChangeTracker:
+    """Per-URL ETag / Last-Modified / normalized content hash in SQLite."""
+
+    def __init__(self, db_path: str = "data/page_validators.sqlite", clock=time.time):
+        self.db_path = Path(db_path)
+        self._clock = clock
+        self._local = threading.local()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._get_conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS page_validators ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, content_hash TEXT NOT NULL, "
+            "checked_at REAL NOT NULL, changed_at REAL NOT NULL)"
+        )
+        conn.commit()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if not hasattr(self._local, "conn"):
+            self._local.conn = sqlite3.connect(str(self.db_path))
+        return self._local.conn
+
+    def get(self, url: str) -> Optional[PageValidators]:
+        row = self._get_conn().execute(
+            "SELECT url, etag, last_modified, content_hash, checked_at, changed_at "
+            "FROM page_validators WHERE url = ?",
+            (url,),
+        ).fetchone()
+        return PageValidators(*row) if row else None
+
+    def conditional_headers(self, url: str) -> dict:
+        """If-None-Match / If-Modified-Since for the last version seen."""
+        validators = self.get(url)
+        headers = {}
+        if validators and validators.etag:
+            headers["If-None-Match"] = validators.etag
+        if validators and validators.last_modified:
+            headers["If-Modified-Since"] = validators.last_modified
+        return headers
+
+    def not_modified(self, url: str) -> None:
+        """Record a 304 for url."""
+        conn = self._get_conn()
+        conn.execute("UPDATE page_validators SET checked_at = ? WHERE url = ?", (self._clock(), url))
+        conn.commit()
+
+    def forget(self, url: str) -> None:
+        """Drop url's validators so the next observe counts as changed."""
+        conn = self._get_conn()
+        conn.execute("DELETE FROM page_validators WHERE url = ?", (url,))
+        conn.commit()
+
+    def check(
+        self, url: str, html: str, headers: Optional[Mapping[str, str]] = None
+    ) -> Tuple[bool, PageValidators]:
+        """(changed, validators) for a fetched page, without recording them."""
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        digest = content_hash(html)
+        now = self._clock()
+        previous = self.get(url)
+        changed = previous is None or previous.content_hash != digest
+        validators = PageValidators(
+            url, headers.get("etag"), headers.get("last-modified"), digest, now,
+            now if changed else previous.changed_at,
+        )
+        return changed, validators
+
+    def record(self, validators: PageValidators) -> None:
+        """Store validators as the last version seen (and stored) for their URL."""
+        conn = self._get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO page_validators "
+            "(url, etag, last_modified, content_hash, checked_at, changed_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (validators.url, validators.etag, validators.last_modified, validators.content_hash,
+             validators.checked_at, validators.changed_at),
+        )
+        conn.commit()
+
+    def observe(self, url: str, html: str, headers: Optional[Mapping[str, str]] = None) -> bool:
+        """Check and record a fetched page; True if it differs from the last one (or is new)."""
+        changed, validators = self.check(url, html, headers)
+        self.record(validators)
+        return changed
+
+
+_change_tracker: Optional[PageChangeTracker] = None
+_change_tracker_lock = threading.Lock()
+_scoped_tracker: ContextVar[Optional[PageChangeTracker]] = ContextVar("scoped_change_tracker", default=None)
+
+
+def get_change_tracker() -> PageChangeTracker:
+    """Tracker installed by use_change_tracker, else the one at SCRAPER_PAGE_VALIDATORS_PATH."""
+    scoped = _scoped_tracker.get()
+    if scoped is not None:
+        return scoped
+    global _change_tracker
+    if _change_tracker is None:
+        with _change_tracker_lock:
+            if _change_tracker is None:
+                _change_tracker = PageChangeTracker(get_settings().SCRAPER_PAGE_VALIDATORS_PATH)
+    return _change_tracker
+
+
+def set_change_tracker(tracker: Optional[PageChangeTracker]) -> None:
+    """Replace the tracker (tests); None re-reads settings on next use."""
+    global _change_tracker
+    _change_tracker = tracker
+
+
+@contextmanager
+def use_change_tracker(tracker: PageChangeTracker) -> Iterator[PageChangeTracker]:
+    """Record validators in tracker for scrapes made in this context (and its tasks)."""
+    token = _scoped_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _scoped_tracker.reset(token)
@@ -16,6 +16,7 @@ from .models import (
     CNGCoinData, PhysicalData, CatalogReference, Provenance, 
     ProvenanceEntry, CNGImage, AuctionInfo, CNGAuctionType, CNGMetal
 )
+from src.infrastructure.scrapers.shared.reference_patterns import ReferenceScanner, build_references
 
 logger = logging.getLogger(__name__)
 
@@ -32,22 +33,23 @@ class CNGParser:
     # Reference patterns for catalog number extraction
     REFERENCE_PATTERNS = [
         # RIC with volume: "RIC III 676 (Aurelius)" or "RIC II.1 783"
-        re.compile(r'RIC\s+(?P<vol>[IVX]+(?:\.\d)?)\s+(?P<num>\d+[a-z]?)(?:\s*\((?P<suffix>[^)]+)\))?', re.I),
+        (re.compile(r'RIC\s+(?P<vol>[IVX]+(?:\.\d)?)\s+(?P<num>\d+[a-z]?)(?:\s*\((?P<suffix>[^)]+)\))?', re.I), 'RIC'),
         # Crawford: "Crawford 44/5" or "Cr. 44/5"
-        re.compile(r'(?:Crawford|Cr\.?)\s*(?P<num>\d+/\d+[a-z]?)', re.I),
+        (re.compile(r'(?:Crawford|Cr\.?)\s*(?P<num>\d+/\d+[a-z]?)', re.I), 'Crawford'),
         # RSC: "RSC 162"
-        re.compile(r'RSC\s+(?P<num>\d+[a-z]?)', re.I),
+        (re.compile(r'RSC\s+(?P<num>\d+[a-z]?)', re.I), 'RSC'),
         # RPC: "RPC I 1234"
-        re.compile(r'RPC\s+(?P<vol>[IVX]+)\s+(?P<num>\d+)', re.I),
+        (re.compile(r'RPC\s+(?P<vol>[IVX]+)\s+(?P<num>\d+)', re.I), 'RPC'),
         # Sear: "Sear 1234"
-        re.compile(r'Sear\s+(?P<num>\d+)', re.I),
+        (re.compile(r'Sear\s+(?P<num>\d+)', re.I), 'Sear'),
         # MIR: "MIR 18, 10-4a"
-        re.compile(r'MIR\s+(?P<vol>\d+),?\s*(?P<num>[\d\-]+[a-z]?)', re.I),
+        (re.compile(r'MIR\s+(?P<vol>\d+),?\s*(?P<num>[\d\-]+[a-z]?)', re.I), 'MIR'),
         # BMC: "BMC 123"
-        re.compile(r'BMC\s+(?P<num>\d+)', re.I),
+        (re.compile(r'BMC\s+(?P<num>\d+)', re.I), 'BMC'),
         # SNG: "SNG Copenhagen 123"
-        re.compile(r'SNG\s+(?P<collection>\w+)\s+(?P<num>\d+)', re.I),
+        (re.compile(r'SNG\s+(?P<collection>\w+)\s+(?P<num>\d+)', re.I), 'SNG'),
     ]
+    _REFERENCE_SCANNER = ReferenceScanner(REFERENCE_PATTERNS)
     
     def __init__(self):
         self.soup: Optional[BeautifulSoup] = None
@@ -431,49 +433,7 @@ class CNGParser:
     
     def _extract_references(self, text: str) -> list[CatalogReference]:
         """Extract all catalog references from description"""
-        references = []
-        
-        for pattern in self.REFERENCE_PATTERNS:
-            for match in pattern.finditer(text):
-                ref = self._build_reference(pattern, match)
-                if ref:
-                    references.append(ref)
-        
-        return references
-    
-    def _build_reference(self, pattern: re.Pattern, match: re.Match) -> Optional[CatalogReference]:
-        """Build CatalogReference from regex match"""
-        groups = match.groupdict()
-        raw = match.group(0)
-        
-        # Determine catalog name from pattern
-        pattern_str = pattern.pattern.lower()
-        if 'ric' in pattern_str:
-            catalog = 'RIC'
-        elif 'crawford' in pattern_str or 'cr\\.' in pattern_str:
-            catalog = 'Crawford'
-        elif 'rsc' in pattern_str:
-            catalog = 'RSC'
-        elif 'rpc' in pattern_str:
-            catalog = 'RPC'
-        elif 'sear' in pattern_str:
-            catalog = 'Sear'
-        elif 'mir' in pattern_str:
-            catalog = 'MIR'
-        elif 'bmc' in pattern_str:
-            catalog = 'BMC'
-        elif 'sng' in pattern_str:
-            catalog = 'SNG'
-        else:
-            return None
-        
-        return CatalogReference(
-            catalog=catalog,
-            volume=groups.get('vol') or groups.get('collection'),
-            number=groups.get('num', ''),
-            suffix=groups.get('suffix'),
-            raw_text=raw
-        )
+        return build_references(self._REFERENCE_SCANNER, text, CatalogReference)
     
     def _extract_condition_notes(self, text: str) -> Optional[str]:
         """Extract condition/toning notes"""
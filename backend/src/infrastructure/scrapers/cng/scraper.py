@@ -24,6 +24,10 @@ class CNGScraper(PlaywrightScraperBase, IScraper):
     """
 
     BASE_URL = "https://auctions.cngcoins.com"
+    # Lot data comes from the JSON-LD Product block, present without Angular
+    STATIC_MARKERS = (r'"@type"\s*:\s*"Product"',)
+    LOT_LINK_PATTERN = r'/lots/view/[^/?#]+'
+    INDEX_PAGE_PARAM = "page"
 
     def __init__(self, headless: bool = True):
         super().__init__(headless=headless, source="cng")
@@ -32,18 +36,20 @@ class CNGScraper(PlaywrightScraperBase, IScraper):
     def can_handle(self, url: str) -> bool:
         return "cngcoins.com" in url or "cng" in url.lower()
     
-    async def scrape(self, url: str) -> ScrapeResult:
+    async def scrape(self, url: str, if_changed: bool = False) -> ScrapeResult:
         """Scrape a CNG lot URL with automatic rate limiting and retry."""
         try:
             logger.info(f"Fetching CNG URL: {url}")
             
-            # Use fetch_page with selector wait for Angular content
-            html = await self.fetch_page(url, wait_selector='[class*="lot"]')
+            # Use fetch_lot_page with selector wait for Angular content
+            page = await self.fetch_lot_page(url, wait_selector='[class*="lot"]', if_changed=if_changed)
+            if page is None:
+                return ScrapeResult(status=ScrapeStatus.UNCHANGED)
             
             # Parse
-            data: CNGCoinData = self.parser.parse(html, url)
+            data: CNGCoinData = self.parser.parse(page.html, url)
             lot = self._map_to_domain(data)
-            return ScrapeResult(status=ScrapeStatus.SUCCESS, data=lot)
+            return ScrapeResult(status=ScrapeStatus.SUCCESS, data=lot, on_persisted=page.on_persisted)
             
         except Exception as e:
             logger.exception(f"Error scraping CNG URL {url}: {e}")
@@ -17,6 +17,7 @@ from .models import (
     EbayImage, EbayListingInfo, EbaySellerInfo, EbayGradingInfo,
     EbayListingType, EbayCondition
 )
+from src.infrastructure.scrapers.shared.reference_patterns import ReferenceScanner, build_references
 
 logger = logging.getLogger(__name__)
 
@@ -28,16 +29,17 @@ class EbayParser:
     
     # Reference patterns
     REFERENCE_PATTERNS = [
-        (re.compile(r'RIC\s+([IVX]+(?:\.\d)?)\s+(\d+[a-z]?)', re.I), 'RIC'),
-        (re.compile(r'(?:Crawford|Cr\.?)\s*(\d+/\d+[a-z]?)', re.I), 'Crawford'),
-        (re.compile(r'RSC\s+(\d+[a-z]?)', re.I), 'RSC'),
-        (re.compile(r'RPC\s+([IVX]+)\s+(\d+)', re.I), 'RPC'),
-        (re.compile(r'Sear\s+(\d+)', re.I), 'Sear'),
-        (re.compile(r'SNG\s+(\w+)\s+(\d+)', re.I), 'SNG'),
-        (re.compile(r'BMC\s+(\d+)', re.I), 'BMC'),
-        (re.compile(r'Cohen\s+(\d+)', re.I), 'Cohen'),
-        (re.compile(r'Sydenham\s+(\d+)', re.I), 'Sydenham'),
+        (re.compile(r'RIC\s+(?P<vol>[IVX]+(?:\.\d)?)\s+(?P<num>\d+[a-z]?)', re.I), 'RIC'),
+        (re.compile(r'(?:Crawford|Cr\.?)\s*(?P<num>\d+/\d+[a-z]?)', re.I), 'Crawford'),
+        (re.compile(r'RSC\s+(?P<num>\d+[a-z]?)', re.I), 'RSC'),
+        (re.compile(r'RPC\s+(?P<vol>[IVX]+)\s+(?P<num>\d+)', re.I), 'RPC'),
+        (re.compile(r'Sear\s+(?P<num>\d+)', re.I), 'Sear'),
+        (re.compile(r'SNG\s+(?P<vol>\w+)\s+(?P<num>\d+)', re.I), 'SNG'),
+        (re.compile(r'BMC\s+(?P<num>\d+)', re.I), 'BMC'),
+        (re.compile(r'Cohen\s+(?P<num>\d+)', re.I), 'Cohen'),
+        (re.compile(r'Sydenham\s+(?P<num>\d+)', re.I), 'Sydenham'),
     ]
+    _REFERENCE_SCANNER = ReferenceScanner(REFERENCE_PATTERNS)
     
     # Grade patterns for slabbed coins
     SLAB_PATTERNS = [
@@ -394,33 +396,10 @@ class EbayParser:
     
     def _extract_references(self, text: str) -> list[EbayCatalogReference]:
         """Extract catalog references"""
-        references = []
-        
-        for pattern, catalog in self.REFERENCE_PATTERNS:
-            for match in pattern.finditer(text):
-                raw = match.group(0)
-                groups = match.groups()
-                
-                if catalog in ('RIC', 'RPC', 'SNG') and len(groups) >= 2:
-                    ref = EbayCatalogReference(
-                        catalog=catalog,
-                        volume=groups[0],
-                        number=groups[1],
-                        raw_text=raw,
-                        needs_verification=True
-                    )
-                else:
-                    ref = EbayCatalogReference(
-                        catalog=catalog,
-                        number=groups[0] if groups else "",
-                        raw_text=raw,
-                        needs_verification=True
-                    )
-                
-                if not any(r.raw_text == ref.raw_text for r in references):
-                    references.append(ref)
-        
-        return references
+        return build_references(
+            self._REFERENCE_SCANNER, text, EbayCatalogReference, unique_raw_text=True,
+            needs_verification=True
+        )
     
     def _extract_grading(self, text: str, specifics: dict) -> EbayGradingInfo:
         """Extract grading information"""
@@ -11,6 +11,7 @@ from typing import Optional
 from src.domain.services.scraper_service import IScraper, ScrapeResult, ScrapeStatus
 from src.domain.auction import AuctionLot
 from src.infrastructure.scrapers.base_playwright import PlaywrightScraperBase
+from src.infrastructure.scrapers.change_detection import get_change_tracker
 
 from .parser import EbayParser
 from .models import EbayCoinData
@@ -32,7 +33,7 @@ class EbayScraper(PlaywrightScraperBase, IScraper):
     def can_handle(self, url: str) -> bool:
         return "ebay.com" in url or "ebay" in url.lower()
     
-    async def scrape(self, url: str) -> ScrapeResult:
+    async def scrape(self, url: str, if_changed: bool = False) -> ScrapeResult:
         """Scrape an eBay listing URL with automatic rate limiting and retry."""
         if not await self.ensure_browser():
             return ScrapeResult(status=ScrapeStatus.ERROR, error_message="Failed to start browser")
@@ -42,62 +43,62 @@ class EbayScraper(PlaywrightScraperBase, IScraper):
 
         # First, visit main eBay site to establish session (helps bypass anti-bot)
         try:
-            session_page = await self.context.new_page()
-            try:
-                logger.debug("Establishing eBay session...")
-                await session_page.goto("https://www.ebay.com", wait_until='domcontentloaded', timeout=15000)
-                await asyncio.sleep(random.uniform(1.5, 3.0))  # Human-like pause
-            except Exception as e:
-                logger.warning(f"Failed to visit eBay main site (continuing anyway): {e}")
-            finally:
-                await session_page.close()
+            async with self.open_page() as session_page:
+                try:
+                    logger.debug("Establishing eBay session...")
+                    await session_page.goto("https://www.ebay.com", wait_until='domcontentloaded', timeout=15000)
+                    await asyncio.sleep(random.uniform(1.5, 3.0))  # Human-like pause
+                except Exception as e:
+                    logger.warning(f"Failed to visit eBay main site (continuing anyway): {e}")
         except Exception as e:
             logger.warning(f"Error establishing eBay session: {e}")
 
-        page = await self.context.new_page()
         try:
-            logger.info(f"Fetching eBay URL: {url}")
+            async with self.open_page() as page:
+                logger.info(f"Fetching eBay URL: {url}")
             
-            # Navigate with longer timeout
-            response = await page.goto(url, wait_until='domcontentloaded', timeout=60000)
+                # Navigate with longer timeout
+                response = await page.goto(url, wait_until='domcontentloaded', timeout=60000)
             
-            if not response:
-                return ScrapeResult(status=ScrapeStatus.ERROR, error_message="No response received")
+                if not response:
+                    return ScrapeResult(status=ScrapeStatus.ERROR, error_message="No response received")
             
-            if response.status >= 400:
-                html = await page.content()
-                if "Checking your browser" in html or "Pardon Our Interruption" in html:
-                    logger.error("eBay anti-bot protection detected - blocking automated access")
-                    return ScrapeResult(status=ScrapeStatus.BLOCKED, error_message="Anti-bot detection triggered")
-                return ScrapeResult(status=ScrapeStatus.ERROR, error_message=f"HTTP Error {response.status}")
-            
-            # Human-like wait
-            await asyncio.sleep(random.uniform(2.0, 4.0))
+                if response.status >= 400:
+                    html = await page.content()
+                    if "Checking your browser" in html or "Pardon Our Interruption" in html:
+                        logger.error("eBay anti-bot protection detected - blocking automated access")
+                        return ScrapeResult(status=ScrapeStatus.BLOCKED, error_message="Anti-bot detection triggered")
+                    return ScrapeResult(status=ScrapeStatus.ERROR, error_message=f"HTTP Error {response.status}")
             
-            # Scroll to trigger lazy loading
-            await self._human_scroll(page)
+                # Human-like wait
+                await asyncio.sleep(random.uniform(2.0, 4.0))
             
-            html = await page.content()
+                # Scroll to trigger lazy loading
+                await self._human_scroll(page)
             
-            # Check again for anti-bot page after waiting
-            if "Checking your browser" in html or "Pardon Our Interruption" in html:
-                logger.error("eBay anti-bot protection detected after page load")
-                return ScrapeResult(status=ScrapeStatus.BLOCKED, error_message="Anti-bot detection triggered (post-load)")
-            
-            # Parse
-            data: EbayCoinData = self.parser.parse(html, url)
+                html = await page.content()
             
-            if not data:
-                 return ScrapeResult(status=ScrapeStatus.ERROR, error_message="Parser returned no data")
+                # Check again for anti-bot page after waiting
+                if "Checking your browser" in html or "Pardon Our Interruption" in html:
+                    logger.error("eBay anti-bot protection detected after page load")
+                    return ScrapeResult(status=ScrapeStatus.BLOCKED, error_message="Anti-bot detection triggered (post-load)")
+                tracker = get_change_tracker() if if_changed else None
+                fetched = self._track_page(url, response.status, html, response.headers, tracker)
+                if fetched is None:
+                    return ScrapeResult(status=ScrapeStatus.UNCHANGED)
+            
+                # Parse
+                data: EbayCoinData = self.parser.parse(html, url)
+            
+                if not data:
+                     return ScrapeResult(status=ScrapeStatus.ERROR, error_message="Parser returned no data")
 
-            lot = self._map_to_domain(data)
-            return ScrapeResult(status=ScrapeStatus.SUCCESS, data=lot)
+                lot = self._map_to_domain(data)
+                return ScrapeResult(status=ScrapeStatus.SUCCESS, data=lot, on_persisted=fetched.on_persisted)
             
         except Exception as e:
             logger.exception(f"Error scraping eBay URL {url}: {e}")
             return ScrapeResult(status=ScrapeStatus.ERROR, error_message=str(e))
-        finally:
-            await page.close()
 
     async def _human_scroll(self, page):
         """Simulate human scrolling."""
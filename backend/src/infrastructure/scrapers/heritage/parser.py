@@ -16,6 +16,7 @@ from .models import (
     ProvenanceEntry, HeritageImage, AuctionInfo, HeritageAuctionType,
     HeritageMetal, SlabGrade, RawGrade, GradingService
 )
+from src.infrastructure.scrapers.shared.reference_patterns import ReferenceScanner, build_references
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +89,7 @@ class HeritageParser:
         # Calicó
         (re.compile(r'Calicó\s+(?P<num>\d+[a-z]?)', re.I), 'Calicó'),
     ]
+    _REFERENCE_SCANNER = ReferenceScanner(REFERENCE_PATTERNS)
     
     def __init__(self):
         self.soup: Optional[BeautifulSoup] = None
@@ -371,21 +373,7 @@ class HeritageParser:
     
     def _extract_references(self, text: str) -> list[CatalogReference]:
         """Extract catalog references from description"""
-        references = []
-        
-        for pattern, catalog in self.REFERENCE_PATTERNS:
-            for match in pattern.finditer(text):
-                raw = match.group(0)
-                groups = match.groupdict()
-                
-                references.append(CatalogReference(
-                    catalog=catalog,
-                    volume=groups.get('vol'),
-                    number=groups.get('num', ''),
-                    raw_text=raw
-                ))
-        
-        return references
+        return build_references(self._REFERENCE_SCANNER, text, CatalogReference)
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # GRADING
@@ -12,6 +12,7 @@ from pathlib import Path
 from src.domain.services.scraper_service import IScraper, ScrapeResult, ScrapeStatus
 from src.domain.auction import AuctionLot
 from src.infrastructure.scrapers.base_playwright import PlaywrightScraperBase
+from src.infrastructure.scrapers.change_detection import get_change_tracker
 
 from .parser import HeritageParser
 from .models import HeritageCoinData
@@ -27,6 +28,9 @@ class HeritageScraper(PlaywrightScraperBase, IScraper):
 
     BASE_URL = "https://coins.ha.com"
 
+    # Lot pages are /a/<auction>-<lot>.s; index pages link the next page with rel="next"
+    LOT_LINK_PATTERN = r'/a/\d+-\d+\.s'
+
     def __init__(self, headless: bool = True):
         super().__init__(headless=headless, source="heritage")
         self.parser = HeritageParser()
@@ -34,7 +38,7 @@ class HeritageScraper(PlaywrightScraperBase, IScraper):
     def can_handle(self, url: str) -> bool:
         return "coins.ha.com" in url or "heritage" in url.lower()
     
-    async def scrape(self, url: str) -> ScrapeResult:
+    async def scrape(self, url: str, if_changed: bool = False) -> ScrapeResult:
         """Scrape a Heritage lot URL with automatic rate limiting and retry."""
         if not await self.ensure_browser():
             return ScrapeResult(status=ScrapeStatus.ERROR, error_message="Failed to start browser")
@@ -42,81 +46,83 @@ class HeritageScraper(PlaywrightScraperBase, IScraper):
         # Enforce rate limiting (handled by base class)
         await self._enforce_rate_limit()
 
-        page = await self.context.new_page()
         try:
-            # Set extra headers for Heritage
-            await page.set_extra_http_headers({
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Referer': 'https://coins.ha.com/',
-            })
+            async with self.open_page() as page:
+                # Set extra headers for Heritage
+                await page.set_extra_http_headers({
+                    'Accept-Language': 'en-US,en;q=0.9',
+                    'Referer': 'https://coins.ha.com/',
+                })
 
-            logger.info(f"Fetching Heritage URL: {url}")
-            response = await page.goto(url, wait_until='domcontentloaded', timeout=45000)
+                logger.info(f"Fetching Heritage URL: {url}")
+                response = await page.goto(url, wait_until='domcontentloaded', timeout=45000)
             
-            if not response:
-                return ScrapeResult(status=ScrapeStatus.ERROR, error_message="No response received")
+                if not response:
+                    return ScrapeResult(status=ScrapeStatus.ERROR, error_message="No response received")
 
-            if response.status == 404:
-                return ScrapeResult(status=ScrapeStatus.NOT_FOUND, error_message="Lot not found")
+                if response.status == 404:
+                    return ScrapeResult(status=ScrapeStatus.NOT_FOUND, error_message="Lot not found")
             
-            if response.status in (403, 429):
-                return ScrapeResult(status=ScrapeStatus.BLOCKED, error_message=f"Blocked (HTTP {response.status})")
+                if response.status in (403, 429):
+                    return ScrapeResult(status=ScrapeStatus.BLOCKED, error_message=f"Blocked (HTTP {response.status})")
             
-            if response.status >= 400:
-                return ScrapeResult(status=ScrapeStatus.ERROR, error_message=f"HTTP Error {response.status}")
+                if response.status >= 400:
+                    return ScrapeResult(status=ScrapeStatus.ERROR, error_message=f"HTTP Error {response.status}")
             
-            # Wait for key elements
-            try:
-                await page.wait_for_selector('.lot-title', timeout=10000)
-            except Exception:
-                pass # Try parsing anyway
+                # Wait for key elements
+                try:
+                    await page.wait_for_selector('.lot-title', timeout=10000)
+                except Exception:
+                    pass # Try parsing anyway
             
-            # Enhance data with JS (Prices aren't always in static HTML)
-            js_data = await page.evaluate('''() => {
-                const result = {};
+                # Enhance data with JS (Prices aren't always in static HTML)
+                js_data = await page.evaluate('''() => {
+                    const result = {};
                 
-                // Price
-                const priceEl = document.querySelector('.price-sold, .bid-price, [class*="Price"]');
-                if (priceEl) {
-                    const match = priceEl.innerText.match(/\$([\d,]+)/);
-                    if (match) result.sold_price = parseInt(match[1].replace(',', ''));
-                }
+                    // Price
+                    const priceEl = document.querySelector('.price-sold, .bid-price, [class*="Price"]');
+                    if (priceEl) {
+                        const match = priceEl.innerText.match(/\$([\d,]+)/);
+                        if (match) result.sold_price = parseInt(match[1].replace(',', ''));
+                    }
                 
-                // Estimates
-                const estEl = document.querySelector('.estimate, [class*="stimate"]');
-                if (estEl) {
-                    const match = estEl.innerText.match(/\$([\d,]+)\s*[-–]\s*\$([\d,]+)/);
-                    if (match) {
-                        result.estimate_low = parseInt(match[1].replace(',', ''));
-                        result.estimate_high = parseInt(match[2].replace(',', ''));
+                    // Estimates
+                    const estEl = document.querySelector('.estimate, [class*="stimate"]');
+                    if (estEl) {
+                        const match = estEl.innerText.match(/\$([\d,]+)\s*[-–]\s*\$([\d,]+)/);
+                        if (match) {
+                            result.estimate_low = parseInt(match[1].replace(',', ''));
+                            result.estimate_high = parseInt(match[2].replace(',', ''));
+                        }
                     }
-                }
                 
-                return result;
-            }''')
-            
-            html = await page.content()
-            
-            # Parse Structured Data
-            data: HeritageCoinData = self.parser.parse(html, url)
-            
-            # Merge JS data
-            if data.auction:
-                if js_data.get('sold_price'):
-                    data.auction.sold_price_usd = js_data['sold_price']
-                    data.auction.is_sold = True
-                if js_data.get('estimate_low'):
-                    data.auction.estimate_low_usd = js_data['estimate_low']
-                    data.auction.estimate_high_usd = js_data['estimate_high']
-            
-            lot = self._map_to_domain(data)
-            return ScrapeResult(status=ScrapeStatus.SUCCESS, data=lot)
+                    return result;
+                }''')
+            
+                html = await page.content()
+                tracker = get_change_tracker() if if_changed else None
+                fetched = self._track_page(url, response.status, html, response.headers, tracker)
+                if fetched is None:
+                    return ScrapeResult(status=ScrapeStatus.UNCHANGED)
+            
+                # Parse Structured Data
+                data: HeritageCoinData = self.parser.parse(html, url)
+            
+                # Merge JS data
+                if data.auction:
+                    if js_data.get('sold_price'):
+                        data.auction.sold_price_usd = js_data['sold_price']
+                        data.auction.is_sold = True
+                    if js_data.get('estimate_low'):
+                        data.auction.estimate_low_usd = js_data['estimate_low']
+                        data.auction.estimate_high_usd = js_data['estimate_high']
+            
+                lot = self._map_to_domain(data)
+                return ScrapeResult(status=ScrapeStatus.SUCCESS, data=lot, on_persisted=fetched.on_persisted)
             
         except Exception as e:
             logger.exception(f"Error scraping Heritage URL {url}: {e}")
             return ScrapeResult(status=ScrapeStatus.ERROR, error_message=str(e))
-        finally:
-            await page.close()
 
     def _map_to_domain(self, data: HeritageCoinData) -> AuctionLot:
         """Map Heritage-specific model to generic Domain AuctionLot."""
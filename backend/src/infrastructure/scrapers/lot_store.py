@@ -0,0 +1,276 @@
+"""Local store of crawled auction lots, with crawl checkpoints.
+
+Sale crawls (scrapers/sale_crawler.py) write every lot they fetch here rather
+than to auction_data_v2, which holds lots linked to collection coins. Lots are
+indexed by source, sale, issuer and change time so wishlist matching can read
+just the lots that are new or changed since its last run.
+
+Each sale crawl is checkpointed: the next index page to read and one queue row
+per discovered lot URL with its status. A crawl interrupted after 1,000 of
+3,000 lots resumes at the first lot not yet done. The store's own
+page_validators table (PageChangeTracker) lets a re-crawl skip unchanged lots.
+"""
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, fields
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from src.domain.auction import AuctionLot
+from src.infrastructure.config import get_settings
+from src.infrastructure.scrapers.change_detection import PageChangeTracker
+
+_DECIMAL_FIELDS = {f.name for f in fields(AuctionLot) if "Decimal" in str(f.type)}
+
+# Lot queue statuses
+PENDING = "pending"
+UPDATED = "updated"  # New or changed, written to lots
+UNCHANGED = "unchanged"
+FAILED = "failed"
+DISALLOWED = "disallowed"  # robots.txt
+
+
+def _lot_to_json(lot: AuctionLot) -> str:
+    return json.dumps(asdict(lot), default=str)
+
+
+def _lot_from_json(data: str) -> AuctionLot:
+    values = json.loads(data)
+    for name in _DECIMAL_FIELDS:
+        if values.get(name) is not None:
+            values[name] = Decimal(values[name])
+    if values.get("auction_date"):
+        values["auction_date"] = date.fromisoformat(values["auction_date"])
+    return AuctionLot(**values)
+
+
+@dataclass(frozen=True)
+class CrawlCheckpoint:
+    sale_url: str
+    source: str
+    next_index_url: Optional[str]  # None once every index page has been read
+    index_pages: int
+    started_at: float
+    finished_at: Optional[float]
+
+    @property
+    def index_done(self) -> bool:
+        return self.next_index_url is None
+
+
+class LocalLotStore:
+    """Crawled AuctionLots and crawl progress in one SQLite file."""
+
+    def __init__(self, db_path: str = "data/lot_store.sqlite", clock=time.time):
+        self.db_path = Path(db_path)
+        self._clock = clock
+        self._local = threading.local()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._get_conn()
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS lots (
+                url TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                sale_url TEXT,
+                issuer TEXT,
+                data TEXT NOT NULL,
+                crawled_at REAL NOT NULL,
+                changed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_lots_source ON lots(source);
+            CREATE INDEX IF NOT EXISTS ix_lots_sale ON lots(sale_url);
+            CREATE INDEX IF NOT EXISTS ix_lots_issuer ON lots(issuer COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS ix_lots_changed ON lots(changed_at);
+            CREATE TABLE IF NOT EXISTS crawls (
+                sale_url TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                next_index_url TEXT,
+                index_pages INTEGER NOT NULL DEFAULT 0,
+                started_at REAL NOT NULL,
+                finished_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS crawl_queue (
+                sale_url TEXT NOT NULL,
+                lot_url TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                error TEXT,
+                PRIMARY KEY (sale_url, lot_url)
+            );
+            CREATE INDEX IF NOT EXISTS ix_crawl_queue_status ON crawl_queue(sale_url, status, position);
+            """
+        )
+        conn.commit()
+        self.tracker = PageChangeTracker(str(self.db_path), clock=clock)
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if not hasattr(self._local, "conn"):
+            self._local.conn = sqlite3.connect(str(self.db_path))
+        return self._local.conn
+
+    # Lots
+
+    def has(self, url: str) -> bool:
+        return self._get_conn().execute("SELECT 1 FROM lots WHERE url = ?", (url,)).fetchone() is not None
+
+    def get(self, url: str) -> Optional[AuctionLot]:
+        row = self._get_conn().execute("SELECT data FROM lots WHERE url = ?", (url,)).fetchone()
+        return _lot_from_json(row[0]) if row else None
+
+    def put(self, url: str, lot: AuctionLot, source: str, sale_url: Optional[str] = None) -> None:
+        """Store lot under the URL it was crawled from (new or changed)."""
+        now = self._clock()
+        conn = self._get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO lots (url, source, sale_url, issuer, data, crawled_at, changed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (url, source, sale_url, lot.issuer, _lot_to_json(lot), now, now),
+        )
+        conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Record that url was re-crawled and found unchanged."""
+        conn = self._get_conn()
+        conn.execute("UPDATE lots SET crawled_at = ? WHERE url = ?", (self._clock(), url))
+        conn.commit()
+
+    def lots(
+        self,
+        source: Optional[str] = None,
+        sale_url: Optional[str] = None,
+        issuer: Optional[str] = None,
+        changed_since: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[AuctionLot]:
+        """Stored lots, optionally filtered; issuer matches case-insensitively."""
+        sql = "SELECT data FROM lots WHERE 1 = 1"
+        params: list = []
+        if source:
+            sql += " AND source = ?"
+            params.append(source)
+        if sale_url:
+            sql += " AND sale_url = ?"
+            params.append(sale_url)
+        if issuer:
+            sql += " AND issuer = ? COLLATE NOCASE"
+            params.append(issuer)
+        if changed_since is not None:
+            sql += " AND changed_at >= ?"
+            params.append(changed_since)
+        sql += " ORDER BY changed_at, url"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [_lot_from_json(row[0]) for row in self._get_conn().execute(sql, params)]
+
+    def count(self, source: Optional[str] = None) -> int:
+        if source:
+            return self._get_conn().execute("SELECT COUNT(*) FROM lots WHERE source = ?", (source,)).fetchone()[0]
+        return self._get_conn().execute("SELECT COUNT(*) FROM lots").fetchone()[0]
+
+    # Crawl checkpoints
+
+    def checkpoint(self, sale_url: str) -> Optional[CrawlCheckpoint]:
+        row = self._get_conn().execute(
+            "SELECT sale_url, source, next_index_url, index_pages, started_at, finished_at "
+            "FROM crawls WHERE sale_url = ?",
+            (sale_url,),
+        ).fetchone()
+        return CrawlCheckpoint(*row) if row else None
+
+    def begin_crawl(self, sale_url: str, source: str) -> CrawlCheckpoint:
+        """
+        Resume an unfinished crawl of sale_url, or start a new pass: index from
+        the first page, every known lot queued again (re-checked for changes).
+        """
+        existing = self.checkpoint(sale_url)
+        if existing is not None and existing.finished_at is None:
+            return existing
+        conn = self._get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO crawls (sale_url, source, next_index_url, index_pages, started_at, finished_at) "
+            "VALUES (?, ?, ?, 0, ?, NULL)",
+            (sale_url, source, sale_url, self._clock()),
+        )
+        conn.execute("UPDATE crawl_queue SET status = ?, error = NULL WHERE sale_url = ?", (PENDING, sale_url))
+        conn.commit()
+        return self.checkpoint(sale_url)
+
+    def enqueue(self, sale_url: str, lot_urls: Iterable[str]) -> int:
+        """Queue lot URLs not yet known for this sale; returns how many were new."""
+        conn = self._get_conn()
+        position = conn.execute(
+            "SELECT COALESCE(MAX(position), -1) FROM crawl_queue WHERE sale_url = ?", (sale_url,)
+        ).fetchone()[0]
+        added = 0
+        for lot_url in lot_urls:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO crawl_queue (sale_url, lot_url, position, status) VALUES (?, ?, ?, ?)",
+                (sale_url, lot_url, position + 1, PENDING),
+            )
+            if cursor.rowcount:
+                position += 1
+                added += 1
+        conn.commit()
+        return added
+
+    def index_page_done(self, sale_url: str, next_index_url: Optional[str]) -> None:
+        """Checkpoint after one index page: where to continue (None = index complete)."""
+        conn = self._get_conn()
+        conn.execute(
+            "UPDATE crawls SET next_index_url = ?, index_pages = index_pages + 1 WHERE sale_url = ?",
+            (next_index_url, sale_url),
+        )
+        conn.commit()
+
+    def pending_lots(self, sale_url: str) -> List[str]:
+        """Lot URLs still to fetch (pending or failed last time), in discovery order."""
+        rows = self._get_conn().execute(
+            "SELECT lot_url FROM crawl_queue WHERE sale_url = ? AND status IN (?, ?) ORDER BY position",
+            (sale_url, PENDING, FAILED),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def mark_lot(self, sale_url: str, lot_url: str, status: str, error: Optional[str] = None) -> None:
+        conn = self._get_conn()
+        conn.execute(
+            "UPDATE crawl_queue SET status = ?, error = ? WHERE sale_url = ? AND lot_url = ?",
+            (status, error, sale_url, lot_url),
+        )
+        conn.commit()
+
+    def queue_counts(self, sale_url: str) -> dict:
+        rows = self._get_conn().execute(
+            "SELECT status, COUNT(*) FROM crawl_queue WHERE sale_url = ? GROUP BY status", (sale_url,)
+        ).fetchall()
+        return dict(rows)
+
+    def finish_crawl(self, sale_url: str) -> None:
+        conn = self._get_conn()
+        conn.execute("UPDATE crawls SET finished_at = ? WHERE sale_url = ?", (self._clock(), sale_url))
+        conn.commit()
+
+
+_lot_store: Optional[LocalLotStore] = None
+_lot_store_lock = threading.Lock()
+
+
+def get_lot_store() -> LocalLotStore:
+    """Process-wide store at SCRAPER_LOT_STORE_PATH."""
+    global _lot_store
+    if _lot_store is None:
+        with _lot_store_lock:
+            if _lot_store is None:
+                _lot_store = LocalLotStore(get_settings().SCRAPER_LOT_STORE_PATH)
+    return _lot_store
+
+
+def set_lot_store(store: Optional[LocalLotStore]) -> None:
+    """Replace the store (tests); None re-reads settings on next use."""
+    global _lot_store
+    _lot_store = store
@@ -10,7 +10,7 @@ class MockScraper(IScraper):
     def can_handle(self, url: str) -> bool:
         return "mock-auction.com" in url
 
-    async def scrape(self, url: str) -> ScrapeResult:
+    async def scrape(self, url: str, if_changed: bool = False) -> ScrapeResult:
         # Simulate network delay
         await asyncio.sleep(0.01)
         
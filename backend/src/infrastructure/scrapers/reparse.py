@@ -0,0 +1,129 @@
+"""Offline re-parse of stored lot HTML into auction_data_v2.
+
+Runs the current parsers over the newest snapshot of every lot that already
+has an auction_data_v2 row, in a process pool (parsing is CPU-bound
+BeautifulSoup work), and writes the results back with bulk updates. No
+network access: pages come from HtmlSnapshotStore. As with a live scrape,
+only fields the parser found overwrite the row, so values Heritage reads via
+JavaScript (sold price, estimates) are kept when the static HTML lacks them.
+"""
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.domain.auction import AuctionLot
+from src.infrastructure.persistence.orm import AuctionDataModel
+from src.infrastructure.repositories.auction_data_repository import SqlAlchemyAuctionDataRepository
+from src.infrastructure.scrapers.snapshot_store import HtmlSnapshotStore, read_snapshot
+
+logger = logging.getLogger(__name__)
+
+_URL_CHUNK = 500  # URLs per IN (...) lookup
+
+
+def _scraper_classes() -> dict:
+    # Imported here so worker processes pay for the scraper imports only once they run
+    from src.infrastructure.scrapers.agora.scraper import AgoraScraper
+    from src.infrastructure.scrapers.biddr.scraper import BiddrScraper
+    from src.infrastructure.scrapers.cng.scraper import CNGScraper
+    from src.infrastructure.scrapers.ebay.scraper import EbayScraper
+    from src.infrastructure.scrapers.heritage.scraper import HeritageScraper
+    return {
+        "heritage": HeritageScraper,
+        "cng": CNGScraper,
+        "biddr": BiddrScraper,
+        "ebay": EbayScraper,
+        "agora": AgoraScraper,
+    }
+
+
+_scrapers: Dict[str, object] = {}
+
+
+def reparse_snapshot(task: Tuple[str, str, str]) -> Tuple[str, Optional[AuctionLot], Optional[str]]:
+    """(source, url, blob path) -> (url, lot, error). Runs in a worker process."""
+    source, url, path = task
+    try:
+        scraper = _scrapers.get(source)
+        if scraper is None:
+            scraper = _scraper_classes()[source]()
+            _scrapers[source] = scraper
+        return url, scraper.parse_html(read_snapshot(path), url), None
+    except Exception as e:
+        return url, None, f"{type(e).__name__}: {e}"
+
+
+@dataclass
+class ReparseStats:
+    snapshots: int = 0  # Latest snapshots considered
+    without_row: int = 0  # Snapshots whose URL has no auction_data_v2 row
+    updated: int = 0
+    failed: int = 0
+    errors: List[Tuple[str, str]] = field(default_factory=list)  # (url, error), first 20
+
+
+def _row_ids(session: Session, urls: List[str]) -> Dict[str, int]:
+    ids: Dict[str, int] = {}
+    for start in range(0, len(urls), _URL_CHUNK):
+        chunk = urls[start:start + _URL_CHUNK]
+        rows = session.query(AuctionDataModel.url, AuctionDataModel.id).filter(AuctionDataModel.url.in_(chunk))
+        ids.update({url: row_id for url, row_id in rows})
+    return ids
+
+
+def _results(tasks: list, workers: Optional[int]) -> Iterator[Tuple[str, Optional[AuctionLot], Optional[str]]]:
+    if workers == 0:
+        yield from map(reparse_snapshot, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(reparse_snapshot, tasks, chunksize=16)
+
+
+def reparse_snapshots(
+    session: Session,
+    store: HtmlSnapshotStore,
+    source: Optional[str] = None,
+    since: Optional[float] = None,
+    workers: Optional[int] = None,
+    batch_size: int = 200,
+    dry_run: bool = False,
+) -> ReparseStats:
+    """
+    Re-parse the latest snapshot of each stored lot and bulk-update its row.
+
+    workers=None uses one process per CPU; 0 parses in this process.
+    """
+    stats = ReparseStats()
+    records = store.latest(source=source, since=since)
+    stats.snapshots = len(records)
+    row_ids = _row_ids(session, [r.url for r in records])
+    stats.without_row = len(records) - len(row_ids)
+    fetched = {r.url: r.fetched_at for r in records}
+    tasks = [(r.source, r.url, str(store.blob_path(r.sha256))) for r in records if r.url in row_ids]
+
+    repo = SqlAlchemyAuctionDataRepository(session)
+    pending: List[Tuple[int, AuctionLot, date]] = []
+
+    def flush() -> None:
+        if pending and not dry_run:
+            repo.bulk_update(pending)
+            session.commit()
+        pending.clear()
+
+    for url, lot, error in _results(tasks, workers):
+        if lot is None:
+            stats.failed += 1
+            if len(stats.errors) < 20:
+                stats.errors.append((url, error))
+            logger.warning("Re-parse failed for %s: %s", url, error)
+            continue
+        pending.append((row_ids[url], lot, date.fromtimestamp(fetched[url])))
+        stats.updated += 1
+        if len(pending) >= batch_size:
+            flush()
+    flush()
+    return stats
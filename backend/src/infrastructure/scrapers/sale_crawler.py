@@ -0,0 +1,160 @@
+"""Whole-sale crawl mode: walk a sale's index pages and fetch every lot.
+
+A SaleCrawler pairs one house scraper (its LOT_LINK_PATTERN finds lot links,
+next_index_url pages through the index) with the LocalLotStore. Every index
+and lot request is checked against robots.txt (RobotsCache) and spaced by the
+per-host CrawlScheduler, at no less than the house's SCRAPER_RATE_LIMITS delay.
+
+Progress is checkpointed in the store after every index page and every lot,
+so an interrupted crawl resumes where it stopped. Lots already in the store
+are fetched conditionally (ETag / Last-Modified / content hash kept in the
+store's own validators), so a re-crawl only parses and writes lots that are
+new or changed.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from src.domain.services.scraper_service import ScrapeStatus
+from src.infrastructure.config import get_settings
+from src.infrastructure.scrapers.base_playwright import PlaywrightScraperBase
+from src.infrastructure.scrapers.change_detection import use_change_tracker
+from src.infrastructure.scrapers.lot_store import DISALLOWED, FAILED, PENDING, UNCHANGED, UPDATED, LocalLotStore
+from src.infrastructure.services.catalogs.crawl_scheduler import CrawlScheduler, get_crawl_scheduler
+from src.infrastructure.services.catalogs.robots_cache import is_allowed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_INDEX_PAGES = 500
+
+
+@dataclass
+class SaleCrawlReport:
+    sale_url: str
+    source: str
+    resumed: bool = False
+    index_pages: int = 0
+    discovered: int = 0  # Lot URLs first seen in this run
+    fetched: int = 0
+    updated: int = 0  # New or changed lots written to the store
+    unchanged: int = 0
+    failed: int = 0
+    disallowed: int = 0
+    errors: List[Tuple[str, str]] = field(default_factory=list)
+    started_at: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return {**vars(self), "errors": [list(e) for e in self.errors]}
+
+
+class SaleCrawler:
+    """Crawls one auction house's sales into a LocalLotStore."""
+
+    def __init__(
+        self,
+        scraper: PlaywrightScraperBase,
+        store: LocalLotStore,
+        scheduler: Optional[CrawlScheduler] = None,
+        user_agent: Optional[str] = None,
+        max_index_pages: int = DEFAULT_MAX_INDEX_PAGES,
+    ):
+        if not scraper.LOT_LINK_PATTERN:
+            raise ValueError(f"No crawl mode for source '{scraper.source}'")
+        self.scraper = scraper
+        self.store = store
+        self._scheduler = scheduler
+        settings = get_settings()
+        self.user_agent = user_agent or settings.SCRAPER_CRAWL_USER_AGENT
+        self.max_index_pages = max_index_pages
+        self.min_delay_sec = settings.SCRAPER_RATE_LIMITS.get(
+            scraper.source, settings.SCRAPER_RATE_LIMITS.get("default", 2.0)
+        )
+
+    @property
+    def scheduler(self) -> CrawlScheduler:
+        return self._scheduler or get_crawl_scheduler()
+
+    async def crawl(self, sale_url: str, max_lots: Optional[int] = None) -> SaleCrawlReport:
+        """Crawl (or resume crawling) sale_url; max_lots caps lot fetches in this run."""
+        previous = self.store.checkpoint(sale_url)
+        checkpoint = self.store.begin_crawl(sale_url, self.scraper.source)
+        report = SaleCrawlReport(
+            sale_url=sale_url,
+            source=self.scraper.source,
+            resumed=previous is not None and previous.finished_at is None,
+            started_at=checkpoint.started_at,
+        )
+        if report.resumed:
+            logger.info(f"Resuming crawl of {sale_url} ({self.store.queue_counts(sale_url)})")
+
+        await self._crawl_index(sale_url, checkpoint.next_index_url, checkpoint.index_pages, report)
+        with use_change_tracker(self.store.tracker):
+            await self._crawl_lots(sale_url, max_lots, report)
+
+        # Failed lots are retried on resume and again on the next full pass
+        if not self.store.queue_counts(sale_url).get(PENDING) and self.store.checkpoint(sale_url).index_done:
+            self.store.finish_crawl(sale_url)
+        logger.info(
+            f"Crawl of {sale_url}: {report.discovered} new lot URLs, {report.updated} updated, "
+            f"{report.unchanged} unchanged, {report.failed} failed, {report.disallowed} disallowed"
+        )
+        return report
+
+    async def _crawl_index(self, sale_url: str, page_url: Optional[str], pages_read: int,
+                           report: SaleCrawlReport) -> None:
+        seen = set()
+        while page_url is not None:
+            if pages_read >= self.max_index_pages:
+                logger.warning(f"Stopping index of {sale_url} after {pages_read} pages")
+                self.store.index_page_done(sale_url, None)
+                return
+            if not await is_allowed(self.user_agent, page_url):
+                logger.warning(f"robots.txt disallows sale index {page_url}")
+                self.store.index_page_done(sale_url, None)
+                return
+            html = await self.scheduler.submit(
+                page_url, lambda url=page_url: self.scraper.fetch_index_page(url), self.min_delay_sec
+            )
+            lot_urls = self.scraper.discover_lot_urls(html, page_url)
+            report.discovered += self.store.enqueue(sale_url, lot_urls)
+            report.index_pages += 1
+            pages_read += 1
+            # A page without lots not already seen in this run is past the end of the sale
+            fresh = set(lot_urls) - seen
+            seen.update(lot_urls)
+            next_url = self.scraper.next_index_url(html, page_url) if fresh else None
+            if next_url == page_url:
+                next_url = None
+            self.store.index_page_done(sale_url, next_url)
+            page_url = next_url
+
+    async def _crawl_lots(self, sale_url: str, max_lots: Optional[int], report: SaleCrawlReport) -> None:
+        for lot_url in self.store.pending_lots(sale_url):
+            if max_lots is not None and report.fetched >= max_lots:
+                return
+            if not await is_allowed(self.user_agent, lot_url):
+                self.store.mark_lot(sale_url, lot_url, DISALLOWED)
+                report.disallowed += 1
+                continue
+            if not self.store.has(lot_url):
+                # Validators left by a fetch whose lot never reached the store
+                self.store.tracker.forget(lot_url)
+            result = await self.scheduler.submit(
+                lot_url, lambda url=lot_url: self.scraper.scrape(url, if_changed=True), self.min_delay_sec
+            )
+            report.fetched += 1
+            if result.status == ScrapeStatus.UNCHANGED:
+                self.store.touch(lot_url)
+                self.store.mark_lot(sale_url, lot_url, UNCHANGED)
+                report.unchanged += 1
+            elif result.status == ScrapeStatus.SUCCESS and result.data:
+                self.store.put(lot_url, result.data, self.scraper.source, sale_url)
+                if result.on_persisted:
+                    result.on_persisted()
+                self.store.mark_lot(sale_url, lot_url, UPDATED)
+                report.updated += 1
+            else:
+                error = result.error_message or result.status.value
+                self.store.mark_lot(sale_url, lot_url, FAILED, error)
+                report.failed += 1
+                report.errors.append((lot_url, error))
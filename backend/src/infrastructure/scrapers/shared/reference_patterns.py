@@ -10,10 +10,16 @@ Usage:
     text = "RIC II.1 756; Crawford 44/5; RSC 162"
     refs = extract_references(text)
     # Returns list of CatalogReference objects
+
+All patterns are combined into one ReferenceScanner, so a long description is
+scanned once (see get_reference_scanner); callers that need spans or want to
+match several things against the same text should use the scanner directly.
 """
 
 import re
-from typing import List, Optional, Tuple, Pattern
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Pattern
 from src.infrastructure.scrapers.shared.models import CatalogReference
 
 
@@ -209,6 +215,212 @@ REFERENCE_PATTERNS: List[Tuple[Pattern, str, bool]] = [
 ]
 
 
+# =============================================================================
+# SINGLE-PASS SCANNER
+# =============================================================================
+
+_SCAN_CACHE_SIZE = 256
+
+_GROUP_NAME = re.compile(r'\(\?P<(\w+)>')
+
+
+def _lowercase_source(source: str) -> str:
+    """
+    Lowercase a case-insensitive pattern's literals so it can run without re.I.
+
+    Escapes (\\d, \\s, \\b, ...) and group names are left as written.
+    """
+    out = []
+    i = 0
+    while i < len(source):
+        ch = source[i]
+        if ch == '\\':
+            out.append(source[i:i + 2])
+            i += 2
+        elif source.startswith('(?P<', i):
+            end = source.index('>', i)
+            out.append(source[i:end + 1])
+            i = end + 1
+        else:
+            out.append(ch.lower())
+            i += 1
+    return ''.join(out)
+
+
+def _lower_same_length(text: str) -> str:
+    """text.lower(), keeping offsets valid for the few characters whose lowercase is longer."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return ''.join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+@dataclass(frozen=True, slots=True)
+class ReferenceMatch:
+    """One catalog reference found by ReferenceScanner, with its span in the scanned text."""
+    catalog: str
+    number: str
+    start: int
+    end: int
+    raw_text: str
+    volume: Optional[str] = None
+    suffix: Optional[str] = None
+    priority: int = 0  # index of the matching pattern in the scanner's table
+
+    @property
+    def normalized(self) -> str:
+        parts = [self.catalog]
+        if self.volume:
+            parts.append(self.volume)
+        parts.append(self.number)
+        return " ".join(parts)
+
+    def to_reference(self, needs_verification: bool = False) -> CatalogReference:
+        return CatalogReference(
+            catalog=self.catalog,
+            volume=self.volume,
+            number=self.number,
+            suffix=self.suffix,
+            raw_text=self.raw_text.strip(),
+            needs_verification=needs_verification,
+        )
+
+
+class ReferenceScanner:
+    """
+    Find every catalog reference in one pass over the text.
+
+    The case-insensitive patterns are lowercased and joined into a single
+    alternation run over text.lower() (same offsets, so spans and raw text come
+    from the original). Each alternative still starts with its catalog keyword,
+    so the regex engine skips branches on their first letter. The alternation
+    only locates positions where some reference starts; there each pattern is
+    matched on its own, so references nested in another one's span (the
+    concordance in "RIC II 118 (RSC 162, Cohen 123)") are still found. Per
+    catalog, matches do not overlap, exactly like running every pattern's
+    finditer in turn. Results are memoized per text, so several consumers of
+    one description share a single scan.
+    """
+
+    def __init__(self, patterns: Sequence[Tuple[Pattern, str]], cache_size: int = _SCAN_CACHE_SIZE):
+        self.catalogs: List[str] = []
+        self._patterns: List[Pattern] = []
+        for pattern, catalog in patterns:
+            self._patterns.append(re.compile(_lowercase_source(pattern.pattern)))
+            self.catalogs.append(catalog)
+        self._candidates = re.compile(
+            '|'.join(_GROUP_NAME.sub('(?:', p.pattern) for p in self._patterns)
+        )
+        self._scan = lru_cache(maxsize=cache_size)(self._scan_uncached)
+
+    def _scan_uncached(self, text: str) -> Tuple[ReferenceMatch, ...]:
+        lowered = _lower_same_length(text)
+        found = []
+        # End of the last match per pattern: like finditer, a pattern resumes after its own match
+        resume_at = [0] * len(self._patterns)
+        candidate = self._candidates.search(lowered)
+        while candidate is not None:
+            pos = candidate.start()
+            for index, pattern in enumerate(self._patterns):
+                if pos < resume_at[index]:
+                    continue
+                match = pattern.match(lowered, pos)
+                if match is None:
+                    continue
+                resume_at[index] = match.end() if match.end() > pos else pos + 1
+                found.append(self._build(text, match, index))
+            candidate = self._candidates.search(lowered, pos + 1)
+        return tuple(found)
+
+    def _build(self, text: str, match: re.Match, index: int) -> ReferenceMatch:
+        groups = match.re.groupindex
+
+        def group(name):
+            if name not in groups or match.start(name) < 0:
+                return None
+            return text[match.start(name):match.end(name)]
+
+        start, end = match.span()
+        return ReferenceMatch(
+            catalog=self.catalogs[index],
+            number=group('num') or '',
+            start=start,
+            end=end,
+            raw_text=text[start:end],
+            volume=group('vol') or group('collection'),
+            suffix=group('suffix'),
+            priority=index,
+        )
+
+    def scan(self, text: Optional[str]) -> Tuple[ReferenceMatch, ...]:
+        """All references in text, in order of position (table order at one position)."""
+        if not text:
+            return ()
+        return self._scan(text)
+
+    def cache_info(self):
+        """functools cache statistics for the per-text memo."""
+        return self._scan.cache_info()
+
+    def cache_clear(self) -> None:
+        self._scan.cache_clear()
+
+
+_reference_scanner: Optional[ReferenceScanner] = None
+
+
+def get_reference_scanner() -> ReferenceScanner:
+    """Shared scanner over REFERENCE_PATTERNS."""
+    global _reference_scanner
+    if _reference_scanner is None:
+        _reference_scanner = ReferenceScanner(
+            [(pattern, catalog) for pattern, catalog, _has_volume in REFERENCE_PATTERNS]
+        )
+    return _reference_scanner
+
+
+def build_references(
+    scanner: ReferenceScanner,
+    text: Optional[str],
+    reference_cls: type,
+    unique_raw_text: bool = False,
+    **extra,
+) -> list:
+    """
+    Scan text and build one reference_cls model per match.
+
+    Scrapers keep their own pattern tables and reference models; this keeps
+    their output order (pattern table first, then position in the text).
+    Fields the model does not declare (e.g. suffix on eBay references) are
+    left out.
+
+    Args:
+        scanner: Scanner over the scraper's REFERENCE_PATTERNS
+        text: Description text
+        reference_cls: Pydantic reference model to build
+        unique_raw_text: Skip matches whose raw text was already returned
+        **extra: Additional fields for every reference (e.g. needs_verification)
+    """
+    fields = reference_cls.model_fields
+    references = []
+    seen_raw: set = set()
+    for match in sorted(scanner.scan(text), key=lambda m: (m.priority, m.start)):
+        if unique_raw_text:
+            if match.raw_text in seen_raw:
+                continue
+            seen_raw.add(match.raw_text)
+        values = {
+            'catalog': match.catalog,
+            'volume': match.volume,
+            'number': match.number,
+            'suffix': match.suffix,
+            'raw_text': match.raw_text,
+            **extra,
+        }
+        references.append(reference_cls(**{k: v for k, v in values.items() if k in fields}))
+    return references
+
+
 # =============================================================================
 # EXTRACTION FUNCTIONS
 # =============================================================================
@@ -232,35 +444,16 @@ def extract_references(
         >>> [r.normalized for r in refs]
         ['RIC II.1 756', 'Crawford 44/5']
     """
-    if not text:
-        return []
-    
     found_refs: List[CatalogReference] = []
     seen_normalized: set = set()
     
-    for pattern, catalog_name, has_volume in REFERENCE_PATTERNS:
-        for match in pattern.finditer(text):
-            groups = match.groupdict()
-            
-            volume = groups.get('vol') or groups.get('collection')
-            number = groups.get('num', '')
-            suffix = groups.get('suffix')
-            raw_text = match.group(0).strip()
-            
-            # Create reference
-            ref = CatalogReference(
-                catalog=catalog_name,
-                volume=volume,
-                number=number,
-                suffix=suffix,
-                raw_text=raw_text,
-                needs_verification=needs_verification
-            )
-            
-            # Deduplicate by normalized form
-            if ref.normalized not in seen_normalized:
-                seen_normalized.add(ref.normalized)
-                found_refs.append(ref)
+    # Table order first (RIC before Crawford, ...), then position in the text
+    matches = sorted(get_reference_scanner().scan(text), key=lambda m: (m.priority, m.start))
+    for match in matches:
+        # Deduplicate by normalized form
+        if match.normalized not in seen_normalized:
+            seen_normalized.add(match.normalized)
+            found_refs.append(match.to_reference(needs_verification))
     
     return found_refs
 
@@ -0,0 +1,137 @@
+"""Content-addressed store of raw lot-page HTML.
+
+Every page a scraper fetches is kept as gzip-compressed HTML named by the
+SHA-256 of its content (objects/ab/abcdef....html.gz), so refetching an
+unchanged page costs one index row and no extra blob. A SQLite index maps
+(url, fetched_at) to the blob and the scraper source. When a parser is fixed,
+scripts/reparse_snapshots.py runs the current parsers over the latest
+snapshot of each lot and updates auction_data_v2 without network access.
+"""
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from src.infrastructure.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SnapshotRecord:
+    url: str
+    source: str
+    fetched_at: float  # Unix time
+    sha256: str
+    size: int  # Uncompressed bytes
+
+
+class HtmlSnapshotStore:
+    """gzip blobs named by content hash plus a (url, fetched_at) index."""
+
+    def __init__(self, root: str = "data/html_snapshots", compress_level: int = 6, clock=time.time):
+        self.root = Path(root)
+        self.compress_level = compress_level
+        self._clock = clock
+        self._local = threading.local()
+        (self.root / "objects").mkdir(parents=True, exist_ok=True)
+        conn = self._get_conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            "url TEXT NOT NULL, source TEXT NOT NULL, fetched_at REAL NOT NULL, "
+            "sha256 TEXT NOT NULL, size INTEGER NOT NULL, PRIMARY KEY (url, fetched_at))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_snapshots_source ON snapshots(source)")
+        conn.commit()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if not hasattr(self._local, "conn"):
+            self._local.conn = sqlite3.connect(str(self.root / "index.sqlite"))
+        return self._local.conn
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.root / "objects" / sha256[:2] / f"{sha256[2:]}.html.gz"
+
+    def put(self, url: str, html: str, source: str, fetched_at: Optional[float] = None) -> SnapshotRecord:
+        """Store html as fetched from url; the blob is written only if its content is new."""
+        data = html.encode("utf-8")
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(sha256)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(gzip.compress(data, self.compress_level))
+            os.replace(tmp, path)
+        record = SnapshotRecord(url, source, fetched_at if fetched_at is not None else self._clock(), sha256, len(data))
+        conn = self._get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO snapshots (url, source, fetched_at, sha256, size) VALUES (?, ?, ?, ?, ?)",
+            (record.url, record.source, record.fetched_at, record.sha256, record.size),
+        )
+        conn.commit()
+        return record
+
+    def read(self, sha256: str) -> str:
+        return read_snapshot(self.blob_path(sha256))
+
+    def history(self, url: str) -> List[SnapshotRecord]:
+        """Every snapshot of url, oldest first."""
+        rows = self._get_conn().execute(
+            "SELECT url, source, fetched_at, sha256, size FROM snapshots WHERE url = ? ORDER BY fetched_at",
+            (url,),
+        ).fetchall()
+        return [SnapshotRecord(*row) for row in rows]
+
+    def latest(self, source: Optional[str] = None, since: Optional[float] = None) -> List[SnapshotRecord]:
+        """Newest snapshot per URL, optionally for one source or fetched at/after since."""
+        query = (
+            "SELECT s.url, s.source, s.fetched_at, s.sha256, s.size FROM snapshots s "
+            "JOIN (SELECT url, MAX(fetched_at) AS fetched_at FROM snapshots GROUP BY url) m "
+            "ON s.url = m.url AND s.fetched_at = m.fetched_at WHERE 1 = 1"
+        )
+        params: list = []
+        if source:
+            query += " AND s.source = ?"
+            params.append(source)
+        if since is not None:
+            query += " AND s.fetched_at >= ?"
+            params.append(since)
+        rows = self._get_conn().execute(query + " ORDER BY s.url", params).fetchall()
+        return [SnapshotRecord(*row) for row in rows]
+
+    def count(self) -> int:
+        return self._get_conn().execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+
+def read_snapshot(path: Path) -> str:
+    """Decompress one blob (usable from worker processes without a store)."""
+    return gzip.decompress(Path(path).read_bytes()).decode("utf-8")
+
+
+_snapshot_store: Optional[HtmlSnapshotStore] = None
+_snapshot_store_lock = threading.Lock()
+
+
+def get_snapshot_store() -> Optional[HtmlSnapshotStore]:
+    """Store at SCRAPER_SNAPSHOT_DIR, or None when snapshots are disabled."""
+    global _snapshot_store
+    if _snapshot_store is None:
+        settings = get_settings()
+        if not settings.SCRAPER_SNAPSHOTS_ENABLED:
+            return None
+        with _snapshot_store_lock:
+            if _snapshot_store is None:
+                _snapshot_store = HtmlSnapshotStore(settings.SCRAPER_SNAPSHOT_DIR)
+    return _snapshot_store
+
+
+def set_snapshot_store(store: Optional[HtmlSnapshotStore]) -> None:
+    """Replace the store (tests); None re-reads settings on next use."""
+    global _snapshot_store
+    _snapshot_store = store
@@ -0,0 +1,141 @@
+"""HTTP-first fetching for auction sites that render lots on the server.
+
+The CNG, Biddr and Agora parsers only read server-rendered HTML, yet every
+fetch went through headless Chromium. Scrapers that declare STATIC_MARKERS
+now try a plain GET first through a pooled per-source httpx client (same
+Accept headers as the browser, cookies kept between requests and copied over
+from the browser context after a fallback). The response is used only when
+it contains every marker the parser needs; otherwise the scraper escalates to
+Playwright. FetchStats counts which path served each source.
+"""
+import logging
+import random
+import re
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Iterable, Optional, Sequence
+
+import httpx
+
+from src.infrastructure.scrapers.browser_pool import USER_AGENTS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_SEC = 30.0
+
+# Sent by PlaywrightScraperBase.fetch_page as well
+BROWSER_HEADERS = {
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+}
+
+
+def _new_client(timeout: float) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        headers={**BROWSER_HEADERS, 'User-Agent': random.choice(USER_AGENTS)},
+        limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+    )
+
+
+class StaticPageFetcher:
+    """One keep-alive httpx client (and cookie jar) per scraper source."""
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT_SEC):
+        self.timeout = timeout
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def client_for(self, source: str) -> httpx.AsyncClient:
+        client = self._clients.get(source)
+        if client is None or client.is_closed:
+            client = _new_client(self.timeout)
+            self._clients[source] = client
+        return client
+
+    def absorb_cookies(self, source: str, cookies: Iterable[dict]) -> None:
+        """Copy Playwright context cookies (context.cookies()) into the source's jar."""
+        jar = self.client_for(source).cookies
+        for cookie in cookies:
+            jar.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+
+    async def aclose(self) -> None:
+        """Close every per-source client (app shutdown)."""
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug("Error closing scraper HTTP client: %s", e)
+
+
+_static_fetcher: Optional[StaticPageFetcher] = None
+
+
+def get_static_fetcher() -> Optional[StaticPageFetcher]:
+    """The app-wide fetcher, or None when each GET should use its own client."""
+    return _static_fetcher
+
+
+def set_static_fetcher(fetcher: Optional[StaticPageFetcher]) -> None:
+    """Install (or clear, with None) the app-wide fetcher."""
+    global _static_fetcher
+    _static_fetcher = fetcher
+
+
+@asynccontextmanager
+async def static_http_client(source: str, timeout: float = DEFAULT_TIMEOUT_SEC) -> AsyncIterator[httpx.AsyncClient]:
+    """Pooled client for source when a fetcher is installed, else a short-lived one."""
+    fetcher = get_static_fetcher()
+    if fetcher is not None:
+        yield fetcher.client_for(source)
+        return
+    async with _new_client(timeout) as client:
+        yield client
+
+
+def has_markers(html: str, markers: Sequence[str]) -> bool:
+    """True when every marker regex occurs in html (case-insensitive)."""
+    return all(re.search(marker, html, re.IGNORECASE) for marker in markers)
+
+
+@dataclass
+class SourceFetchStats:
+    http: int = 0  # Served by the plain GET
+    browser: int = 0  # Served by Playwright (including escalations)
+    escalated_status: int = 0  # GET returned an HTTP error
+    escalated_markers: int = 0  # GET page lacked the parser markers
+    escalated_error: int = 0  # GET raised (timeout, connection reset, ...)
+    unchanged: int = 0  # Refreshes answered 304 or with an identical page
+
+
+class FetchStats:
+    """Per-source counters of which fetch path served each page."""
+
+    def __init__(self):
+        self._sources: Dict[str, SourceFetchStats] = {}
+
+    def record(self, source: str, path: str) -> None:
+        stats = self._sources.setdefault(source, SourceFetchStats())
+        setattr(stats, path, getattr(stats, path) + 1)
+
+    def snapshot(self) -> Dict[str, dict]:
+        result = {}
+        for source, stats in self._sources.items():
+            total = stats.http + stats.browser
+            result[source] = {
+                **vars(stats),
+                "http_ratio": round(stats.http / total, 3) if total else 0.0,
+            }
+        return result
+
+    def reset(self) -> None:
+        self._sources.clear()
+
+
+fetch_stats = FetchStats()
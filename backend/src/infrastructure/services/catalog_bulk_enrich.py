@@ -1,24 +1,45 @@
 """
 Bulk catalog enrichment background task.
 
-Resolves coin set, runs CatalogRegistry.lookup per coin reference,
-builds diff (fills/conflicts), and applies fills via ApplyEnrichmentService.
+Resolves the coin set once (stored on the job), prefetches coins in bulk, and
+runs CatalogRegistry.lookup_many per catalog system: systems run concurrently,
+each with a small number of multi-query chunks in flight and backing off when
+the registry's per-system rate limit refuses a chunk. After each chunk the
+per-coin results (enrichment_job_items) and counters are committed as a
+checkpoint, so a job interrupted by a restart resumes with the coins it has
+not finished (see resume_interrupted_jobs). Fills are applied via
+ApplyEnrichmentService.
 """
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.application.services.apply_enrichment import ApplyEnrichmentService
 from src.application.services.catalog_validation import validate_reference_for_coin
 from src.application.services.reference_sync import sync_coin_references
 from src.domain.enrichment import EnrichmentApplication
-from src.infrastructure.persistence.orm import EnrichmentJobModel
+from src.infrastructure.persistence.orm import EnrichmentJobItemModel, EnrichmentJobModel
 from src.infrastructure.repositories.coin_repository import SqlAlchemyCoinRepository
 from src.infrastructure.services.catalogs.registry import CatalogRegistry
 
 logger = logging.getLogger(__name__)
 
+# Coins looked up per CatalogRegistry.lookup_many call (one checkpoint per chunk)
+_LOOKUP_CHUNK_SIZE = 25
+# Chunks in flight per catalog system (systems run concurrently)
+_CHUNKS_PER_SYSTEM = 2
+# Back-off when the per-system rate limit refuses a chunk
+_RATE_LIMIT_RETRY_SEC = 5.0
+_RATE_LIMIT_MAX_RETRIES = 24
+
+_REQUEST_FIELDS = ("coin_ids", "missing_fields", "reference_system", "category", "dry_run", "max_coins")
+
+# Jobs running in this process (avoid resuming a job twice)
+_active_jobs: Dict[str, asyncio.Task] = {}
+
 
 def _ref_string_from_coin(coin: Any) -> Optional[str]:
     """Get first reference string from coin for catalog lookup."""
@@ -51,145 +72,242 @@ def _payload_to_fills(payload: Dict[str, Any]) -> Dict[str, Any]:
     return fills
 
 
+def _request_to_json(request: Any) -> str:
+    return json.dumps({name: getattr(request, name, None) for name in _REQUEST_FIELDS})
+
+
+def _request_from_json(data: Optional[str]) -> Any:
+    params = json.loads(data) if data else {}
+    return SimpleNamespace(**{name: params.get(name) for name in _REQUEST_FIELDS})
+
+
+def _coin_issuer(coin: Any) -> Optional[str]:
+    return getattr(coin.attribution, "issuer", None) if coin.attribution else None
+
+
+class _JobRun:
+    """State of one run (or resumed run) of a job; all DB work happens on the event loop thread."""
+
+    def __init__(self, session: Any, job: EnrichmentJobModel, request: Any):
+        self.session = session
+        self.job = job
+        self.dry_run = getattr(request, "dry_run", True)
+        self.reference_system = getattr(request, "reference_system", None)
+        self.repo = SqlAlchemyCoinRepository(session)
+        self.apply_service = ApplyEnrichmentService(self.repo)
+
+    # -------------------------------------------------------------------------
+    # Per-coin processing
+    # -------------------------------------------------------------------------
+
+    def _process_result(self, coin: Any, ref_str: str, result: Any) -> Dict[str, Any]:
+        """Apply one lookup result to its coin; returns the result entry."""
+        if result.status == "not_found":
+            return {"coin_id": coin.id, "status": "not_found"}
+        if not (result.status == "success" and result.payload):
+            return {"coin_id": coin.id, "status": str(result.status)}
+
+        from src.infrastructure.services.catalogs.parser import parse_catalog_reference
+        parsed = parse_catalog_reference(ref_str)
+        numismatic = validate_reference_for_coin(
+            catalog=parsed.get("catalog"),
+            number=parsed.get("number"),
+            volume=parsed.get("volume"),
+            coin_category=getattr(coin, "category", None) and getattr(coin.category, "value", None),
+            year_start=getattr(coin.attribution, "year_start", None) if coin.attribution else None,
+            year_end=getattr(coin.attribution, "year_end", None) if coin.attribution else None,
+            issuer=_coin_issuer(coin),
+        )
+        fills = _payload_to_fills(result.payload)
+        applied_any = False
+        if fills and not self.dry_run:
+            for field_name, value in fills.items():
+                app = EnrichmentApplication(
+                    coin_id=coin.id,
+                    field_name=field_name,
+                    new_value=value,
+                    source_type="catalog",
+                    source_id=getattr(result, "external_id", None),
+                )
+                r = self.apply_service.apply(app)
+                if r.success:
+                    applied_any = True
+        # Persist external_id/external_url to ReferenceType for this ref (merge=True to keep existing refs)
+        if getattr(result, "external_id", None) or getattr(result, "external_url", None):
+            try:
+                external_ids = {
+                    ref_str: (getattr(result, "external_id", None), getattr(result, "external_url", None)),
+                }
+                sync_coin_references(
+                    self.session,
+                    coin.id,
+                    [ref_str],
+                    "catalog_lookup",
+                    external_ids=external_ids,
+                    merge=True,
+                )
+            except Exception as sync_err:
+                logger.warning("Reference sync (external_id) failed for coin %s: %s", coin.id, sync_err)
+        status_str = "success" if (applied_any or (fills and self.dry_run)) else ("unchanged" if fills else "no_fills")
+        entry: Dict[str, Any] = {"coin_id": coin.id, "status": status_str, "applied": applied_any}
+        if numismatic.status == "warning" and numismatic.message:
+            entry["numismatic_warning"] = numismatic.message
+        return entry
+
+    def _checkpoint(self, entries: List[Dict[str, Any]]) -> None:
+        """Record per-coin results and counters, then commit."""
+        job = self.job
+        for entry in entries:
+            status = entry["status"]
+            if entry.pop("applied", False):
+                job.updated += 1
+            if status in ("not_found", "no_reference"):
+                job.not_found += 1
+            elif status == "error":
+                job.errors += 1
+            self.session.add(EnrichmentJobItemModel(
+                job_id=job.id,
+                coin_id=entry["coin_id"],
+                status=status,
+                result=json.dumps(entry),
+            ))
+        job.progress += len(entries)
+        job.checkpointed_at = datetime.now(timezone.utc)
+        self.session.commit()
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    async def _lookup_chunk(self, system: str, chunk: List[Tuple[Any, str]]) -> List[Any]:
+        """lookup_many for one chunk, retrying items refused by the rate limit."""
+        results: List[Any] = [None] * len(chunk)
+        todo = list(range(len(chunk)))
+        for attempt in range(_RATE_LIMIT_MAX_RETRIES + 1):
+            found = await CatalogRegistry.lookup_many(
+                system=system,
+                references=[chunk[i][1] for i in todo],
+                contexts=[{"ruler": _coin_issuer(chunk[i][0])} for i in todo],
+            )
+            limited = []
+            for i, result in zip(todo, found):
+                results[i] = result
+                if CatalogRegistry.is_rate_limited(result):
+                    limited.append(i)
+            if not limited or attempt == _RATE_LIMIT_MAX_RETRIES:
+                break
+            todo = limited
+            await asyncio.sleep(_RATE_LIMIT_RETRY_SEC)
+        return results
+
+    async def _run_chunk(self, system: str, chunk: List[Tuple[Any, str]], semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            try:
+                results = await self._lookup_chunk(system, chunk)
+            except Exception as e:
+                logger.exception(f"Catalog lookup failed for coins {[coin.id for coin, _ in chunk]}: {e}")
+                results = [None] * len(chunk)
+        entries = []
+        for (coin, ref_str), result in zip(chunk, results):
+            if result is None:
+                entries.append({"coin_id": coin.id, "status": "error"})
+            else:
+                entries.append(self._process_result(coin, ref_str, result))
+        self._checkpoint(entries)
+
+    async def _run_system(self, system: str, items: List[Tuple[Any, str]]) -> None:
+        semaphore = asyncio.Semaphore(_CHUNKS_PER_SYSTEM)
+        await asyncio.gather(*(
+            self._run_chunk(system, items[start:start + _LOOKUP_CHUNK_SIZE], semaphore)
+            for start in range(0, len(items), _LOOKUP_CHUNK_SIZE)
+        ))
+
+    async def run(self, coin_ids: List[int]) -> None:
+        done = {
+            coin_id for (coin_id,) in self.session.query(EnrichmentJobItemModel.coin_id)
+            .filter(EnrichmentJobItemModel.job_id == self.job.id)
+        }
+        remaining = [coin_id for coin_id in coin_ids if coin_id not in done]
+        if done:
+            logger.info("Bulk enrich job %s resuming: %s done, %s remaining", self.job.id, len(done), len(remaining))
+
+        coins = self.repo.get_by_ids(remaining)
+        missing = set(remaining) - {coin.id for coin in coins}
+        by_system: Dict[str, List[Tuple[Any, str]]] = {}
+        no_reference: List[Dict[str, Any]] = [{"coin_id": coin_id, "status": "error"} for coin_id in missing]
+        for coin in coins:
+            ref_str = _ref_string_from_coin(coin)
+            if not ref_str:
+                no_reference.append({"coin_id": coin.id, "status": "no_reference"})
+                continue
+            system = self.reference_system or CatalogRegistry.detect_system(ref_str) or "ric"
+            by_system.setdefault(system, []).append((coin, ref_str))
+        if no_reference:
+            self._checkpoint(no_reference)
+
+        await asyncio.gather(*(self._run_system(system, items) for system, items in by_system.items()))
+
+    def result_summary(self, coin_ids: List[int]) -> str:
+        items = {
+            item.coin_id: json.loads(item.result)
+            for item in self.session.query(EnrichmentJobItemModel).filter(EnrichmentJobItemModel.job_id == self.job.id)
+        }
+        return json.dumps([items[coin_id] for coin_id in coin_ids if coin_id in items])
+
+
+def _resolve_coin_ids(session: Any, request: Any) -> List[int]:
+    coin_ids = getattr(request, "coin_ids", None)
+    if coin_ids:
+        return list(dict.fromkeys(coin_ids))
+    max_coins = getattr(request, "max_coins", 50) or 50
+    category = getattr(request, "category", None)
+    filters = {"category": category} if category else None
+    return [coin.id for coin in SqlAlchemyCoinRepository(session).get_all(limit=max_coins, filters=filters)]
+
+
 async def run_bulk_enrich(
     job_id: str,
     request: Any,  # BulkEnrichRequest-like
     session_factory: Any,
 ) -> None:
     """
-    Background task: resolve coins, run catalog lookup per coin, update job and optionally apply fills.
-    Uses its own session from session_factory; commits on success.
+    Background task: run (or resume) a bulk enrichment job.
+    Uses its own session from session_factory; commits at every checkpoint.
     """
-    dry_run = getattr(request, "dry_run", True)
-    max_coins = getattr(request, "max_coins", 50) or 50
-    coin_ids = getattr(request, "coin_ids", None)
-    category = getattr(request, "category", None)
-
     session = session_factory()
     try:
         job = session.get(EnrichmentJobModel, job_id)
         if not job:
             logger.warning("Enrichment job %s not found in DB; ensure job is committed before background task runs", job_id)
             return
-        logger.info("Bulk enrich job %s starting (total=%s)", job_id, getattr(request, "coin_ids", None) or "filter-based")
-        now = datetime.now(timezone.utc)
-        job.status = "running"
-        job.started_at = now
-        session.flush()
-
-        repo = SqlAlchemyCoinRepository(session)
-        apply_service = ApplyEnrichmentService(repo)
-        if coin_ids:
-            coins = [repo.get_by_id(i) for i in coin_ids]
-            coins = [c for c in coins if c is not None]
+        if job.coin_ids:
+            coin_ids = json.loads(job.coin_ids)
         else:
-            filters = {}
-            if category:
-                filters["category"] = category
-            coins = repo.get_all(limit=max_coins, filters=filters or None)
-        total = len(coins)
-        job.total = total
-        session.flush()
-
-        results_list: List[Dict[str, Any]] = []
-        updated_count = 0
-        conflict_count = 0
-        not_found_count = 0
-        error_count = 0
-
-        for i, coin in enumerate(coins):
-            ref_str = _ref_string_from_coin(coin)
-            job.progress = i + 1
-            if not ref_str:
-                not_found_count += 1
-                results_list.append({"coin_id": coin.id, "status": "no_reference"})
-                session.flush()
-                continue
-            try:
-                system = getattr(request, "reference_system", None) or "ric"
-                result = await CatalogRegistry.lookup(
-                    system=system,
-                    reference=ref_str,
-                    context={"ruler": getattr(coin.attribution, "issuer", None) if coin.attribution else None},
-                )
-            except Exception as e:
-                logger.exception(f"Catalog lookup failed for coin {coin.id}: {e}")
-                error_count += 1
-                results_list.append({"coin_id": coin.id, "status": "error"})
-                session.flush()
-                continue
-            if result.status == "not_found":
-                not_found_count += 1
-                results_list.append({"coin_id": coin.id, "status": "not_found"})
-            elif result.status == "success" and result.payload:
-                from src.infrastructure.services.catalogs.parser import parse_catalog_reference
-                parsed = parse_catalog_reference(ref_str)
-                numismatic = validate_reference_for_coin(
-                    catalog=parsed.get("catalog"),
-                    number=parsed.get("number"),
-                    volume=parsed.get("volume"),
-                    coin_category=getattr(coin, "category", None) and getattr(coin.category, "value", None),
-                    year_start=getattr(coin.attribution, "year_start", None) if coin.attribution else None,
-                    year_end=getattr(coin.attribution, "year_end", None) if coin.attribution else None,
-                    issuer=getattr(coin.attribution, "issuer", None) if coin.attribution else None,
-                )
-                fills = _payload_to_fills(result.payload)
-                applied_any = False
-                if fills and not dry_run:
-                    for field_name, value in fills.items():
-                        app = EnrichmentApplication(
-                            coin_id=coin.id,
-                            field_name=field_name,
-                            new_value=value,
-                            source_type="catalog",
-                            source_id=getattr(result, "external_id", None),
-                        )
-                        r = apply_service.apply(app)
-                        if r.success:
-                            applied_any = True
-                    if applied_any:
-                        updated_count += 1
-                # Persist external_id/external_url to ReferenceType for this ref (merge=True to keep existing refs)
-                if getattr(result, "external_id", None) or getattr(result, "external_url", None):
-                    try:
-                        external_ids = {
-                            ref_str: (getattr(result, "external_id", None), getattr(result, "external_url", None)),
-                        }
-                        sync_coin_references(
-                            session,
-                            coin.id,
-                            [ref_str],
-                            "catalog_lookup",
-                            external_ids=external_ids,
-                            merge=True,
-                        )
-                    except Exception as sync_err:
-                        logger.warning("Reference sync (external_id) failed for coin %s: %s", coin.id, sync_err)
-                status_str = "success" if (applied_any or (fills and dry_run)) else ("unchanged" if fills else "no_fills")
-                result_entry: Dict[str, Any] = {"coin_id": coin.id, "status": status_str}
-                if numismatic.status == "warning" and numismatic.message:
-                    result_entry["numismatic_warning"] = numismatic.message
-                results_list.append(result_entry)
-            else:
-                results_list.append({"coin_id": coin.id, "status": str(result.status)})
-            session.flush()
+            coin_ids = _resolve_coin_ids(session, request)
+            job.coin_ids = json.dumps(coin_ids)
+            job.request_params = job.request_params or _request_to_json(request)
+            job.total = len(coin_ids)
+        logger.info("Bulk enrich job %s starting (total=%s)", job_id, job.total)
+        job.status = "running"
+        job.started_at = job.started_at or datetime.now(timezone.utc)
+        session.commit()
+
+        run = _JobRun(session, job, request)
+        await run.run(coin_ids)
 
         job.status = "completed"
         job.completed_at = datetime.now(timezone.utc)
-        job.progress = total
-        job.updated = updated_count
-        job.conflicts = conflict_count
-        job.not_found = not_found_count
-        job.errors = error_count
-        job.result_summary = json.dumps(results_list)
+        job.progress = job.total
+        job.result_summary = run.result_summary(coin_ids)
         session.commit()
         logger.info(
             "Bulk enrich job %s completed: updated=%s conflicts=%s not_found=%s errors=%s",
-            job_id, updated_count, conflict_count, not_found_count, error_count,
+            job_id, job.updated, job.conflicts, job.not_found, job.errors,
         )
     except Exception as e:
         logger.exception(f"Bulk enrich job {job_id} failed: {e}")
         try:
+            session.rollback()
             job = session.get(EnrichmentJobModel, job_id)
             if job:
                 job.status = "failed"
@@ -201,3 +319,44 @@ async def run_bulk_enrich(
         raise
     finally:
         session.close()
+
+
+def start_bulk_enrich(job_id: str, request: Any, session_factory: Any) -> Optional[asyncio.Task]:
+    """Schedule run_bulk_enrich on the running loop unless the job is already running here."""
+    task = _active_jobs.get(job_id)
+    if task is not None and not task.done():
+        return None
+    task = asyncio.create_task(run_bulk_enrich(job_id, request, session_factory))
+    _active_jobs[job_id] = task
+    task.add_done_callback(lambda _: _active_jobs.pop(job_id, None))
+    return task
+
+
+def resume_interrupted_jobs(session_factory: Any) -> List[str]:
+    """
+    Restart jobs left queued/running by a previous process (call on app startup).
+    Returns the resumed job ids.
+    """
+    session = session_factory()
+    try:
+        jobs = (
+            session.query(EnrichmentJobModel)
+            .filter(EnrichmentJobModel.status.in_(("queued", "running")))
+            .all()
+        )
+        resumable = [(job.id, job.request_params) for job in jobs if job.request_params or job.coin_ids]
+        for job in jobs:
+            if not (job.request_params or job.coin_ids):
+                job.status = "failed"
+                job.error_message = "Interrupted before it could be checkpointed"
+                job.completed_at = datetime.now(timezone.utc)
+        session.commit()
+    finally:
+        session.close()
+
+    resumed = []
+    for job_id, params in resumable:
+        if start_bulk_enrich(job_id, _request_from_json(params), session_factory) is not None:
+            logger.info("Resuming bulk enrich job %s", job_id)
+            resumed.append(job_id)
+    return resumed
@@ -4,6 +4,8 @@ from typing import Literal, Any, List, Dict, Optional
 from pydantic import BaseModel
 from datetime import datetime, timedelta, timezone
 
+from src.infrastructure.services.catalogs.http_pool import CatalogHTTPPool
+
 
 class CatalogCandidate(BaseModel):
     """A candidate match from catalog reconciliation."""
@@ -103,6 +105,11 @@ class CatalogService(ABC):
     CACHE_TTL_DAYS: int = 180  # 6 months default
     BASE_URL: str = ""
     SYSTEM: str = ""  # "ric", "crawford", "rpc"
+    RECONCILE_BATCH_SIZE: int = 1  # Queries per reconcile request (see reconcile_many)
+    
+    def __init__(self, http_pool: Optional[CatalogHTTPPool] = None):
+        # Shared keep-alive clients (injected by CatalogRegistry); None = client per call
+        self.http_pool = http_pool
     
     @abstractmethod
     def normalize_reference(self, raw: str) -> Optional[str]:
@@ -162,6 +169,27 @@ class CatalogService(ABC):
         """
         pass
     
+    async def reconcile_many(self, queries: List[Dict]) -> List[CatalogResult]:
+        """
+        Reconcile several queries, results in the same order.
+        
+        Default: one reconcile() per query. Services whose API accepts
+        multi-query requests override this and set RECONCILE_BATCH_SIZE.
+        """
+        return [await self.reconcile(query) for query in queries]
+
+    def resolve_local(self, reference: str, context: Optional[Dict] = None) -> Optional[CatalogResult]:
+        """
+        Resolve a reference from local type data without the network.
+
+        Default: no local data (None = miss, caller reconciles).
+        """
+        return None
+
+    def local_type_data(self, external_id: str) -> Optional[Dict]:
+        """Locally mirrored JSON-LD for a type, or None."""
+        return None
+
     @abstractmethod
     async def fetch_type_data(self, external_id: str) -> Optional[Dict]:
         """
@@ -0,0 +1,89 @@
+"""Per-host polite crawl scheduler for catalog scrapers.
+
+Scrapers submit each request as a coroutine factory instead of sleeping
+inline. Every host has its own FIFO queue: requests to one host start at least
+the crawl delay apart (max of the caller's minimum and robots.txt Crawl-delay,
+see robots_cache.get_crawl_delay_sec) and run one at a time, while different
+hosts proceed concurrently.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+from urllib.parse import urlparse
+
+from src.infrastructure.services.catalogs.robots_cache import get_crawl_delay_sec
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _HostQueue:
+    """FIFO slot for one host: waiters on the lock are the queue."""
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    next_start: float = 0.0  # monotonic time the next request may start
+    waiting: int = 0
+
+
+class CrawlScheduler:
+    """Spaces requests per host; hosts are independent of each other."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, clock=time.monotonic, sleep=asyncio.sleep):
+        self.loop = loop
+        self._clock = clock
+        self._sleep = sleep
+        self._hosts: Dict[str, _HostQueue] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        parsed = urlparse(url)
+        return (parsed.netloc or parsed.path.split("/")[0]).lower()
+
+    def pending(self, host: str) -> int:
+        """Requests queued or running for host."""
+        queue = self._hosts.get(host.lower())
+        return queue.waiting if queue else 0
+
+    def delay_for(self, host: str, min_delay_sec: float = 0.0) -> float:
+        return max(min_delay_sec, get_crawl_delay_sec(host))
+
+    async def submit(
+        self,
+        url: str,
+        request: Callable[[], Awaitable[T]],
+        min_delay_sec: float = 0.0,
+    ) -> T:
+        """
+        Run request() for url's host once its turn comes and the crawl delay has passed.
+
+        Exceptions from request() propagate to the caller; the host's delay still applies.
+        """
+        host = self.host_of(url)
+        queue = self._hosts.setdefault(host, _HostQueue())
+        queue.waiting += 1
+        try:
+            async with queue.lock:
+                wait = queue.next_start - self._clock()
+                if wait > 0:
+                    logger.debug("Crawl delay: waiting %.1fs for %s", wait, host)
+                    await self._sleep(wait)
+                queue.next_start = self._clock() + self.delay_for(host, min_delay_sec)
+                return await request()
+        finally:
+            queue.waiting -= 1
+
+
+# Scheduler per event loop (asyncio locks belong to one loop)
+_scheduler: Optional[CrawlScheduler] = None
+
+
+def get_crawl_scheduler() -> CrawlScheduler:
+    """Get the process-wide crawl scheduler for the running event loop."""
+    global _scheduler
+    loop = asyncio.get_running_loop()
+    if _scheduler is None or _scheduler.loop is not loop:
+        _scheduler = CrawlScheduler(loop)
+    return _scheduler
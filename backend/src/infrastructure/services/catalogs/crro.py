@@ -1,19 +1,16 @@
 """CRRO (Coinage of the Roman Republic Online) service for Crawford lookups."""
-import json
-import httpx
 import logging
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
-from src.infrastructure.services.catalogs.base import (
-    CatalogService, CatalogResult, CatalogPayload, CatalogCandidate
-)
+from src.infrastructure.services.catalogs.base import CatalogPayload
+from src.infrastructure.services.catalogs.http_pool import catalog_http_client
+from src.infrastructure.services.catalogs.openrefine import OpenRefineCatalogService
 from src.infrastructure.services.catalogs.parser import parser
 
 logger = logging.getLogger(__name__)
 
 
-class CRROService(CatalogService):
+class CRROService(OpenRefineCatalogService):
     """
     CRRO catalog service for Roman Republican Coinage (Crawford).
     
@@ -22,6 +19,7 @@ class CRROService(CatalogService):
     
     BASE_URL = "http://numismatics.org/crro"
     RECONCILE_URL = f"{BASE_URL}/apis/reconcile"
+    CATALOG_LABEL = "CRRO"
     SYSTEM = "crawford"
     CACHE_TTL_DAYS = 180  # 6 months
     
@@ -68,6 +66,23 @@ class CRROService(CatalogService):
             "subtype": result.subtype,
         }
     
+    def local_type_key(self, external_id: str) -> Optional[Tuple[Optional[str], str]]:
+        """rrc-335.1c -> (None, "335.1c")."""
+        if not (external_id or "").startswith("rrc-"):
+            return None
+        return None, external_id[len("rrc-"):].lower()
+    
+    def local_reference_key(self, reference: str) -> Optional[Tuple[Optional[str], str]]:
+        """Crawford 335/1c -> (None, "335.1c"), matching local_type_key."""
+        parsed = self.parse_reference(reference)
+        if not parsed or not parsed.get("number"):
+            return None
+        number = parsed["number"]
+        subtype = parsed.get("subtype")
+        if subtype and subtype not in number:
+            number = f"{number}{subtype}"
+        return None, number.replace("/", ".").lower()
+    
     async def build_reconcile_query(
         self, 
         ref: str, 
@@ -102,105 +117,6 @@ class CRROService(CatalogService):
         
         return {"q0": {"query": query_str}}
     
-    async def reconcile(self, query: Dict) -> CatalogResult:
-        """
-        Hit CRRO reconciliation API.
-        
-        Returns best match or list of candidates if ambiguous.
-        """
-        try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                # CRRO reconciliation uses POST with form data
-                queries_json = json.dumps(query)
-                response = await client.post(
-                    self.RECONCILE_URL,
-                    data={"queries": queries_json}
-                )
-                response.raise_for_status()
-                
-                # Parse response
-                content = response.text.strip()
-                
-                # CRRO returns response without outer braces: "q0":{...}
-                # Need to wrap it in {} to make valid JSON
-                if content.startswith('"q0"'):
-                    content = '{' + content + '}'
-                
-                # Try to extract JSON from potential JSONP wrapper
-                if content.startswith("("):
-                    content = content[1:-1]
-                
-                data = json.loads(content)
-                
-                # Parse reconciliation response
-                if "q0" not in data:
-                    return CatalogResult(
-                        status="error",
-                        error_message="Invalid response from CRRO API"
-                    )
-                
-                results = data["q0"].get("result", [])
-                
-                if not results:
-                    return CatalogResult(
-                        status="not_found",
-                        lookup_timestamp=datetime.now(timezone.utc)
-                    )
-                
-                # Convert to candidates
-                candidates = []
-                for r in results:
-                    score = r.get("score", 0)
-                    candidates.append(CatalogCandidate(
-                        external_id=r.get("id", ""),
-                        external_url=self.build_url(r.get("id", "")),
-                        score=score,
-                        confidence=score / 100.0,
-                        name=r.get("name"),
-                        description=r.get("description"),
-                        match_type="exact" if r.get("match") else "partial"
-                    ))
-                
-                # Check for exact match
-                best = candidates[0]
-                if best.confidence >= 0.8 or (results[0].get("match") is True):
-                    return CatalogResult(
-                        status="success",
-                        external_id=best.external_id,
-                        external_url=best.external_url,
-                        confidence=best.confidence,
-                        candidates=candidates if len(candidates) > 1 else None,
-                        lookup_timestamp=datetime.now(timezone.utc)
-                    )
-                
-                # Ambiguous - multiple candidates
-                return CatalogResult(
-                    status="ambiguous",
-                    candidates=candidates,
-                    confidence=best.confidence,
-                    lookup_timestamp=datetime.now(timezone.utc)
-                )
-                
-        except httpx.TimeoutException:
-            return CatalogResult(
-                status="deferred",
-                error_message="CRRO API timeout - will retry later",
-                lookup_timestamp=datetime.now(timezone.utc)
-            )
-        except httpx.HTTPStatusError as e:
-            return CatalogResult(
-                status="error",
-                error_message=f"CRRO API error: {e.response.status_code}",
-                lookup_timestamp=datetime.now(timezone.utc)
-            )
-        except Exception as e:
-            logger.error(f"CRRO reconcile error: {e}", exc_info=True)
-            return CatalogResult(
-                status="error",
-                error_message=str(e),
-                lookup_timestamp=datetime.now(timezone.utc)
-            )
-    
     async def fetch_type_data(self, external_id: str) -> Optional[Dict]:
         """
         Fetch full JSON-LD for a matched type.
@@ -209,12 +125,15 @@ class CRROService(CatalogService):
         """
         if not external_id:
             return None
+        local = self.local_type_data(external_id)
+        if local is not None:
+            return local
         
         url = f"{self.BASE_URL}/id/{external_id}.jsonld"
         
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                response = await client.get(url)
+            async with catalog_http_client(url, self.http_pool, self.TIMEOUT) as client:
+                response = await client.get(url, timeout=self.TIMEOUT)
                 response.raise_for_status()
                 return response.json()
         except Exception as e:
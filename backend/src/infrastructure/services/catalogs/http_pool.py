@@ -0,0 +1,114 @@
+"""Shared, connection-pooled HTTP clients for catalog services.
+
+OCRE, CRRO, the RPC scraper and the robots.txt cache used to open a new
+httpx.AsyncClient per call, paying a TCP (and TLS) handshake on every lookup.
+CatalogHTTPPool keeps one keep-alive client per catalog host. The app creates
+it in the FastAPI lifespan and injects it into CatalogRegistry; code running
+without a pool (scripts, tests) falls back to a short-lived client per call.
+"""
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_SEC = 30.0
+
+
+@dataclass
+class CatalogHTTPConfig:
+    """Pool limits applied to each per-host client."""
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry_sec: float = 30.0
+    http2: bool = False
+    timeout_sec: float = DEFAULT_TIMEOUT_SEC
+
+    @classmethod
+    def from_settings(cls, settings) -> "CatalogHTTPConfig":
+        return cls(
+            max_connections=settings.CATALOG_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.CATALOG_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry_sec=settings.CATALOG_HTTP_KEEPALIVE_EXPIRY_SEC,
+            http2=settings.CATALOG_HTTP2_ENABLED,
+            timeout_sec=settings.CATALOG_HTTP_TIMEOUT_SEC,
+        )
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _host_key(url: str) -> str:
+    parsed = urlparse(url if "://" in url else f"https://{url}")
+    return f"{parsed.scheme}://{(parsed.netloc or '').lower()}"
+
+
+class CatalogHTTPPool:
+    """One keep-alive httpx.AsyncClient per catalog host."""
+
+    def __init__(self, config: Optional[CatalogHTTPConfig] = None):
+        self.config = config or CatalogHTTPConfig()
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._http2 = self.config.http2 and _http2_available()
+        if self.config.http2 and not self._http2:
+            logger.warning("CATALOG_HTTP2_ENABLED is set but the h2 package is not installed; using HTTP/1.1")
+
+    def client_for(self, url: str) -> httpx.AsyncClient:
+        """Pooled client for the host of url (created on first use)."""
+        key = _host_key(url)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=self.config.timeout_sec,
+                follow_redirects=True,
+                http2=self._http2,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                    keepalive_expiry=self.config.keepalive_expiry_sec,
+                ),
+            )
+            self._clients[key] = client
+        return client
+
+    @property
+    def hosts(self) -> list[str]:
+        return list(self._clients)
+
+    async def aclose(self) -> None:
+        """Close every per-host client (app shutdown)."""
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug("Error closing catalog HTTP client: %s", e)
+
+
+@asynccontextmanager
+async def catalog_http_client(
+    url: str,
+    pool: Optional[CatalogHTTPPool] = None,
+    timeout: float = DEFAULT_TIMEOUT_SEC,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Client for a request to url: the pooled one when a pool is given,
+    otherwise a short-lived client closed on exit.
+
+    Pass per-call timeout/headers on the request itself so both cases behave
+    the same.
+    """
+    if pool is not None:
+        yield pool.client_for(url)
+        return
+    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+        yield client
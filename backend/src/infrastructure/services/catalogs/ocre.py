@@ -1,19 +1,19 @@
 """OCRE (Online Coins of the Roman Empire) service for RIC lookups."""
 import re
-import json
-import httpx
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.infrastructure.services.catalogs.base import (
-    CatalogService, CatalogResult, CatalogPayload, CatalogCandidate
-)
+from src.infrastructure.services.catalogs.base import CatalogPayload
+from src.infrastructure.services.catalogs.http_pool import catalog_http_client
+from src.infrastructure.services.catalogs.openrefine import OpenRefineCatalogService
 
 logger = logging.getLogger(__name__)
 
+# OCRE volume token: volume, optional part, optional edition ("2", "2_1", "1(2)", "2_1(2)")
+_OCRE_VOLUME = re.compile(r"^\d+(?:_\d+)?(?:\(\d+\))?$")
 
-class OCREService(CatalogService):
+
+class OCREService(OpenRefineCatalogService):
     """
     OCRE catalog service for Roman Imperial Coinage (RIC).
     
@@ -22,6 +22,7 @@ class OCREService(CatalogService):
     
     BASE_URL = "http://numismatics.org/ocre"
     RECONCILE_URL = f"{BASE_URL}/apis/reconcile"
+    CATALOG_LABEL = "OCRE"
     SYSTEM = "ric"
     CACHE_TTL_DAYS = 180  # 6 months
     
@@ -67,6 +68,50 @@ class OCREService(CatalogService):
             "mint": result.mint, # Include mint
         }
     
+    @staticmethod
+    def _split_authority(ref: str) -> Tuple[str, Optional[str]]:
+        """Split a trailing " - Ruler" off a reference: ("RIC II 128", "Trajan")."""
+        ref_clean = (ref or "").strip()
+        m = re.match(r"^(.+?)\s+-\s+(.+)$", ref_clean)
+        if m:
+            pre, suf = m.group(1).strip(), m.group(2).strip()
+            # Only if suffix doesn't look like a part number
+            if suf and not re.search(r"\d", suf):
+                return pre, suf
+        return ref_clean, None
+    
+    def local_type_key(self, external_id: str) -> Optional[Tuple[Optional[str], str]]:
+        """
+        ric.2.tr.128 / ric.1(2).aug.207 / ric.2_1(2).ves.1 -> ("2", "128") / ("1(2)", "207") / ("2_1(2)", "1").
+
+        The volume keeps OCRE's part and edition so RIC I and RIC I² types do not share a key.
+        """
+        parts = (external_id or "").split(".")
+        if len(parts) < 4 or parts[0] != "ric" or not _OCRE_VOLUME.match(parts[1]):
+            return None
+        return parts[1], ".".join(parts[3:]).lower()
+    
+    def local_reference_key(self, reference: str) -> Optional[Tuple[Optional[str], str]]:
+        """RIC II 128 / RIC I² 207 / RIC II.1 128 -> ("2", "128") / ("1(2)", "207") / ("2_1", "128")."""
+        ref_clean, _ = self._split_authority(reference)
+        parsed = self.parse_reference(ref_clean)
+        if not parsed or not parsed.get("number") or not parsed.get("volume_main"):
+            return None
+        main, _, part = parsed["volume_main"].partition(".")
+        volume = main if main.isdigit() else str(self._roman_to_arabic(main))
+        if part:
+            volume += f"_{part}"
+        if parsed.get("edition"):
+            volume += f"({parsed['edition']})"
+        return volume, parsed["number"].lower()
+    
+    def local_match_hints(self, reference: str, context: Optional[Dict] = None) -> List[str]:
+        """Ruler (context or " - Ruler" suffix) and mint narrow several local matches."""
+        ref_clean, authority = self._split_authority(reference)
+        parsed = self.parse_reference(ref_clean) or {}
+        hints = super().local_match_hints(reference, context)
+        return hints + [authority or "", parsed.get("mint") or ""]
+    
     async def build_reconcile_query(
         self, 
         ref: str, 
@@ -75,17 +120,7 @@ class OCREService(CatalogService):
         """
         Build OpenRefine reconciliation query for OCRE.
         """
-        ref_clean = (ref or "").strip()
-        
-        # Extract authority from trailing " - Ruler"
-        authority_from_ref: Optional[str] = None
-        m = re.match(r"^(.+?)\s+-\s+(.+)$", ref_clean)
-        if m:
-            pre, suf = m.group(1).strip(), m.group(2).strip()
-            # Only if suffix doesn't look like a part number
-            if suf and not re.search(r"\d", suf):
-                ref_clean = pre
-                authority_from_ref = suf
+        ref_clean, authority_from_ref = self._split_authority(ref)
         
         # Extract context overrides
         authority = None
@@ -125,106 +160,6 @@ class OCREService(CatalogService):
 
         return {"q0": {"query": query_str}}
     
-    async def reconcile(self, query: Dict) -> CatalogResult:
-        """
-        Hit OCRE reconciliation API.
-        
-        Returns best match or list of candidates if ambiguous.
-        """
-        try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                # OCRE reconciliation uses POST with form data
-                # queries parameter must be JSON-encoded
-                queries_json = json.dumps(query)
-                response = await client.post(
-                    self.RECONCILE_URL,
-                    data={"queries": queries_json}
-                )
-                response.raise_for_status()
-                
-                # Parse response
-                content = response.text.strip()
-                
-                # OCRE returns response without outer braces: "q0":{...}
-                # Need to wrap it in {} to make valid JSON
-                if content.startswith('"q0"'):
-                    content = '{' + content + '}'
-                
-                # Try to extract JSON from potential JSONP wrapper
-                if content.startswith("("):
-                    content = content[1:-1]
-                
-                data = json.loads(content)
-                
-                # Parse reconciliation response
-                if "q0" not in data:
-                    return CatalogResult(
-                        status="error",
-                        error_message="Invalid response from OCRE API"
-                    )
-                
-                results = data["q0"].get("result", [])
-                
-                if not results:
-                    return CatalogResult(
-                        status="not_found",
-                        lookup_timestamp=datetime.now(timezone.utc)
-                    )
-                
-                # Convert to candidates
-                candidates = []
-                for r in results:
-                    score = r.get("score", 0)
-                    candidates.append(CatalogCandidate(
-                        external_id=r.get("id", ""),
-                        external_url=self.build_url(r.get("id", "")),
-                        score=score,
-                        confidence=score / 100.0,  # Normalize to 0-1
-                        name=r.get("name"),
-                        description=r.get("description"),
-                        match_type="exact" if r.get("match") else "partial"
-                    ))
-                
-                # Check for exact match
-                best = candidates[0]
-                if best.confidence >= 0.8 or (results[0].get("match") is True):
-                    return CatalogResult(
-                        status="success",
-                        external_id=best.external_id,
-                        external_url=best.external_url,
-                        confidence=best.confidence,
-                        candidates=candidates if len(candidates) > 1 else None,
-                        lookup_timestamp=datetime.now(timezone.utc)
-                    )
-                
-                # Ambiguous - multiple candidates
-                return CatalogResult(
-                    status="ambiguous",
-                    candidates=candidates,
-                    confidence=best.confidence,
-                    lookup_timestamp=datetime.now(timezone.utc)
-                )
-                
-        except httpx.TimeoutException:
-            return CatalogResult(
-                status="deferred",
-                error_message="OCRE API timeout - will retry later",
-                lookup_timestamp=datetime.now(timezone.utc)
-            )
-        except httpx.HTTPStatusError as e:
-            return CatalogResult(
-                status="error",
-                error_message=f"OCRE API error: {e.response.status_code}",
-                lookup_timestamp=datetime.now(timezone.utc)
-            )
-        except Exception as e:
-            logger.error(f"OCRE reconcile error: {e}", exc_info=True)
-            return CatalogResult(
-                status="error",
-                error_message=str(e),
-                lookup_timestamp=datetime.now(timezone.utc)
-            )
-    
     async def fetch_type_data(self, external_id: str) -> Optional[Dict]:
         """
         Fetch full JSON-LD for a matched type.
@@ -233,12 +168,15 @@ class OCREService(CatalogService):
         """
         if not external_id:
             return None
+        local = self.local_type_data(external_id)
+        if local is not None:
+            return local
         
         url = f"{self.BASE_URL}/id/{external_id}.jsonld"
         
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                response = await client.get(url)
+            async with catalog_http_client(url, self.http_pool, self.TIMEOUT) as client:
+                response = await client.get(url, timeout=self.TIMEOUT)
                 response.raise_for_status()
                 return response.json()
         except Exception as e:
@@ -0,0 +1,227 @@
+"""OpenRefine reconciliation shared by the Nomisma-backed catalogs (OCRE, CRRO).
+
+The reconcile API accepts many queries (q0..qN) in one POST. reconcile()
+sends a single query; reconcile_many() packs up to RECONCILE_BATCH_SIZE
+queries per POST and maps each answer back to its position.
+
+With a LocalTypeStore (imported bulk dumps), resolve_local() and
+local_type_data() answer from the mirror; the registry goes to the network
+only on a miss.
+"""
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from src.infrastructure.services.catalogs.base import (
+    CatalogService, CatalogResult, CatalogCandidate
+)
+from src.infrastructure.services.catalogs.http_pool import CatalogHTTPPool, catalog_http_client
+from src.infrastructure.services.catalogs.type_store import LocalTypeStore
+
+logger = logging.getLogger(__name__)
+
+
+class OpenRefineCatalogService(CatalogService):
+    """CatalogService whose reconcile step is an OpenRefine reconciliation endpoint."""
+
+    RECONCILE_URL: str = ""
+    CATALOG_LABEL: str = ""  # "OCRE", "CRRO" (error messages)
+    TIMEOUT: float = 30.0
+    RECONCILE_BATCH_SIZE = 25
+
+    def __init__(
+        self,
+        http_pool: Optional[CatalogHTTPPool] = None,
+        type_store: Optional[LocalTypeStore] = None,
+    ):
+        super().__init__(http_pool=http_pool)
+        # Local mirror of bulk type dumps (injected by CatalogRegistry); None = network only
+        self.type_store = type_store
+
+    # -------------------------------------------------------------------------
+    # Local type mirror
+    # -------------------------------------------------------------------------
+
+    def local_type_key(self, external_id: str) -> Optional[Tuple[Optional[str], str]]:
+        """(volume, number) index key for one of this catalog's type ids; None if not a type id."""
+        return None
+
+    def local_reference_key(self, reference: str) -> Optional[Tuple[Optional[str], str]]:
+        """(volume, number) key to look a reference up in the local mirror."""
+        return None
+
+    def local_type_data(self, external_id: str) -> Optional[Dict]:
+        if not self.type_store or not external_id:
+            return None
+        return self.type_store.get(self.SYSTEM, external_id)
+
+    def resolve_local(self, reference: str, context: Optional[Dict] = None) -> Optional[CatalogResult]:
+        """
+        Match a reference against the local mirror.
+
+        Returns None on a miss (caller falls back to reconcile); several types
+        with the same key are narrowed by the ruler/mint hint when possible.
+        """
+        key = self.local_reference_key(reference) if self.type_store else None
+        if not key:
+            return None
+        volume, number = key
+        matches = self.type_store.find(self.SYSTEM, number, volume)
+        if not matches:
+            return None
+        if len(matches) > 1:
+            hints = [h.lower() for h in self.local_match_hints(reference, context) if h]
+            narrowed = [
+                m for m in matches
+                if any(h in " ".join(filter(None, (m.authority, m.mint, m.label))).lower() for h in hints)
+            ]
+            matches = narrowed or matches
+        if len(matches) == 1:
+            data = self.type_store.get(self.SYSTEM, matches[0].external_id)
+            return CatalogResult(
+                status="success",
+                external_id=matches[0].external_id,
+                external_url=self.build_url(matches[0].external_id),
+                confidence=1.0,
+                payload=self.parse_payload(data).model_dump() if data else None,
+                raw=data,
+                source_version="local",
+                lookup_timestamp=datetime.now(timezone.utc)
+            )
+        return CatalogResult(
+            status="ambiguous",
+            candidates=[
+                CatalogCandidate(
+                    external_id=m.external_id,
+                    external_url=self.build_url(m.external_id),
+                    score=100.0 / len(matches),
+                    confidence=1.0 / len(matches),
+                    name=m.label,
+                    match_type="partial"
+                )
+                for m in matches
+            ],
+            confidence=1.0 / len(matches),
+            source_version="local",
+            lookup_timestamp=datetime.now(timezone.utc)
+        )
+
+    def local_match_hints(self, reference: str, context: Optional[Dict] = None) -> List[str]:
+        """Names used to narrow several local matches (ruler from context by default)."""
+        if not context:
+            return []
+        return [context.get("ruler") or context.get("authority") or ""]
+
+    async def reconcile(self, query: Dict) -> CatalogResult:
+        """
+        Hit the reconciliation API with one query.
+
+        Returns best match or list of candidates if ambiguous.
+        """
+        return (await self.reconcile_many([query]))[0]
+
+    async def reconcile_many(self, queries: List[Dict]) -> List[CatalogResult]:
+        """
+        Reconcile many queries, RECONCILE_BATCH_SIZE per POST.
+
+        Each query is a build_reconcile_query() dict ({"q0": {...}}); results
+        come back in the same order.
+        """
+        results: List[CatalogResult] = []
+        for start in range(0, len(queries), self.RECONCILE_BATCH_SIZE):
+            results.extend(await self._reconcile_chunk(queries[start:start + self.RECONCILE_BATCH_SIZE]))
+        return results
+
+    async def _reconcile_chunk(self, queries: List[Dict]) -> List[CatalogResult]:
+        """One multi-query POST; failures apply to every query in the chunk."""
+        batch = {f"q{i}": next(iter(query.values())) for i, query in enumerate(queries)}
+        try:
+            async with catalog_http_client(self.RECONCILE_URL, self.http_pool, self.TIMEOUT) as client:
+                # Reconciliation uses POST with form data; queries parameter must be JSON-encoded
+                response = await client.post(
+                    self.RECONCILE_URL,
+                    data={"queries": json.dumps(batch)},
+                    timeout=self.TIMEOUT,
+                )
+                response.raise_for_status()
+                data = self._parse_reconcile_response(response.text)
+        except httpx.TimeoutException:
+            return [self._failure("deferred", f"{self.CATALOG_LABEL} API timeout - will retry later") for _ in queries]
+        except httpx.HTTPStatusError as e:
+            return [self._failure("error", f"{self.CATALOG_LABEL} API error: {e.response.status_code}") for _ in queries]
+        except Exception as e:
+            logger.error(f"{self.CATALOG_LABEL} reconcile error: {e}", exc_info=True)
+            return [self._failure("error", str(e)) for _ in queries]
+
+        results = []
+        for key in batch:
+            if not isinstance(data.get(key), dict):
+                results.append(self._failure("error", f"Invalid response from {self.CATALOG_LABEL} API"))
+            else:
+                results.append(self._result_from_matches(data[key].get("result", [])))
+        return results
+
+    @staticmethod
+    def _parse_reconcile_response(text: str) -> Dict[str, Any]:
+        content = text.strip()
+        # Nomisma returns the response without outer braces: "q0":{...},"q1":{...}
+        # Need to wrap it in {} to make valid JSON
+        if content.startswith('"q'):
+            content = '{' + content + '}'
+        # Try to extract JSON from potential JSONP wrapper
+        if content.startswith("("):
+            content = content[1:-1]
+        return json.loads(content)
+
+    def _result_from_matches(self, matches: List[Dict[str, Any]]) -> CatalogResult:
+        """Best match, ambiguous candidates, or not_found for one query's results."""
+        if not matches:
+            return CatalogResult(
+                status="not_found",
+                lookup_timestamp=datetime.now(timezone.utc)
+            )
+
+        # Convert to candidates
+        candidates = []
+        for r in matches:
+            score = r.get("score", 0)
+            candidates.append(CatalogCandidate(
+                external_id=r.get("id", ""),
+                external_url=self.build_url(r.get("id", "")),
+                score=score,
+                confidence=score / 100.0,  # Normalize to 0-1
+                name=r.get("name"),
+                description=r.get("description"),
+                match_type="exact" if r.get("match") else "partial"
+            ))
+
+        # Check for exact match
+        best = candidates[0]
+        if best.confidence >= 0.8 or (matches[0].get("match") is True):
+            return CatalogResult(
+                status="success",
+                external_id=best.external_id,
+                external_url=best.external_url,
+                confidence=best.confidence,
+                candidates=candidates if len(candidates) > 1 else None,
+                lookup_timestamp=datetime.now(timezone.utc)
+            )
+
+        # Ambiguous - multiple candidates
+        return CatalogResult(
+            status="ambiguous",
+            candidates=candidates,
+            confidence=best.confidence,
+            lookup_timestamp=datetime.now(timezone.utc)
+        )
+
+    @staticmethod
+    def _failure(status: str, message: str) -> CatalogResult:
+        return CatalogResult(
+            status=status,
+            error_message=message,
+            lookup_timestamp=datetime.now(timezone.utc)
+        )
@@ -3,9 +3,14 @@
 Orchestration layer: normalizes input, routes to per-catalog parsers (parsers/),
 builds ParseResult and dict output. Single entry points: parse_catalog_reference(raw)
 and parse_catalog_reference_full(raw).
+
+Only the parsers registered for the input's leading word run (SYSTEM_PREFIXES),
+and results are memoized per normalized text, so repeated references from
+imports, catalog lookups and reference sync are parsed once.
 """
 import re
-from typing import List, Dict, Optional, Union, Any
+from functools import lru_cache
+from typing import Callable, Iterable, List, Dict, Optional, Tuple, Union, Any
 from pydantic import BaseModel
 
 from src.infrastructure.services.catalogs.catalog_systems import (
@@ -14,12 +19,31 @@ from src.infrastructure.services.catalogs.catalog_systems import (
 )
 from src.infrastructure.services.catalogs.parsers import (
     SYSTEM_PARSERS,
+    SYSTEM_PREFIXES,
     ParsedRef,
     normalize_whitespace,
 )
 
 # Compiled once at import for _looks_like_reference
 _REF_DETECTION_PATTERN = reference_detection_pattern()
+_DIGIT_PATTERN = re.compile(r"\d")
+_TRAILING_VARIANT_PATTERN = re.compile(r"\s+([a-z])\s*$")
+_LEADING_WORD_PATTERN = re.compile(r"[^\W\d_]*")
+
+# Normalized texts memoized per ReferenceParser
+_PARSE_CACHE_SIZE = 4096
+
+
+def _build_dispatch() -> Dict[str, Tuple[Callable[[str], Optional[ParsedRef]], ...]]:
+    """Leading word -> parsers to try, in SYSTEM_PARSERS (precedence) order."""
+    dispatch: Dict[str, List[Callable[[str], Optional[ParsedRef]]]] = {}
+    for system, parse_fn in SYSTEM_PARSERS.items():
+        for prefix in SYSTEM_PREFIXES[system]:
+            dispatch.setdefault(prefix, []).append(parse_fn)
+    return {prefix: tuple(fns) for prefix, fns in dispatch.items()}
+
+
+_DISPATCH = _build_dispatch()
 
 
 class ParseResult(BaseModel):
@@ -100,7 +124,7 @@ def _parsed_ref_to_result(parsed: ParsedRef, raw: str) -> ParseResult:
 
 def _looks_like_reference(raw: str) -> bool:
     """Check if string looks like it could be a catalog reference."""
-    has_numbers = bool(re.search(r"\d", raw))
+    has_numbers = bool(_DIGIT_PATTERN.search(raw))
     has_ref_words = _REF_DETECTION_PATTERN.search(raw) is not None
     return has_numbers and (has_ref_words or "/" in raw)
 
@@ -111,6 +135,27 @@ class ReferenceParser:
     returns ParseResult. Supports RIC, Crawford, RPC, RSC, BMCRE, Sear, Sydenham.
     """
 
+    def __init__(self, cache_size: int = _PARSE_CACHE_SIZE):
+        self._parse_text = lru_cache(maxsize=cache_size)(self._parse_text_uncached)
+
+    @staticmethod
+    def _normalize(raw: str) -> str:
+        text = normalize_whitespace(raw)
+        # Attach trailing single-letter variant to number (e.g. "351 b" -> "351b") for canonical consistency
+        return _TRAILING_VARIANT_PATTERN.sub(r"\1", text)
+
+    @staticmethod
+    def _parse_text_uncached(text: str) -> ParseResult:
+        """Parse normalized text with the parsers registered for its leading word."""
+        prefix = _LEADING_WORD_PATTERN.match(text).group(0).lower()
+        for parse_fn in _DISPATCH.get(prefix, ()):
+            parsed = parse_fn(text)
+            if parsed is not None:
+                return _parsed_ref_to_result(parsed, "")
+        if _looks_like_reference(text):
+            return ParseResult(confidence=0.2, needs_llm=True)
+        return ParseResult(confidence=0.0, needs_llm=False)
+
     def parse(self, raw: str) -> ParseResult:
         """
         Parse a reference string into structured components.
@@ -121,24 +166,23 @@ class ReferenceParser:
                 raw=raw or "",
                 needs_llm=False,
             )
-        text = normalize_whitespace(raw)
-        # Attach trailing single-letter variant to number (e.g. "351 b" -> "351b") for canonical consistency
-        text = re.sub(r"\s+([a-z])\s*$", r"\1", text)
-        for _system, parse_fn in SYSTEM_PARSERS.items():
-            parsed = parse_fn(text)
-            if parsed is not None:
-                return _parsed_ref_to_result(parsed, raw)
-        if _looks_like_reference(text):
-            return ParseResult(
-                raw=raw,
-                confidence=0.2,
-                needs_llm=True,
-            )
-        return ParseResult(
-            raw=raw,
-            confidence=0.0,
-            needs_llm=False,
-        )
+        cached = self._parse_text(self._normalize(raw))
+        # Callers own the result (cached instance is shared)
+        return cached.model_copy(update={"raw": raw, "warnings": list(cached.warnings)})
+
+    def parse_many(self, raws: Iterable[str]) -> List[ParseResult]:
+        """
+        Parse many reference strings (imports, bulk enrichment); results in input order.
+        Each distinct normalized text is parsed once.
+        """
+        return [self.parse(raw) for raw in raws]
+
+    def cache_info(self):
+        """functools cache statistics for the normalized-text memo."""
+        return self._parse_text.cache_info()
+
+    def cache_clear(self) -> None:
+        self._parse_text.cache_clear()
 
     def parse_multiple(self, raw: str) -> List[ParseResult]:
         """
@@ -151,15 +195,7 @@ class ReferenceParser:
         
         # Split by common separators
         parts = re.split(r"[;,\n]|\s+/\s+", raw)
-        results = []
-        
-        for part in parts:
-            part = part.strip()
-            if part:
-                result = self.parse(part)
-                results.append(result)
-        
-        return results
+        return self.parse_many(part.strip() for part in parts if part.strip())
 
 
 # Singleton instance for convenience
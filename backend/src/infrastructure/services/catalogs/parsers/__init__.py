@@ -4,7 +4,7 @@ Per-catalog reference parsers.
 Each module exports parse(raw: str) -> Optional[ParsedRef].
 Volume is in Roman form (I, IV.1) for RIC, RPC, DOC where applicable.
 """
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from .base import (
     ParsedRef,
@@ -44,9 +44,28 @@ SYSTEM_PARSERS: Dict[str, Callable[[str], Optional[ParsedRef]]] = {
     "sydenham": parse_sydenham,
 }
 
+# Leading word (lowercased letter run) each parser's patterns can start with;
+# ReferenceParser dispatches on it instead of trying every parser. "" = input
+# starts with a digit (bare Crawford "335/1c"). Keep in sync with the patterns.
+SYSTEM_PREFIXES: Dict[str, Tuple[str, ...]] = {
+    "ric": ("ric",),
+    "crawford": ("crawford", "cr", "rrc", ""),
+    "rpc": ("rpc",),
+    "rsc": ("rsc",),
+    "doc": ("doc",),
+    "bmcrr": ("bmcrr", "bmc"),
+    "bmcre": ("bmcre", "bmc"),
+    "sng": ("sng",),
+    "cohen": ("cohen",),
+    "calico": ("calicó", "cal"),
+    "sear": ("sear", "scv"),
+    "sydenham": ("sydenham", "syd"),
+}
+
 __all__ = [
     "ParsedRef",
     "SYSTEM_PARSERS",
+    "SYSTEM_PREFIXES",
     "make_simple_ref",
     "parse_ric",
     "parse_crawford",
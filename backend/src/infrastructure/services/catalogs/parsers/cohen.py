@@ -16,6 +16,7 @@ _PATTERNS = [
     # Cohen 123, Cohen 382a
     (r"Cohen\s+(\d+)([a-z])?", "no_volume"),
 ]
+_COMPILED_PATTERNS = [(re.compile(pattern, re.IGNORECASE), kind) for pattern, kind in _PATTERNS]
 
 
 def parse(raw: str) -> Optional[ParsedRef]:
@@ -23,8 +24,8 @@ def parse(raw: str) -> Optional[ParsedRef]:
     if not raw or not raw.strip():
         return None
     text = raw.strip()
-    for pattern, kind in _PATTERNS:
-        m = re.match(pattern, text, re.IGNORECASE)
+    for pattern, kind in _COMPILED_PATTERNS:
+        m = pattern.match(text)
         if not m:
             continue
         if kind == "roman_volume":
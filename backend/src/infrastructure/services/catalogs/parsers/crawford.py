@@ -42,6 +42,7 @@ _PATTERNS = [
     # Cr 123 (no subnumber)
     (r"(?:Crawford|Cr\.?|RRC)[:\s]*(\d+)$", "no_subnumber"),
 ]
+_COMPILED_PATTERNS = [(re.compile(pattern, re.IGNORECASE), kind) for pattern, kind in _PATTERNS]
 
 
 def parse(raw: str) -> Optional[ParsedRef]:
@@ -49,8 +50,8 @@ def parse(raw: str) -> Optional[ParsedRef]:
     if not raw or not raw.strip():
         return None
     text = normalize_whitespace(raw)
-    for pattern, kind in _PATTERNS:
-        m = re.match(pattern, text, re.IGNORECASE)
+    for pattern, kind in _COMPILED_PATTERNS:
+        m = pattern.match(text)
         if not m:
             continue
         if kind == "no_subnumber":
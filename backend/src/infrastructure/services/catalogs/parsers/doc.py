@@ -17,6 +17,7 @@ _PATTERNS = [
     # DOC I 234, DOC III 567a, DOC V 12
     (r"DOC\s+([IVX]+)\s+(\d+)([a-z])?", "roman_volume"),
 ]
+_COMPILED_PATTERNS = [(re.compile(pattern, re.IGNORECASE), kind) for pattern, kind in _PATTERNS]
 
 
 def parse(raw: str) -> Optional[ParsedRef]:
@@ -24,8 +25,8 @@ def parse(raw: str) -> Optional[ParsedRef]:
     if not raw or not raw.strip():
         return None
     text = raw.strip()
-    for pattern, kind in _PATTERNS:
-        m = re.match(pattern, text, re.IGNORECASE)
+    for pattern, kind in _COMPILED_PATTERNS:
+        m = pattern.match(text)
         if not m:
             continue
         if kind == "arabic_volume":
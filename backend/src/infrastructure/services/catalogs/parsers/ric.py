@@ -74,6 +74,7 @@ _PATTERNS = [
     # RIC 123 (no volume - fallback)
     (r"RIC\s+(\d+)([a-z])?" + _SUFFIX, "no_volume"),
 ]
+_COMPILED_PATTERNS = [(re.compile(pattern, re.IGNORECASE), kind) for pattern, kind in _PATTERNS]
 
 
 def parse(raw: str) -> Optional[ParsedRef]:
@@ -84,8 +85,8 @@ def parse(raw: str) -> Optional[ParsedRef]:
     # Normalize "RIC vol I" -> "RIC I"
     text = re.sub(r"^RIC\s+vol\.?\s+", "RIC ", text, flags=re.IGNORECASE)
     
-    for pattern, kind in _PATTERNS:
-        m = re.match(pattern, text, re.IGNORECASE)
+    for pattern, kind in _COMPILED_PATTERNS:
+        m = pattern.match(text)
         if not m:
             continue
         if kind == "roman_volume_part_bare":
@@ -22,6 +22,7 @@ _PATTERNS = [
     # RPC 5678 (no volume)
     (r"RPC\s+(\d+)\s*([a-zA-Z])?$", "no_volume"),
 ]
+_COMPILED_PATTERNS = [(re.compile(pattern, re.IGNORECASE), kind) for pattern, kind in _PATTERNS]
 
 
 def parse(raw: str) -> Optional[ParsedRef]:
@@ -32,8 +33,8 @@ def parse(raw: str) -> Optional[ParsedRef]:
     # Normalize "RPC online 1234" -> "RPC 1234" (treat online as no-volume or ignore it)
     text = re.sub(r"^RPC\s+online\s+", "RPC ", text, flags=re.IGNORECASE)
     
-    for pattern, kind in _PATTERNS:
-        m = re.match(pattern, text, re.IGNORECASE)
+    for pattern, kind in _COMPILED_PATTERNS:
+        m = pattern.match(text)
         if not m:
             continue
         if kind == "roman_volume_supplement":
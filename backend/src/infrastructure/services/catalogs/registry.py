@@ -1,14 +1,25 @@
 """Catalog registry - routes to correct service by reference system."""
+import asyncio
+import logging
 import time
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Awaitable, Callable, Optional, List, Dict, Tuple
 from src.infrastructure.services.catalogs.base import CatalogService, CatalogResult
+from src.infrastructure.services.catalogs.http_pool import CatalogHTTPPool
 from src.infrastructure.services.catalogs.parser import parser
+from src.infrastructure.services.catalogs.result_cache import (
+    CatalogResultCache,
+    get_catalog_result_cache,
+)
+from src.infrastructure.services.catalogs.type_store import LocalTypeStore, get_local_type_store
 
-# In-memory cache TTL (seconds); 24h
-_CACHE_TTL_SEC = 86400
 # Rate limit: max requests per window (per system)
 _RATE_LIMIT_MAX = 30
 _RATE_LIMIT_WINDOW_SEC = 60
+_RATE_LIMIT_MESSAGE = "Catalog rate limit exceeded (30 requests per minute per system). Try again later."
+# Concurrent type-data (JSON-LD) fetches per lookup_many
+_TYPE_FETCH_CONCURRENCY = 4
+
+logger = logging.getLogger(__name__)
 
 
 class CatalogRegistry:
@@ -20,36 +31,83 @@ class CatalogRegistry:
     """
     
     _services: Dict[str, CatalogService] = {}
-    _cache: Dict[Tuple[str, ...], Tuple[Any, float]] = {}
+    _http_pool: Optional[CatalogHTTPPool] = None
+    _result_cache: Optional[CatalogResultCache] = None
+    _type_store: Optional[LocalTypeStore] = None
+    _refreshing: Dict[str, "asyncio.Task"] = {}
     _rate_limit_timestamps: List[Tuple[float, str]] = []
 
     @classmethod
-    def _cache_key_lookup(cls, system: str, reference: str) -> Tuple[str, str, str]:
-        return ("lookup", system.lower().strip(), (reference or "").strip())
+    def _cache_key_lookup(cls, system: str, reference: str) -> str:
+        return CatalogResultCache.make_key("lookup", system, reference)
 
     @classmethod
-    def _cache_key_get_by_id(cls, system: str, external_id: str) -> Tuple[str, str, str]:
-        return ("get_by_id", system.lower().strip(), (external_id or "").strip())
+    def _cache_key_get_by_id(cls, system: str, external_id: str) -> str:
+        return CatalogResultCache.make_key("get_by_id", system, external_id)
 
     @classmethod
-    def _cache_get(cls, key: Tuple[str, ...]) -> Optional[CatalogResult]:
-        if key not in cls._cache:
-            return None
-        result, expiry = cls._cache[key]
-        if time.monotonic() > expiry:
-            del cls._cache[key]
-            return None
+    def set_result_cache(cls, cache: Optional[CatalogResultCache]) -> None:
+        """Use a specific result cache (tests, scripts); None = process-wide default."""
+        cls._result_cache = cache
+
+    @classmethod
+    def _get_result_cache(cls) -> CatalogResultCache:
+        if cls._result_cache is None:
+            cls._result_cache = get_catalog_result_cache()
+        return cls._result_cache
+
+    @classmethod
+    def _cache_ttl_days(cls, system: str) -> float:
+        service = cls.get_service(system)
+        return service.CACHE_TTL_DAYS if service else CatalogService.CACHE_TTL_DAYS
+
+    @classmethod
+    async def _cached(
+        cls,
+        key: str,
+        system: str,
+        fetch: Callable[[], Awaitable[CatalogResult]],
+    ) -> CatalogResult:
+        """
+        Serve from the persistent cache; stale entries are returned at once and
+        refreshed in the background. On a miss, fetch and store the result.
+        """
+        cache = cls._get_result_cache()
+        hit = cache.get(key)
+        if hit is not None:
+            if hit.stale:
+                cls._schedule_refresh(key, system, fetch, hit.result)
+            return hit.result
+        result = await fetch()
+        cache.set(key, system, result, cls._cache_ttl_days(system))
         return result
 
     @classmethod
-    def _cache_set(cls, key: Tuple[str, ...], result: CatalogResult) -> None:
-        cls._cache[key] = (result, time.monotonic() + _CACHE_TTL_SEC)
-        # Prune old entries occasionally (when cache is large)
-        if len(cls._cache) > 500:
-            now = time.monotonic()
-            to_del = [k for k, (_, exp) in cls._cache.items() if exp < now]
-            for k in to_del:
-                del cls._cache[k]
+    def _schedule_refresh(
+        cls,
+        key: str,
+        system: str,
+        fetch: Callable[[], Awaitable[CatalogResult]],
+        stale: CatalogResult,
+    ) -> None:
+        """Refresh one stale entry in the background (at most one refresh per key)."""
+        if key in cls._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                result = await fetch()
+                cache = cls._get_result_cache()
+                # A timeout (deferred) or error is never cached, and a match missing
+                # its type data must not replace a complete stale match
+                if not cache.is_incomplete(result) or cache.is_incomplete(stale):
+                    cache.set(key, system, result, cls._cache_ttl_days(system))
+            except Exception as e:
+                logger.warning("Catalog cache refresh failed for %s: %s", key, e)
+            finally:
+                cls._refreshing.pop(key, None)
+
+        cls._refreshing[key] = asyncio.create_task(refresh())
 
     @classmethod
     def _rate_limit_acquire(cls, system: str) -> bool:
@@ -64,6 +122,44 @@ class CatalogRegistry:
         cls._rate_limit_timestamps.append((now, system_lower))
         return True
 
+    @classmethod
+    def is_rate_limited(cls, result: CatalogResult) -> bool:
+        """True if result was refused by the per-system rate limit (safe to retry later)."""
+        return result.status == "error" and result.error_message == _RATE_LIMIT_MESSAGE
+
+    @classmethod
+    def set_http_pool(cls, pool: Optional[CatalogHTTPPool]) -> None:
+        """
+        Inject the shared HTTP pool (app lifespan); services are rebuilt to use it.
+        
+        Pass None on shutdown to go back to a client per call.
+        """
+        cls._http_pool = pool
+        cls._services = {}
+
+    @classmethod
+    def set_type_store(cls, store: Optional[LocalTypeStore]) -> None:
+        """Use a specific local type mirror (tests, scripts); None = CATALOG_TYPE_STORE_PATH if imported."""
+        cls._type_store = store
+        cls._services = {}
+
+    @classmethod
+    def _get_type_store(cls) -> Optional[LocalTypeStore]:
+        return cls._type_store if cls._type_store is not None else get_local_type_store()
+
+    @classmethod
+    def _resolve_local(
+        cls, service: Optional[CatalogService], reference: str, context: Optional[Dict] = None
+    ) -> Optional[CatalogResult]:
+        """Answer from the local type mirror; None on a miss (or a broken entry)."""
+        if not service:
+            return None
+        try:
+            return service.resolve_local(reference, context)
+        except Exception as e:
+            logger.warning("Local type lookup failed for %s: %s", reference, e)
+            return None
+
     @classmethod
     def get_service(cls, system: str) -> Optional[CatalogService]:
         """
@@ -96,13 +192,13 @@ class CatalogRegistry:
         try:
             if system == "ric":
                 from src.infrastructure.services.catalogs.ocre import OCREService
-                return OCREService()
+                return OCREService(http_pool=cls._http_pool, type_store=cls._get_type_store())
             elif system in ["crawford", "rrc"]:
                 from src.infrastructure.services.catalogs.crro import CRROService
-                return CRROService()
+                return CRROService(http_pool=cls._http_pool, type_store=cls._get_type_store())
             elif system == "rpc":
                 from src.infrastructure.services.catalogs.rpc import RPCService
-                return RPCService()
+                return RPCService(http_pool=cls._http_pool)
         except ImportError as e:
             print(f"Failed to load service for {system}: {e}")
             return None
@@ -122,7 +218,8 @@ class CatalogRegistry:
     ) -> CatalogResult:
         """
         Lookup a reference in the appropriate catalog.
-        Uses in-memory cache (24h TTL) and per-system rate limit (30/min).
+        Uses the persistent result cache (per-system TTL, stale-while-revalidate)
+        and per-system rate limit (30/min).
         """
         # Auto-detect system if not forced and reference looks specific
         if not system or system == "unknown" or system == "auto":
@@ -130,18 +227,31 @@ class CatalogRegistry:
             if detected:
                 system = detected
 
-        cache_key = cls._cache_key_lookup(system, reference)
-        cached = cls._cache_get(cache_key)
-        if cached is not None:
-            return cached
+        return await cls._cached(
+            cls._cache_key_lookup(system, reference),
+            system,
+            lambda: cls._fetch_lookup(system, reference, context),
+        )
+
+    @classmethod
+    async def _fetch_lookup(
+        cls,
+        system: str,
+        reference: str,
+        context: Optional[Dict] = None
+    ) -> CatalogResult:
+        """Local type mirror first, then rate-limited lookup against the catalog service (no caching)."""
+        service = cls.get_service(system)
+        local = cls._resolve_local(service, reference, context)
+        if local is not None:
+            return local
 
         if not cls._rate_limit_acquire(system):
             return CatalogResult(
                 status="error",
-                error_message="Catalog rate limit exceeded (30 requests per minute per system). Try again later.",
+                error_message=_RATE_LIMIT_MESSAGE,
             )
         
-        service = cls.get_service(system)
         
         if not service:
             return CatalogResult(
@@ -163,7 +273,6 @@ class CatalogRegistry:
                     result.payload = payload.model_dump()
                     result.raw = jsonld
 
-            cls._cache_set(cache_key, result)
             return result
             
         except Exception as e:
@@ -172,28 +281,149 @@ class CatalogRegistry:
                 error_message=str(e)
             )
     
+    @classmethod
+    async def lookup_many(
+        cls,
+        system: str,
+        references: List[str],
+        contexts: Optional[List[Optional[Dict]]] = None,
+    ) -> List[CatalogResult]:
+        """
+        Lookup many references, packing reconcile queries into multi-query
+        requests (the service's RECONCILE_BATCH_SIZE per request).
+        
+        Results are in the same order as references. Caching matches lookup();
+        each reconcile request counts once against the per-system rate limit.
+        """
+        contexts = contexts or [None] * len(references)
+        cache = cls._get_result_cache()
+        results: List[Optional[CatalogResult]] = [None] * len(references)
+        # system -> cache key -> (reference, context, positions)
+        pending: Dict[str, Dict[str, Tuple[str, Optional[Dict], List[int]]]] = {}
+
+        for i, (reference, context) in enumerate(zip(references, contexts)):
+            ref_system = system
+            if not ref_system or ref_system == "unknown" or ref_system == "auto":
+                ref_system = cls.detect_system(reference) or ref_system
+            key = cls._cache_key_lookup(ref_system, reference)
+            hit = cache.get(key)
+            if hit is not None:
+                if hit.stale:
+                    cls._schedule_refresh(
+                        key,
+                        ref_system,
+                        lambda s=ref_system, r=reference, c=context: cls._fetch_lookup(s, r, c),
+                        hit.result,
+                    )
+                results[i] = hit.result
+                continue
+            group = pending.setdefault(ref_system, {})
+            if key in group:
+                group[key][2].append(i)
+            else:
+                group[key] = (reference, context, [i])
+
+        for ref_system, group in pending.items():
+            fetched = await cls._fetch_lookup_many(
+                ref_system, [(reference, context) for reference, context, _ in group.values()]
+            )
+            for (key, (_, _, positions)), result in zip(group.items(), fetched):
+                cache.set(key, ref_system, result, cls._cache_ttl_days(ref_system))
+                for i in positions:
+                    results[i] = result
+        return results
+
+    @classmethod
+    async def _fetch_lookup_many(
+        cls,
+        system: str,
+        items: List[Tuple[str, Optional[Dict]]],
+    ) -> List[CatalogResult]:
+        """Local type mirror first, then chunked, rate-limited reconcile of the misses (no caching)."""
+        service = cls.get_service(system)
+        if not service:
+            return [
+                CatalogResult(
+                    status="error",
+                    error_message=f"Unsupported or undetected reference system: {system or reference}"
+                )
+                for reference, _ in items
+            ]
+
+        results: List[Optional[CatalogResult]] = [
+            cls._resolve_local(service, reference, context) for reference, context in items
+        ]
+        misses = [i for i, result in enumerate(results) if result is None]
+        batch_size = max(1, service.RECONCILE_BATCH_SIZE)
+        for start in range(0, len(misses), batch_size):
+            chunk = misses[start:start + batch_size]
+            if not cls._rate_limit_acquire(system):
+                for i in chunk:
+                    results[i] = CatalogResult(status="error", error_message=_RATE_LIMIT_MESSAGE)
+                continue
+            try:
+                queries = [await service.build_reconcile_query(*items[i]) for i in chunk]
+                fetched = await service.reconcile_many(queries)
+            except Exception as e:
+                fetched = [CatalogResult(status="error", error_message=str(e)) for _ in chunk]
+            for i, result in zip(chunk, fetched):
+                results[i] = result
+
+        await cls._attach_type_data(service, results)
+        return results
+
+    @classmethod
+    async def _attach_type_data(cls, service: CatalogService, results: List[CatalogResult]) -> None:
+        """Fetch JSON-LD once per matched type and attach the parsed payload."""
+        by_type: Dict[str, List[CatalogResult]] = {}
+        for result in results:
+            # Skip fetch when payload already set (e.g. RPC scraper in reconcile)
+            if result.status == "success" and result.external_id and result.payload is None:
+                by_type.setdefault(result.external_id, []).append(result)
+
+        semaphore = asyncio.Semaphore(_TYPE_FETCH_CONCURRENCY)
+
+        async def fetch(external_id: str, matches: List[CatalogResult]) -> None:
+            try:
+                async with semaphore:
+                    jsonld = await service.fetch_type_data(external_id)
+                if jsonld:
+                    payload = service.parse_payload(jsonld).model_dump()
+                    for result in matches:
+                        result.payload = payload
+                        result.raw = jsonld
+            except Exception as e:
+                logger.warning("Type data fetch failed for %s: %s", external_id, e)
+
+        await asyncio.gather(*(fetch(external_id, matches) for external_id, matches in by_type.items()))
+
     @classmethod
     async def get_by_id(cls, system: str, external_id: str) -> CatalogResult:
         """
         Fetch full details for a specific catalog ID.
-        Uses in-memory cache (24h TTL) and per-system rate limit (30/min).
+        Uses the persistent result cache (per-system TTL, stale-while-revalidate)
+        and per-system rate limit (30/min).
         """
         system = system.lower()
         if system == "rrc":
             system = "crawford"
 
-        cache_key = cls._cache_key_get_by_id(system, external_id)
-        cached = cls._cache_get(cache_key)
-        if cached is not None:
-            return cached
+        return await cls._cached(
+            cls._cache_key_get_by_id(system, external_id),
+            system,
+            lambda: cls._fetch_by_id(system, external_id),
+        )
 
-        if not cls._rate_limit_acquire(system):
+    @classmethod
+    async def _fetch_by_id(cls, system: str, external_id: str) -> CatalogResult:
+        """Rate-limited fetch of one catalog type (no caching); mirrored types skip the limit."""
+        service = cls.get_service(system)
+        if not (service and service.local_type_data(external_id)) and not cls._rate_limit_acquire(system):
             return CatalogResult(
                 status="error",
-                error_message="Catalog rate limit exceeded (30 requests per minute per system). Try again later.",
+                error_message=_RATE_LIMIT_MESSAGE,
             )
             
-        service = cls.get_service(system)
         if not service:
              return CatalogResult(
                 status="error", 
@@ -216,7 +446,6 @@ class CatalogRegistry:
                 payload=payload,
                 raw=jsonld
             )
-            cls._cache_set(cache_key, result)
             return result
             
         except Exception as e:
@@ -0,0 +1,220 @@
+"""Persistent cache of CatalogResult for registry lookups and get-by-id.
+
+SQLite-backed (survives restarts) and bounded with LRU eviction. Freshness
+follows the service's CACHE_TTL_DAYS for matches; not-found results and
+matches whose type data could not be fetched (payload missing) use a shorter
+negative TTL, and deferred (timed out) and error results are never cached.
+Once an entry
+expires it is still served as stale for a grace period so the registry can
+return it immediately and refresh it in the background.
+
+Reads do not write: last-access times of hits are buffered in memory and
+flushed in one batch (on the next set, or when the buffer is large or old),
+and the row count is tracked approximately so eviction only counts rows when
+the cache may be over its limit.
+"""
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.infrastructure.services.catalogs.base import CatalogResult
+
+logger = logging.getLogger(__name__)
+
+_DAY_SEC = 86400
+
+# Statuses cached for the system TTL vs the negative TTL; anything else (deferred, error) is not cached
+_POSITIVE_STATUSES = ("success", "ambiguous")
+_NEGATIVE_STATUSES = ("not_found",)
+
+# Buffered last-access updates are written once this many are pending or this old
+_ACCESS_FLUSH_SIZE = 256
+_ACCESS_FLUSH_SEC = 60.0
+
+
+@dataclass
+class CachedCatalogResult:
+    """A cache hit; stale entries should be served while they are refreshed."""
+    result: CatalogResult
+    stale: bool
+
+
+class CatalogResultCache:
+    """SQLite cache of CatalogResult keyed by (kind, system, reference/id)."""
+
+    def __init__(
+        self,
+        db_path: str = "data/catalog_cache.sqlite",
+        max_entries: int = 20000,
+        negative_ttl_hours: float = 24.0,
+        stale_grace_days: float = 30.0,
+        clock=time.time,
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.negative_ttl_sec = negative_ttl_hours * 3600
+        self.stale_grace_sec = stale_grace_days * _DAY_SEC
+        self._clock = clock
+        self._local = threading.local()
+        self._access_lock = threading.Lock()
+        self._pending_access: Dict[str, float] = {}
+        self._last_flush = clock()
+        self._init_db()
+        # Upper bound on rows; recounted only when it passes max_entries
+        self._approx_count = len(self)
+
+    @classmethod
+    def from_settings(cls, settings) -> "CatalogResultCache":
+        return cls(
+            db_path=settings.CATALOG_CACHE_PATH,
+            max_entries=settings.CATALOG_CACHE_MAX_ENTRIES,
+            negative_ttl_hours=settings.CATALOG_CACHE_NEGATIVE_TTL_HOURS,
+            stale_grace_days=settings.CATALOG_CACHE_STALE_GRACE_DAYS,
+        )
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if not hasattr(self._local, "conn"):
+            self._local.conn = sqlite3.connect(str(self.db_path))
+        return self._local.conn
+
+    def _init_db(self):
+        conn = self._get_conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS catalog_cache ("
+            "cache_key TEXT PRIMARY KEY, system TEXT NOT NULL, status TEXT NOT NULL, "
+            "result TEXT NOT NULL, fetched_at REAL NOT NULL, expires_at REAL NOT NULL, "
+            "last_access REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_catalog_cache_access ON catalog_cache(last_access)")
+        conn.commit()
+
+    @staticmethod
+    def make_key(kind: str, system: str, value: str) -> str:
+        return f"{kind}|{(system or '').lower().strip()}|{(value or '').strip()}"
+
+    def get(self, key: str) -> Optional[CachedCatalogResult]:
+        """Fresh or stale (within the grace period) entry, or None."""
+        now = self._clock()
+        conn = self._get_conn()
+        row = conn.execute(
+            "SELECT result, expires_at FROM catalog_cache WHERE cache_key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        result_json, expires_at = row
+        if now > expires_at + self.stale_grace_sec:
+            self.delete(key)
+            return None
+        try:
+            result = CatalogResult.model_validate_json(result_json)
+        except ValueError as e:
+            logger.warning("Dropping unreadable catalog cache entry %s: %s", key, e)
+            self.delete(key)
+            return None
+        self._touch(key, now)
+        return CachedCatalogResult(result=result, stale=now > expires_at)
+
+    def _touch(self, key: str, now: float) -> None:
+        """Record a hit; written with the next batch instead of per read."""
+        with self._access_lock:
+            self._pending_access[key] = now
+            due = (
+                len(self._pending_access) >= _ACCESS_FLUSH_SIZE
+                or now - self._last_flush >= _ACCESS_FLUSH_SEC
+            )
+        if due:
+            self.flush()
+
+    def _write_access(self, conn: sqlite3.Connection) -> None:
+        with self._access_lock:
+            pending, self._pending_access = self._pending_access, {}
+            self._last_flush = self._clock()
+        if pending:
+            conn.executemany(
+                "UPDATE catalog_cache SET last_access = ? WHERE cache_key = ?",
+                [(ts, key) for key, ts in pending.items()],
+            )
+
+    def flush(self) -> None:
+        """Write buffered last-access times."""
+        conn = self._get_conn()
+        self._write_access(conn)
+        conn.commit()
+
+    @staticmethod
+    def is_incomplete(result: CatalogResult) -> bool:
+        """True for a match whose type data (payload) is missing, e.g. its fetch failed."""
+        return result.status == "success" and result.payload is None
+
+    def set(self, key: str, system: str, result: CatalogResult, ttl_days: float) -> bool:
+        """Store result (positive: ttl_days, negative: negative TTL). Returns False if not cacheable."""
+        if self.is_incomplete(result):
+            ttl_sec = self.negative_ttl_sec
+        elif result.status in _POSITIVE_STATUSES:
+            ttl_sec = ttl_days * _DAY_SEC
+        elif result.status in _NEGATIVE_STATUSES:
+            ttl_sec = self.negative_ttl_sec
+        else:
+            return False
+        now = self._clock()
+        conn = self._get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO catalog_cache "
+            "(cache_key, system, status, result, fetched_at, expires_at, last_access) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, (system or "").lower(), result.status, result.model_dump_json(), now, now + ttl_sec, now),
+        )
+        self._approx_count += 1
+        self._write_access(conn)
+        if self._approx_count > self.max_entries:
+            self._evict(conn)
+        conn.commit()
+        return True
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used entries beyond max_entries."""
+        (count,) = conn.execute("SELECT COUNT(*) FROM catalog_cache").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM catalog_cache WHERE cache_key IN "
+                "(SELECT cache_key FROM catalog_cache ORDER BY last_access ASC LIMIT ?)",
+                (excess,),
+            )
+            count -= excess
+        self._approx_count = count
+
+    def delete(self, key: str) -> None:
+        conn = self._get_conn()
+        conn.execute("DELETE FROM catalog_cache WHERE cache_key = ?", (key,))
+        conn.commit()
+        with self._access_lock:
+            self._pending_access.pop(key, None)
+
+    def clear(self) -> None:
+        conn = self._get_conn()
+        conn.execute("DELETE FROM catalog_cache")
+        conn.commit()
+        with self._access_lock:
+            self._pending_access.clear()
+        self._approx_count = 0
+
+    def __len__(self) -> int:
+        return self._get_conn().execute("SELECT COUNT(*) FROM catalog_cache").fetchone()[0]
+
+
+# Global cache instance
+_catalog_result_cache: Optional[CatalogResultCache] = None
+
+
+def get_catalog_result_cache() -> CatalogResultCache:
+    """Get or create the process-wide catalog result cache."""
+    global _catalog_result_cache
+    if _catalog_result_cache is None:
+        from src.infrastructure.config import get_settings
+        _catalog_result_cache = CatalogResultCache.from_settings(get_settings())
+    return _catalog_result_cache
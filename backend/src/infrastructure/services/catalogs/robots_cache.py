@@ -1,35 +1,44 @@
 """Robots.txt cache and parser for polite catalog scraping.
 
-Fetch and cache robots.txt per host (24h TTL). Use can_fetch(user_agent, url)
-before each type-page request. Honor Crawl-delay if present (use max(parsed, our_min)).
+Fetch and cache robots.txt per host (24h TTL; 1h when unreachable, which allows
+everything). Use is_allowed(user_agent, url) before each type-page request and
+get_crawl_delay_sec(host) for spacing (the crawl scheduler does this). Honor
+Crawl-delay if present (use max(parsed, our_min)).
+
+Each host is fetched single-flight: concurrent callers for one host await the
+same fetch while other hosts proceed. Entries are persisted to SQLite so a
+restart does not refetch every robots.txt.
 """
 import asyncio
 import logging
+import sqlite3
+import threading
 import time
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
-import httpx
+from src.infrastructure.services.catalogs.http_pool import CatalogHTTPPool, catalog_http_client
 
 logger = logging.getLogger(__name__)
 
-# Cache: host -> (RobotFileParser, expiry_timestamp)
-_robots_cache: dict[str, Tuple[RobotFileParser, float]] = {}
 _robots_ttl_sec = 24 * 3600  # 24 hours
+_robots_unreachable_ttl_sec = 3600  # retry unreachable robots.txt after 1 hour
 _min_crawl_delay_sec = 8.0
-_last_request_time: dict[str, float] = {}
-_lock = asyncio.Lock()
 
 
-async def _fetch_robots_txt(host: str, timeout: float = 10.0) -> Optional[str]:
+async def _fetch_robots_txt(
+    host: str, timeout: float = 10.0, http_pool: Optional[CatalogHTTPPool] = None
+) -> Optional[str]:
     """Fetch robots.txt for host. Returns None on failure."""
     url = f"https://{host}/robots.txt" if not host.startswith("http") else f"{host}/robots.txt"
     if not url.startswith("http"):
         url = f"https://{host}/robots.txt"
     try:
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-            r = await client.get(url)
+        async with catalog_http_client(url, http_pool, timeout) as client:
+            r = await client.get(url, timeout=timeout)
             if r.status_code == 200:
                 return r.text
     except Exception as e:
@@ -50,29 +59,143 @@ def _get_crawl_delay_from_content(content: str) -> Optional[float]:
     return None
 
 
-async def is_allowed(user_agent: str, url: str) -> bool:
+@dataclass
+class RobotsEntry:
+    """Parsed robots.txt for one host; content None = unreachable (allow all)."""
+    content: Optional[str]
+    expires_at: float  # wall clock (persisted)
+    parser: Optional[RobotFileParser] = None
+    crawl_delay_sec: Optional[float] = None
+
+    @classmethod
+    def build(cls, content: Optional[str], expires_at: float) -> "RobotsEntry":
+        entry = cls(content=content, expires_at=expires_at)
+        if content is not None:
+            entry.parser = RobotFileParser()
+            entry.parser.parse(content.splitlines())
+            entry.crawl_delay_sec = _get_crawl_delay_from_content(content)
+        return entry
+
+    def can_fetch(self, user_agent: str, url: str) -> bool:
+        return self.parser is None or self.parser.can_fetch(user_agent, url)
+
+
+class RobotsCache:
+    """Per-host robots.txt entries: in memory, persisted to SQLite, fetched single-flight."""
+
+    def __init__(self, db_path: Optional[str] = "data/robots_cache.sqlite", clock=time.time):
+        self.db_path = Path(db_path) if db_path else None
+        self._clock = clock
+        self._entries: Dict[str, RobotsEntry] = {}
+        self._inflight: Dict[str, "asyncio.Future[RobotsEntry]"] = {}
+        self._local = threading.local()
+        if self.db_path:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = self._get_conn()
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS robots_txt ("
+                "host TEXT PRIMARY KEY, content TEXT, fetched_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.commit()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if not hasattr(self._local, "conn"):
+            self._local.conn = sqlite3.connect(str(self.db_path))
+        return self._local.conn
+
+    def _load(self, host: str) -> Optional[RobotsEntry]:
+        if not self.db_path:
+            return None
+        row = self._get_conn().execute(
+            "SELECT content, expires_at FROM robots_txt WHERE host = ?", (host,)
+        ).fetchone()
+        return RobotsEntry.build(row[0], row[1]) if row else None
+
+    def _save(self, host: str, entry: RobotsEntry) -> None:
+        if not self.db_path:
+            return
+        conn = self._get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO robots_txt (host, content, fetched_at, expires_at) VALUES (?, ?, ?, ?)",
+            (host, entry.content, self._clock(), entry.expires_at),
+        )
+        conn.commit()
+
+    def peek(self, host: str) -> Optional[RobotsEntry]:
+        """Unexpired entry from memory or disk, without fetching."""
+        key = host.lower()
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._load(key)
+            if entry is not None:
+                self._entries[key] = entry
+        if entry is not None and self._clock() < entry.expires_at:
+            return entry
+        return None
+
+    async def get(self, host: str, http_pool: Optional[CatalogHTTPPool] = None) -> RobotsEntry:
+        """Entry for host, fetching robots.txt once even when many callers ask at the same time."""
+        key = host.lower()
+        entry = self.peek(key)
+        if entry is not None:
+            return entry
+        inflight = self._inflight.get(key)
+        if inflight is None or inflight.get_loop() is not asyncio.get_running_loop():
+            inflight = asyncio.ensure_future(self._fetch(key, http_pool))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda f: self._inflight.pop(key) if self._inflight.get(key) is f else None)
+        return await asyncio.shield(inflight)
+
+    async def _fetch(self, host: str, http_pool: Optional[CatalogHTTPPool]) -> RobotsEntry:
+        content = await _fetch_robots_txt(host, http_pool=http_pool)
+        ttl = _robots_ttl_sec if content is not None else _robots_unreachable_ttl_sec
+        entry = RobotsEntry.build(content, self._clock() + ttl)
+        self._entries[host] = entry
+        self._save(host, entry)
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+        if self.db_path:
+            conn = self._get_conn()
+            conn.execute("DELETE FROM robots_txt")
+            conn.commit()
+
+
+# Global cache instance
+_robots_cache: Optional[RobotsCache] = None
+
+
+def get_robots_cache() -> RobotsCache:
+    """Get or create the process-wide robots.txt cache."""
+    global _robots_cache
+    if _robots_cache is None:
+        from src.infrastructure.config import get_settings
+        _robots_cache = RobotsCache(get_settings().CATALOG_ROBOTS_CACHE_PATH)
+    return _robots_cache
+
+
+def set_robots_cache(cache: Optional[RobotsCache]) -> None:
+    """Use a specific robots cache (tests); None = recreate from settings on next use."""
+    global _robots_cache
+    _robots_cache = cache
+
+
+def _host_of(url: str) -> str:
+    parsed = urlparse(url)
+    return parsed.netloc or parsed.path.split("/")[0]
+
+
+async def is_allowed(user_agent: str, url: str, http_pool: Optional[CatalogHTTPPool] = None) -> bool:
     """
     Return True if robots.txt allows fetching the given URL for the user_agent.
     Caches robots.txt per host (24h). If robots.txt is unreachable, returns True (allow).
     """
-    parsed = urlparse(url)
-    host = parsed.netloc or parsed.path.split("/")[0]
+    host = _host_of(url)
     if not host:
         return True
-    key = host.lower()
-    async with _lock:
-        entry = _robots_cache.get(key)
-        if entry:
-            rp, expiry = entry
-            if time.monotonic() < expiry:
-                return rp.can_fetch(user_agent, url)
-        content = await _fetch_robots_txt(host)
-        if content is None:
-            return True  # No robots.txt or error -> allow
-        rp = RobotFileParser()
-        rp.parse(content.splitlines())
-        _robots_cache[key] = (rp, time.monotonic() + _robots_ttl_sec)
-        return rp.can_fetch(user_agent, url)
+    entry = await get_robots_cache().get(host, http_pool=http_pool)
+    return entry.can_fetch(user_agent, url)
 
 
 def get_crawl_delay_sec(host: str) -> float:
@@ -80,20 +203,7 @@ def get_crawl_delay_sec(host: str) -> float:
     Return crawl delay in seconds for host.
     Uses our minimum (8s) if Crawl-delay was not in robots.txt or not yet fetched.
     """
-    entry = _robots_cache.get(host.lower())
-    if entry:
-        # We don't store crawl_delay in cache currently; return minimum
-        pass
+    entry = get_robots_cache().peek(host)
+    if entry is not None and entry.crawl_delay_sec is not None:
+        return entry.crawl_delay_sec
     return _min_crawl_delay_sec
-
-
-async def enforce_rate_limit(host: str, min_delay_sec: float) -> None:
-    """Sleep so that at least min_delay_sec has passed since last request to this host."""
-    key = host.lower()
-    last = _last_request_time.get(key, 0)
-    elapsed = time.monotonic() - last
-    if elapsed < min_delay_sec:
-        wait = min_delay_sec - elapsed
-        logger.debug("RPC rate limit: waiting %.1fs for %s", wait, host)
-        await asyncio.sleep(wait)
-    _last_request_time[key] = time.monotonic()
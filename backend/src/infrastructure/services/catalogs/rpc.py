@@ -116,6 +116,7 @@ class RPCService(CatalogService):
                 url,
                 user_agent=settings.CATALOG_SCRAPER_USER_AGENT,
                 rate_limit_sec=settings.CATALOG_SCRAPER_RPC_RATE_LIMIT_SEC,
+                http_pool=self.http_pool,
             )
             if scrape.status in ("full", "partial") and scrape.payload:
                 confidence = 0.9 if scrape.status == "full" else 0.6
@@ -171,6 +172,7 @@ class RPCService(CatalogService):
             url,
             user_agent=settings.CATALOG_SCRAPER_USER_AGENT,
             rate_limit_sec=settings.CATALOG_SCRAPER_RPC_RATE_LIMIT_SEC,
+            http_pool=self.http_pool,
         )
         if scrape.payload:
             return scrape.payload.model_dump()
@@ -1,7 +1,7 @@
 """RPC Online (Roman Provincial Coinage) HTML scraper.
 
 Fetches a single type page (e.g. /coins/1/4374), parses the table into CatalogPayload.
-Polite: robots.txt check, rate limit, one request per reference. Graceful degradation:
+Polite: robots.txt check, requests spaced per host by the crawl scheduler, one request per reference. Graceful degradation:
 returns partial payload when only some fields parse; structure-change detection.
 """
 import logging
@@ -13,10 +13,9 @@ import httpx
 from bs4 import BeautifulSoup
 
 from src.infrastructure.services.catalogs.base import CatalogPayload
-from src.infrastructure.services.catalogs.robots_cache import (
-    enforce_rate_limit,
-    is_allowed,
-)
+from src.infrastructure.services.catalogs.http_pool import CatalogHTTPPool, catalog_http_client
+from src.infrastructure.services.catalogs.crawl_scheduler import get_crawl_scheduler
+from src.infrastructure.services.catalogs.robots_cache import is_allowed
 from src.infrastructure.services.catalogs.parsers.base import roman_to_arabic
 
 logger = logging.getLogger(__name__)
@@ -183,16 +182,15 @@ async def fetch_rpc_type_page(
     user_agent: str,
     timeout_sec: float = 20.0,
     rate_limit_sec: float = 10.0,
+    http_pool: Optional[CatalogHTTPPool] = None,
 ) -> RPCScrapeResult:
     """
     Fetch one RPC type page and parse into CatalogPayload.
-    Checks robots.txt and enforces rate limit before request.
+    Checks robots.txt, then queues the request on the crawl scheduler (at least
+    rate_limit_sec, or the robots.txt Crawl-delay, between requests to the host).
+    Uses the shared keep-alive client for the host when http_pool is given.
     """
-    from urllib.parse import urlparse
-    parsed = urlparse(url)
-    host = parsed.netloc or RPC_BASE_HOST
-
-    allowed = await is_allowed(user_agent, url)
+    allowed = await is_allowed(user_agent, url, http_pool=http_pool)
     if not allowed:
         logger.info("RPC fetch disallowed by robots.txt: %s", url)
         return RPCScrapeResult(
@@ -201,17 +199,14 @@ async def fetch_rpc_type_page(
             message="Fetch disallowed by robots.txt; use link for manual lookup",
         )
 
-    await enforce_rate_limit(host, rate_limit_sec)
+    async def fetch_html() -> str:
+        async with catalog_http_client(url, http_pool, timeout_sec) as client:
+            r = await client.get(url, headers={"User-Agent": user_agent}, timeout=timeout_sec)
+            r.raise_for_status()
+            return r.text
 
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout_sec,
-            follow_redirects=True,
-            headers={"User-Agent": user_agent},
-        ) as client:
-            r = await client.get(url)
-            r.raise_for_status()
-            html = r.text
+        html = await get_crawl_scheduler().submit(url, fetch_html, min_delay_sec=rate_limit_sec)
     except httpx.HTTPStatusError as e:
         logger.warning("RPC fetch HTTP error %s: %s", e.response.status_code, url)
         return RPCScrapeResult(
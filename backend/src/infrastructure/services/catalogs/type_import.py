@@ -0,0 +1,155 @@
+"""Import Nomisma bulk type dumps (OCRE, CRRO) into the local type store.
+
+Accepts JSON-LD dumps (one file holding a @graph of many types, or a
+directory of per-type .jsonld files as served by /id/{id}.jsonld) and, when
+rdflib is installed, RDF/XML or Turtle dumps. Nodes are grouped per type
+(the type URI plus its #obverse/#reverse fragments) so each stored document
+has the shape OCREService/CRROService.parse_payload expect.
+"""
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+from src.infrastructure.services.catalogs.openrefine import OpenRefineCatalogService
+from src.infrastructure.services.catalogs.type_store import LocalTypeRecord, LocalTypeStore, TypeImportStats
+
+try:
+    import rdflib
+    RDFLIB_AVAILABLE = True
+except ImportError:
+    RDFLIB_AVAILABLE = False
+    rdflib = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+JSONLD_SUFFIXES = (".jsonld", ".json")
+RDF_FORMATS = {".rdf": "xml", ".xml": "xml", ".ttl": "turtle", ".nt": "nt"}
+
+# Prefixes the payload parsers look for (nmo:hasMint, dcterms:source, ...)
+NOMISMA_CONTEXT = {
+    "nmo": "http://nomisma.org/ontology#",
+    "dcterms": "http://purl.org/dc/terms/",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "skos": "http://www.w3.org/2004/02/skos/core#",
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+}
+
+
+def _load_document(path: Path) -> Any:
+    suffix = path.suffix.lower()
+    if suffix in RDF_FORMATS:
+        if not RDFLIB_AVAILABLE:
+            raise ImportError(f"rdflib is required to import {path.name}; install the 'catalog-dumps' extra")
+        graph = rdflib.Graph()
+        graph.parse(str(path), format=RDF_FORMATS[suffix])
+        return json.loads(graph.serialize(format="json-ld", context=NOMISMA_CONTEXT))
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _nodes(document: Any) -> List[Dict[str, Any]]:
+    if isinstance(document, list):
+        return [node for item in document for node in _nodes(item)]
+    if isinstance(document, dict):
+        if "@graph" in document:
+            return [node for node in document["@graph"] if isinstance(node, dict)]
+        return [document]
+    return []
+
+
+def _external_id(uri: str) -> str:
+    """ric.2.tr.128 from http://numismatics.org/ocre/id/ric.2.tr.128[#obverse]."""
+    return uri.split("#")[0].rstrip("/").rsplit("/", 1)[-1]
+
+
+def iter_dump_types(
+    service: OpenRefineCatalogService,
+    document: Any,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """(external_id, per-type JSON-LD) for each type of service.SYSTEM in a dump document."""
+    context = document.get("@context") if isinstance(document, dict) else None
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for node in _nodes(document):
+        uri = node.get("@id")
+        if not isinstance(uri, str):
+            continue
+        external_id = _external_id(uri)
+        if service.local_type_key(external_id) is None:
+            continue
+        group = groups.setdefault(external_id, [])
+        # Main type node first (parse_payload picks the node without a fragment)
+        if "#" in uri:
+            group.append(node)
+        else:
+            group.insert(0, node)
+    for external_id, graph in groups.items():
+        if "#" in graph[0].get("@id", "#"):
+            continue  # fragments without their type
+        data: Dict[str, Any] = {"@graph": graph}
+        if context:
+            data["@context"] = context
+        yield external_id, data
+
+
+def _label(node: Dict[str, Any]) -> Any:
+    label = node.get("skos:prefLabel") or node.get("rdfs:label")
+    if isinstance(label, list):
+        english = [item for item in label if isinstance(item, dict) and item.get("@language") == "en"]
+        label = (english or label or [None])[0]
+    if isinstance(label, dict):
+        label = label.get("@value")
+    return label
+
+
+def build_records(
+    service: OpenRefineCatalogService,
+    types: Iterable[Tuple[str, Dict[str, Any]]],
+) -> Iterator[LocalTypeRecord]:
+    """Index fields for each type via the service's id scheme and payload parser."""
+    for external_id, data in types:
+        volume, number = service.local_type_key(external_id)
+        try:
+            payload = service.parse_payload(data)
+        except Exception as e:
+            logger.warning("Skipping %s type %s: %s", service.SYSTEM, external_id, e)
+            continue
+        yield LocalTypeRecord(
+            external_id=external_id,
+            data=data,
+            number=number,
+            volume=volume,
+            authority=payload.authority,
+            mint=payload.mint,
+            label=_label(data["@graph"][0]),
+        )
+
+
+def dump_files(path: Union[str, Path]) -> List[Path]:
+    """The dump file, or every JSON-LD/RDF file under a dump directory."""
+    path = Path(path)
+    if path.is_dir():
+        suffixes = JSONLD_SUFFIXES + tuple(RDF_FORMATS)
+        return sorted(p for p in path.rglob("*") if p.is_file() and p.suffix.lower() in suffixes)
+    return [path]
+
+
+def import_type_dump(
+    store: LocalTypeStore,
+    service: OpenRefineCatalogService,
+    paths: Iterable[Union[str, Path]],
+    prune: bool = False,
+) -> TypeImportStats:
+    """
+    Load dump files into the store; only new or changed types are written.
+
+    prune=True also removes stored types absent from the dump (full dumps only).
+    """
+    def types() -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for path in paths:
+            for dump_path in dump_files(path):
+                logger.info("Reading %s dump %s", service.SYSTEM, dump_path)
+                yield from iter_dump_types(service, _load_document(dump_path))
+
+    return store.upsert_many(service.SYSTEM, build_records(service, types()), prune=prune)
@@ -0,0 +1,172 @@
+"""Local mirror of Nomisma-published type data (OCRE, CRRO).
+
+SQLite-backed store of per-type JSON-LD loaded from bulk dumps (see
+type_import.py). Each type is indexed by (system, volume, number) so the
+catalog services can resolve a reference and its payload without calling
+numismatics.org; a content hash per type lets re-imports skip unchanged types.
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LocalTypeRecord:
+    """One type to store: its JSON-LD and the index fields derived from it."""
+    external_id: str
+    data: Dict[str, Any]
+    number: Optional[str] = None
+    volume: Optional[str] = None
+    authority: Optional[str] = None
+    mint: Optional[str] = None
+    label: Optional[str] = None
+
+
+@dataclass
+class LocalTypeMatch:
+    """A stored type matching a (volume, number) key."""
+    external_id: str
+    authority: Optional[str] = None
+    mint: Optional[str] = None
+    label: Optional[str] = None
+
+
+@dataclass
+class TypeImportStats:
+    """Outcome of an upsert: changed ids are those added or updated."""
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    changed_ids: List[str] = field(default_factory=list)
+
+
+def content_hash(data: Dict[str, Any]) -> str:
+    """Stable hash of a JSON-LD document (key order independent)."""
+    return hashlib.sha256(json.dumps(data, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+class LocalTypeStore:
+    """SQLite store of catalog types keyed by (system, external_id)."""
+
+    def __init__(self, db_path: str = "data/catalog_types.sqlite"):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._init_db()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if not hasattr(self._local, "conn"):
+            self._local.conn = sqlite3.connect(str(self.db_path))
+        return self._local.conn
+
+    def _init_db(self):
+        conn = self._get_conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS catalog_types ("
+            "system TEXT NOT NULL, external_id TEXT NOT NULL, volume TEXT, number TEXT, "
+            "authority TEXT, mint TEXT, label TEXT, content_hash TEXT NOT NULL, "
+            "data TEXT NOT NULL, imported_at REAL NOT NULL, "
+            "PRIMARY KEY (system, external_id))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_catalog_types_key ON catalog_types(system, number, volume)")
+        conn.commit()
+
+    def get(self, system: str, external_id: str) -> Optional[Dict[str, Any]]:
+        """Stored JSON-LD for a type, or None."""
+        row = self._get_conn().execute(
+            "SELECT data FROM catalog_types WHERE system = ? AND external_id = ?",
+            (system, external_id),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find(self, system: str, number: str, volume: Optional[str] = None) -> List[LocalTypeMatch]:
+        """Types with this number (and volume, when given)."""
+        sql = "SELECT external_id, authority, mint, label FROM catalog_types WHERE system = ? AND number = ?"
+        params: List[Any] = [system, number]
+        if volume is not None:
+            sql += " AND volume = ?"
+            params.append(volume)
+        rows = self._get_conn().execute(sql + " ORDER BY external_id", params).fetchall()
+        return [LocalTypeMatch(*row) for row in rows]
+
+    def upsert_many(self, system: str, records: Iterable[LocalTypeRecord], prune: bool = False) -> TypeImportStats:
+        """
+        Insert new types and rewrite those whose content changed; unchanged types are skipped.
+
+        prune=True deletes stored types of this system missing from records
+        (use with a complete dump, not a partial one).
+        """
+        conn = self._get_conn()
+        stats = TypeImportStats()
+        existing = {
+            external_id: (digest, volume, number)
+            for external_id, digest, volume, number in conn.execute(
+                "SELECT external_id, content_hash, volume, number FROM catalog_types WHERE system = ?", (system,)
+            )
+        }
+        seen = set()
+        now = time.time()
+        for record in records:
+            seen.add(record.external_id)
+            digest = content_hash(record.data)
+            previous = existing.get(record.external_id)
+            # Same content and index key; a changed key scheme rewrites the row
+            if previous == (digest, record.volume, record.number):
+                stats.unchanged += 1
+                continue
+            conn.execute(
+                "INSERT OR REPLACE INTO catalog_types "
+                "(system, external_id, volume, number, authority, mint, label, content_hash, data, imported_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    system, record.external_id, record.volume, record.number, record.authority,
+                    record.mint, record.label, digest, json.dumps(record.data), now,
+                ),
+            )
+            if previous is None:
+                stats.added += 1
+            else:
+                stats.updated += 1
+            stats.changed_ids.append(record.external_id)
+        if prune:
+            missing = [external_id for external_id in existing if external_id not in seen]
+            conn.executemany(
+                "DELETE FROM catalog_types WHERE system = ? AND external_id = ?",
+                [(system, external_id) for external_id in missing],
+            )
+            stats.removed = len(missing)
+            stats.changed_ids.extend(missing)
+        conn.commit()
+        return stats
+
+    def count(self, system: Optional[str] = None) -> int:
+        if system is None:
+            return self._get_conn().execute("SELECT COUNT(*) FROM catalog_types").fetchone()[0]
+        return self._get_conn().execute(
+            "SELECT COUNT(*) FROM catalog_types WHERE system = ?", (system,)
+        ).fetchone()[0]
+
+
+# Global store instance (None when nothing has been imported)
+_local_type_store: Optional[LocalTypeStore] = None
+
+
+def get_local_type_store() -> Optional[LocalTypeStore]:
+    """Process-wide local type store, or None if no dump has been imported yet."""
+    global _local_type_store
+    if _local_type_store is None:
+        from src.infrastructure.config import get_settings
+        path = get_settings().CATALOG_TYPE_STORE_PATH
+        if not path or not Path(path).exists():
+            return None
+        _local_type_store = LocalTypeStore(path)
+    return _local_type_store
@@ -0,0 +1,164 @@
+"""WebP renditions (thumb / medium / large) of local coin images.
+
+Renditions sit next to their original under data/coin_images, named
+<stem>.<size>.webp, so sha256/ab/<sha>.jpg gets sha256/ab/<sha>.thumb.webp and
+is served as /images/sha256/ab/<sha>.thumb.webp. Each is scaled to fit a
+square box (never enlarged), EXIF-rotated and stripped of metadata.
+
+The image mirror queues renditions for every new file on a small thread pool,
+so grids can load thumbnails instead of full-size originals. Renditions still
+missing when requested (older images, a failed or pending job) are generated
+on that first request by the /images mount.
+"""
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.infrastructure.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image, ImageOps
+    PILLOW_AVAILABLE = True
+except ImportError:
+    PILLOW_AVAILABLE = False
+    Image = None  # type: ignore
+
+# Rendition name -> longest side in pixels
+RENDITIONS: Dict[str, int] = {"thumb": 256, "medium": 800, "large": 1600}
+
+IMAGES_URL_PREFIX = "/images/"
+ORIGINAL_EXTS = (".jpg", ".jpeg", ".png", ".gif", ".webp")
+
+
+def rendition_name(name: str, size: str) -> str:
+    """photo.jpg -> photo.thumb.webp"""
+    return f"{Path(name).stem}.{size}.webp"
+
+
+def parse_rendition(name: str) -> Optional[tuple]:
+    """(original stem, size) if name is a rendition file name, else None."""
+    parts = name.rsplit(".", 2)
+    if len(parts) == 3 and parts[2] == "webp" and parts[1] in RENDITIONS:
+        return parts[0], parts[1]
+    return None
+
+
+def rendition_urls(url: Optional[str]) -> Dict[str, str]:
+    """Size -> URL of each rendition of a local /images/... image; {} for remote or unknown URLs."""
+    if not url or not url.startswith(IMAGES_URL_PREFIX):
+        return {}
+    relative = url[len(IMAGES_URL_PREFIX):]
+    if Path(relative).suffix.lower() not in ORIGINAL_EXTS or parse_rendition(Path(relative).name):
+        return {}
+    parent = relative.rsplit("/", 1)[0] + "/" if "/" in relative else ""
+    return {size: f"{IMAGES_URL_PREFIX}{parent}{rendition_name(relative, size)}" for size in RENDITIONS}
+
+
+class ImageDerivativeService:
+    """Generates renditions on a thread pool; one job per original at a time."""
+
+    def __init__(self, workers: int = 2, quality: int = 80):
+        self.quality = quality
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="image-derivatives")
+        self._lock = threading.Lock()
+        self._jobs: Dict[Path, Future] = {}
+
+    def rendition_path(self, original: Path, size: str) -> Path:
+        return original.with_name(rendition_name(original.name, size))
+
+    def generate(self, original: Path) -> Dict[str, Path]:
+        """Write every missing rendition of original (blocking); size -> path."""
+        if not PILLOW_AVAILABLE:
+            raise RuntimeError("Pillow not installed. Run: pip install Pillow")
+        targets = {size: self.rendition_path(original, size) for size in RENDITIONS}
+        missing = {size: path for size, path in targets.items() if not path.exists()}
+        if not missing:
+            return targets
+        with Image.open(original) as source:
+            image = ImageOps.exif_transpose(source)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+            # Largest first, so each smaller rendition is scaled from the previous one
+            for size in sorted(missing, key=RENDITIONS.get, reverse=True):
+                image = image.copy()
+                image.thumbnail((RENDITIONS[size], RENDITIONS[size]), Image.LANCZOS)
+                path = missing[size]
+                tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                image.save(tmp, "WEBP", quality=self.quality, method=4)
+                os.replace(tmp, path)
+        return targets
+
+    def submit(self, original: Path) -> Future:
+        """Queue generate(original) unless a job for it is already running."""
+        original = Path(original)
+        with self._lock:
+            job = self._jobs.get(original)
+            if job is None:
+                job = self._jobs[original] = self._executor.submit(self._run, original)
+        return job
+
+    def _run(self, original: Path) -> Dict[str, Path]:
+        try:
+            return self.generate(original)
+        except Exception as e:
+            logger.warning("Could not create renditions of %s: %s", original, e)
+            raise
+        finally:
+            with self._lock:
+                self._jobs.pop(original, None)
+
+    def find_original(self, rendition: Path) -> Optional[Path]:
+        """Original image a rendition path is derived from, if it exists."""
+        parsed = parse_rendition(rendition.name)
+        if parsed is None:
+            return None
+        stem = parsed[0]
+        for ext in ORIGINAL_EXTS:
+            candidate = rendition.with_name(stem + ext)
+            if candidate.is_file():
+                return candidate
+        return None
+
+    async def ensure(self, rendition: Path) -> Optional[Path]:
+        """Path of rendition, generating it first if missing; None if it has no original."""
+        if rendition.is_file():
+            return rendition
+        original = self.find_original(rendition)
+        if original is None:
+            return None
+        try:
+            await asyncio.wrap_future(self.submit(original))
+        except Exception:
+            return None
+        return rendition if rendition.is_file() else None
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the pool; with wait, finish queued jobs first, else drop them."""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+_image_derivatives: Optional[ImageDerivativeService] = None
+
+
+def get_image_derivatives() -> ImageDerivativeService:
+    """Process-wide service with IMAGE_DERIVATIVE_WORKERS threads."""
+    global _image_derivatives
+    if _image_derivatives is None:
+        settings = get_settings()
+        _image_derivatives = ImageDerivativeService(
+            workers=settings.IMAGE_DERIVATIVE_WORKERS,
+            quality=settings.IMAGE_DERIVATIVE_QUALITY,
+        )
+    return _image_derivatives
+
+
+def set_image_derivatives(service: Optional[ImageDerivativeService]) -> None:
+    """Replace the service (tests); None re-reads settings on next use."""
+    global _image_derivatives
+    _image_derivatives = service
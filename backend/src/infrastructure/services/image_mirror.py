@@ -0,0 +1,364 @@
+"""Local mirror of remote coin and auction lot images.
+
+Images are downloaded concurrently (a global limit plus a per-host limit, so
+one slow auction CDN cannot take every slot) into data/coin_images under
+content-addressed names: sha256/ab/<sha256>.<ext>, served by the /images
+mount as /images/sha256/ab/<sha256>.<ext>. The same picture reached through
+different URLs (lot page, thumbnail CDN, re-listing) is stored once. Each
+newly stored file gets WebP renditions queued (image_derivatives). Since a
+content-addressed URL never changes meaning, /images serves these files as
+immutable; legacy local files (/images/<name>) are adopted into the same
+layout so their URLs become content-versioned too.
+
+A SQLite index maps each remote URL to its blob, so a rerun skips URLs that
+are already mirrored and only retries failures. mirror_coin_images points
+coin_images_v2 rows at the local copies; auction lot images are mirrored but
+auction_data_v2 keeps the remote URLs it was scraped with.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+from sqlalchemy.orm import Session
+
+from src.infrastructure.config import get_settings
+from src.infrastructure.persistence.orm import AuctionDataModel, CoinImageModel
+from src.infrastructure.services.image_derivatives import ImageDerivativeService, get_image_derivatives
+
+logger = logging.getLogger(__name__)
+
+# Relative IMAGE_MIRROR_* paths resolve here, the directory main.py serves /images from
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent.parent
+
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024  # Same cap as image_processor.ImageConfig.max_size_mb
+
+# sha256/ab/<sha256>.<ext> and its renditions (<sha256>.<size>.webp); group 1 = hash, 2 = size
+CONTENT_ADDRESSED = re.compile(r"(?:^|/)sha256/[0-9a-f]{2}/([0-9a-f]{64})(?:\.([a-z]+))?\.[a-z0-9]+$")
+
+# Magic bytes -> extension; anything else is rejected as "not an image"
+_SIGNATURES: Tuple[Tuple[bytes, str], ...] = (
+    (b"\xff\xd8\xff", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+)
+
+
+def sniff_image_ext(data: bytes) -> Optional[str]:
+    """File extension for JPEG/PNG/GIF/WebP content, else None."""
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    for signature, ext in _SIGNATURES:
+        if data.startswith(signature):
+            return ext
+    return None
+
+
+def is_remote(url: Optional[str]) -> bool:
+    return bool(url) and url.strip().lower().startswith(("http://", "https://"))
+
+
+@dataclass(frozen=True)
+class MirroredImage:
+    url: str  # Remote URL it was downloaded from
+    sha256: str
+    ext: str
+    size: int
+
+    @property
+    def relative_path(self) -> str:
+        return f"sha256/{self.sha256[:2]}/{self.sha256}.{self.ext}"
+
+    @property
+    def local_url(self) -> str:
+        """URL under the /images static mount."""
+        return f"/images/{self.relative_path}"
+
+
+@dataclass
+class MirrorReport:
+    requested: int = 0
+    already_mirrored: int = 0  # Found in the index; no request made
+    downloaded: int = 0
+    deduplicated: int = 0  # Downloaded, but identical content was already on disk
+    failed: int = 0
+    bytes_downloaded: int = 0
+    bytes_written: int = 0
+    bytes_saved: int = 0  # Not written thanks to deduplication
+    rows_updated: int = 0  # coin_images_v2 rows now pointing at a local copy
+    adopted: int = 0  # Legacy /images/<name> files moved to content-addressed URLs
+    errors: List[Tuple[str, str]] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {**vars(self), "errors": [list(e) for e in self.errors]}
+
+
+class ImageMirror:
+    """Downloads images into a content-addressed directory with a URL index."""
+
+    def __init__(
+        self,
+        root: str = "data/coin_images",
+        index_path: str = "data/image_mirror.sqlite",
+        max_concurrency: int = 16,
+        per_host: int = 4,
+        timeout: float = 30.0,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        client: Optional[httpx.AsyncClient] = None,
+        clock=time.time,
+        derivatives: Optional[ImageDerivativeService] = None,
+    ):
+        self.root = Path(root)
+        self.derivatives = derivatives
+        self.index_path = Path(index_path)
+        self.per_host = per_host
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._local = threading.local()
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._client = client or httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            headers={"User-Agent": get_settings().SCRAPER_USER_AGENT},
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=per_host),
+        )
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._get_conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS mirrored_images ("
+            "url TEXT PRIMARY KEY, sha256 TEXT, ext TEXT, size INTEGER, "
+            "error TEXT, fetched_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_mirrored_images_sha ON mirrored_images(sha256)")
+        conn.commit()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if not hasattr(self._local, "conn"):
+            self._local.conn = sqlite3.connect(str(self.index_path))
+        return self._local.conn
+
+    def path_for(self, image: MirroredImage) -> Path:
+        return self.root / image.relative_path
+
+    def lookup(self, url: str) -> Optional[MirroredImage]:
+        """Mirrored copy of url, if downloaded before and still on disk."""
+        row = self._get_conn().execute(
+            "SELECT url, sha256, ext, size FROM mirrored_images WHERE url = ? AND sha256 IS NOT NULL",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        image = MirroredImage(*row)
+        return image if self.path_for(image).exists() else None
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.per_host)
+        return slot
+
+    async def _download(self, url: str) -> bytes:
+        async with self._slots, self._host_slot(url):
+            async with self._client.stream("GET", url) as response:
+                response.raise_for_status()
+                chunks, size = [], 0
+                async for chunk in response.aiter_bytes():
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise ValueError(f"Image larger than {self.max_bytes} bytes")
+                    chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _store(self, url: str, data: bytes) -> Tuple[MirroredImage, bool]:
+        """Write data under its hash unless already present; (image, written)."""
+        ext = sniff_image_ext(data)
+        if ext is None:
+            raise ValueError("Response is not a JPEG, PNG, GIF or WebP image")
+        image = MirroredImage(url, hashlib.sha256(data).hexdigest(), ext, len(data))
+        path = self.path_for(image)
+        written = not path.exists()
+        if written:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            if self.derivatives is not None:
+                self.derivatives.submit(path)
+        self._record(url, image=image)
+        return image, written
+
+    def _record(self, url: str, image: Optional[MirroredImage] = None, error: Optional[str] = None) -> None:
+        conn = self._get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO mirrored_images (url, sha256, ext, size, error, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (url, image.sha256 if image else None, image.ext if image else None,
+             image.size if image else None, error, self._clock()),
+        )
+        conn.commit()
+
+    async def fetch(self, url: str, report: Optional[MirrorReport] = None) -> Optional[MirroredImage]:
+        """Local copy of url, downloading it first if needed; None if that fails."""
+        report = report if report is not None else MirrorReport()
+        report.requested += 1
+        image = self.lookup(url)
+        if image is not None:
+            report.already_mirrored += 1
+            return image
+        try:
+            data = await self._download(url)
+            image, written = self._store(url, data)
+        except Exception as e:
+            logger.warning("Could not mirror image %s: %s", url[:120], e)
+            self._record(url, error=str(e)[:500])
+            report.failed += 1
+            report.errors.append((url, str(e)))
+            return None
+        report.downloaded += 1
+        report.bytes_downloaded += image.size
+        if written:
+            report.bytes_written += image.size
+        else:
+            report.deduplicated += 1
+            report.bytes_saved += image.size
+        return image
+
+    async def mirror(self, urls: Iterable[str], report: Optional[MirrorReport] = None) -> Dict[str, MirroredImage]:
+        """Mirror urls concurrently (within the global and per-host limits)."""
+        report = report if report is not None else MirrorReport()
+        unique = list(dict.fromkeys(u.strip() for u in urls if is_remote(u)))
+        images = await asyncio.gather(*(self.fetch(url, report) for url in unique))
+        return {url: image for url, image in zip(unique, images) if image is not None}
+
+    def adopt(self, local_url: str) -> Optional[MirroredImage]:
+        """
+        Content-addressed copy of a legacy /images/<name> file (left in place
+        for any other references); None if it is missing or not an image.
+        """
+        if not local_url.startswith("/images/") or CONTENT_ADDRESSED.search(local_url):
+            return None
+        path = (self.root / local_url[len("/images/"):]).resolve()
+        if not path.is_relative_to(self.root.resolve()) or not path.is_file():
+            return None
+        try:
+            image, _ = self._store(local_url, path.read_bytes())
+        except (OSError, ValueError) as e:
+            logger.warning("Could not adopt local image %s: %s", local_url, e)
+            return None
+        return image
+
+    def original_url(self, local_url: str) -> Optional[str]:
+        """A remote URL a mirrored /images/sha256/... file was downloaded from."""
+        sha256 = Path(local_url).stem
+        row = self._get_conn().execute(
+            "SELECT url FROM mirrored_images WHERE sha256 = ? ORDER BY fetched_at LIMIT 1", (sha256,)
+        ).fetchone()
+        return row[0] if row else None
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def _lot_image_urls(row: AuctionDataModel) -> List[str]:
+    urls = [row.primary_image_url] if row.primary_image_url else []
+    if row.additional_images:
+        try:
+            urls.extend(u for u in json.loads(row.additional_images) if isinstance(u, str))
+        except ValueError:
+            pass
+    return urls
+
+
+async def mirror_coin_images(
+    session: Session,
+    mirror: ImageMirror,
+    include_lots: bool = True,
+    batch_size: int = 200,
+    limit: Optional[int] = None,
+) -> MirrorReport:
+    """
+    Mirror remote coin_images_v2 URLs and point the rows at the local copies,
+    committing after each batch so an interrupted run keeps its progress.
+    Rows with legacy local /images/<name> URLs are moved to content-addressed
+    URLs. With include_lots, auction_data_v2 lot images are mirrored too.
+    """
+    report = MirrorReport()
+    query = session.query(CoinImageModel).filter(
+        CoinImageModel.url.like("http://%") | CoinImageModel.url.like("https://%")
+    ).order_by(CoinImageModel.id)
+    rows = query.limit(limit).all() if limit else query.all()
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        images = await mirror.mirror((row.url for row in batch), report)
+        for row in batch:
+            image = images.get(row.url.strip())
+            if image is not None:
+                row.url = image.local_url
+                report.rows_updated += 1
+        session.commit()
+
+    local = session.query(CoinImageModel).filter(
+        CoinImageModel.url.like("/images/%") & ~CoinImageModel.url.like("/images/sha256/%")
+    ).order_by(CoinImageModel.id)
+    local_rows = local.limit(limit).all() if limit else local.all()
+    for start in range(0, len(local_rows), batch_size):
+        for row in local_rows[start:start + batch_size]:
+            image = mirror.adopt(row.url)
+            if image is not None:
+                row.url = image.local_url
+                report.adopted += 1
+                report.rows_updated += 1
+        session.commit()
+
+    if include_lots:
+        lots = session.query(AuctionDataModel).filter(
+            AuctionDataModel.primary_image_url.isnot(None) | AuctionDataModel.additional_images.isnot(None)
+        ).order_by(AuctionDataModel.id)
+        lot_rows = lots.limit(limit).all() if limit else lots.all()
+        for start in range(0, len(lot_rows), batch_size):
+            urls = [url for row in lot_rows[start:start + batch_size] for url in _lot_image_urls(row)]
+            await mirror.mirror(urls, report)
+    return report
+
+
+_image_mirror: Optional[ImageMirror] = None
+
+
+def backend_path(path: str) -> Path:
+    """path itself if absolute, else resolved against the backend directory (not the cwd)."""
+    return BACKEND_DIR / path
+
+
+def get_image_mirror() -> ImageMirror:
+    """Process-wide mirror at IMAGE_MIRROR_DIR."""
+    global _image_mirror
+    if _image_mirror is None:
+        settings = get_settings()
+        _image_mirror = ImageMirror(
+            root=backend_path(settings.IMAGE_MIRROR_DIR),
+            index_path=backend_path(settings.IMAGE_MIRROR_INDEX_PATH),
+            max_concurrency=settings.IMAGE_MIRROR_CONCURRENCY,
+            per_host=settings.IMAGE_MIRROR_PER_HOST,
+            derivatives=get_image_derivatives(),
+        )
+    return _image_mirror
+
+
+def set_image_mirror(mirror: Optional[ImageMirror]) -> None:
+    """Replace the mirror (tests); None re-reads settings on next use."""
+    global _image_mirror
+    _image_mirror = mirror
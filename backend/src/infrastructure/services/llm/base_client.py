@@ -14,11 +14,12 @@ import os
 import re
 import sqlite3
 import threading
-from collections import defaultdict
-from dataclasses import dataclass, field
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 import yaml
 
@@ -38,6 +39,16 @@ from src.domain.llm import (
     LLMBudgetExceeded,
     LLMCapabilityNotAvailable,
 )
+from src.infrastructure.services.llm.batching import (
+    build_batch_prompt,
+    get_prompt_batcher,
+    split_batch_response,
+)
+from src.infrastructure.services.llm.model_health import (
+    BreakerConfig,
+    get_model_health_tracker,
+)
+from src.infrastructure.services.llm.stub_provider import STUB_PROVIDER, get_stub_provider
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +68,11 @@ class ModelConfig:
     supports_vision: bool = False
     supports_json_mode: bool = True
     local: bool = False
+    stub_options: Dict[str, Any] = field(default_factory=dict)  # provider: stub only
+    
+    @property
+    def is_stub(self) -> bool:
+        return self.provider == STUB_PROVIDER
 
 
 @dataclass
@@ -68,6 +84,9 @@ class CapabilityConfig:
     requires_vision: bool = False
     cacheable: bool = True
     streaming: bool = False
+    prefer_fastest: Optional[bool] = None  # None = use settings.routing.prefer_fastest
+    hedging: Dict[str, Any] = field(default_factory=dict)
+    batching: Dict[str, Any] = field(default_factory=dict)
     profiles: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     parameters: Dict[str, Any] = field(default_factory=dict)
 
@@ -148,6 +167,7 @@ class ConfigLoader:
                 supports_vision=cfg.get("supports_vision", False),
                 supports_json_mode=cfg.get("supports_json_mode", True),
                 local=cfg.get("local", False),
+                stub_options=cfg.get("stub") or {},
             )
     
     def _parse_capabilities(self):
@@ -160,6 +180,9 @@ class ConfigLoader:
                 requires_vision=cfg.get("requires_vision", False),
                 cacheable=cfg.get("cacheable", True),
                 streaming=cfg.get("streaming", False),
+                prefer_fastest=cfg.get("prefer_fastest"),
+                hedging=cfg.get("hedging") or {},
+                batching=cfg.get("batching") or {},
                 profiles=cfg.get("profiles", {}),
                 parameters=cfg.get("parameters", {}),
             )
@@ -180,6 +203,19 @@ class ConfigLoader:
     def rate_limit_config(self) -> Dict[str, Any]:
         return self.settings.get("rate_limit", {})
     
+    @property
+    def routing_config(self) -> Dict[str, Any]:
+        return self.settings.get("routing", {})
+    
+    def prefers_fastest(self, capability: str) -> bool:
+        cap_cfg = self._capabilities.get(capability)
+        if cap_cfg and cap_cfg.prefer_fastest is not None:
+            return bool(cap_cfg.prefer_fastest)
+        return bool(self.routing_config.get("prefer_fastest", False))
+    
+    def get_profile_settings(self, profile: Optional[str] = None) -> Dict[str, Any]:
+        return (self._config.get("profile_settings") or {}).get(profile or self.active_profile) or {}
+    
     def get_model(self, name: str) -> Optional[ModelConfig]:
         return self._models.get(name)
     
@@ -194,6 +230,9 @@ class ConfigLoader:
         profile_cfg = cap_cfg.profiles.get(profile, {})
         primary_name = profile_cfg.get("primary")
         fallback_names = profile_cfg.get("fallback", [])
+        if not primary_name:
+            # Profiles such as loadtest route every capability to one model
+            primary_name = self.get_profile_settings(profile).get("default_model")
         primary = self._models.get(primary_name) if primary_name else None
         return primary, fallback_names
 
@@ -347,13 +386,22 @@ class BaseLLMClient:
             max_per_window=rate_limit_cfg.get("enrichments_per_coin", 3),
             window_minutes=rate_limit_cfg.get("window_minutes", 5)
         )
+        
+        # Hedge requests being cancelled because the other request won
+        self._hedge_losers: Set[asyncio.Task] = set()
+
+        # Process-wide circuit breakers (shared across per-request clients)
+        self.model_health = get_model_health_tracker()
+        self.model_health.configure(
+            BreakerConfig.from_dict(self.config.routing_config.get("circuit_breaker"))
+        )
 
     def is_capability_available(self, capability: LLMCapability) -> bool:
         """Check if capability is configured and provider is available."""
-        if not LITELLM_AVAILABLE:
-            return False
         model, _ = self.config.get_model_for_capability(capability.value)
-        return model is not None
+        if model is None:
+            return False
+        return LITELLM_AVAILABLE or model.is_stub
 
     @staticmethod
     def _strip_markdown_json(content: str) -> str:
@@ -367,6 +415,19 @@ class BaseLLMClient:
             content = content[:-3]
         return content.strip()
 
+    @staticmethod
+    def _render_user_message(template: str, user_input: str, context: Optional[Dict] = None) -> str:
+        """
+        Fill the capability's user_template from user_input and context.
+        
+        Templates name fields like {vocab_type}; when the caller did not pass
+        all of them, send the (already complete) user_input as-is.
+        """
+        try:
+            return template.format(**{**(context or {}), "input": user_input})
+        except (KeyError, IndexError, ValueError):
+            return user_input
+
     async def execute_prompt(
         self,
         capability: LLMCapability,
@@ -390,9 +451,6 @@ class BaseLLMClient:
         Returns:
             Dict containing 'content' (str/json), 'model', 'cost', 'cached', 'usage'
         """
-        if not LITELLM_AVAILABLE:
-            raise LLMProviderUnavailable("LiteLLM library not installed")
-
         # 1. Rate Limit Check
         if rate_limit_key and not self.rate_limiter.check_limit(rate_limit_key):
             raise LLMRateLimitExceeded(
@@ -410,11 +468,13 @@ class BaseLLMClient:
         primary_model, fallbacks = self.config.get_model_for_capability(cap_name)
         if not primary_model:
             raise LLMCapabilityNotAvailable(f"No model configured for {cap_name}")
+        if not LITELLM_AVAILABLE and not primary_model.is_stub:
+            raise LLMProviderUnavailable("LiteLLM library not installed", [primary_model.name])
 
         # 4. Prompt Construction
         system_prompt = system_override or self.prompts.get_system_prompt(cap_name)
         user_template = self.prompts.get_user_template(cap_name)
-        full_user_message = user_template.format(input=user_input)
+        full_user_message = self._render_user_message(user_template, user_input, context)
 
         # 5. Cache Check
         cache_key_prompt = f"{system_prompt}\n{full_user_message}\nHasImage={bool(image_data)}"
@@ -429,27 +489,177 @@ class BaseLLMClient:
                     "usage": {"input_tokens": 0, "output_tokens": 0}
                 }
 
-        # 6. Execute with Fallback
+        # 6. Execute (batched with other pending items when enabled)
+        if cap_cfg.batching.get("enabled") and not image_data and not system_override:
+            batcher = get_prompt_batcher(cap_name, cap_cfg.batching)
+            result = await batcher.submit(self, full_user_message)
+        else:
+            result = await self._route(cap_cfg, system_prompt, full_user_message, image_data)
+
+        # 7. Cache Result
+        if self.cache:
+            await self.cache.set(
+                capability=cap_name,
+                prompt=cache_key_prompt,
+                response=result["content"],
+                model=result["model"],
+                cost_usd=result["cost"],
+                context=context
+            )
+        return result
+
+    async def _route(
+        self,
+        cap_cfg: CapabilityConfig,
+        system_prompt: str,
+        full_user_message: str,
+        image_data: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute with fallback, skipping models whose circuit breaker is open.
+
+        Raises LLMProviderUnavailable when every model is circuit-open and
+        LLMError when every attempted model failed.
+        """
+        cap_name = cap_cfg.name
+        primary_model, fallbacks = self.config.get_model_for_capability(cap_name)
         models_to_try = [primary_model] + [self.config.get_model(name) for name in fallbacks if self.config.get_model(name)]
-        last_error = None
+        candidates = deque(self.model_health.order_models(
+            models_to_try, prefer_fastest=self.config.prefers_fastest(cap_name)
+        ))
+
+        def next_model() -> Optional[ModelConfig]:
+            while candidates:
+                model_cfg = candidates.popleft()
+                if self.model_health.allow_request(model_cfg.name):
+                    return model_cfg
+                logger.info(f"Skipping {model_cfg.name} for {cap_name}: circuit open")
+            return None
+
+        async def invoke(model_cfg: ModelConfig) -> Tuple[Dict[str, Any], bool]:
+            return await self._invoke_model(
+                model_cfg, cap_cfg, system_prompt, full_user_message, image_data
+            )
+
+        result: Optional[Dict[str, Any]] = None
+        last_error: Optional[Exception] = None
+        attempted = 0
+
+        # Hedged pair: primary, plus first fallback if primary is slow
+        if cap_cfg.hedging.get("enabled"):
+            first = next_model()
+            if first:
+                result, tried, last_error = await self._execute_hedged(
+                    first, next_model, invoke, cap_cfg
+                )
+                attempted += tried
+
+        # Sequential fallback over whatever is left
+        while result is None:
+            model_cfg = next_model()
+            if model_cfg is None:
+                break
+            attempted += 1
+            try:
+                result, _ = await invoke(model_cfg)
+            except Exception as e:
+                logger.warning(f"Model {model_cfg.name} failed: {e}")
+                last_error = e
+
+        if result is None:
+            if attempted == 0:
+                raise LLMProviderUnavailable(
+                    f"All models for {cap_name} are circuit-open",
+                    [m.name for m in models_to_try],
+                )
+            raise LLMError(f"All models failed for {cap_name}. Last error: {last_error}")
+        return result
+
+    async def execute_batch(self, capability: str, messages: List[str]) -> List[Any]:
+        """
+        Send several rendered user messages of one capability as one prompt.
 
-        for model_cfg in models_to_try:
+        Returns one result dict (or exception) per message, in order. Cost and
+        token usage are split evenly across items. Items the model skipped or
+        answered malformed are retried on their own; a batch that fails on
+        every model fails all of its items.
+        """
+        cap_cfg = self.config.get_capability(capability)
+        system_prompt = self.prompts.get_system_prompt(capability)
+
+        async def single(message: str) -> Any:
             try:
-                logger.info(f"Invoking {model_cfg.model_id} for {cap_name}")
-                messages = [{"role": "system", "content": system_prompt}]
-                
-                if image_data and model_cfg.supports_vision:
-                    content_block = [
-                        {"type": "text", "text": full_user_message},
-                        {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{image_data}"}}
-                    ]
-                    messages.append({"role": "user", "content": content_block})
-                else:
-                    messages.append({"role": "user", "content": full_user_message})
-
-                # Call API
-                json_mode = cap_cfg.requires_json and model_cfg.supports_json_mode
-                
+                return await self._route(cap_cfg, system_prompt, message)
+            except Exception as e:
+                return e
+
+        if len(messages) == 1:
+            return [await single(messages[0])]
+
+        batch_system, batch_user = build_batch_prompt(system_prompt, messages, cap_cfg.requires_json)
+        batch = await self._route(replace(cap_cfg, requires_json=True), batch_system, batch_user)
+        parts = split_batch_response(batch["content"], len(messages), cap_cfg.requires_json)
+
+        count = len(messages)
+        usage = batch["usage"]
+        results: List[Any] = [
+            None if part is None else {
+                "content": part,
+                "model": batch["model"],
+                "cost": batch["cost"] / count,
+                "cached": False,
+                "usage": {
+                    "input_tokens": usage["input_tokens"] // count,
+                    "output_tokens": usage["output_tokens"] // count,
+                },
+                "batch_size": count,
+            }
+            for part in parts
+        ]
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning(f"Batch of {count} {capability} items missing {len(missing)} answers; retrying individually")
+            retried = await asyncio.gather(*(single(messages[i]) for i in missing))
+            for i, result in zip(missing, retried):
+                results[i] = result
+        return results
+
+    async def _invoke_model(
+        self,
+        model_cfg: ModelConfig,
+        cap_cfg: CapabilityConfig,
+        system_prompt: str,
+        full_user_message: str,
+        image_data: Optional[str] = None,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Call a single model, recording its health and cost.
+
+        Returns (result, valid) where valid is False when JSON was expected
+        but the response could not be parsed. Raises on provider errors.
+        """
+        logger.info(f"Invoking {model_cfg.model_id} for {cap_cfg.name}")
+        messages = [{"role": "system", "content": system_prompt}]
+        
+        if image_data and model_cfg.supports_vision:
+            content_block = [
+                {"type": "text", "text": full_user_message},
+                {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{image_data}"}}
+            ]
+            messages.append({"role": "user", "content": content_block})
+        else:
+            messages.append({"role": "user", "content": full_user_message})
+
+        # Call API
+        json_mode = cap_cfg.requires_json and model_cfg.supports_json_mode
+        
+        started = time.monotonic()
+        try:
+            if model_cfg.is_stub:
+                stub = get_stub_provider(model_cfg.name, model_cfg.stub_options)
+                response = await stub.acompletion(cap_cfg.name, messages)
+            else:
                 response = await acompletion(
                     model=model_cfg.model_id,
                     messages=messages,
@@ -457,56 +667,152 @@ class BaseLLMClient:
                     max_tokens=model_cfg.max_tokens,
                     temperature=0.1, # Deterministic usually better for data extraction
                 )
-                
-                content = response.choices[0].message.content
-                usage = response.usage
-                
-                # Parse JSON if expected
-                parsed_content = content
-                if json_mode:
-                    try:
-                        cleaned_content = self._strip_markdown_json(content)
-                        parsed_content = json.loads(cleaned_content)
-                    except json.JSONDecodeError:
-                        logger.warning("Failed to parse JSON from model response")
-                        # If strict JSON was required, this might be a failure, but we return raw and let caller handle
-                
-                # Calculate Cost
-                cost = litellm.completion_cost(completion_response=response)
-                
-                # Track Cost
-                if self.cost_tracker:
-                    await self.cost_tracker.record(
-                        model=model_cfg.name,
-                        capability=cap_name,
-                        input_tokens=usage.prompt_tokens,
-                        output_tokens=usage.completion_tokens,
-                        cost_usd=cost,
-                        cached=False
-                    )
-                
-                # Cache Result
-                if self.cache:
-                    await self.cache.set(
-                        capability=cap_name,
-                        prompt=cache_key_prompt,
-                        response=parsed_content,
-                        model=model_cfg.name,
-                        cost_usd=cost,
-                        context=context
-                    )
-                
-                return {
-                    "content": parsed_content,
-                    "model": model_cfg.name,
-                    "cost": cost,
-                    "cached": False,
-                    "usage": {"input_tokens": usage.prompt_tokens, "output_tokens": usage.completion_tokens}
-                }
-
-            except Exception as e:
-                logger.warning(f"Model {model_cfg.name} failed: {e}")
-                last_error = e
-                continue
+        except asyncio.CancelledError:
+            # Lost a hedge race: the provider may still bill the prompt. Other
+            # cancellations (caller gone, shutdown) are not hedging costs.
+            if asyncio.current_task() in self._hedge_losers:
+                self.model_health.record_cancelled(model_cfg.name)
+                await self._record_cancelled_cost(model_cfg, cap_cfg.name, messages)
+            raise
+        except Exception as e:
+            self.model_health.record_failure(
+                model_cfg.name, (time.monotonic() - started) * 1000, type(e).__name__
+            )
+            raise
+        self.model_health.record_success(model_cfg.name, (time.monotonic() - started) * 1000)
+        
+        content = response.choices[0].message.content
+        usage = response.usage
+        
+        # Parse JSON if expected
+        parsed_content = content
+        valid = True
+        if json_mode:
+            try:
+                cleaned_content = self._strip_markdown_json(content)
+                parsed_content = json.loads(cleaned_content)
+            except json.JSONDecodeError:
+                logger.warning("Failed to parse JSON from model response")
+                # If strict JSON was required, this might be a failure, but we return raw and let caller handle
+                valid = False
+        
+        # Calculate Cost
+        cost = self._calculate_cost(model_cfg, response)
         
-        raise LLMError(f"All models failed for {cap_name}. Last error: {last_error}")
+        # Track Cost
+        if self.cost_tracker:
+            await self.cost_tracker.record(
+                model=model_cfg.name,
+                capability=cap_cfg.name,
+                input_tokens=usage.prompt_tokens,
+                output_tokens=usage.completion_tokens,
+                cost_usd=cost,
+                cached=False
+            )
+        
+        return {
+            "content": parsed_content,
+            "model": model_cfg.name,
+            "cost": cost,
+            "cached": False,
+            "usage": {"input_tokens": usage.prompt_tokens, "output_tokens": usage.completion_tokens}
+        }, valid
+
+    @staticmethod
+    def _calculate_cost(model_cfg: ModelConfig, response: Any) -> float:
+        """Provider-reported cost, or configured per-1k rates for stub models."""
+        if not model_cfg.is_stub:
+            return litellm.completion_cost(completion_response=response)
+        usage = response.usage
+        return (
+            usage.prompt_tokens / 1000.0 * model_cfg.cost_per_1k_input
+            + usage.completion_tokens / 1000.0 * model_cfg.cost_per_1k_output
+        )
+
+    def _hedge_delay_seconds(self, model_name: str, hedging: Dict[str, Any]) -> float:
+        """Delay before hedging: the primary's rolling latency percentile, clamped."""
+        observed = self.model_health.latency_percentile(
+            model_name, hedging.get("delay_percentile", 95)
+        )
+        delay_ms = observed if observed is not None else hedging.get("default_delay_ms", 2000)
+        delay_ms = max(hedging.get("min_delay_ms", 250), min(delay_ms, hedging.get("max_delay_ms", 10000)))
+        return delay_ms / 1000.0
+
+    async def _execute_hedged(
+        self,
+        primary: ModelConfig,
+        next_model: Callable[[], Optional[ModelConfig]],
+        invoke: Callable[[ModelConfig], Awaitable[Tuple[Dict[str, Any], bool]]],
+        cap_cfg: CapabilityConfig,
+    ) -> Tuple[Optional[Dict[str, Any]], int, Optional[Exception]]:
+        """
+        Race the primary against one fallback started after a latency-based delay.
+
+        The first valid response wins and the other request is cancelled. If
+        the primary fails before the delay, the caller's sequential fallback
+        takes over. Returns (result or None, models attempted, last error).
+        """
+        tasks = {asyncio.create_task(invoke(primary)): primary}
+        attempted = 1
+        last_error: Optional[Exception] = None
+        unparsed: Optional[Dict[str, Any]] = None
+        won = False
+        try:
+            done, _ = await asyncio.wait(
+                tasks, timeout=self._hedge_delay_seconds(primary.name, cap_cfg.hedging)
+            )
+            if not done:
+                backup = next_model()
+                if backup:
+                    logger.info(f"Hedging {cap_cfg.name}: {primary.name} slow, also trying {backup.name}")
+                    tasks[asyncio.create_task(invoke(backup))] = backup
+                    attempted += 1
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                        logger.warning(f"Model {tasks[task].name} failed: {last_error}")
+                        continue
+                    result, valid = task.result()
+                    if valid:
+                        won = True
+                        return result, attempted, last_error
+                    unparsed = unparsed or result
+            return unparsed, attempted, last_error
+        finally:
+            losers = [t for t in tasks if not t.done()]
+            if won:
+                self._hedge_losers.update(losers)
+            for task in losers:
+                task.cancel()
+            if losers:
+                try:
+                    await asyncio.gather(*losers, return_exceptions=True)
+                finally:
+                    self._hedge_losers.difference_update(losers)
+
+    async def _record_cancelled_cost(
+        self,
+        model_cfg: ModelConfig,
+        capability: str,
+        messages: List[Dict[str, Any]],
+    ) -> None:
+        """Record the estimated prompt cost of a cancelled (hedged) request."""
+        if not self.cost_tracker:
+            return
+        try:
+            input_tokens = litellm.token_counter(model=model_cfg.model_id, messages=messages)
+        except Exception:
+            input_tokens = sum(len(str(m.get("content", ""))) for m in messages) // 4
+        await self.cost_tracker.record(
+            model=model_cfg.name,
+            capability=capability,
+            input_tokens=input_tokens,
+            output_tokens=0,
+            cost_usd=input_tokens / 1000.0 * model_cfg.cost_per_1k_input,
+            cached=False,
+            request_id="hedge_cancelled",
+        )
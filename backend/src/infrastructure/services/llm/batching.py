@@ -0,0 +1,190 @@
+"""
+Prompt Batching - Pack several small items of one capability into one prompt.
+
+Cheap text capabilities (vocab_normalize, legend_expand, catalog_parse) send
+tiny prompts whose cost is dominated by the system prompt and the round trip.
+With `batching.enabled` in a capability's config, execute_prompt hands cache
+misses to a process-wide PromptBatcher. It collects items for up to
+`window_ms` (or until `max_batch_size` are waiting), sends them as one
+numbered prompt that asks for a JSON `results` list, and fans the per-item
+answers back out to the waiting callers. Each item is then cached on its own
+by execute_prompt, exactly as if it had been sent alone.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from src.infrastructure.services.llm.base_client import BaseLLMClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchConfig:
+    """Batching settings (capabilities.<name>.batching in llm_config.yaml)."""
+    enabled: bool = False
+    max_batch_size: int = 10
+    window_ms: float = 25.0
+
+    @classmethod
+    def from_dict(cls, cfg: Optional[Dict[str, Any]]) -> "BatchConfig":
+        cfg = cfg or {}
+        return cls(
+            enabled=bool(cfg.get("enabled", False)),
+            max_batch_size=max(1, int(cfg.get("max_batch_size", 10))),
+            window_ms=float(cfg.get("window_ms", 25.0)),
+        )
+
+
+# =============================================================================
+# PROMPT PACKING
+# =============================================================================
+
+def build_batch_prompt(system_prompt: str, messages: List[str], requires_json: bool) -> Tuple[str, str]:
+    """Return (system, user) prompts asking for one answer per numbered item."""
+    answer_shape = (
+        "the JSON object you would return for that item alone"
+        if requires_json
+        else "the plain-text answer you would return for that item alone, as a JSON string"
+    )
+    system = (
+        f"{system_prompt}\n\n"
+        f"BATCH MODE: You will receive {len(messages)} independent items, each starting with "
+        "'### ITEM <id>'. Handle every item exactly as if it were the only request. "
+        'Respond with a single JSON object: {"results": [{"id": <id>, "result": <answer>}, ...]} '
+        f"containing one entry per item, where <answer> is {answer_shape}."
+    )
+    user = "\n\n".join(f"### ITEM {i}\n{message}" for i, message in enumerate(messages, 1))
+    return system, user
+
+
+def split_batch_response(content: Any, count: int, requires_json: bool) -> List[Optional[Any]]:
+    """
+    Map a batch response back to items (index order).
+
+    Items the model skipped or answered in the wrong shape come back as None
+    so the caller can retry them individually.
+    """
+    parts: List[Optional[Any]] = [None] * count
+    if isinstance(content, str):
+        text = content.strip()
+        if text.startswith("```"):
+            text = text.strip("`")
+            text = text[4:] if text.startswith("json") else text
+        try:
+            content = json.loads(text)
+        except json.JSONDecodeError:
+            return parts
+    results = content.get("results") if isinstance(content, dict) else content
+    if not isinstance(results, list):
+        return parts
+
+    for position, entry in enumerate(results):
+        if isinstance(entry, dict) and "result" in entry:
+            item_id, answer = entry.get("id", position + 1), entry["result"]
+        else:
+            item_id, answer = position + 1, entry
+        try:
+            index = int(item_id) - 1
+        except (TypeError, ValueError):
+            continue
+        if not 0 <= index < count or parts[index] is not None:
+            continue
+        if requires_json and isinstance(answer, str):
+            try:
+                answer = json.loads(answer)
+            except json.JSONDecodeError:
+                continue
+        if requires_json and not isinstance(answer, dict):
+            continue
+        if not requires_json and not isinstance(answer, (str, dict)):
+            continue
+        parts[index] = answer
+    return parts
+
+
+# =============================================================================
+# BATCHER
+# =============================================================================
+
+@dataclass
+class _PendingItem:
+    message: str
+    future: asyncio.Future
+
+
+class PromptBatcher:
+    """Collects pending items for one capability and flushes them as one prompt."""
+
+    def __init__(self, capability: str, config: BatchConfig, loop: asyncio.AbstractEventLoop):
+        self.capability = capability
+        self.config = config
+        self.loop = loop
+        self._pending: List[_PendingItem] = []
+        self._client: Optional["BaseLLMClient"] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, client: "BaseLLMClient", message: str) -> Dict[str, Any]:
+        """Queue one item and wait for its share of the batch result."""
+        future = self.loop.create_future()
+        self._pending.append(_PendingItem(message, future))
+        if self._client is None:
+            self._client = client
+        if len(self._pending) >= self.config.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = self.loop.call_later(self.config.window_ms / 1000.0, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        items, client = self._pending, self._client
+        self._pending, self._client = [], None
+        if not items or client is None:
+            return
+        task = self.loop.create_task(self._run(client, items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, client: "BaseLLMClient", items: List[_PendingItem]) -> None:
+        try:
+            results = await client.execute_batch(self.capability, [item.message for item in items])
+        except Exception as e:
+            results = [e] * len(items)
+        except BaseException:
+            # Cancelled (shutdown) or worse: nobody may wait on a batch that never resolves
+            for item in items:
+                if not item.future.done():
+                    item.future.cancel()
+            raise
+        for item, result in zip(items, results):
+            if item.future.done():  # Caller went away
+                continue
+            if isinstance(result, Exception):
+                item.future.set_exception(result)
+            else:
+                item.future.set_result(result)
+
+
+# Global batchers per capability (BaseLLMClient is created per request)
+_batchers: Dict[str, PromptBatcher] = {}
+
+
+def get_prompt_batcher(capability: str, config: Optional[Dict[str, Any]]) -> PromptBatcher:
+    """Get the batcher for a capability on the running event loop."""
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(capability)
+    if batcher is None or batcher.loop is not loop:
+        batcher = PromptBatcher(capability, BatchConfig.from_dict(config), loop)
+        _batchers[capability] = batcher
+    else:
+        batcher.config = BatchConfig.from_dict(config)
+    return batcher
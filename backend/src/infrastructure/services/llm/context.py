@@ -11,6 +11,7 @@ from typing import Optional, List, Dict, Any, Tuple
 
 from src.domain.llm import LLMCapability, LLMResult
 from src.infrastructure.services.llm.base_client import BaseLLMClient
+from src.infrastructure.scrapers.shared.reference_patterns import ReferenceScanner
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,10 @@ class ContextService:
         r'\bDOC\s+[IVXLC]+\s*,?\s*\d+\b',
         r'\bMIB\s+[IVXLC]+\s+\d+\b',
     ]
+    # Generated text is rarely seen twice, so no memo
+    _CITATION_SCANNER = ReferenceScanner(
+        [(re.compile(pattern, re.IGNORECASE), pattern) for pattern in CATALOG_PATTERNS], cache_size=0
+    )
 
     def __init__(self, client: BaseLLMClient):
         self.client = client
@@ -124,11 +129,8 @@ class ContextService:
 
     def _parse_citations(self, content: str) -> List[str]:
         citations = set()
-        for pattern in self.CATALOG_PATTERNS:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                cleaned = " ".join(match.split())
-                citations.add(cleaned)
+        for match in self._CITATION_SCANNER.scan(content):
+            citations.add(" ".join(match.raw_text.split()))
         return sorted(citations, key=lambda x: (x.split()[0], x))
 
     def _normalize_reference(self, ref: str) -> str:
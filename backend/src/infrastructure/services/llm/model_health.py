@@ -0,0 +1,291 @@
+"""
+Model Health - Per-model circuit breakers for LLM routing.
+
+Tracks a rolling window of call outcomes per model (error rate, p95 latency)
+and opens a circuit breaker for models that are failing or too slow. While a
+breaker is open the router skips that model instead of paying a full timeout
+on every request; after the cool-down a single trial call decides whether the
+breaker closes again.
+
+The tracker is process-wide (BaseLLMClient is created per request), see
+get_model_health_tracker().
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker state for a single model."""
+    CLOSED = "closed"        # Healthy, requests flow normally
+    OPEN = "open"            # Tripped, model is skipped until cool-down ends
+    HALF_OPEN = "half_open"  # Cool-down over, one trial request allowed
+
+
+@dataclass
+class BreakerConfig:
+    """Circuit breaker thresholds (settings.routing.circuit_breaker in llm_config.yaml)."""
+    enabled: bool = True
+    window_size: int = 20
+    min_calls: int = 5
+    error_rate_threshold: float = 0.5
+    p95_latency_threshold_ms: float = 0.0  # 0 disables the latency trip
+    cooldown_seconds: float = 60.0
+
+    @classmethod
+    def from_dict(cls, cfg: Optional[Dict[str, Any]]) -> "BreakerConfig":
+        cfg = cfg or {}
+        return cls(
+            enabled=bool(cfg.get("enabled", True)),
+            window_size=int(cfg.get("window_size", 20)),
+            min_calls=int(cfg.get("min_calls", 5)),
+            error_rate_threshold=float(cfg.get("error_rate_threshold", 0.5)),
+            p95_latency_threshold_ms=float(cfg.get("p95_latency_threshold_ms", 0.0)),
+            cooldown_seconds=float(cfg.get("cooldown_seconds", 60.0)),
+        )
+
+
+@dataclass
+class _ModelHealth:
+    """Mutable health record for one model (guarded by the tracker lock)."""
+    samples: Deque[Tuple[float, bool]]  # (latency_ms, success)
+    state: CircuitState = CircuitState.CLOSED
+    opened_at: float = 0.0
+    probe_started_at: Optional[float] = None
+    trips: int = 0
+    total_calls: int = 0
+    total_failures: int = 0
+    last_error: Optional[str] = None
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of values (pct in 0..100); None when empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    idx = int(len(ordered) * pct / 100.0)
+    return ordered[min(idx, len(ordered) - 1)]
+
+
+class ModelHealthTracker:
+    """
+    Rolling health statistics and circuit breakers keyed by model name.
+
+    Thread-safe; all methods are cheap enough to call on every LLM request.
+    """
+
+    def __init__(
+        self,
+        config: Optional[BreakerConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.config = config or BreakerConfig()
+        self._clock = clock
+        self._models: Dict[str, _ModelHealth] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, config: BreakerConfig) -> None:
+        """Replace thresholds (existing windows are resized lazily)."""
+        with self._lock:
+            self.config = config
+
+    def _get(self, model: str) -> _ModelHealth:
+        health = self._models.get(model)
+        if health is None or health.samples.maxlen != self.config.window_size:
+            samples: Deque[Tuple[float, bool]] = deque(
+                health.samples if health else (), maxlen=self.config.window_size
+            )
+            if health is None:
+                health = _ModelHealth(samples=samples)
+            else:
+                health.samples = samples
+            self._models[model] = health
+        return health
+
+    # -------------------------------------------------------------------------
+    # Routing
+    # -------------------------------------------------------------------------
+
+    def allow_request(self, model: str) -> bool:
+        """
+        Return True if a request may be sent to model now.
+
+        An open breaker whose cool-down has elapsed moves to half-open and
+        admits exactly one trial request. A trial that never reports back
+        (e.g. cancelled) is abandoned after another cool-down period.
+        """
+        if not self.config.enabled:
+            return True
+        with self._lock:
+            health = self._get(model)
+            now = self._clock()
+            if health.state == CircuitState.CLOSED:
+                return True
+            if health.state == CircuitState.OPEN:
+                if now - health.opened_at < self.config.cooldown_seconds:
+                    return False
+                health.state = CircuitState.HALF_OPEN
+                health.probe_started_at = now
+                return True
+            # HALF_OPEN
+            if (
+                health.probe_started_at is None
+                or now - health.probe_started_at >= self.config.cooldown_seconds
+            ):
+                health.probe_started_at = now
+                return True
+            return False
+
+    def order_models(self, models: Sequence[Any], prefer_fastest: bool = False) -> List[Any]:
+        """
+        Order candidate models (anything with a .name) for routing.
+
+        Config order is kept by default. With prefer_fastest, measured models
+        are sorted by rolling p95 latency among the positions they hold;
+        models without latency data keep their configured position, so a
+        primary with no samples yet is not demoted behind its fallbacks.
+        """
+        if not prefer_fastest:
+            return list(models)
+        with self._lock:
+            p95s = {m.name: self._p95(self._get(m.name)) for m in models}
+        fastest = iter(sorted(
+            (m for m in models if p95s[m.name] is not None),
+            key=lambda m: p95s[m.name],
+        ))
+        return [m if p95s[m.name] is None else next(fastest) for m in models]
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def record_success(self, model: str, latency_ms: float) -> None:
+        with self._lock:
+            health = self._get(model)
+            health.total_calls += 1
+            if health.state == CircuitState.HALF_OPEN:
+                self._close(health)
+            health.samples.append((latency_ms, True))
+            self._maybe_trip(health)
+
+    def record_failure(self, model: str, latency_ms: float, error_type: Optional[str] = None) -> None:
+        with self._lock:
+            health = self._get(model)
+            health.total_calls += 1
+            health.total_failures += 1
+            health.last_error = error_type
+            health.samples.append((latency_ms, False))
+            if health.state == CircuitState.HALF_OPEN:
+                self._open(health)
+            else:
+                self._maybe_trip(health)
+
+    def record_cancelled(self, model: str) -> None:
+        """A request was cancelled before completing (e.g. lost a hedge race)."""
+        with self._lock:
+            health = self._get(model)
+            if health.state == CircuitState.HALF_OPEN:
+                health.probe_started_at = None
+
+    def _maybe_trip(self, health: _ModelHealth) -> None:
+        if not self.config.enabled or health.state != CircuitState.CLOSED:
+            return
+        if len(health.samples) < self.config.min_calls:
+            return
+        if self._error_rate(health) >= self.config.error_rate_threshold:
+            self._open(health)
+            return
+        threshold = self.config.p95_latency_threshold_ms
+        p95 = self._p95(health)
+        if threshold > 0 and p95 is not None and p95 >= threshold:
+            self._open(health)
+
+    def _open(self, health: _ModelHealth) -> None:
+        health.state = CircuitState.OPEN
+        health.opened_at = self._clock()
+        health.probe_started_at = None
+        health.trips += 1
+
+    @staticmethod
+    def _close(health: _ModelHealth) -> None:
+        health.state = CircuitState.CLOSED
+        health.probe_started_at = None
+        health.samples.clear()
+
+    # -------------------------------------------------------------------------
+    # Statistics
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _error_rate(health: _ModelHealth) -> float:
+        if not health.samples:
+            return 0.0
+        failures = sum(1 for _, ok in health.samples if not ok)
+        return failures / len(health.samples)
+
+    @staticmethod
+    def _p95(health: _ModelHealth) -> Optional[float]:
+        return percentile([ms for ms, ok in health.samples if ok], 95)
+
+    def latency_percentile(self, model: str, pct: float) -> Optional[float]:
+        """Rolling latency percentile of successful calls for model (ms)."""
+        with self._lock:
+            health = self._models.get(model)
+            if health is None:
+                return None
+            return percentile([ms for ms, ok in health.samples if ok], pct)
+
+    def get_state(self, model: str) -> CircuitState:
+        with self._lock:
+            health = self._models.get(model)
+            return health.state if health else CircuitState.CLOSED
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Per-model health and breaker state for the metrics endpoint."""
+        now = self._clock()
+        with self._lock:
+            result = []
+            for name, health in sorted(self._models.items()):
+                retry_in = None
+                if health.state == CircuitState.OPEN:
+                    retry_in = max(0.0, self.config.cooldown_seconds - (now - health.opened_at))
+                result.append({
+                    "model": name,
+                    "state": health.state.value,
+                    "window_calls": len(health.samples),
+                    "error_rate": round(self._error_rate(health), 4),
+                    "p95_latency_ms": self._p95(health),
+                    "total_calls": health.total_calls,
+                    "total_failures": health.total_failures,
+                    "trips": health.trips,
+                    "retry_in_seconds": round(retry_in, 1) if retry_in is not None else None,
+                    "last_error": health.last_error,
+                })
+            return result
+
+
+# =============================================================================
+# PROCESS-WIDE INSTANCE
+# =============================================================================
+
+# Global tracker (BaseLLMClient is built per request, health must outlive it)
+_model_health_tracker: Optional[ModelHealthTracker] = None
+
+
+def get_model_health_tracker() -> ModelHealthTracker:
+    """Get the process-wide model health tracker."""
+    global _model_health_tracker
+    if _model_health_tracker is None:
+        _model_health_tracker = ModelHealthTracker()
+    return _model_health_tracker
+
+
+def reset_model_health_tracker() -> None:
+    """Drop all health state (tests / config reload)."""
+    global _model_health_tracker
+    _model_health_tracker = None
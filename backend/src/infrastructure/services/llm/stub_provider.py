@@ -0,0 +1,300 @@
+"""
+Local Stub Provider - Deterministic LLM stand-in for load and throughput testing.
+
+Models configured with `provider: stub` in llm_config.yaml are served by this
+module instead of LiteLLM. Responses come from per-capability fixture files
+(<fixtures_dir>/<capability>.json) when a fixture's inputs appear in the
+prompt, otherwise from a schema-valid synthetic template. The fixture
+directory is the model's `stub.fixtures_dir` option or the
+LLM_STUB_FIXTURES_DIR setting; with neither, only synthetic responses are used. Latency,
+error rate, and token counts are configurable, and all randomness comes from a
+seeded RNG so runs are reproducible.
+
+Example model entry:
+
+    local-stub:
+      provider: stub
+      model_id: stub/coinstack
+      cost_per_1k_input: 0.0005   # non-zero to exercise budget checks
+      cost_per_1k_output: 0.001
+      supports_vision: true
+      local: true
+      stub:
+        seed: 42
+        latency_ms: {distribution: lognormal, median: 600, sigma: 0.4}
+        error_rate: 0.02
+        timeout_rate: 0.0
+        timeout_ms: 30000
+        output_tokens: null        # null = estimate from response length
+        fixtures_dir: null         # null = LLM_STUB_FIXTURES_DIR
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import random
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STUB_PROVIDER = "stub"
+
+# Numbered items of a batched prompt (see llm/batching.py)
+_BATCH_ITEM = re.compile(r"^### ITEM (\d+)\n", re.MULTILINE)
+
+_BACKEND_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent
+
+
+# =============================================================================
+# RESPONSE SHAPE (mirrors the parts of a LiteLLM response the client reads)
+# =============================================================================
+
+@dataclass
+class StubMessage:
+    content: str
+
+
+@dataclass
+class StubChoice:
+    message: StubMessage
+
+
+@dataclass
+class StubUsage:
+    prompt_tokens: int
+    completion_tokens: int
+
+
+@dataclass
+class StubResponse:
+    choices: List[StubChoice]
+    usage: StubUsage
+    model: str
+
+
+class StubProviderError(Exception):
+    """Injected provider failure (error_rate)."""
+    pass
+
+
+# =============================================================================
+# SYNTHETIC TEMPLATES (schema-valid for each capability's result parser)
+# =============================================================================
+
+SYNTHETIC_RESPONSES: Dict[str, Any] = {
+    "vocab_normalize": {"canonical_name": "Trajan", "confidence": 0.9, "reasoning": ["Synthetic stub response"]},
+    "legend_expand": "Imperator Caesar Nerva Traianus Augustus",
+    "auction_parse": {
+        "issuer": "Trajan", "denomination": "Denarius", "metal": "silver", "mint": "Rome",
+        "year_start": 103, "year_end": 111, "weight_g": 3.35, "diameter_mm": 19.0,
+        "obverse_legend": "IMP TRAIANO AVG GER DAC P M TR P", "obverse_description": "Laureate bust right",
+        "reverse_legend": "COS V P P S P Q R OPTIMO PRINC", "reverse_description": "Victory standing left",
+        "references": ["RIC II 128"], "grade": "VF", "confidence": 0.85,
+    },
+    "provenance_parse": {
+        "provenance_chain": [
+            {"source": "Stub Auctions", "source_type": "auction", "year": 2020, "sale": "1", "lot": "100"}
+        ],
+        "earliest_known": 2020, "confidence": 0.8, "reasoning": ["Synthetic stub response"],
+    },
+    "image_identify": {
+        "ruler": "Trajan", "denomination": "Denarius", "mint": "Rome", "date_range": "103-111",
+        "obverse_description": "Laureate bust right", "reverse_description": "Victory standing left",
+        "suggested_references": ["RIC II 128"], "confidence": 0.7, "reasoning": ["Synthetic stub response"],
+    },
+    "reference_validate": {
+        "is_valid": True, "normalized": "RIC II 128", "alternatives": [], "notes": "",
+        "confidence": 0.85, "reasoning": ["Synthetic stub response"],
+    },
+    "context_generate": (
+        "## HISTORICAL_CONTEXT\nSynthetic historical context for load testing.\n\n"
+        "## NUMISMATIC_SIGNIFICANCE\nSynthetic significance, see RIC II 128."
+    ),
+    "attribution_assist": {
+        "suggestions": [
+            {"attribution": "Trajan, Rome mint", "reference": "RIC II 128", "confidence": 0.6,
+             "reasoning": ["Synthetic stub response"]}
+        ],
+        "questions_to_resolve": [],
+    },
+    "legend_transcribe": {
+        "obverse_legend": "IMP TRAIANO AVG GER DAC P M TR P", "obverse_legend_expanded": None,
+        "reverse_legend": "COS V P P S P Q R OPTIMO PRINC", "reverse_legend_expanded": None,
+        "exergue": None, "uncertain_portions": [],
+    },
+    "catalog_parse": {
+        "catalog_system": "RIC", "volume": "II", "number": "128", "issuer": "Trajan",
+        "mint": "Rome", "alternatives": [], "confidence": 0.9,
+    },
+    "condition_observations": {
+        "wear_observations": "Light wear on high points", "surface_notes": "", "strike_quality": "Well centered",
+        "notable_features": [], "concerns": [], "recommendation": "Professional grading recommended",
+    },
+}
+
+
+# =============================================================================
+# PROVIDER
+# =============================================================================
+
+class LocalStubProvider:
+    """
+    Deterministic, network-free provider for a single stub model.
+
+    Latency and injected failures come from a seeded RNG shared by all calls to
+    the model; response content depends only on capability and prompt.
+    """
+
+    def __init__(self, model_name: str, options: Optional[Dict[str, Any]] = None):
+        self.model_name = model_name
+        self.options = options or {}
+        self._rng = random.Random(self.options.get("seed", 0))
+        self._rng_lock = threading.Lock()
+        self._fixtures: Dict[str, List[Tuple[List[str], str]]] = {}
+        fixtures_dir = self.options.get("fixtures_dir")
+        if fixtures_dir is None:
+            from src.infrastructure.config import get_settings
+            fixtures_dir = get_settings().LLM_STUB_FIXTURES_DIR
+        self._fixtures_dir: Optional[Path] = None
+        if fixtures_dir:
+            self._fixtures_dir = Path(fixtures_dir)
+            if not self._fixtures_dir.is_absolute():
+                self._fixtures_dir = _BACKEND_ROOT / self._fixtures_dir
+
+    # -------------------------------------------------------------------------
+    # Content
+    # -------------------------------------------------------------------------
+
+    def _load_fixtures(self, capability: str) -> List[Tuple[List[str], str]]:
+        if capability in self._fixtures:
+            return self._fixtures[capability]
+        entries: List[Tuple[List[str], str]] = []
+        path = self._fixtures_dir / f"{capability}.json" if self._fixtures_dir else None
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                for fixture in data.values():
+                    output = fixture.get("output", {})
+                    content = output.get("content") if "content" in output else json.dumps(output)
+                    if not isinstance(content, str):
+                        content = json.dumps(content)
+                    needles = [
+                        str(v) for v in fixture.get("input", {}).values()
+                        if isinstance(v, (str, int, float)) and str(v).strip()
+                    ]
+                    entries.append((needles, content))
+            except (OSError, ValueError, AttributeError) as e:
+                logger.warning("Could not load stub fixtures %s: %s", path, e)
+        self._fixtures[capability] = entries
+        return entries
+
+    def render(self, capability: str, prompt: str) -> str:
+        """Best fixture whose inputs all appear in the prompt, else synthetic."""
+        best: Optional[str] = None
+        best_score = 0
+        for needles, content in self._load_fixtures(capability):
+            if needles and all(n in prompt for n in needles):
+                score = sum(len(n) for n in needles)
+                if score > best_score:
+                    best, best_score = content, score
+        if best is not None:
+            return best
+        synthetic = SYNTHETIC_RESPONSES.get(capability, {"result": "stub", "confidence": 0.5})
+        return synthetic if isinstance(synthetic, str) else json.dumps(synthetic)
+
+    def render_batch(self, capability: str, prompt: str) -> Optional[str]:
+        """Answer a batched prompt item by item, or None if it is not one."""
+        pieces = _BATCH_ITEM.split(prompt)
+        if len(pieces) < 3:
+            return None
+        results = []
+        for item_id, item_prompt in zip(pieces[1::2], pieces[2::2]):
+            content = self.render(capability, item_prompt)
+            try:
+                answer = json.loads(content)
+            except ValueError:
+                answer = content
+            results.append({"id": int(item_id), "result": answer})
+        return json.dumps({"results": results})
+
+    # -------------------------------------------------------------------------
+    # Latency / failure injection
+    # -------------------------------------------------------------------------
+
+    def _sample_latency_ms(self) -> float:
+        cfg = self.options.get("latency_ms", 0)
+        if isinstance(cfg, (int, float)):
+            return float(cfg)
+        dist = cfg.get("distribution", "fixed")
+        with self._rng_lock:
+            if dist == "uniform":
+                value = self._rng.uniform(cfg.get("min", 0), cfg.get("max", 0))
+            elif dist == "normal":
+                value = self._rng.gauss(cfg.get("mean", 0), cfg.get("stddev", 0))
+            elif dist == "lognormal":
+                value = self._rng.lognormvariate(math.log(max(cfg.get("median", 1), 1e-3)), cfg.get("sigma", 0.5))
+            else:
+                value = cfg.get("value", 0)
+        return max(0.0, float(value))
+
+    def _roll(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self._rng_lock:
+            return self._rng.random() < rate
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        return max(1, len(text) // 4)
+
+    # -------------------------------------------------------------------------
+    # Completion
+    # -------------------------------------------------------------------------
+
+    async def acompletion(self, capability: str, messages: List[Dict[str, Any]]) -> StubResponse:
+        """Produce a LiteLLM-shaped response after the configured latency."""
+        prompt_parts = []
+        for message in messages:
+            content = message.get("content", "")
+            if isinstance(content, list):
+                content = " ".join(b.get("text", "") for b in content if isinstance(b, dict))
+            prompt_parts.append(str(content))
+        prompt = "\n".join(prompt_parts)
+        user_prompt = prompt_parts[-1] if prompt_parts else ""
+
+        scale = float(self.options.get("time_scale", 1.0))
+        if self._roll(float(self.options.get("timeout_rate", 0.0))):
+            await asyncio.sleep(float(self.options.get("timeout_ms", 30000)) * scale / 1000.0)
+            raise asyncio.TimeoutError(f"Stub timeout ({self.model_name})")
+
+        await asyncio.sleep(self._sample_latency_ms() * scale / 1000.0)
+        if self._roll(float(self.options.get("error_rate", 0.0))):
+            raise StubProviderError(f"Injected stub error ({self.model_name})")
+
+        content = self.render_batch(capability, user_prompt) or self.render(capability, user_prompt)
+        input_tokens = self.options.get("input_tokens") or self._estimate_tokens(prompt)
+        output_tokens = self.options.get("output_tokens") or self._estimate_tokens(content)
+        return StubResponse(
+            choices=[StubChoice(message=StubMessage(content=content))],
+            usage=StubUsage(prompt_tokens=int(input_tokens), completion_tokens=int(output_tokens)),
+            model=self.model_name,
+        )
+
+
+# Global providers per model (RNG sequence must survive per-request clients)
+_stub_providers: Dict[str, LocalStubProvider] = {}
+
+
+def get_stub_provider(model_name: str, options: Optional[Dict[str, Any]] = None) -> LocalStubProvider:
+    """Get the process-wide stub provider for a model."""
+    provider = _stub_providers.get(model_name)
+    if provider is None or (options is not None and provider.options != options):
+        provider = LocalStubProvider(model_name, options)
+        _stub_providers[model_name] = provider
+    return provider
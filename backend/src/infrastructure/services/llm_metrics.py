@@ -11,18 +11,24 @@ Metrics tracked:
 - Parse failures
 - Hallucination detections
 - Cost by capability/model
+
+Every recorded call is also folded into hourly rollups per capability/model
+(counts, token sums, and a mergeable latency sketch), so dashboard queries
+read a bounded number of rollup rows regardless of call volume and raw rows
+can be pruned without losing history.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import math
 import sqlite3
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +65,10 @@ class MetricsSummary:
     p95_latency_ms: float
     cache_hit_rate: float
     success_rate: float
+    p50_latency_ms: float = 0.0
+    p99_latency_ms: float = 0.0
+    total_input_tokens: int = 0
+    total_output_tokens: int = 0
     calls_by_capability: Dict[str, int] = field(default_factory=dict)
     calls_by_model: Dict[str, int] = field(default_factory=dict)
     errors_by_type: Dict[str, int] = field(default_factory=dict)
@@ -76,6 +86,77 @@ class CapabilityMetrics:
     total_cost_usd: float
     parse_failures: int
     hallucinations: int
+    p50_latency_ms: float = 0.0
+    p95_latency_ms: float = 0.0
+    p99_latency_ms: float = 0.0
+    errors: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+class LatencySketch:
+    """
+    Mergeable log-bucketed latency histogram (DDSketch-style).
+    
+    Bucket i holds latencies in (GAMMA^(i-1), GAMMA^i] ms, so every quantile
+    is reported within RELATIVE_ACCURACY of the true value. Sketches merge by
+    adding bucket counts, which is exactly what the hourly rollup table stores.
+    """
+    
+    RELATIVE_ACCURACY = 0.01
+    GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+    _LOG_GAMMA = math.log(GAMMA)
+    
+    def __init__(self, buckets: Optional[Dict[int, int]] = None):
+        self.buckets: Dict[int, int] = dict(buckets or {})
+    
+    @classmethod
+    def bucket_for(cls, latency_ms: float) -> int:
+        if latency_ms <= 1.0:
+            return 0
+        return math.ceil(math.log(latency_ms) / cls._LOG_GAMMA)
+    
+    @classmethod
+    def value_for(cls, bucket: int) -> float:
+        """Representative latency for a bucket (midpoint in relative terms)."""
+        return 2 * cls.GAMMA ** bucket / (cls.GAMMA + 1)
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[int, int]]) -> "LatencySketch":
+        sketch = cls()
+        for bucket, count in rows:
+            sketch.buckets[bucket] = sketch.buckets.get(bucket, 0) + count
+        return sketch
+    
+    @property
+    def count(self) -> int:
+        return sum(self.buckets.values())
+    
+    def add(self, latency_ms: float, count: int = 1):
+        bucket = self.bucket_for(latency_ms)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+    
+    def merge(self, other: "LatencySketch"):
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+    
+    def quantile(self, q: float) -> float:
+        """Nearest-rank quantile (q in 0..1); 0.0 for an empty sketch."""
+        total = self.count
+        if total == 0:
+            return 0.0
+        rank = min(int(total * q), total - 1)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen > rank:
+                return self.value_for(bucket)
+        return self.value_for(max(self.buckets))
+
+
+def _hour_bucket(ts: datetime) -> str:
+    """UTC hour bucket key used by the rollup tables."""
+    return ts.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:00:00")
 
 
 # =============================================================================
@@ -162,7 +243,152 @@ class LLMMetrics:
             )
         """)
         
+        # Hourly rollups (maintained on write, survive raw-row cleanup)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_metrics_hourly (
+                hour TEXT NOT NULL,
+                capability TEXT NOT NULL,
+                model TEXT NOT NULL,
+                calls INTEGER NOT NULL DEFAULT 0,
+                successful INTEGER NOT NULL DEFAULT 0,
+                failed INTEGER NOT NULL DEFAULT 0,
+                cached INTEGER NOT NULL DEFAULT 0,
+                parse_failures INTEGER NOT NULL DEFAULT 0,
+                hallucinations INTEGER NOT NULL DEFAULT 0,
+                input_tokens INTEGER NOT NULL DEFAULT 0,
+                output_tokens INTEGER NOT NULL DEFAULT 0,
+                cost_usd REAL NOT NULL DEFAULT 0.0,
+                latency_sum_ms REAL NOT NULL DEFAULT 0.0,
+                PRIMARY KEY (hour, capability, model)
+            )
+        """)
+        
+        # Latency sketch buckets per rollup (non-cached calls only)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_metrics_hourly_latency (
+                hour TEXT NOT NULL,
+                capability TEXT NOT NULL,
+                model TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (hour, capability, model, bucket)
+            )
+        """)
+        
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_metrics_hourly_errors (
+                hour TEXT NOT NULL,
+                capability TEXT NOT NULL,
+                model TEXT NOT NULL,
+                error_type TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (hour, capability, model, error_type)
+            )
+        """)
+        
         conn.commit()
+        self._backfill_rollups(conn)
+    
+    def _backfill_rollups(self, conn: sqlite3.Connection):
+        """Build rollups from raw rows once (databases created before rollups existed)."""
+        has_rollups = conn.execute("SELECT 1 FROM llm_metrics_hourly LIMIT 1").fetchone()
+        has_raw = conn.execute("SELECT 1 FROM llm_metrics LIMIT 1").fetchone()
+        if has_rollups or not has_raw:
+            return
+        
+        cursor = conn.execute(
+            """
+            SELECT timestamp, capability, model, latency_ms, success, cached,
+                   cost_usd, input_tokens, output_tokens, error_type
+            FROM llm_metrics
+            """
+        )
+        for row in cursor.fetchall():
+            success, cached = bool(row[4]), bool(row[5])
+            self._rollup(
+                conn, datetime.fromisoformat(row[0]), row[1], row[2],
+                calls=1,
+                successful=1 if success else 0,
+                failed=0 if success else 1,
+                cached=1 if cached else 0,
+                cost_usd=row[6] or 0.0,
+                input_tokens=row[7] or 0,
+                output_tokens=row[8] or 0,
+                latency_ms=row[3],
+                sketch_latency=not cached,
+                error_type=row[9],
+            )
+        for table, column in (("llm_parse_failures", "parse_failures"), ("llm_hallucinations", "hallucinations")):
+            cursor = conn.execute(f"SELECT timestamp, capability, model FROM {table}")
+            for ts, capability, model in cursor.fetchall():
+                self._rollup(conn, datetime.fromisoformat(ts), capability, model, **{column: 1})
+        conn.commit()
+        logger.info("Backfilled LLM metrics rollups from raw rows")
+    
+    def _rollup(
+        self,
+        conn: sqlite3.Connection,
+        ts: datetime,
+        capability: str,
+        model: str,
+        calls: int = 0,
+        successful: int = 0,
+        failed: int = 0,
+        cached: int = 0,
+        parse_failures: int = 0,
+        hallucinations: int = 0,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cost_usd: float = 0.0,
+        latency_ms: float = 0.0,
+        sketch_latency: bool = False,
+        error_type: Optional[str] = None,
+    ):
+        """Fold one event into its hourly rollup (caller commits)."""
+        hour = _hour_bucket(ts)
+        conn.execute(
+            """
+            INSERT INTO llm_metrics_hourly
+            (hour, capability, model, calls, successful, failed, cached,
+             parse_failures, hallucinations, input_tokens, output_tokens,
+             cost_usd, latency_sum_ms)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(hour, capability, model) DO UPDATE SET
+                calls = calls + excluded.calls,
+                successful = successful + excluded.successful,
+                failed = failed + excluded.failed,
+                cached = cached + excluded.cached,
+                parse_failures = parse_failures + excluded.parse_failures,
+                hallucinations = hallucinations + excluded.hallucinations,
+                input_tokens = input_tokens + excluded.input_tokens,
+                output_tokens = output_tokens + excluded.output_tokens,
+                cost_usd = cost_usd + excluded.cost_usd,
+                latency_sum_ms = latency_sum_ms + excluded.latency_sum_ms
+            """,
+            (
+                hour, capability, model, calls, successful, failed, cached,
+                parse_failures, hallucinations, input_tokens, output_tokens,
+                cost_usd, latency_ms if calls else 0.0,
+            )
+        )
+        if sketch_latency:
+            conn.execute(
+                """
+                INSERT INTO llm_metrics_hourly_latency (hour, capability, model, bucket, count)
+                VALUES (?, ?, ?, ?, 1)
+                ON CONFLICT(hour, capability, model, bucket) DO UPDATE SET count = count + 1
+                """,
+                (hour, capability, model, LatencySketch.bucket_for(latency_ms))
+            )
+        if error_type:
+            conn.execute(
+                """
+                INSERT INTO llm_metrics_hourly_errors (hour, capability, model, error_type, count)
+                VALUES (?, ?, ?, ?, 1)
+                ON CONFLICT(hour, capability, model, error_type) DO UPDATE SET count = count + 1
+                """,
+                (hour, capability, model, error_type)
+            )
     
     # -------------------------------------------------------------------------
     # Recording Methods
@@ -180,7 +406,8 @@ class LLMMetrics:
         output_tokens: int = 0,
         error_type: Optional[str] = None,
     ):
-        """Record an LLM call metric."""
+        """Record an LLM call metric (raw row plus hourly rollup)."""
+        now = datetime.now(timezone.utc)
         conn = self._get_conn()
         conn.execute(
             """
@@ -190,7 +417,7 @@ class LLMMetrics:
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
-                datetime.now(timezone.utc).isoformat(),
+                now.isoformat(),
                 capability,
                 model,
                 latency_ms,
@@ -202,6 +429,19 @@ class LLMMetrics:
                 error_type,
             )
         )
+        self._rollup(
+            conn, now, capability, model,
+            calls=1,
+            successful=1 if success else 0,
+            failed=0 if success else 1,
+            cached=1 if cached else 0,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=cost_usd,
+            latency_ms=latency_ms,
+            sketch_latency=not cached,
+            error_type=error_type,
+        )
         conn.commit()
     
     async def record_parse_failure(
@@ -216,6 +456,7 @@ class LLMMetrics:
             f"Parse failure in {capability} ({model}): {raw_output[:200]}..."
         )
         
+        now = datetime.now(timezone.utc)
         conn = self._get_conn()
         conn.execute(
             """
@@ -224,13 +465,14 @@ class LLMMetrics:
             VALUES (?, ?, ?, ?, ?)
             """,
             (
-                datetime.now(timezone.utc).isoformat(),
+                now.isoformat(),
                 capability,
                 model,
                 raw_output[:5000],  # Limit storage
                 error_message,
             )
         )
+        self._rollup(conn, now, capability, model, parse_failures=1)
         conn.commit()
     
     async def record_hallucination(
@@ -246,6 +488,7 @@ class LLMMetrics:
             f"Hallucination in {capability}.{field} ({model}): {invalid_value}"
         )
         
+        now = datetime.now(timezone.utc)
         conn = self._get_conn()
         conn.execute(
             """
@@ -254,7 +497,7 @@ class LLMMetrics:
             VALUES (?, ?, ?, ?, ?, ?)
             """,
             (
-                datetime.now(timezone.utc).isoformat(),
+                now.isoformat(),
                 capability,
                 model,
                 field,
@@ -262,86 +505,98 @@ class LLMMetrics:
                 validation_error,
             )
         )
+        self._rollup(conn, now, capability, model, hallucinations=1)
         conn.commit()
     
     # -------------------------------------------------------------------------
     # Query Methods
     # -------------------------------------------------------------------------
     
+    @staticmethod
+    def _since_hour(hours: int) -> str:
+        """First hour bucket inside a window of the last `hours` hours."""
+        return _hour_bucket(datetime.now(timezone.utc) - timedelta(hours=hours))
+    
+    def get_latency_sketch(
+        self,
+        hours: int = 24,
+        capability: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> LatencySketch:
+        """Merged latency sketch for a window, optionally filtered."""
+        sql = "SELECT bucket, SUM(count) FROM llm_metrics_hourly_latency WHERE hour >= ?"
+        params: List[Any] = [self._since_hour(hours)]
+        if capability:
+            sql += " AND capability = ?"
+            params.append(capability)
+        if model:
+            sql += " AND model = ?"
+            params.append(model)
+        sql += " GROUP BY bucket"
+        return LatencySketch.from_rows(self._get_conn().execute(sql, params).fetchall())
+    
     def get_summary(self, hours: int = 24) -> MetricsSummary:
-        """Get aggregated metrics summary."""
-        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        """
+        Get aggregated metrics summary.
+        
+        Reads hourly rollups, so the window is aligned to whole UTC hours and
+        cost is independent of how many calls were recorded.
+        """
+        since = self._since_hour(hours)
         conn = self._get_conn()
         
         # Total counts
         cursor = conn.execute(
             """
             SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful,
-                SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed,
-                SUM(CASE WHEN cached = 1 THEN 1 ELSE 0 END) as cached_count,
-                COALESCE(SUM(cost_usd), 0) as total_cost,
-                COALESCE(AVG(latency_ms), 0) as avg_latency
-            FROM llm_metrics
-            WHERE timestamp >= ?
+                COALESCE(SUM(calls), 0),
+                COALESCE(SUM(successful), 0),
+                COALESCE(SUM(failed), 0),
+                COALESCE(SUM(cached), 0),
+                COALESCE(SUM(cost_usd), 0),
+                COALESCE(SUM(latency_sum_ms), 0),
+                COALESCE(SUM(input_tokens), 0),
+                COALESCE(SUM(output_tokens), 0)
+            FROM llm_metrics_hourly
+            WHERE hour >= ?
             """,
-            (since.isoformat(),)
+            (since,)
         )
-        row = cursor.fetchone()
+        total, successful, failed, cached_count, total_cost, latency_sum, input_tokens, output_tokens = cursor.fetchone()
         
-        total = row[0] or 0
-        successful = row[1] or 0
-        failed = row[2] or 0
-        cached_count = row[3] or 0
-        total_cost = row[4] or 0.0
-        avg_latency = row[5] or 0.0
-        
-        # P95 latency
-        cursor = conn.execute(
-            """
-            SELECT latency_ms FROM llm_metrics
-            WHERE timestamp >= ? AND cached = 0
-            ORDER BY latency_ms
-            """,
-            (since.isoformat(),)
-        )
-        latencies = [r[0] for r in cursor.fetchall()]
-        p95_latency = 0.0
-        if latencies:
-            idx = int(len(latencies) * 0.95)
-            p95_latency = latencies[min(idx, len(latencies) - 1)]
+        # Latency percentiles (non-cached calls)
+        sketch = self.get_latency_sketch(hours)
         
         # Calls by capability
         cursor = conn.execute(
             """
-            SELECT capability, COUNT(*) FROM llm_metrics
-            WHERE timestamp >= ?
+            SELECT capability, SUM(calls) FROM llm_metrics_hourly
+            WHERE hour >= ?
             GROUP BY capability
             """,
-            (since.isoformat(),)
+            (since,)
         )
-        calls_by_capability = {r[0]: r[1] for r in cursor.fetchall()}
+        calls_by_capability = {r[0]: r[1] for r in cursor.fetchall() if r[1]}
         
         # Calls by model
         cursor = conn.execute(
             """
-            SELECT model, COUNT(*) FROM llm_metrics
-            WHERE timestamp >= ?
+            SELECT model, SUM(calls) FROM llm_metrics_hourly
+            WHERE hour >= ?
             GROUP BY model
             """,
-            (since.isoformat(),)
+            (since,)
         )
-        calls_by_model = {r[0]: r[1] for r in cursor.fetchall()}
+        calls_by_model = {r[0]: r[1] for r in cursor.fetchall() if r[1]}
         
         # Errors by type
         cursor = conn.execute(
             """
-            SELECT error_type, COUNT(*) FROM llm_metrics
-            WHERE timestamp >= ? AND error_type IS NOT NULL
+            SELECT error_type, SUM(count) FROM llm_metrics_hourly_errors
+            WHERE hour >= ?
             GROUP BY error_type
             """,
-            (since.isoformat(),)
+            (since,)
         )
         errors_by_type = {r[0]: r[1] for r in cursor.fetchall()}
         
@@ -352,10 +607,14 @@ class LLMMetrics:
             failed_calls=failed,
             cached_calls=cached_count,
             total_cost_usd=total_cost,
-            avg_latency_ms=avg_latency,
-            p95_latency_ms=p95_latency,
+            avg_latency_ms=latency_sum / total if total > 0 else 0.0,
+            p95_latency_ms=sketch.quantile(0.95),
             cache_hit_rate=cached_count / total if total > 0 else 0.0,
             success_rate=successful / total if total > 0 else 0.0,
+            p50_latency_ms=sketch.quantile(0.50),
+            p99_latency_ms=sketch.quantile(0.99),
+            total_input_tokens=input_tokens,
+            total_output_tokens=output_tokens,
             calls_by_capability=calls_by_capability,
             calls_by_model=calls_by_model,
             errors_by_type=errors_by_type,
@@ -366,56 +625,45 @@ class LLMMetrics:
         capability: str,
         hours: int = 24
     ) -> CapabilityMetrics:
-        """Get metrics for a specific capability."""
-        since = datetime.now(timezone.utc) - timedelta(hours=hours)
-        conn = self._get_conn()
-        
-        # Main metrics
-        cursor = conn.execute(
+        """Get metrics for a specific capability (from hourly rollups)."""
+        cursor = self._get_conn().execute(
             """
             SELECT 
-                COUNT(*) as total,
-                AVG(CASE WHEN success = 1 THEN 1.0 ELSE 0.0 END) as success_rate,
-                AVG(latency_ms) as avg_latency,
-                AVG(CASE WHEN cached = 1 THEN 1.0 ELSE 0.0 END) as cache_rate,
-                SUM(cost_usd) as total_cost
-            FROM llm_metrics
-            WHERE capability = ? AND timestamp >= ?
-            """,
-            (capability, since.isoformat())
-        )
-        row = cursor.fetchone()
-        
-        # Parse failures count
-        cursor = conn.execute(
-            """
-            SELECT COUNT(*) FROM llm_parse_failures
-            WHERE capability = ? AND timestamp >= ?
+                COALESCE(SUM(calls), 0),
+                COALESCE(SUM(successful), 0),
+                COALESCE(SUM(failed), 0),
+                COALESCE(SUM(cached), 0),
+                COALESCE(SUM(cost_usd), 0),
+                COALESCE(SUM(latency_sum_ms), 0),
+                COALESCE(SUM(parse_failures), 0),
+                COALESCE(SUM(hallucinations), 0),
+                COALESCE(SUM(input_tokens), 0),
+                COALESCE(SUM(output_tokens), 0)
+            FROM llm_metrics_hourly
+            WHERE capability = ? AND hour >= ?
             """,
-            (capability, since.isoformat())
+            (capability, self._since_hour(hours))
         )
-        parse_failures = cursor.fetchone()[0]
-        
-        # Hallucinations count
-        cursor = conn.execute(
-            """
-            SELECT COUNT(*) FROM llm_hallucinations
-            WHERE capability = ? AND timestamp >= ?
-            """,
-            (capability, since.isoformat())
-        )
-        hallucinations = cursor.fetchone()[0]
+        (total, successful, failed, cached_count, total_cost, latency_sum,
+         parse_failures, hallucinations, input_tokens, output_tokens) = cursor.fetchone()
+        sketch = self.get_latency_sketch(hours, capability=capability)
         
         return CapabilityMetrics(
             capability=capability,
             period_hours=hours,
-            total_calls=row[0] or 0,
-            success_rate=row[1] or 0.0,
-            avg_latency_ms=row[2] or 0.0,
-            cache_hit_rate=row[3] or 0.0,
-            total_cost_usd=row[4] or 0.0,
+            total_calls=total,
+            success_rate=successful / total if total > 0 else 0.0,
+            avg_latency_ms=latency_sum / total if total > 0 else 0.0,
+            cache_hit_rate=cached_count / total if total > 0 else 0.0,
+            total_cost_usd=total_cost,
             parse_failures=parse_failures,
             hallucinations=hallucinations,
+            p50_latency_ms=sketch.quantile(0.50),
+            p95_latency_ms=sketch.quantile(0.95),
+            p99_latency_ms=sketch.quantile(0.99),
+            errors=failed,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
         )
     
     def get_recent_parse_failures(
@@ -473,11 +721,21 @@ class LLMMetrics:
             for row in cursor.fetchall()
         ]
     
-    def cleanup_old_data(self, days: int = 90):
-        """Remove old metrics data."""
+    def cleanup_old_data(self, days: int = 90, rollup_days: Optional[int] = None):
+        """
+        Remove old raw metrics rows.
+        
+        Hourly rollups already hold everything the summaries need, so raw rows
+        can be dropped aggressively. Rollups are kept unless rollup_days is set.
+        """
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
         conn = self._get_conn()
         
+        if rollup_days is not None:
+            rollup_cutoff = _hour_bucket(datetime.now(timezone.utc) - timedelta(days=rollup_days))
+            for table in ("llm_metrics_hourly", "llm_metrics_hourly_latency", "llm_metrics_hourly_errors"):
+                conn.execute(f"DELETE FROM {table} WHERE hour < ?", (rollup_cutoff,))
+        
         conn.execute(
             "DELETE FROM llm_metrics WHERE timestamp < ?",
             (cutoff.isoformat(),)
@@ -2,6 +2,8 @@ from pathlib import Path
 from dotenv import load_dotenv
 import sys
 import asyncio
+import logging
+from contextlib import asynccontextmanager
 
 # Fix for Windows + Playwright + FastAPI async subprocess issue
 if sys.platform == 'win32':
@@ -13,12 +15,56 @@ load_dotenv(env_path, override=True)
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from src.infrastructure.web.routers import v2, audit_v2, scrape_v2, vocab, series, llm, provenance, stats, review, import_v2, catalog, catalog_v2, grading_history, rarity_assessment, concordance, external_links, llm_enrichment, census_snapshot, market, valuation, wishlist, collections, dies, die_links, die_pairings, die_varieties, attribution_hypotheses, iconography_elements, iconography_compositions, coin_iconography  # Phase 4: Compositional Iconography
 from src.infrastructure.persistence.database import init_db
 from src.infrastructure.config import get_settings
 from src.infrastructure.logging_config import configure_logging
 from src.infrastructure.web.middleware import ObservabilityMiddleware
+from src.infrastructure.web.static_images import CoinImageFiles
+from src.infrastructure.services.catalogs.http_pool import CatalogHTTPConfig, CatalogHTTPPool
+from src.infrastructure.services.catalogs.registry import CatalogRegistry
+from src.infrastructure.services.catalog_bulk_enrich import resume_interrupted_jobs
+from src.infrastructure.scrapers.browser_pool import BrowserPool, BrowserPoolConfig, set_browser_pool
+from src.infrastructure.scrapers.static_fetch import StaticPageFetcher, set_static_fetcher
+from src.infrastructure.persistence.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown."""
+    settings = get_settings()
+    # One keep-alive client per catalog host for OCRE/CRRO/RPC lookups
+    catalog_http_pool = CatalogHTTPPool(CatalogHTTPConfig.from_settings(settings))
+    CatalogRegistry.set_http_pool(catalog_http_pool)
+    app.state.catalog_http_pool = catalog_http_pool
+    # One Chromium shared by all scrapers; launched on the first scrape
+    browser_pool = None
+    if settings.SCRAPER_BROWSER_POOL_ENABLED:
+        browser_pool = BrowserPool(BrowserPoolConfig.from_settings(settings))
+        set_browser_pool(browser_pool)
+    app.state.browser_pool = browser_pool
+    # Keep-alive client (and cookie jar) per source for HTTP-first scrapes
+    static_fetcher = StaticPageFetcher(timeout=settings.SCRAPER_TIMEOUT)
+    set_static_fetcher(static_fetcher)
+    # Pick up bulk enrichment jobs interrupted by the last shutdown
+    try:
+        resume_interrupted_jobs(SessionLocal)
+    except Exception as e:
+        # e.g. enrichment checkpoint migration not applied yet; the API still starts
+        logger.error("Could not resume interrupted enrichment jobs: %s", e)
+    try:
+        yield
+    finally:
+        CatalogRegistry.set_http_pool(None)
+        await catalog_http_pool.aclose()
+        set_static_fetcher(None)
+        await static_fetcher.aclose()
+        if browser_pool is not None:
+            set_browser_pool(None)
+            await browser_pool.aclose()
+
 
 def create_app() -> FastAPI:
     # Note: Windows event loop policy already set at module level (lines 7-8)
@@ -30,7 +76,7 @@ def create_app() -> FastAPI:
         include_request_id=True,
     )
 
-    app = FastAPI(title="CoinStack V2 API")
+    app = FastAPI(title="CoinStack V2 API", lifespan=lifespan)
 
     # Add unified observability middleware (request ID, timing, slow request detection)
     app.add_middleware(
@@ -49,11 +95,11 @@ def create_app() -> FastAPI:
 
     init_db()
     
-    # Mount static files for images
+    # Mount static files for images (missing WebP renditions are created on request)
     # Use absolute path to ensure images are found regardless of CWD
     images_dir = Path(__file__).parent.parent.parent.parent / "data" / "coin_images"
     images_dir.mkdir(parents=True, exist_ok=True)
-    app.mount("/images", StaticFiles(directory=str(images_dir)), name="images")
+    app.mount("/images", CoinImageFiles(directory=str(images_dir)), name="images")
     
     app.include_router(v2.router)
     app.include_router(audit_v2.router)
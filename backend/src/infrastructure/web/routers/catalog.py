@@ -4,7 +4,7 @@ import logging
 import uuid
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
+from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -14,7 +14,7 @@ from src.infrastructure.services.catalogs.base import CatalogResult
 from src.infrastructure.web.dependencies import get_db
 from src.infrastructure.persistence.database import SessionLocal
 from src.infrastructure.persistence.orm import EnrichmentJobModel
-from src.infrastructure.services.catalog_bulk_enrich import run_bulk_enrich
+from src.infrastructure.services.catalog_bulk_enrich import start_bulk_enrich
 
 logger = logging.getLogger(__name__)
 
@@ -131,7 +131,7 @@ def get_reference_integrity(
     return run_integrity_check(db, include_orphans=orphans)
 
 
-# --- Bulk enrich (Phase 2: real implementation with enrichment_jobs and BackgroundTasks) ---
+# --- Bulk enrich (Phase 2: real implementation with enrichment_jobs and a background task) ---
 
 @router.post(
     "/bulk-enrich",
@@ -141,7 +141,6 @@ def get_reference_integrity(
 )
 async def bulk_enrich(
     request: BulkEnrichRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     job_id = str(uuid.uuid4())
@@ -158,12 +157,14 @@ async def bulk_enrich(
         conflicts=0,
         not_found=0,
         errors=0,
+        request_params=request.model_dump_json(),
         created_at=datetime.now(timezone.utc),
     )
     db.add(job)
     db.commit()
     logger.info("Bulk enrich job %s queued (total=%s)", job_id, total)
-    background_tasks.add_task(run_bulk_enrich, job_id, request, SessionLocal)
+    # Registered in _active_jobs like resumed jobs, so it is deduplicated and resumable
+    start_bulk_enrich(job_id, request, SessionLocal)
     return BulkEnrichResponse(
         job_id=job_id,
         total_coins=total,
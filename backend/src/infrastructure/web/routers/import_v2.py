@@ -1,6 +1,9 @@
 """Import API router for V2 - URL scraping, NGC lookup, and import confirmation."""
+import json
+import time
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field, field_validator
+from sse_starlette.sse import EventSourceResponse
 from typing import Optional, List, Dict, Any
 from decimal import Decimal
 from src.infrastructure.external.ngc_client import (
@@ -52,15 +55,21 @@ class ImportConfirmResponse(BaseModel):
 # DEPENDENCIES
 # ============================================================================
 
+_orchestrator: Optional[ScraperOrchestrator] = None
+
+
 def get_scraper_orchestrator():
-    """Get scraper orchestrator with all scrapers."""
-    return ScraperOrchestrator([
-        HeritageScraper(headless=True),
-        CNGScraper(headless=True),
-        BiddrScraper(headless=True),
-        EbayScraper(headless=True),
-        AgoraScraper(headless=True),
-    ])
+    """Get the shared scraper orchestrator (pages come from the app's browser pool)."""
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = ScraperOrchestrator([
+            HeritageScraper(headless=True),
+            CNGScraper(headless=True),
+            BiddrScraper(headless=True),
+            EbayScraper(headless=True),
+            AgoraScraper(headless=True),
+        ])
+    return _orchestrator
 
 # ============================================================================
 # REQUEST SCHEMAS
@@ -87,6 +96,11 @@ class NGCImportRequest(BaseModel):
         return v  # Return original format, client will clean it
 
 
+class NGCBulkImportRequest(BaseModel):
+    """Request to import many NGC certificates; malformed ones fail individually."""
+    cert_numbers: List[str] = Field(..., min_length=1, max_length=500, description="NGC certification numbers")
+
+
 # ============================================================================
 # RESPONSE SCHEMAS
 # ============================================================================
@@ -297,102 +311,162 @@ async def import_from_ngc(
     """
     try:
         cert_data = await ngc_client.lookup_certificate(request.cert_number)
-    except InvalidCertificateError as e:
+    except Exception as e:
+        return _ngc_error_preview(e, request.cert_number)
+    return _ngc_preview(cert_data, request.cert_number, _ngc_graded_coins(db))
+
+
+@router.post("/from-ngc/bulk")
+async def import_from_ngc_bulk(
+    request: NGCBulkImportRequest,
+    db: Session = Depends(get_db),
+    ngc_client: NGCClient = Depends(get_ngc_client),
+):
+    """
+    Look up many NGC certificates (e.g. a box of slabs) and stream previews.
+    
+    Duplicate cert numbers are looked up once; cached certificates are
+    returned first, then the rest one by one at NGC's rate limit over one
+    browser session. Streams Server-Sent Events: one `result` per distinct
+    certificate (its `indexes` in the request, `cached`, progress counts and
+    the same preview as /from-ngc), then a `done` event with totals.
+    """
+    graded_coins = _ngc_graded_coins(db)
+
+    async def events():
+        start = time.perf_counter()
+        total = len(request.cert_numbers)
+        completed = succeeded = cached = 0
+        async for item in ngc_client.lookup_many(request.cert_numbers):
+            if item.error is not None:
+                preview = _ngc_error_preview(item.error, item.cert_number)
+            else:
+                preview = _ngc_preview(item.data, item.cert_number, graded_coins)
+                succeeded += len(item.indexes)
+                cached += len(item.indexes) if item.cached else 0
+            completed += len(item.indexes)
+            yield {"event": "result", "data": json.dumps({
+                "indexes": item.indexes,
+                "cert_number": item.cert_number,
+                "cached": item.cached,
+                "completed": completed,
+                "total": total,
+                "preview": preview.model_dump(mode="json"),
+            })}
+        yield {"event": "done", "data": json.dumps({
+            "total": total,
+            "succeeded": succeeded,
+            "failed": completed - succeeded,
+            "cached": cached,
+            "elapsed_ms": (time.perf_counter() - start) * 1000,
+        })}
+
+    return EventSourceResponse(events())
+
+
+def _ngc_error_preview(e: Exception, cert_number: str) -> ImportPreviewResponse:
+    """Preview response for a failed certificate lookup."""
+    if isinstance(e, InvalidCertificateError):
         return ImportPreviewResponse(
             success=False,
             error=str(e),
             error_code="invalid_cert",
             manual_entry_suggested=True,
         )
-    except CertificateNotFoundError as e:
+    if isinstance(e, CertificateNotFoundError):
         return ImportPreviewResponse(
             success=False,
             error=str(e),
             error_code="not_found",
             manual_entry_suggested=True,
         )
-    except NGCTimeoutError:
+    if isinstance(e, NGCTimeoutError):
         return ImportPreviewResponse(
             success=False,
             error="NGC lookup timed out. Please try again.",
             error_code="timeout",
             retry_after=30,
         )
-    except NGCRateLimitError as e:
+    if isinstance(e, NGCRateLimitError):
         return ImportPreviewResponse(
             success=False,
             error="Rate limited by NGC. Please wait before trying again.",
             error_code="rate_limit",
             retry_after=e.retry_after,
         )
-    except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.exception(f"Error looking up NGC cert {request.cert_number}")
-        
-        # Check if it's an anti-bot protection error
-        error_msg = str(e)
-        if "403" in error_msg or "Forbidden" in error_msg or "anti-bot" in error_msg.lower():
-            return ImportPreviewResponse(
-                success=False,
-                error=(
-                    "NGC is blocking automated access (anti-bot protection). "
-                    f"You can manually enter the coin data, or try accessing the certificate at: "
-                    f"https://www.ngccoin.com/certlookup/{request.cert_number}/"
-                ),
-                error_code="anti_bot_blocked",
-                manual_entry_suggested=True,
-            )
-        
+
+    import logging
+    logger = logging.getLogger(__name__)
+    logger.error(f"Error looking up NGC cert {cert_number}", exc_info=e)
+    
+    # Check if it's an anti-bot protection error
+    error_msg = str(e)
+    if "403" in error_msg or "Forbidden" in error_msg or "anti-bot" in error_msg.lower():
         return ImportPreviewResponse(
             success=False,
-            error=f"NGC lookup failed: {error_msg}",
-            error_code="ngc_error",
+            error=(
+                "NGC is blocking automated access (anti-bot protection). "
+                f"You can manually enter the coin data, or try accessing the certificate at: "
+                f"https://www.ngccoin.com/certlookup/{cert_number}/"
+            ),
+            error_code="anti_bot_blocked",
             manual_entry_suggested=True,
         )
     
-    # Map NGC data to preview format
-    coin_data = _map_ngc_to_preview(cert_data)
-    
-    # Check for duplicates by certification number
-    coin_repo = SqlAlchemyCoinRepository(db)
-    similar_coins = []
-    
-    # Search for coins with same NGC cert
+    return ImportPreviewResponse(
+        success=False,
+        error=f"NGC lookup failed: {error_msg}",
+        error_code="ngc_error",
+        manual_entry_suggested=True,
+    )
+
+
+def _ngc_graded_coins(db: Session) -> list:
+    """Collection coins graded by NGC, loaded once per request for duplicate checks."""
     try:
-        # Query coins with matching certification number
         # Use filters to find coins with matching NGC cert
-        from src.domain.coin import GradeService
-        matching_coins = coin_repo.get_all(
+        coin_repo = SqlAlchemyCoinRepository(db)
+        return coin_repo.get_all(
             limit=100,
             filters={
                 "grade_service": "ngc",
             }
         )
-        for coin in matching_coins:
-            if (coin.grading and 
-                coin.grading.service == GradeService.NGC and
-                coin.grading.certification_number == request.cert_number):
-                similar_coins.append(CoinSummary(
-                    id=coin.id or 0,
-                    title=f"{coin.attribution.issuer} {coin.denomination or ''}".strip(),
-                    match_reason="ngc_cert",
-                    match_confidence=1.0,
-                    issuing_authority=coin.attribution.issuer,
-                    denomination=coin.denomination,
-                    metal=coin.metal.value if coin.metal else None,
-                    weight_g=coin.dimensions.weight_g,
-                    grade=coin.grading.grade,
-                ))
     except Exception as e:
         import logging
         logger = logging.getLogger(__name__)
         logger.warning(f"Error checking duplicates: {e}")
+        return []
+
+
+def _ngc_preview(cert_data, cert_number: str, graded_coins: list) -> ImportPreviewResponse:
+    """Preview response for a found certificate, flagging coins that already have it."""
+    # Map NGC data to preview format
+    coin_data = _map_ngc_to_preview(cert_data)
+    
+    # Check for duplicates by certification number
+    from src.domain.coin import GradeService
+    similar_coins = []
+    for coin in graded_coins:
+        if (coin.grading and 
+            coin.grading.service == GradeService.NGC and
+            coin.grading.certification_number == cert_number):
+            similar_coins.append(CoinSummary(
+                id=coin.id or 0,
+                title=f"{coin.attribution.issuer} {coin.denomination or ''}".strip(),
+                match_reason="ngc_cert",
+                match_confidence=1.0,
+                issuing_authority=coin.attribution.issuer,
+                denomination=coin.denomination,
+                metal=coin.metal.value if coin.metal else None,
+                weight_g=coin.dimensions.weight_g,
+                grade=coin.grading.grade,
+            ))
     
     return ImportPreviewResponse(
         success=True,
         source_type="ngc",
-        source_id=request.cert_number,
+        source_id=cert_number,
         source_url=cert_data.verification_url,
         coin_data=coin_data,
         field_confidence={
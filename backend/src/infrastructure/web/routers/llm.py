@@ -356,6 +356,20 @@ class CostReportResponse(BaseModel):
     by_model: Dict[str, float]
 
 
+class ModelHealthResponse(BaseModel):
+    """Rolling health and circuit breaker state for one model."""
+    model: str
+    state: str  # "closed", "open", "half_open"
+    window_calls: int
+    error_rate: float
+    p95_latency_ms: Optional[float] = None
+    total_calls: int
+    total_failures: int
+    trips: int
+    retry_in_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+
+
 class MetricsSummaryResponse(BaseModel):
     """Metrics summary."""
     period_hours: int
@@ -365,10 +379,17 @@ class MetricsSummaryResponse(BaseModel):
     cached_calls: int
     total_cost_usd: float
     avg_latency_ms: float
+    p50_latency_ms: float = 0.0
+    p95_latency_ms: float = 0.0
+    p99_latency_ms: float = 0.0
+    total_input_tokens: int = 0
+    total_output_tokens: int = 0
     cache_hit_rate: float
     success_rate: float
     calls_by_capability: Dict[str, int]
+    calls_by_model: Dict[str, int] = Field(default_factory=dict)
     errors_by_type: Dict[str, int]
+    model_health: List[ModelHealthResponse] = Field(default_factory=list)
 
 
 # =============================================================================
@@ -402,7 +423,9 @@ def _coin_images_dir() -> Path:
 async def _resolve_coin_primary_image_b64(session: Session, coin_id: int) -> Optional[str]:
     """
     Load coin by id, get primary image URL, return its content as base64.
-    Supports http(s) URLs (fetched) and /images/... paths (read from data/coin_images).
+    Supports http(s) URLs (mirrored into data/coin_images on first use, or
+    fetched directly when the mirror rejects them, e.g. AVIF or over 10 MB)
+    and /images/... paths (read from data/coin_images).
     """
     from src.infrastructure.repositories.coin_repository import SqlAlchemyCoinRepository
 
@@ -416,6 +439,17 @@ async def _resolve_coin_primary_image_b64(session: Session, coin_id: int) -> Opt
         return None
     url = url.strip()
     if url.startswith("http://") or url.startswith("https://"):
+        # Downloaded once into the local image mirror, read from disk afterwards
+        from src.infrastructure.services.image_mirror import get_image_mirror
+
+        mirror = get_image_mirror()
+        image = await mirror.fetch(url)
+        if image is not None:
+            try:
+                import base64
+                return base64.b64encode(mirror.path_for(image).read_bytes()).decode("utf-8")
+            except Exception as e:
+                logger.warning("Failed to read mirrored coin image %s: %s", url[:80], e)
         try:
             import base64
             import httpx
@@ -1327,8 +1361,11 @@ async def get_metrics(
     """
     Get metrics summary.
     
-    Returns call counts, latencies, cache rates, and error breakdown.
+    Returns call counts, latencies, cache rates, error breakdown, and
+    per-model circuit breaker state.
     """
+    from src.infrastructure.services.llm.model_health import get_model_health_tracker
+
     summary = metrics_service.get_summary(hours)
     
     return MetricsSummaryResponse(
@@ -1339,10 +1376,19 @@ async def get_metrics(
         cached_calls=summary.cached_calls,
         total_cost_usd=summary.total_cost_usd,
         avg_latency_ms=summary.avg_latency_ms,
+        p50_latency_ms=summary.p50_latency_ms,
+        p95_latency_ms=summary.p95_latency_ms,
+        p99_latency_ms=summary.p99_latency_ms,
+        total_input_tokens=summary.total_input_tokens,
+        total_output_tokens=summary.total_output_tokens,
         cache_hit_rate=summary.cache_hit_rate,
         success_rate=summary.success_rate,
         calls_by_capability=summary.calls_by_capability,
+        calls_by_model=summary.calls_by_model,
         errors_by_type=summary.errors_by_type,
+        model_health=[
+            ModelHealthResponse(**h) for h in get_model_health_tracker().snapshot()
+        ],
     )
 
 
@@ -1,10 +1,14 @@
+import json
+import time
 from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from sse_starlette.sse import EventSourceResponse
+from typing import List, Optional
 from decimal import Decimal
 from sqlalchemy.orm import Session
 from src.application.commands.scrape_lot import ScrapeAuctionLotUseCase, ScrapeLotDTO
 from src.application.commands.enrich_coin import EnrichCoinUseCase, EnrichCoinDTO
+from src.application.commands.batch_scrape import BatchScrapeUseCase, BatchScrapeDTO, BatchScrapeSummary
 from src.domain.services.scraper_orchestrator import ScraperOrchestrator
 from src.infrastructure.scrapers.mock_scraper import MockScraper
 from src.infrastructure.scrapers.heritage.scraper import HeritageScraper
@@ -12,27 +16,42 @@ from src.infrastructure.scrapers.cng.scraper import CNGScraper
 from src.infrastructure.scrapers.biddr.scraper import BiddrScraper
 from src.infrastructure.scrapers.ebay.scraper import EbayScraper
 from src.infrastructure.scrapers.agora.scraper import AgoraScraper
+from src.infrastructure.scrapers.browser_pool import get_browser_pool
+from src.infrastructure.scrapers.resource_policy import route_stats
+from src.infrastructure.scrapers.static_fetch import fetch_stats
 
 from src.infrastructure.web.dependencies import get_db
 from src.infrastructure.repositories.coin_repository import SqlAlchemyCoinRepository
 from src.infrastructure.repositories.auction_data_repository import SqlAlchemyAuctionDataRepository
 
-# In a real app, we'd inject real scrapers here
+_orchestrator: Optional[ScraperOrchestrator] = None
+
+
 def get_scraper_orchestrator():
-    return ScraperOrchestrator([
-        HeritageScraper(),
-        CNGScraper(),
-        BiddrScraper(),
-        EbayScraper(),
-        AgoraScraper(),
-        MockScraper() 
-    ])
+    """
+    Orchestrator shared across requests. Its scrapers lease pages from the
+    app's browser pool, so a warm scrape does not launch Chromium.
+    """
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = ScraperOrchestrator([
+            HeritageScraper(),
+            CNGScraper(),
+            BiddrScraper(),
+            EbayScraper(),
+            AgoraScraper(),
+            MockScraper()
+        ])
+    return _orchestrator
 
 router = APIRouter(prefix="/api/v2/scrape", tags=["scrape"])
 
 class ScrapeRequest(BaseModel):
     url: str
 
+class BatchScrapeRequest(BaseModel):
+    urls: List[str] = Field(..., min_length=1, max_length=1000)
+
 class EnrichRequest(BaseModel):
     coin_id: int
     url: Optional[str] = None
@@ -47,6 +66,16 @@ class ScrapeResponse(BaseModel):
     issuer: Optional[str] = None
     grade: Optional[str] = None
 
+@router.get("/stats")
+async def scrape_stats():
+    """Fetch paths (HTTP vs browser), blocked browser requests and pool counters per source."""
+    pool = get_browser_pool()
+    return {
+        "fetch_paths": fetch_stats.snapshot(),
+        "browser_requests": route_stats.snapshot(),
+        "browser_pool": pool.stats() if pool is not None else None,
+    }
+
 @router.post("/lot", response_model=ScrapeResponse)
 async def scrape_lot(
     request: ScrapeRequest,
@@ -70,6 +99,30 @@ async def scrape_lot(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/batch")
+async def scrape_batch(
+    request: BatchScrapeRequest,
+    orchestrator: ScraperOrchestrator = Depends(get_scraper_orchestrator)
+):
+    """
+    Scrape many lot URLs, auction houses in parallel (each at its own rate limit).
+
+    Streams Server-Sent Events: one `result` per URL as it finishes (with its
+    `index` in the request), then a `done` event with counts per status.
+    """
+    use_case = BatchScrapeUseCase(orchestrator)
+
+    async def events():
+        start = time.perf_counter()
+        summary = BatchScrapeSummary()
+        async for item in use_case.stream(BatchScrapeDTO(urls=request.urls)):
+            summary.add(item)
+            yield {"event": "result", "data": json.dumps(item.to_dict(), default=str)}
+        summary.elapsed_ms = (time.perf_counter() - start) * 1000
+        yield {"event": "done", "data": json.dumps(summary.to_dict())}
+
+    return EventSourceResponse(events())
+
 @router.post("/enrich", response_model=ScrapeResponse)
 async def enrich_coin(
     request: EnrichRequest,
@@ -78,7 +131,7 @@ async def enrich_coin(
 ):
     coin_repo = SqlAlchemyCoinRepository(db)
     auction_repo = SqlAlchemyAuctionDataRepository(db)
-    use_case = EnrichCoinUseCase(coin_repo, auction_repo, orchestrator)
+    use_case = EnrichCoinUseCase(coin_repo, auction_repo, orchestrator, commit=db.commit)
     
     try:
         result = await use_case.execute(EnrichCoinDTO(coin_id=request.coin_id, url=request.url))
@@ -25,6 +25,7 @@ from src.domain.coin import (
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from src.infrastructure.web.dependencies import get_coin_repo, get_db
+from src.infrastructure.services.image_derivatives import rendition_urls
 
 router = APIRouter(prefix="/api/v2/coins", tags=["coins"])
 
@@ -259,6 +260,8 @@ class ImageResponse(BaseModel):
     url: str
     image_type: str
     is_primary: bool
+    # WebP renditions of local images: "thumb" | "medium" | "large" -> URL (generated on first request)
+    renditions: Dict[str, str] = {}
 
 class DesignResponse(BaseModel):
     obverse_legend: Optional[str] = None
@@ -499,7 +502,8 @@ class CoinResponse(BaseModel):
                 ImageResponse(
                     url=img.url,
                     image_type=img.image_type,
-                    is_primary=img.is_primary
+                    is_primary=img.is_primary,
+                    renditions=rendition_urls(img.url),
                 ) for img in coin.images
             ],
             description=coin.description,
@@ -0,0 +1,72 @@
+"""
+Static file app for /images (data/coin_images).
+
+Serves files like StaticFiles; a request for a missing WebP rendition
+(<stem>.thumb.webp, .medium.webp, .large.webp) whose original exists
+generates it on the spot and serves it.
+
+Content-addressed files (sha256/ab/<sha256>...) never change under their
+URL, so they are sent as immutable for a year with their hash as a strong
+ETag: a repeat visit to the collection grid loads them from the browser
+cache without a request. Other files must be revalidated (If-None-Match /
+If-Modified-Since -> 304). Range and If-Range requests are answered by
+FileResponse with 206 / 416.
+"""
+
+import os
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from src.infrastructure.services.image_derivatives import ORIGINAL_EXTS, get_image_derivatives, parse_rendition
+from src.infrastructure.services.image_mirror import CONTENT_ADDRESSED
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "public, no-cache"
+
+
+class CoinImageFiles(StaticFiles):
+    """StaticFiles that creates missing image renditions on first request."""
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        headers = {"cache-control": REVALIDATE}
+        match = CONTENT_ADDRESSED.search(Path(full_path).as_posix())
+        if match:
+            sha256, size = match.groups()
+            headers = {"cache-control": IMMUTABLE, "etag": f'"{sha256}-{size}"' if size else f'"{sha256}"'}
+        response = FileResponse(full_path, status_code=status_code, headers=headers, stat_result=stat_result)
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        try:
+            return await super().get_response(path, scope)
+        except HTTPException as e:
+            if e.status_code != 404 or not await self._create_rendition(path):
+                raise
+        return await super().get_response(path, scope)
+
+    async def _create_rendition(self, path: str) -> bool:
+        """Generate the rendition at path from its original; False if there is none."""
+        parsed = parse_rendition(os.path.basename(path))
+        if parsed is None:
+            return False
+        stem = os.path.join(os.path.dirname(path), parsed[0])
+        for ext in ORIGINAL_EXTS:
+            # lookup_path keeps the original inside the served directory
+            original, stat_result = self.lookup_path(stem + ext)
+            if stat_result is not None:
+                rendition = Path(original).with_name(os.path.basename(path))
+                return await get_image_derivatives().ensure(rendition) is not None
+        return False
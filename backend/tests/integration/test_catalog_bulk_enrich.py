@@ -0,0 +1,106 @@
+"""Integration tests for checkpointed, resumable catalog bulk enrichment."""
+import json
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services.reference_sync import sync_coin_references
+from src.domain.coin import (
+    Coin,
+    Category,
+    Metal,
+    Dimensions,
+    Attribution,
+    GradingDetails,
+    GradingState,
+)
+from src.infrastructure.persistence.models import Base
+from src.infrastructure.persistence.orm import EnrichmentJobItemModel, EnrichmentJobModel
+from src.infrastructure.repositories.coin_repository import SqlAlchemyCoinRepository
+from src.infrastructure.services import catalog_bulk_enrich
+from src.infrastructure.services.catalogs.base import CatalogResult
+from src.infrastructure.services.catalogs.registry import CatalogRegistry
+
+
+class SimulatedCrash(BaseException):
+    """Stands in for the process going away mid-job (not handled as a job failure)."""
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'coins.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _seed(session_factory, count: int) -> list:
+    session = session_factory()
+    repo = SqlAlchemyCoinRepository(session)
+    ids = []
+    for n in range(count):
+        coin = repo.save(Coin(
+            id=None,
+            category=Category.ROMAN_IMPERIAL,
+            metal=Metal.SILVER,
+            dimensions=Dimensions(weight_g=Decimal("3.5"), diameter_mm=Decimal("18.0")),
+            attribution=Attribution(issuer="Trajan", year_start=98, year_end=117),
+            grading=GradingDetails(grading_state=GradingState.RAW, grade="VF"),
+        ))
+        if n % 10:  # every tenth coin has no reference
+            sync_coin_references(session, coin.id, [f"RIC II {n}"], "user")
+        ids.append(coin.id)
+    session.add(EnrichmentJobModel(id="job-1", status="queued", total=count))
+    session.commit()
+    session.close()
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_bulk_enrich_resumes_from_checkpoint(session_factory, monkeypatch):
+    coin_ids = _seed(session_factory, 60)
+    calls = []
+    crash = {"after": 1}
+
+    async def fake_lookup_many(cls, system, references, contexts=None):
+        if crash["after"] is not None and len(calls) >= crash["after"]:
+            raise SimulatedCrash()
+        calls.append(list(references))
+        return [CatalogResult(status="not_found") for _ in references]
+
+    monkeypatch.setattr(CatalogRegistry, "lookup_many", classmethod(fake_lookup_many))
+    monkeypatch.setattr(catalog_bulk_enrich, "_CHUNKS_PER_SYSTEM", 1)
+    request = SimpleNamespace(coin_ids=coin_ids, reference_system="ric", dry_run=True, max_coins=None)
+
+    with pytest.raises(SimulatedCrash):
+        await catalog_bulk_enrich.run_bulk_enrich("job-1", request, session_factory)
+
+    session = session_factory()
+    job = session.get(EnrichmentJobModel, "job-1")
+    # 6 coins without references plus the first lookup chunk were checkpointed
+    assert job.status == "running"
+    assert job.progress == 6 + 25
+    assert json.loads(job.coin_ids) == coin_ids
+    assert session.query(EnrichmentJobItemModel).count() == 31
+    session.close()
+
+    # Simulate the restart: resume only the remaining coins
+    crash["after"] = None
+    calls.clear()
+
+    resumed = catalog_bulk_enrich.resume_interrupted_jobs(session_factory)
+    assert resumed == ["job-1"]
+    await catalog_bulk_enrich._active_jobs["job-1"]
+
+    assert sum(len(refs) for refs in calls) == 54 - 25
+    session = session_factory()
+    job = session.get(EnrichmentJobModel, "job-1")
+    assert job.status == "completed"
+    assert job.not_found == 60
+    summary = json.loads(job.result_summary)
+    assert [entry["coin_id"] for entry in summary] == coin_ids
+    assert summary[0]["status"] == "no_reference"
+    session.close()
@@ -0,0 +1,164 @@
+"""Integration tests for the local image mirror."""
+import asyncio
+import io
+import json
+
+import httpx
+import pytest
+from PIL import Image
+
+from src.infrastructure.persistence.orm import AuctionDataModel, CoinImageModel
+from src.infrastructure.services.image_derivatives import ImageDerivativeService
+from src.infrastructure.services.image_mirror import (
+    BACKEND_DIR,
+    ImageMirror,
+    backend_path,
+    mirror_coin_images,
+    sniff_image_ext,
+)
+
+JPEG = b"\xff\xd8\xff\xe0" + b"obverse" * 100
+PNG = b"\x89PNG\r\n\x1a\n" + b"reverse" * 100
+
+
+class FakeCDN:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.requests = []
+        self.active = {}
+        self.peak = {}
+
+    async def __call__(self, request):
+        host = request.url.host
+        self.requests.append(str(request.url))
+        self.active[host] = self.active.get(host, 0) + 1
+        self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        await asyncio.sleep(self.delay)
+        self.active[host] -= 1
+        path = request.url.path
+        if path.startswith("/missing"):
+            return httpx.Response(404)
+        if path.startswith("/page"):
+            return httpx.Response(200, text="<html>not an image</html>")
+        return httpx.Response(200, content=PNG if "rev" in path else JPEG)
+
+
+@pytest.fixture
+def cdn():
+    return FakeCDN()
+
+
+@pytest.fixture
+def mirror(tmp_path, cdn):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(cdn))
+    return ImageMirror(str(tmp_path / "coin_images"), str(tmp_path / "mirror.sqlite"),
+                       max_concurrency=8, per_host=2, client=client)
+
+
+def test_sniff_image_ext():
+    assert sniff_image_ext(JPEG) == "jpg"
+    assert sniff_image_ext(PNG) == "png"
+    assert sniff_image_ext(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "webp"
+    assert sniff_image_ext(b"<html>") is None
+
+
+def test_relative_mirror_paths_resolve_against_backend_dir(tmp_path):
+    assert backend_path("data/coin_images") == BACKEND_DIR / "data" / "coin_images"
+    assert (BACKEND_DIR / "src" / "infrastructure" / "web" / "main.py").is_file()
+    assert backend_path(str(tmp_path)) == tmp_path
+
+
+@pytest.mark.asyncio
+async def test_duplicates_stored_once_and_rerun_is_free(mirror, cdn):
+    urls = ["https://a.example/obv1.jpg", "https://b.example/obv-copy.jpg", "https://a.example/rev1.jpg",
+            "https://a.example/missing.jpg", "https://a.example/page.html"]
+
+    first = await mirror.mirror(urls)
+
+    assert set(first) == set(urls[:3])
+    assert first[urls[0]].sha256 == first[urls[1]].sha256
+    files = list((mirror.root / "sha256").rglob("*.*"))
+    assert sorted(p.suffix for p in files) == [".jpg", ".png"]
+    assert mirror.path_for(first[urls[0]]).read_bytes() == JPEG
+    assert first[urls[2]].local_url == f"/images/sha256/{first[urls[2]].sha256[:2]}/{first[urls[2]].sha256}.png"
+    assert mirror.original_url(first[urls[2]].local_url) == urls[2]
+
+    cdn.requests.clear()
+    again = await mirror.mirror(urls)
+    assert set(again) == set(urls[:3])
+    # Only the failures are retried
+    assert sorted(cdn.requests) == sorted(urls[3:])
+
+
+@pytest.mark.asyncio
+async def test_per_host_limit(tmp_path):
+    cdn = FakeCDN(delay=0.01)
+    mirror = ImageMirror(str(tmp_path / "coin_images"), str(tmp_path / "mirror.sqlite"), max_concurrency=8,
+                         per_host=2, client=httpx.AsyncClient(transport=httpx.MockTransport(cdn)))
+    urls = [f"https://a.example/{i}.jpg" for i in range(6)] + [f"https://b.example/{i}.jpg" for i in range(6)]
+
+    await mirror.mirror(urls)
+
+    assert cdn.peak == {"a.example": 2, "b.example": 2}
+
+
+@pytest.mark.asyncio
+async def test_mirror_coin_images_points_rows_at_local_copies(db_session, mirror):
+    rows = [
+        CoinImageModel(coin_id=1, url="https://a.example/obv1.jpg", image_type="obverse", is_primary=True),
+        CoinImageModel(coin_id=1, url="https://a.example/missing.jpg", image_type="reverse"),
+        CoinImageModel(coin_id=2, url="/images/local.jpg", image_type="obverse"),
+    ]
+    db_session.add_all(rows)
+    db_session.add(AuctionDataModel(url="https://lots.example/1", source="CNG",
+                                    primary_image_url="https://b.example/obv-copy.jpg",
+                                    additional_images=json.dumps(["https://b.example/rev2.jpg"])))
+    db_session.flush()
+
+    report = await mirror_coin_images(db_session, mirror, batch_size=1)
+
+    assert rows[0].url.startswith("/images/sha256/") and rows[0].url.endswith(".jpg")
+    assert rows[1].url == "https://a.example/missing.jpg"
+    assert rows[2].url == "/images/local.jpg"
+    assert (report.rows_updated, report.downloaded, report.deduplicated, report.failed) == (1, 3, 1, 1)
+    assert report.bytes_saved == len(JPEG)
+    assert report.bytes_written == len(JPEG) + len(PNG)
+
+
+@pytest.mark.asyncio
+async def test_new_files_get_renditions_queued(tmp_path):
+    buffer = io.BytesIO()
+    Image.new("RGB", (1200, 900), "silver").save(buffer, "JPEG")
+    photo = buffer.getvalue()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=photo)))
+    derivatives = ImageDerivativeService(workers=1)
+    mirror = ImageMirror(str(tmp_path / "coin_images"), str(tmp_path / "mirror.sqlite"),
+                         client=client, derivatives=derivatives)
+
+    image = await mirror.fetch("https://a.example/coin.jpg")
+    derivatives.shutdown(wait=True)
+
+    thumb = mirror.path_for(image).with_name(f"{image.sha256}.thumb.webp")
+    assert Image.open(thumb).size == (256, 192)
+
+
+@pytest.mark.asyncio
+async def test_legacy_local_images_move_to_content_addressed_urls(mirror, db_session):
+    (mirror.root / "legacy.jpg").write_bytes(JPEG)
+    (mirror.root / "notes.txt").write_text("not an image")
+    rows = [
+        CoinImageModel(coin_id=1, url="/images/legacy.jpg", image_type="obverse"),
+        CoinImageModel(coin_id=1, url="/images/notes.txt", image_type="other"),
+        CoinImageModel(coin_id=2, url="/images/../../etc/passwd", image_type="other"),
+    ]
+    db_session.add_all(rows)
+    db_session.flush()
+
+    report = await mirror_coin_images(db_session, mirror, include_lots=False)
+
+    assert rows[0].url.startswith("/images/sha256/") and rows[0].url.endswith(".jpg")
+    assert (mirror.root / rows[0].url[len("/images/"):]).read_bytes() == JPEG
+    assert (mirror.root / "legacy.jpg").exists()
+    assert [row.url for row in rows[1:]] == ["/images/notes.txt", "/images/../../etc/passwd"]
+    assert (report.adopted, report.rows_updated, report.requested) == (1, 1, 0)
+    assert mirror.adopt(rows[0].url) is None
@@ -0,0 +1,36 @@
+"""Integration tests for set-based pending-enrichment selection."""
+from decimal import Decimal
+
+import pytest
+
+from src.infrastructure.persistence.orm import AuctionDataModel, CoinModel
+from src.infrastructure.repositories.auction_data_repository import SqlAlchemyAuctionDataRepository
+
+
+def _coin(db_session, url):
+    coin = CoinModel(
+        category="roman_imperial", metal="silver", diameter_mm=Decimal("18.5"), issuer="Trajan",
+        grading_state="raw", grade="VF", acquisition_url=url,
+    )
+    db_session.add(coin)
+    db_session.flush()
+    return coin.id
+
+
+@pytest.mark.integration
+def test_pending_enrichment_selects_coins_with_url_and_no_auction_data(db_session):
+    pending_a = _coin(db_session, "https://www.cngcoins.com/lots/view/1")
+    enriched = _coin(db_session, "https://www.cngcoins.com/lots/view/2")
+    _coin(db_session, None)
+    _coin(db_session, "")
+    pending_b = _coin(db_session, "https://www.biddr.com/auctions/x/browse?l=3")
+    db_session.add(AuctionDataModel(coin_id=enriched, url="https://www.cngcoins.com/lots/view/2", source="CNG"))
+    db_session.flush()
+
+    repo = SqlAlchemyAuctionDataRepository(db_session)
+
+    assert [coin_id for coin_id, _ in repo.get_pending_enrichment()] == [pending_a, pending_b]
+    assert repo.get_pending_enrichment(limit=1) == [(pending_a, "https://www.cngcoins.com/lots/view/1")]
+    assert repo.get_pending_enrichment(limit=1, exclude_coin_ids={pending_a}) == [
+        (pending_b, "https://www.biddr.com/auctions/x/browse?l=3")
+    ]
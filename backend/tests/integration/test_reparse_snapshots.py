@@ -0,0 +1,68 @@
+"""Integration tests for the HTML snapshot store and offline re-parse."""
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from src.infrastructure.persistence.orm import AuctionDataModel
+from src.infrastructure.scrapers.reparse import reparse_snapshots
+from src.infrastructure.scrapers.snapshot_store import HtmlSnapshotStore
+
+LOT_URL = "https://agoraauctions.com/listing/viewdetail/123"
+OLD_HTML = "<html><h1>Lot 12. Hadrian AR Denarius</h1></html>"
+NEW_HTML = (
+    "<html><h1>Lot 12. Hadrian AR Denarius</h1>"
+    "<h3>Rome mint, AD 125-128. Laureate head right / Roma seated left. RIC II 756. 3.35 g</h3>"
+    "<p>Final Price: $1,250</p></html>"
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    clock = iter(range(1_700_000_000, 1_800_000_000, 86400))
+    return HtmlSnapshotStore(str(tmp_path / "snapshots"), clock=lambda: float(next(clock)))
+
+
+def test_identical_pages_share_one_compressed_blob(store):
+    first = store.put(LOT_URL, OLD_HTML, "agora")
+    again = store.put(LOT_URL, OLD_HTML, "agora")
+    changed = store.put(LOT_URL, NEW_HTML, "agora")
+
+    assert first.sha256 == again.sha256 != changed.sha256
+    assert len(list((store.root / "objects").rglob("*.html.gz"))) == 2
+    assert [r.fetched_at for r in store.history(LOT_URL)] == [first.fetched_at, again.fetched_at, changed.fetched_at]
+    assert store.latest() == [changed]
+    assert store.read(changed.sha256) == NEW_HTML
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_reparse_updates_existing_rows_from_latest_snapshot(db_session, store, workers):
+    row = AuctionDataModel(url=LOT_URL, source="Agora Auctions", lot_number="0", grade="VF", coin_id=None)
+    db_session.add(row)
+    db_session.flush()
+    store.put(LOT_URL, OLD_HTML, "agora")
+    latest = store.put(LOT_URL, NEW_HTML, "agora")
+    store.put("https://agoraauctions.com/listing/viewdetail/999", NEW_HTML, "agora")
+
+    stats = reparse_snapshots(db_session, store, workers=workers)
+
+    assert (stats.snapshots, stats.without_row, stats.updated, stats.failed) == (2, 1, 1, 0)
+    db_session.refresh(row)
+    assert row.lot_number == "12"
+    assert row.hammer_price == Decimal("1250.00")
+    assert "RIC II 756" in row.description
+    assert row.grade == "VF"  # Not found by the parser, so kept
+    assert row.scraped_at == date.fromtimestamp(latest.fetched_at)
+
+
+def test_reparse_dry_run_and_source_filter(db_session, store):
+    row = AuctionDataModel(url=LOT_URL, source="Agora Auctions", lot_number="0")
+    db_session.add(row)
+    db_session.flush()
+    store.put(LOT_URL, NEW_HTML, "agora")
+
+    assert reparse_snapshots(db_session, store, source="cng", workers=0).snapshots == 0
+    stats = reparse_snapshots(db_session, store, workers=0, dry_run=True)
+    assert stats.updated == 1
+    db_session.refresh(row)
+    assert row.lot_number == "0"
@@ -0,0 +1,20 @@
+"""Unit tests for BatchScrapeUseCase."""
+import pytest
+
+from src.application.commands.batch_scrape import BatchScrapeDTO, BatchScrapeUseCase
+from src.domain.services.scraper_orchestrator import ScraperOrchestrator
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_houses_overlap_but_each_runs_one_lot_at_a_time(slow_house, scrape_probe):
+    cng, biddr = slow_house("cng"), slow_house("biddr")
+    urls = [f"https://cng/{i}" for i in range(4)] + [f"https://biddr/{i}" for i in range(4)] + ["https://unknown/1"]
+    use_case = BatchScrapeUseCase(ScraperOrchestrator([cng, biddr]))
+
+    items, summary = await use_case.execute(BatchScrapeDTO(urls=urls))
+
+    assert [i.index for i in items] == list(range(9))
+    assert summary.by_status == {"success": 8, "error": 1}
+    assert (cng.peak, biddr.peak) == (1, 1)
+    assert scrape_probe.peak == 2  # Two houses in parallel, not eight lots in series
@@ -0,0 +1,146 @@
+"""Unit tests for the concurrent pending-enrichment pipeline."""
+import asyncio
+
+import pytest
+
+from src.application.commands.enrich_pending import EnrichPendingCoinsUseCase
+from src.domain.auction import AuctionLot
+from src.domain.services.scraper_orchestrator import ScraperOrchestrator
+from src.domain.services.scraper_service import ScrapeResult, ScrapeStatus
+
+
+class Tracker:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+
+class FakeHouse:
+    def __init__(self, host, tracker, fail=(), delay=0.01):
+        self.host = host
+        self.tracker = tracker
+        self.fail = set(fail)
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+
+    def can_handle(self, url):
+        return self.host in url
+
+    async def scrape(self, url, if_changed=False):
+        self.calls.append(url)
+        self.active += 1
+        self.tracker.active += 1
+        self.peak = max(self.peak, self.active)
+        self.tracker.peak = max(self.tracker.peak, self.tracker.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        self.tracker.active -= 1
+        if url in self.fail:
+            raise RuntimeError("blocked")
+        return ScrapeResult(status=ScrapeStatus.SUCCESS, data=AuctionLot(source=self.host, lot_id=url, url=url))
+
+
+class FakeAuctionRepo:
+    def __init__(self, broken=()):
+        self.broken = set(broken)
+        self.upserts = []
+
+    def upsert(self, lot, coin_id=None):
+        if coin_id in self.broken:
+            raise ValueError("constraint")
+        self.upserts.append((lot.url, coin_id))
+        return len(self.upserts)
+
+
+class FakeSession:
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+def _use_case(houses, repo, session, concurrency):
+    return EnrichPendingCoinsUseCase(
+        repo, ScraperOrchestrator(houses), commit=session.commit, rollback=session.rollback,
+        concurrency=concurrency,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_houses_overlap_within_concurrency_and_each_lot_is_committed():
+    tracker = Tracker()
+    houses = [FakeHouse(name, tracker) for name in ("cng", "biddr", "agora")]
+    coins = [(i, f"https://{houses[i % 3].host}/lot/{i}") for i in range(12)]
+    repo, session = FakeAuctionRepo(), FakeSession()
+
+    progress = await _use_case(houses, repo, session, concurrency=2).execute(coins)
+
+    assert (progress.total, progress.enriched, progress.failed) == (12, 12, 0)
+    assert sorted(coin_id for _, coin_id in repo.upserts) == list(range(12))
+    assert session.commits == 12
+    assert tracker.peak == 2
+    # One request at a time per house, in the given order
+    assert all(house.peak == 1 for house in houses)
+    assert houses[0].calls == [url for _, url in coins if "cng" in url]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failures_are_reported_and_do_not_stop_the_batch():
+    tracker = Tracker()
+    house = FakeHouse("cng", tracker, fail={"https://cng/lot/2"})
+    coins = [(1, "https://cng/lot/1"), (2, "https://cng/lot/2"), (3, "https://cng/lot/3"),
+             (4, "https://unknown/lot/4")]
+    repo, session = FakeAuctionRepo(broken={3}), FakeSession()
+    failed = []
+
+    progress = await _use_case([house], repo, session, concurrency=4).execute(
+        coins, on_failed=lambda coin_id, error: failed.append(coin_id)
+    )
+
+    assert sorted(failed) == [2, 3, 4]
+    assert repo.upserts == [("https://cng/lot/1", 1)]
+    assert (session.commits, session.rollbacks) == (1, 1)
+    assert (progress.enriched, progress.failed) == (1, 3)
+    assert progress.by_source["FakeHouse"] == {"enriched": 1, "failed": 2}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_progress_is_reported_periodically():
+    house = FakeHouse("cng", Tracker(), delay=0.02)
+    snapshots = []
+
+    progress = await _use_case([house], FakeAuctionRepo(), FakeSession(), concurrency=1).execute(
+        [(i, f"https://cng/lot/{i}") for i in range(5)],
+        on_progress=lambda p: snapshots.append(p.done),
+        progress_every=0.03,
+    )
+
+    assert snapshots and snapshots == sorted(snapshots)
+    assert "5/5 coins (5 enriched, 0 failed" in progress.summary()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_consumer_failure_stops_producers_and_is_raised():
+    coins = [(i, f"https://cng/lot/{i}") for i in range(20)]
+    house = FakeHouse("cng", Tracker(), fail={url for _, url in coins}, delay=0)
+
+    def on_failed(coin_id, error):
+        raise OSError("checkpoint not writable")
+
+    with pytest.raises(OSError, match="checkpoint"):
+        await asyncio.wait_for(
+            _use_case([house], FakeAuctionRepo(), FakeSession(), concurrency=1).execute(coins, on_failed=on_failed),
+            timeout=2,
+        )
+    assert len(house.calls) < len(coins)
@@ -0,0 +1,136 @@
+"""Unit tests for RefreshAuctionDataUseCase and change-aware EnrichCoinUseCase."""
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.commands.enrich_coin import EnrichCoinDTO, EnrichCoinUseCase
+from src.application.commands.refresh_auction_data import RefreshAuctionDataUseCase
+from src.domain.auction import AuctionLot
+from src.domain.services.scraper_orchestrator import ScraperOrchestrator
+from src.domain.services.scraper_service import ScrapeResult, ScrapeStatus
+
+
+class FakeHouse:
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.calls = []
+        self.persisted = []
+
+    def can_handle(self, url):
+        return "house" in url
+
+    async def scrape(self, url, if_changed=False):
+        self.calls.append((url, if_changed))
+        status = self.statuses[url]
+        if status == ScrapeStatus.SUCCESS:
+            return ScrapeResult(
+                status=status,
+                data=AuctionLot(source="House", lot_id="1", url=url),
+                on_persisted=lambda: self.persisted.append(url),
+            )
+        return ScrapeResult(status=status, error_message=None if status == ScrapeStatus.UNCHANGED else "boom")
+
+
+class FakeAuctionRepo:
+    def __init__(self, stored=(), links=None, fail_urls=()):
+        self.stored = {lot.url: lot for lot in stored}
+        self.links = dict(links or {})  # coin_id -> url
+        self.fail_urls = set(fail_urls)
+        self.upserts = []
+
+    def upsert(self, lot, coin_id=None):
+        if lot.url in self.fail_urls:
+            raise RuntimeError("disk full")
+        self.upserts.append((lot.url, coin_id))
+        if coin_id is not None:
+            self.links[coin_id] = lot.url
+        return len(self.upserts)
+
+    def get_by_url(self, url):
+        return self.stored.get(url)
+
+    def get_by_coin_id(self, coin_id):
+        return self.stored.get(self.links.get(coin_id))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_refresh_writes_only_changed_lots_and_reports_skips():
+    house = FakeHouse({
+        "https://house/1": ScrapeStatus.UNCHANGED,
+        "https://house/2": ScrapeStatus.SUCCESS,
+        "https://house/3": ScrapeStatus.UNCHANGED,
+        "https://house/4": ScrapeStatus.BLOCKED,
+    })
+    repo = FakeAuctionRepo()
+    use_case = RefreshAuctionDataUseCase(repo, ScraperOrchestrator([house]))
+
+    report = await use_case.execute([(i, f"https://house/{i}") for i in range(1, 5)])
+
+    assert (report.checked, report.updated, report.unchanged, report.failed) == (4, 1, 2, 1)
+    assert report.errors == [("https://house/4", "boom")]
+    assert repo.upserts == [("https://house/2", 2)]
+    assert all(if_changed for _, if_changed in house.calls)
+    assert house.persisted == ["https://house/2"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_refresh_marks_pages_seen_only_after_commit():
+    house = FakeHouse({"https://house/1": ScrapeStatus.SUCCESS, "https://house/2": ScrapeStatus.SUCCESS})
+    repo = FakeAuctionRepo(fail_urls={"https://house/1"})
+    events = []
+    use_case = RefreshAuctionDataUseCase(
+        repo, ScraperOrchestrator([house]),
+        commit=lambda: events.append(("commit", list(house.persisted))),
+        rollback=lambda: events.append(("rollback", list(house.persisted))),
+    )
+
+    report = await use_case.execute([(1, "https://house/1"), (2, "https://house/2")])
+
+    assert (report.updated, report.failed) == (1, 1)
+    assert report.errors == [("https://house/1", "Persist failed: disk full")]
+    assert events == [("rollback", []), ("commit", [])]
+    assert house.persisted == ["https://house/2"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_enrich_only_conditional_for_stored_lots():
+    url = "https://house/1"
+    coin_repo = SimpleNamespace(get_by_id=lambda coin_id: SimpleNamespace(acquisition=SimpleNamespace(url=url)))
+    stored = AuctionLot(source="House", lot_id="1", url=url)
+
+    house = FakeHouse({url: ScrapeStatus.SUCCESS})
+    repo = FakeAuctionRepo()
+    commits = []
+    use_case = EnrichCoinUseCase(coin_repo, repo, ScraperOrchestrator([house]), commit=lambda: commits.append(list(house.persisted)))
+    lot = await use_case.execute(EnrichCoinDTO(coin_id=7))
+    assert lot.url == url and repo.upserts == [(url, 7)]
+    assert house.calls == [(url, False)]
+    assert commits == [[]] and house.persisted == [url]
+
+    house = FakeHouse({url: ScrapeStatus.UNCHANGED})
+    repo = FakeAuctionRepo([stored], links={7: url})
+    assert await EnrichCoinUseCase(coin_repo, repo, ScraperOrchestrator([house])).execute(EnrichCoinDTO(coin_id=7)) is stored
+    assert repo.upserts == [] and house.calls == [(url, True)]
+
+    house = FakeHouse({url: ScrapeStatus.BLOCKED})
+    with pytest.raises(RuntimeError):
+        await EnrichCoinUseCase(coin_repo, FakeAuctionRepo(), ScraperOrchestrator([house])).execute(EnrichCoinDTO(coin_id=7))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_enrich_links_unchanged_lot_stored_for_another_coin():
+    url = "https://house/1"
+    coin_repo = SimpleNamespace(get_by_id=lambda coin_id: SimpleNamespace(acquisition=SimpleNamespace(url=url)))
+    stored = AuctionLot(source="House", lot_id="1", url=url)
+    repo = FakeAuctionRepo([stored], links={3: url})
+    commits = []
+
+    use_case = EnrichCoinUseCase(coin_repo, repo, ScraperOrchestrator([FakeHouse({url: ScrapeStatus.UNCHANGED})]),
+                                 commit=lambda: commits.append(True))
+
+    assert await use_case.execute(EnrichCoinDTO(coin_id=7)) is stored
+    assert repo.upserts == [(url, 7)] and commits == [True]
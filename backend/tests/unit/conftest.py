@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from src.domain.auction import AuctionLot
+from src.domain.services.scraper_service import ScrapeResult, ScrapeStatus
+
+
+class ScrapeProbe:
+    """Concurrent scrapes across every SlowHouse sharing it."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+
+class SlowHouse:
+    """One lot at a time, like a rate-limited scraper; '.../missing' is not found."""
+
+    def __init__(self, host, delay=0.05, probe=None):
+        self.host = host
+        self.delay = delay
+        self.probe = probe or ScrapeProbe()
+        self.active = 0
+        self.peak = 0
+
+    def can_handle(self, url):
+        return self.host in url
+
+    async def scrape(self, url):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.probe.active += 1
+        self.probe.peak = max(self.probe.peak, self.probe.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        self.probe.active -= 1
+        if url.endswith("missing"):
+            return ScrapeResult(status=ScrapeStatus.NOT_FOUND, error_message="Lot not found")
+        return ScrapeResult(status=ScrapeStatus.SUCCESS, data=AuctionLot(source=self.host, lot_id=url[-1], url=url))
+
+
+@pytest.fixture
+def scrape_probe():
+    return ScrapeProbe()
+
+
+@pytest.fixture
+def slow_house(scrape_probe):
+    """Factory: slow_house(host, delay=0.05) -> SlowHouse reporting to scrape_probe."""
+    def make(host, delay=0.05):
+        return SlowHouse(host, delay, scrape_probe)
+    return make
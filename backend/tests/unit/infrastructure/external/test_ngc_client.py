@@ -0,0 +1,100 @@
+"""Unit tests for the persistent NGC cache and bulk certificate lookup."""
+import pytest
+
+from src.infrastructure.external.ngc_client import (
+    CertificateNotFoundError,
+    InvalidCertificateError,
+    NGCCertificateData,
+    NGCClient,
+    NGCRateLimitError,
+    SQLiteCache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeNGCClient(NGCClient):
+    """Serves certificates from a dict instead of a browser."""
+
+    def __init__(self, cache, pages, rate_limited=()):
+        super().__init__(cache=cache, cache_ttl=3600)
+        self.pages = pages
+        self.rate_limited = set(rate_limited)
+        self.fetched = []
+
+    async def lookup_certificate(self, cert_number):
+        cert_clean = self.clean_cert_number(cert_number)
+        self.fetched.append(cert_clean)
+        if cert_clean in self.rate_limited:
+            raise NGCRateLimitError("Rate limited by NGC", retry_after=90)
+        if cert_clean not in self.pages:
+            raise CertificateNotFoundError(f"NGC cert {cert_number} not found")
+        data = NGCCertificateData(cert_number=cert_clean, grade=self.pages[cert_clean])
+        await self.cache.set(f"ngc:{cert_clean}", data.model_dump_json(), self.cache_ttl)
+        return data
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return SQLiteCache(str(tmp_path / "ngc.sqlite"), clock=clock)
+
+
+async def _collect(client, certs):
+    return [item async for item in client.lookup_many(certs)]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sqlite_cache_survives_restart_and_expires(tmp_path, cache, clock):
+    await cache.set("ngc:1234567", '{"cert_number": "1234567"}', ttl=60)
+
+    reopened = SQLiteCache(str(tmp_path / "ngc.sqlite"), clock=clock)
+    assert await reopened.get("ngc:1234567") == '{"cert_number": "1234567"}'
+
+    clock.now += 61
+    assert await reopened.get("ngc:1234567") is None
+    reopened.cleanup_expired()
+    assert reopened._get_conn().execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lookup_many_dedupes_and_serves_cached_first(cache):
+    client = FakeNGCClient(cache, {"2167888014": "XF", "4455667": "VF", "7654321": "AU"})
+    await client.lookup_certificate("7654321")
+    client.fetched.clear()
+
+    items = await _collect(client, ["2167888-014", "4455667", "12ab", "2167888014", "7654321", "9999999"])
+
+    by_cert = {item.cert_number: item for item in items}
+    assert [item.cert_number for item in items][:2] == ["12ab", "7654321"]
+    assert by_cert["7654321"].cached and by_cert["7654321"].data.grade == "AU"
+    assert by_cert["2167888-014"].indexes == [0, 3]
+    assert by_cert["2167888-014"].data.grade == "XF"
+    assert isinstance(by_cert["12ab"].error, InvalidCertificateError)
+    assert isinstance(by_cert["9999999"].error, CertificateNotFoundError)
+    assert client.fetched == ["2167888014", "4455667", "9999999"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lookup_many_stops_fetching_when_rate_limited(cache):
+    client = FakeNGCClient(cache, {"1111111": "VF", "3333333": "XF"}, rate_limited={"2222222"})
+
+    items = await _collect(client, ["1111111", "2222222", "3333333"])
+
+    assert [item.cert_number for item in items] == ["1111111", "2222222", "3333333"]
+    assert items[0].data.grade == "VF"
+    assert all(isinstance(item.error, NGCRateLimitError) for item in items[1:])
+    assert client.fetched == ["1111111", "2222222"]
@@ -0,0 +1,148 @@
+"""Unit tests for the shared scraper BrowserPool (no real Chromium)."""
+import asyncio
+
+import pytest
+
+from src.infrastructure.scrapers.browser_pool import BrowserPool, BrowserPoolConfig
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def crash(self):
+        self.handlers["crash"](self)
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def close(self):
+        self.connected = False
+
+
+class FakeBrowserPool(BrowserPool):
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.browsers = []
+
+    async def _launch(self):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    async def _new_context(self, browser, source):
+        context = FakeContext()
+        browser.contexts.append(context)
+        return context
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_warm_requests_reuse_browser_context_and_page():
+    pool = FakeBrowserPool()
+    async with pool.page("cng") as first:
+        pass
+    async with pool.page("cng") as second:
+        pass
+    async with pool.page("heritage"):
+        pass
+
+    assert second is first
+    stats = pool.stats()
+    assert stats["browser_launches"] == 1
+    assert stats["contexts_created"] == 2  # One per source
+    assert stats["pages_reused"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_context_recycled_after_max_uses():
+    pool = FakeBrowserPool(BrowserPoolConfig(context_max_uses=2))
+    for _ in range(3):
+        async with pool.page("cng"):
+            pass
+
+    old, new = pool.browsers[0].contexts
+    assert old.closed and not new.closed
+    assert pool.stats()["contexts_recycled"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_crashed_page_recycles_context_and_failed_page_is_not_reused():
+    pool = FakeBrowserPool()
+    async with pool.page("ebay") as page:
+        page.crash()
+    async with pool.page("ebay") as fresh:
+        pass
+    assert page.closed and fresh is not page
+    assert pool.browsers[0].contexts[0].closed
+
+    with pytest.raises(RuntimeError):
+        async with pool.page("ebay") as failed:
+            raise RuntimeError("navigation failed")
+    async with pool.page("ebay") as after:
+        pass
+    assert failed.closed and after is not failed
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_disconnected_browser_is_relaunched():
+    pool = FakeBrowserPool()
+    async with pool.page("cng"):
+        pass
+    pool.browsers[0].connected = False
+    async with pool.page("cng"):
+        pass
+    assert pool.stats()["browser_launches"] == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_pages_are_capped():
+    pool = FakeBrowserPool(BrowserPoolConfig(max_pages=2))
+    active = peak = 0
+
+    async def lease():
+        nonlocal active, peak
+        async with pool.page("biddr"):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(lease() for _ in range(6)))
+    assert peak == 2
+    await pool.aclose()
+    assert not pool.browsers[0].connected
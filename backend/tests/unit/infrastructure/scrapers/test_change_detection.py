@@ -0,0 +1,147 @@
+"""Unit tests for change-detecting (conditional) auction page refreshes."""
+import httpx
+import pytest
+
+from src.domain.services.scraper_service import ScrapeStatus
+from src.infrastructure.scrapers.agora.scraper import AgoraScraper
+from src.infrastructure.scrapers.change_detection import (
+    PageChangeTracker,
+    content_hash,
+    normalize_html,
+    set_change_tracker,
+)
+from src.infrastructure.scrapers.snapshot_store import HtmlSnapshotStore, set_snapshot_store
+from src.infrastructure.scrapers.static_fetch import StaticPageFetcher, fetch_stats, set_static_fetcher
+
+LOT_URL = "https://agoraauctions.com/listing/viewdetail/123"
+LOT_HTML = (
+    "<html><h1>Lot 12. Hadrian denarius</h1><h3>Rome, AD 125.</h3>"
+    "<input type='hidden' name='csrf' value='{token}'><script>var t = '{token}';</script></html>"
+)
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = PageChangeTracker(str(tmp_path / "validators.sqlite"))
+    set_change_tracker(tracker)
+    set_snapshot_store(HtmlSnapshotStore(str(tmp_path / "snapshots")))
+    yield tracker
+    set_change_tracker(None)
+    set_snapshot_store(None)
+
+
+@pytest.fixture
+def fetcher():
+    fetcher = StaticPageFetcher()
+    set_static_fetcher(fetcher)
+    fetch_stats.reset()
+    yield fetcher
+    set_static_fetcher(None)
+    fetch_stats.reset()
+
+
+def _scraper(fetcher, handler):
+    fetcher._clients["agora"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    scraper = AgoraScraper()
+
+    async def no_wait():
+        return None
+
+    scraper._enforce_rate_limit = no_wait
+    return scraper
+
+
+@pytest.mark.unit
+def test_volatile_markup_does_not_change_the_hash():
+    first = LOT_HTML.format(token="abc")
+    second = LOT_HTML.format(token="xyz").replace(", AD", ",\n   AD")
+    assert "csrf" not in normalize_html(first)
+    assert content_hash(first) == content_hash(second)
+    assert content_hash(first) != content_hash(first.replace("AD 125", "AD 126"))
+
+
+@pytest.mark.unit
+def test_tracker_records_validators_and_changes(tracker):
+    assert tracker.observe(LOT_URL, "<h1>A</h1>", {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    assert tracker.conditional_headers(LOT_URL) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+    assert not tracker.observe(LOT_URL, "<h1>A</h1>  ")
+    assert tracker.observe(LOT_URL, "<h1>B</h1>")
+    assert tracker.conditional_headers("https://example.com/other") == {}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_refresh_sends_conditional_request_and_skips_on_304(tracker, fetcher):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=LOT_HTML.format(token="a"), headers={"ETag": '"v1"'})
+
+    scraper = _scraper(fetcher, handler)
+    first = await scraper.scrape(LOT_URL, if_changed=True)
+    first.on_persisted()
+    second = await scraper.scrape(LOT_URL, if_changed=True)
+
+    assert first.status == ScrapeStatus.SUCCESS and first.data.lot_number == "12"
+    assert second.status == ScrapeStatus.UNCHANGED and second.data is None
+    assert seen == [None, '"v1"']
+    assert fetch_stats.snapshot()["agora"]["unchanged"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_refresh_compares_normalized_hash_without_validators(tracker, fetcher):
+    pages = iter([LOT_HTML.format(token="a"), LOT_HTML.format(token="b"), LOT_HTML.format(token="b").replace("125", "126")])
+    scraper = _scraper(fetcher, lambda request: httpx.Response(200, text=next(pages)))
+
+    statuses = []
+    for _ in range(3):
+        result = await scraper.scrape(LOT_URL, if_changed=True)
+        if result.on_persisted:
+            result.on_persisted()
+        statuses.append(result.status)
+
+    assert statuses == [ScrapeStatus.SUCCESS, ScrapeStatus.UNCHANGED, ScrapeStatus.SUCCESS]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_validators_wait_until_the_lot_is_persisted(tracker, fetcher):
+    scraper = _scraper(fetcher, lambda request: httpx.Response(200, text=LOT_HTML.format(token="a"), headers={"ETag": '"v1"'}))
+
+    first = await scraper.scrape(LOT_URL, if_changed=True)
+    assert tracker.get(LOT_URL) is None  # Not stored yet: the next refresh fetches it in full
+    retried = await scraper.scrape(LOT_URL, if_changed=True)
+    assert first.status == retried.status == ScrapeStatus.SUCCESS
+
+    retried.on_persisted()
+    assert (await scraper.scrape(LOT_URL, if_changed=True)).status == ScrapeStatus.UNCHANGED
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unparseable_page_records_no_validators(tracker, fetcher):
+    scraper = _scraper(fetcher, lambda request: httpx.Response(200, text=LOT_HTML.format(token="a")))
+
+    def broken(html, url):
+        raise ValueError("layout changed")
+
+    scraper.parser.parse = broken
+    assert (await scraper.scrape(LOT_URL, if_changed=True)).status == ScrapeStatus.ERROR
+    assert tracker.get(LOT_URL) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_plain_scrape_ignores_validators(tracker, fetcher):
+    scraper = _scraper(fetcher, lambda request: httpx.Response(200, text=LOT_HTML.format(token="a")))
+
+    assert (await scraper.scrape(LOT_URL)).status == ScrapeStatus.SUCCESS
+    assert (await scraper.scrape(LOT_URL)).status == ScrapeStatus.SUCCESS
+    assert tracker.get(LOT_URL) is None
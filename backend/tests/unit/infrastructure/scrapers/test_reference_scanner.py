@@ -0,0 +1,100 @@
+"""Unit tests for the single-pass ReferenceScanner and its consumers."""
+import random
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from src.application.services.wishlist_matching_service import WishlistMatchingService
+from src.domain.auction import AuctionLot
+from src.domain.coin import WishlistItem
+from src.infrastructure.scrapers.biddr.parser import BiddrParser
+from src.infrastructure.scrapers.shared.reference_patterns import (
+    REFERENCE_PATTERNS,
+    ReferenceScanner,
+    extract_references,
+)
+
+CORPUS_PATH = Path(__file__).resolve().parents[3] / "fixtures" / "reference_corpus.txt"
+
+FILLER = (
+    "Roman Empire denarius silver obverse laureate head right reverse Victory standing "
+    "left holding wreath and palm struck at Rome mint good very fine toned from the "
+    "collection of 3.45g 19mm 12h"
+).split()
+
+
+def _descriptions(count=40, length=3000):
+    refs = [line.strip() for line in CORPUS_PATH.read_text(encoding="utf-8").splitlines()
+            if line.strip() and not line.startswith("#")]
+    rng = random.Random(7)
+    for _ in range(count):
+        words = []
+        while sum(len(w) + 1 for w in words) < length:
+            words.append(rng.choice(refs) if rng.random() < 0.03 else rng.choice(FILLER))
+        yield " ".join(words)
+
+
+def _sequential_matches(text):
+    """Every pattern's finditer in turn (extraction before the scanner)."""
+    return {
+        (catalog, m.start(), m.end())
+        for pattern, catalog, _ in REFERENCE_PATTERNS
+        for m in pattern.finditer(text)
+    }
+
+
+@pytest.mark.unit
+def test_scan_matches_sequential_patterns():
+    scanner = ReferenceScanner([(p, c) for p, c, _ in REFERENCE_PATTERNS], cache_size=0)
+    for text in _descriptions():
+        found = {(m.catalog, m.start, m.end) for m in scanner.scan(text)}
+        assert found == _sequential_matches(text)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("text, expected", [
+    ("RIC II 118 (RSC 162, Cohen 123)", ["RIC II 118", "RSC 162", "Cohen 123"]),
+    ("RIC III 676 (RSC 162) Sear 1234", ["RIC III 676", "RSC 162", "Sear 1234"]),
+])
+def test_references_nested_in_another_match_are_found(text, expected):
+    assert [r.normalized for r in extract_references(text)] == expected
+    # Scrapers with their own tables share the scanner and keep the concordance too
+    assert [r.normalized for r in BiddrParser()._extract_references(text)] == expected
+
+
+@pytest.mark.unit
+def test_scan_returns_spans_and_components_from_original_text():
+    text = "İstanbul hoard. ric ii.1 756 (Hadrian); Cr. 335/1c and SNG Cop 33"
+    matches = ReferenceScanner([(p, c) for p, c, _ in REFERENCE_PATTERNS]).scan(text)
+
+    assert [m.catalog for m in matches] == ["RIC", "Crawford", "SNG"]
+    for m in matches:
+        assert text[m.start:m.end] == m.raw_text
+    assert (matches[0].volume, matches[0].number, matches[0].suffix) == ("ii.1", "756", "Hadrian")
+    assert matches[2].normalized == "SNG Cop 33"
+
+
+@pytest.mark.unit
+def test_extract_references_keeps_pattern_order_and_memoizes():
+    text = "Crawford 44/5; RIC II 756; crawford 44/5"
+    refs = extract_references(text)
+    assert [r.normalized for r in refs] == ["RIC II 756", "Crawford 44/5"]
+
+    scanner = ReferenceScanner([(p, c) for p, c, _ in REFERENCE_PATTERNS])
+    first = scanner.scan(text)
+    assert scanner.scan(text) is first
+    assert scanner.cache_info().hits == 1
+
+
+@pytest.mark.unit
+def test_wishlist_catalog_ref_compares_scanned_references():
+    service = WishlistMatchingService.__new__(WishlistMatchingService)
+    lot = AuctionLot(source="cng", lot_id="1", url="u", description="Denarius. Cr. 44/5; RIC III 207. Toned.")
+
+    def score(ref):
+        return service._match_catalog_ref(WishlistItem(catalog_ref=ref), lot)
+
+    assert score("Crawford 44/5") == Decimal(service.WEIGHT_CATALOG_REF)
+    assert score("RIC II 207") == Decimal(service.WEIGHT_CATALOG_REF * 0.6)
+    assert score("RSC 162") == Decimal("0")
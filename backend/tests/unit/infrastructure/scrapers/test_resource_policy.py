@@ -0,0 +1,89 @@
+"""Unit tests for scraper request interception."""
+import pytest
+
+from src.infrastructure.scrapers.resource_policy import (
+    ResourcePolicy,
+    install_resource_policy,
+    policy_for,
+    route_stats,
+)
+
+HERITAGE = ResourcePolicy(allowed_domains=("ha.com",))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("resource_type, url, expected", [
+    ("image", "https://coins.ha.com/img/lot.jpg", "type"),
+    ("font", "https://coins.ha.com/fonts/a.woff2", "type"),
+    ("script", "https://coins.ha.com/js/app.js", None),
+    ("xhr", "https://api.ha.com/lot/123", None),
+    ("script", "https://www.googletagmanager.com/gtm.js", "ads"),
+    ("script", "https://cdn.example-widgets.com/chat.js", "third_party"),
+    ("stylesheet", "data:text/css,body{}", None),
+])
+def test_block_reason(resource_type, url, expected):
+    assert HERITAGE.block_reason(resource_type, url) == expected
+
+
+@pytest.mark.unit
+def test_main_document_and_unlisted_sources():
+    assert HERITAGE.block_reason("document", "https://elsewhere.com/lot", is_main_document=True) is None
+    open_policy = ResourcePolicy()
+    assert open_policy.block_reason("script", "https://cdn.example-widgets.com/chat.js") is None
+    assert open_policy.block_reason("script", "https://ssl.google-analytics.com/ga.js") == "ads"
+    assert policy_for("ebay").allowed_domains is None
+    assert "auctionmobility.com" in policy_for("cng").allowed_domains
+
+
+class FakeFrame:
+    parent_frame = None
+
+
+class FakeRequest:
+    frame = FakeFrame()
+
+    def __init__(self, resource_type, url):
+        self.resource_type = resource_type
+        self.url = url
+
+
+class FakeRoute:
+    def __init__(self):
+        self.action = None
+
+    async def continue_(self):
+        self.action = "continue"
+
+    async def abort(self, error_code=None):
+        self.action = "abort"
+
+
+class FakeContext:
+    handler = None
+
+    async def route(self, pattern, handler):
+        self.handler = handler
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_installed_route_aborts_and_counts():
+    route_stats.reset()
+    context = FakeContext()
+    await install_resource_policy(context, "heritage", HERITAGE)
+
+    actions = []
+    for resource_type, url in [
+        ("document", "https://coins.ha.com/itm/1"),
+        ("image", "https://coins.ha.com/a.jpg"),
+        ("script", "https://connect.facebook.net/sdk.js"),
+    ]:
+        route = FakeRoute()
+        await context.handler(route, FakeRequest(resource_type, url))
+        actions.append(route.action)
+
+    assert actions == ["continue", "abort", "abort"]
+    assert route_stats.snapshot()["heritage"] == {
+        "allowed": 1, "blocked": {"type": 1, "ads": 1}, "blocked_total": 2,
+    }
+    route_stats.reset()
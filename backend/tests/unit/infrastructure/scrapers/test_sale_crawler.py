@@ -0,0 +1,133 @@
+"""Unit tests for whole-sale crawl mode and the local lot store."""
+import asyncio
+import itertools
+
+import httpx
+import pytest
+
+from src.infrastructure.scrapers.agora.scraper import AgoraScraper
+from src.infrastructure.scrapers.lot_store import LocalLotStore
+from src.infrastructure.scrapers.sale_crawler import SaleCrawler
+from src.infrastructure.scrapers.snapshot_store import HtmlSnapshotStore, set_snapshot_store
+from src.infrastructure.scrapers.static_fetch import StaticPageFetcher, set_static_fetcher
+from src.infrastructure.services.catalogs import robots_cache
+from src.infrastructure.services.catalogs.crawl_scheduler import CrawlScheduler
+from src.infrastructure.services.catalogs.robots_cache import RobotsCache, RobotsEntry
+
+SALE_URL = "https://agoraauctions.com/auction/77"
+INDEX = {
+    None: [1, 2],
+    "2": [3, 4],
+    "3": [4],  # Past the end: nothing new
+}
+
+
+def lot_url(n):
+    return f"https://agoraauctions.com/listing/viewdetail/{n}"
+
+
+class FakeSite:
+    def __init__(self):
+        self.requests = []
+        self.pages = {n: f"<html><h1>Lot {n}. Hadrian denarius</h1><h3>Rome, AD 125. RIC II {n}</h3></html>"
+                      for n in range(1, 5)}
+
+    def __call__(self, request):
+        self.requests.append(str(request.url))
+        if request.url.path == "/auction/77":
+            links = "".join(f'<a href="/listing/viewdetail/{n}">Lot {n}</a>' for n in INDEX[request.url.params.get("page")])
+            return httpx.Response(200, text=f"<html>{links}</html>")
+        return httpx.Response(200, text=self.pages[int(request.url.path.rsplit("/", 1)[1])])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def crawler(tmp_path):
+    robots = RobotsCache(None)
+    robots._entries["agoraauctions.com"] = RobotsEntry.build(
+        "User-agent: *\nDisallow: /listing/viewdetail/3\n", expires_at=float("inf")
+    )
+    robots_cache.set_robots_cache(robots)
+    set_snapshot_store(HtmlSnapshotStore(str(tmp_path / "snapshots")))
+    site = FakeSite()
+    fetcher = StaticPageFetcher()
+    fetcher._clients["agora"] = httpx.AsyncClient(transport=httpx.MockTransport(site))
+    set_static_fetcher(fetcher)
+
+    scraper = AgoraScraper()
+
+    async def no_wait():
+        return None
+
+    scraper._enforce_rate_limit = no_wait
+    ticks = itertools.count(1000)
+    store = LocalLotStore(str(tmp_path / "lots.sqlite"), clock=lambda: float(next(ticks)))
+    crawler = SaleCrawler(scraper, store)
+    crawler.site = site
+    yield crawler
+    set_static_fetcher(None)
+    set_snapshot_store(None)
+    robots_cache.set_robots_cache(None)
+
+
+def _no_real_delays(crawler):
+    clock = FakeClock()
+    crawler._scheduler = CrawlScheduler(asyncio.get_running_loop(), clock=clock, sleep=clock.sleep)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_crawl_is_checkpointed_and_resumes(crawler):
+    _no_real_delays(crawler)
+    first = await crawler.crawl(SALE_URL, max_lots=2)
+
+    assert (first.index_pages, first.discovered, first.updated, first.resumed) == (3, 4, 2, False)
+    assert [lot.lot_number for lot in crawler.store.lots(sale_url=SALE_URL)] == ["1", "2"]
+    assert crawler.store.checkpoint(SALE_URL).finished_at is None
+
+    crawler.site.requests.clear()
+    second = await crawler.crawl(SALE_URL)
+
+    # Index already read; lot 3 is disallowed by robots.txt and never requested
+    assert (second.resumed, second.index_pages, second.updated, second.disallowed) == (True, 0, 1, 1)
+    assert crawler.site.requests == [lot_url(4)]
+    assert crawler.store.checkpoint(SALE_URL).finished_at is not None
+    assert crawler.store.count("agora") == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_recrawl_writes_only_new_or_changed_lots(crawler):
+    _no_real_delays(crawler)
+    await crawler.crawl(SALE_URL)
+    changed_since = crawler.store._clock()
+
+    crawler.site.pages[2] = crawler.site.pages[2].replace("denarius", "denarius, toned")
+    again = await crawler.crawl(SALE_URL)
+
+    assert (again.resumed, again.discovered, again.updated, again.unchanged) == (False, 0, 1, 2)
+    [changed] = crawler.store.lots(changed_since=changed_since)
+    assert changed.url == lot_url(2) and changed.description.endswith("toned")
+    assert crawler.store.lots(issuer="nobody") == []
+
+
+@pytest.mark.unit
+def test_index_links_and_paging():
+    scraper = AgoraScraper()
+    html = ('<a href="/listing/viewdetail/5#bids">x</a><a href="/listing/viewdetail/5">y</a>'
+            '<a href="/about">z</a><a href="https://agoraauctions.com/listing/viewdetail/6">w</a>')
+
+    assert scraper.discover_lot_urls(html, SALE_URL) == [lot_url(5), lot_url(6)]
+    assert scraper.next_index_url(html, SALE_URL + "?page=4") == SALE_URL + "?page=5"
+    assert scraper.next_index_url('<link rel="next" href="/auction/77/p2">', SALE_URL) == SALE_URL + "/p2"
@@ -0,0 +1,114 @@
+"""Unit tests for HTTP-first scraping with Playwright fallback."""
+import httpx
+import pytest
+
+from src.infrastructure.scrapers.agora.scraper import AgoraScraper
+from src.infrastructure.scrapers.biddr.scraper import BiddrScraper
+from src.infrastructure.scrapers.snapshot_store import HtmlSnapshotStore, set_snapshot_store
+from src.infrastructure.scrapers.static_fetch import (
+    StaticPageFetcher,
+    fetch_stats,
+    has_markers,
+    set_static_fetcher,
+)
+
+LOT_URL = "https://agoraauctions.com/listing/viewdetail/123"
+LOT_HTML = "<html><h1>Lot 12. Hadrian denarius</h1><h3>Rome, AD 125. Laureate head right.</h3></html>"
+SHELL_HTML = "<html><div id='app'></div><script src='bundle.js'></script></html>"
+BIDDR_SHELL_HTML = (
+    "<html><head><title>Lot 12 - Hadrian denarius | biddr</title>"
+    "<meta name='description' content='Description: Lot 12, Hadrian denarius'>"
+    "<meta property='og:image' content='https://media.biddr.com/auction_lots/12.l.jpg'></head>"
+    "<body><div id='app'></div></body></html>"
+)
+BIDDR_LOT_HTML = (
+    "<html><body><h1>Lot 12</h1><h4>Description</h4><div>Hadrian, AD 117-138. Denarius</div>"
+    "<img src='https://media.biddr.com/auction_lots/12.m.jpg'></body></html>"
+)
+
+
+@pytest.fixture
+def snapshots(tmp_path):
+    store = HtmlSnapshotStore(str(tmp_path / "snapshots"))
+    set_snapshot_store(store)
+    yield store
+    set_snapshot_store(None)
+
+
+@pytest.fixture
+def fetcher(snapshots):
+    fetcher = StaticPageFetcher()
+    set_static_fetcher(fetcher)
+    fetch_stats.reset()
+    yield fetcher
+    set_static_fetcher(None)
+    fetch_stats.reset()
+
+
+def _scraper(fetcher, handler):
+    fetcher._clients["agora"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    scraper = AgoraScraper()
+    scraper.browser_urls = []
+
+    async def no_wait():
+        return None
+
+    async def browser_fetch(url, wait_selector=None):
+        scraper.browser_urls.append(url)
+        return 200, LOT_HTML, {}
+
+    scraper._enforce_rate_limit = no_wait
+    scraper._fetch_with_browser = browser_fetch
+    return scraper
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_static_page_with_markers_skips_browser(fetcher, snapshots):
+    scraper = _scraper(fetcher, lambda request: httpx.Response(200, text=LOT_HTML))
+
+    assert await scraper.fetch_page(LOT_URL) == LOT_HTML
+    assert scraper.browser_urls == []
+    assert fetch_stats.snapshot()["agora"]["http"] == 1
+    # Kept for offline re-parsing
+    [record] = snapshots.latest()
+    assert (record.url, record.source, snapshots.read(record.sha256)) == (LOT_URL, "agora", LOT_HTML)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("response, counter", [
+    (httpx.Response(200, text=SHELL_HTML), "escalated_markers"),
+    (httpx.Response(403, text="Forbidden"), "escalated_status"),
+])
+async def test_unusable_static_page_escalates_to_browser(fetcher, response, counter):
+    scraper = _scraper(fetcher, lambda request: response)
+
+    assert await scraper.fetch_page(LOT_URL) == LOT_HTML
+    assert scraper.browser_urls == [LOT_URL]
+    stats = fetch_stats.snapshot()["agora"]
+    assert (stats[counter], stats["browser"], stats["http"], stats["http_ratio"]) == (1, 1, 0, 0.0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_browser_cookies_are_sent_with_later_gets(fetcher):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("cookie"))
+        return httpx.Response(200, text=LOT_HTML)
+
+    scraper = _scraper(fetcher, handler)
+    fetcher.absorb_cookies("agora", [
+        {"name": "session", "value": "abc", "domain": "agoraauctions.com", "path": "/"},
+    ])
+    await scraper.fetch_page(LOT_URL)
+    assert seen == ["session=abc"]
+
+
+@pytest.mark.unit
+def test_biddr_markers_ignore_meta_tags():
+    scraper = BiddrScraper()
+    assert not has_markers(BIDDR_SHELL_HTML, scraper.STATIC_MARKERS)
+    assert has_markers(BIDDR_LOT_HTML, scraper.STATIC_MARKERS)
@@ -0,0 +1,91 @@
+"""Unit tests for the per-host crawl scheduler and single-flight robots.txt cache."""
+import asyncio
+
+import httpx
+import pytest
+
+from src.infrastructure.services.catalogs import robots_cache
+from src.infrastructure.services.catalogs.crawl_scheduler import CrawlScheduler
+from src.infrastructure.services.catalogs.http_pool import CatalogHTTPPool
+from src.infrastructure.services.catalogs.robots_cache import RobotsCache, is_allowed
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def robots(tmp_path):
+    cache = RobotsCache(str(tmp_path / "robots.sqlite"))
+    robots_cache.set_robots_cache(cache)
+    yield cache
+    robots_cache.set_robots_cache(None)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_requests_spaced_per_host_and_concurrent_across_hosts(robots):
+    clock = FakeClock()
+    scheduler = CrawlScheduler(asyncio.get_running_loop(), clock=clock, sleep=clock.sleep)
+    started = []
+
+    def request(url):
+        async def run():
+            started.append((scheduler.host_of(url), clock.now))
+            return url
+        return run
+
+    urls = ["https://a.example/1", "https://a.example/2", "https://b.example/1", "https://a.example/3"]
+    results = await asyncio.gather(*(scheduler.submit(u, request(u), min_delay_sec=10) for u in urls))
+
+    assert results == urls
+    a_starts = [t for host, t in started if host == "a.example"]
+    assert a_starts == [100.0, 110.0, 120.0]
+    # b.example does not wait behind a.example's crawl delay
+    assert [host for host, _ in started][:2] == ["a.example", "b.example"]
+    assert scheduler.pending("a.example") == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_robots_single_flight_per_host_and_persisted(tmp_path, robots):
+    fetches = []
+    slow_started = asyncio.Event()
+    release_slow = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        fetches.append(request.url.host)
+        if request.url.host == "slow.example":
+            slow_started.set()
+            await release_slow.wait()
+        return httpx.Response(200, text="User-agent: *\nDisallow: /private\nCrawl-delay: 20\n")
+
+    pool = CatalogHTTPPool()
+    for host in ("fast.example", "slow.example"):
+        pool._clients[f"https://{host}"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        slow = [asyncio.create_task(is_allowed("bot", "https://slow.example/a", pool)) for _ in range(5)]
+        await slow_started.wait()
+        # A slow host does not hold up robots checks for other hosts
+        assert await is_allowed("bot", "https://fast.example/coins/1", pool)
+        assert not await is_allowed("bot", "https://fast.example/private/x", pool)
+        release_slow.set()
+        assert await asyncio.gather(*slow) == [True] * 5
+        assert sorted(fetches) == ["fast.example", "slow.example"]
+        assert robots_cache.get_crawl_delay_sec("fast.example") == 20.0
+
+        # A new cache on the same file (restart) does not refetch
+        reopened = RobotsCache(str(tmp_path / "robots.sqlite"))
+        robots_cache.set_robots_cache(reopened)
+        assert not await is_allowed("bot", "https://slow.example/private", pool)
+        assert len(fetches) == 2
+    finally:
+        await pool.aclose()
@@ -0,0 +1,77 @@
+"""Unit tests for the shared catalog HTTP pool."""
+import httpx
+import pytest
+
+from src.infrastructure.services.catalogs.http_pool import (
+    CatalogHTTPConfig,
+    CatalogHTTPPool,
+    catalog_http_client,
+)
+from src.infrastructure.services.catalogs.ocre import OCREService
+from src.infrastructure.services.catalogs.registry import CatalogRegistry
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_one_client_per_host():
+    pool = CatalogHTTPPool(CatalogHTTPConfig(max_connections=3))
+    ocre = pool.client_for("http://numismatics.org/ocre/apis/reconcile")
+    crro = pool.client_for("http://numismatics.org/crro/id/rrc-1.1.jsonld")
+    rpc = pool.client_for("https://rpc.ashmus.ox.ac.uk/coins/1/4374")
+
+    assert ocre is crro
+    assert rpc is not ocre
+    assert sorted(pool.hosts) == ["http://numismatics.org", "https://rpc.ashmus.ox.ac.uk"]
+
+    await pool.aclose()
+    assert ocre.is_closed and rpc.is_closed
+    assert pool.hosts == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_catalog_http_client_only_closes_unpooled_clients():
+    pool = CatalogHTTPPool()
+    async with catalog_http_client("https://example.org/a", pool) as pooled:
+        pass
+    assert not pooled.is_closed
+
+    async with catalog_http_client("https://example.org/a") as ephemeral:
+        assert ephemeral is not pooled
+    assert ephemeral.is_closed
+    await pool.aclose()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_ocre_lookups_reuse_pooled_client():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text='"q0":{"result":[{"id":"ric.2.tr.128","score":95,"match":true}]}')
+
+    pool = CatalogHTTPPool()
+    pool._clients["http://numismatics.org"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    service = OCREService(http_pool=pool)
+
+    for _ in range(2):
+        result = await service.reconcile({"q0": {"query": "RIC II 128"}})
+        assert result.status == "success"
+        assert result.external_id == "ric.2.tr.128"
+
+    assert len(requests) == 2
+    assert pool.hosts == ["http://numismatics.org"]
+    await pool.aclose()
+
+
+@pytest.mark.unit
+def test_registry_injects_pool_into_services():
+    pool = CatalogHTTPPool()
+    try:
+        CatalogRegistry.set_http_pool(pool)
+        assert CatalogRegistry.get_service("ric").http_pool is pool
+        assert CatalogRegistry.get_service("crawford").http_pool is pool
+    finally:
+        CatalogRegistry.set_http_pool(None)
+    assert CatalogRegistry.get_service("ric").http_pool is None
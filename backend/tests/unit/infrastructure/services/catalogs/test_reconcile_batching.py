@@ -0,0 +1,96 @@
+"""Unit tests for multi-query OpenRefine reconciliation and lookup_many."""
+import json
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from src.infrastructure.services.catalogs.http_pool import CatalogHTTPPool
+from src.infrastructure.services.catalogs.ocre import OCREService
+from src.infrastructure.services.catalogs.registry import CatalogRegistry
+from src.infrastructure.services.catalogs.result_cache import CatalogResultCache
+
+
+def _reconcile_handler(posts, skip=()):
+    """Answer each qN with a match whose id echoes the query text."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return httpx.Response(404)
+        queries = json.loads(parse_qs(request.content.decode())["queries"][0])
+        posts.append(queries)
+        body = {
+            key: {"result": [{"id": q["query"].replace(" ", "."), "score": 95, "match": True}]}
+            for key, q in queries.items()
+            if q["query"] not in skip
+        }
+        # Nomisma style: no outer braces
+        return httpx.Response(200, text=json.dumps(body)[1:-1])
+
+    return handler
+
+
+def _pool(handler) -> CatalogHTTPPool:
+    pool = CatalogHTTPPool()
+    pool._clients["http://numismatics.org"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return pool
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_reconcile_many_chunks_and_maps_back():
+    posts = []
+    pool = _pool(_reconcile_handler(posts, skip={"RIC II 7"}))
+    service = OCREService(http_pool=pool)
+    queries = [{"q0": {"query": f"RIC II {n}"}} for n in range(60)]
+
+    results = await service.reconcile_many(queries)
+
+    assert [len(p) for p in posts] == [25, 25, 10]
+    assert results[42].status == "success"
+    assert results[42].external_id == "RIC.II.42"
+    assert results[7].status == "error"
+    assert "Invalid response from OCRE API" in results[7].error_message
+    await pool.aclose()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_chunk_gives_independent_results():
+    pool = _pool(lambda request: httpx.Response(503))
+    service = OCREService(http_pool=pool)
+
+    results = await service.reconcile_many([{"q0": {"query": f"RIC II {n}"}} for n in range(3)])
+
+    assert [r.status for r in results] == ["error"] * 3
+    results[0].error_message = "changed by caller"
+    assert results[1].error_message != "changed by caller"
+    await pool.aclose()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lookup_many_500_references_in_20_requests(tmp_path, monkeypatch):
+    posts = []
+    pool = _pool(_reconcile_handler(posts))
+    monkeypatch.setattr(CatalogRegistry, "_rate_limit_timestamps", [])
+    CatalogRegistry.set_http_pool(pool)
+    CatalogRegistry.set_result_cache(CatalogResultCache(str(tmp_path / "catalog.sqlite")))
+    try:
+        references = [f"RIC II {n}" for n in range(500)]
+        results = await CatalogRegistry.lookup_many("ric", references)
+
+        assert len(posts) == 20
+        assert len(CatalogRegistry._rate_limit_timestamps) == 20
+        assert all(r.status == "success" for r in results)
+        assert results[123].external_id == "RIC.II.123"
+
+        # Cached on the second pass, including single lookups
+        again = await CatalogRegistry.lookup_many("ric", references[:30] + ["RIC II 999"])
+        single = await CatalogRegistry.lookup("ric", "RIC II 5")
+        assert len(posts) == 21 and len(posts[-1]) == 1
+        assert again[0].external_id == "RIC.II.0" and single.external_id == "RIC.II.5"
+    finally:
+        CatalogRegistry.set_http_pool(None)
+        CatalogRegistry.set_result_cache(None)
+        await pool.aclose()
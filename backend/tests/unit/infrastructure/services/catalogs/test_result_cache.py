@@ -0,0 +1,151 @@
+"""Unit tests for the persistent catalog result cache."""
+import asyncio
+
+import pytest
+
+from src.infrastructure.services.catalogs.base import CatalogResult
+from src.infrastructure.services.catalogs.registry import CatalogRegistry
+from src.infrastructure.services.catalogs.result_cache import CatalogResultCache
+
+DAY = 86400
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return CatalogResultCache(
+        str(tmp_path / "catalog.sqlite"), max_entries=3, negative_ttl_hours=1, stale_grace_days=10, clock=clock
+    )
+
+
+def _success(external_id: str = "ric.2.tr.128") -> CatalogResult:
+    return CatalogResult(status="success", external_id=external_id, confidence=0.95, payload={"mint": "Rome"})
+
+
+@pytest.mark.unit
+def test_survives_reopen_and_goes_stale_after_ttl(tmp_path, cache, clock):
+    key = cache.make_key("lookup", "RIC", "RIC II 128")
+    assert cache.set(key, "ric", _success(), ttl_days=180)
+
+    reopened = CatalogResultCache(str(tmp_path / "catalog.sqlite"), stale_grace_days=10, clock=clock)
+    hit = reopened.get(key)
+    assert hit.result.external_id == "ric.2.tr.128" and not hit.stale
+
+    clock.now += 181 * DAY
+    assert reopened.get(key).stale
+    clock.now += 11 * DAY
+    assert reopened.get(key) is None
+
+
+@pytest.mark.unit
+def test_negative_ttl_and_errors_not_cached(cache, clock):
+    assert cache.set("lookup|ric|x", "ric", CatalogResult(status="not_found"), ttl_days=180)
+    assert not cache.set("lookup|ric|y", "ric", CatalogResult(status="error", error_message="boom"), ttl_days=180)
+    assert cache.get("lookup|ric|y") is None
+
+    clock.now += 2 * 3600
+    assert cache.get("lookup|ric|x").stale
+
+
+@pytest.mark.unit
+def test_match_without_payload_gets_negative_ttl_and_deferred_not_cached(cache, clock):
+    assert cache.set("lookup|ric|x", "ric", CatalogResult(status="success", external_id="ric.2.tr.128"), ttl_days=180)
+    assert not cache.set("lookup|ric|y", "ric", CatalogResult(status="deferred"), ttl_days=180)
+    assert cache.get("lookup|ric|y") is None
+
+    clock.now += 2 * 3600
+    assert cache.get("lookup|ric|x").stale
+
+
+@pytest.mark.unit
+def test_lru_eviction(cache, clock):
+    for i in range(3):
+        clock.now += 1
+        cache.set(f"k{i}", "ric", _success(str(i)), ttl_days=1)
+    clock.now += 1
+    cache.get("k0")  # k1 is now least recently used
+    clock.now += 1
+    cache.set("k3", "ric", _success("3"), ttl_days=1)
+
+    assert len(cache) == 3
+    assert cache.get("k1") is None
+    assert cache.get("k0") is not None
+
+
+@pytest.mark.unit
+def test_hits_do_not_write_until_flushed(cache, clock):
+    cache.set("k0", "ric", _success("0"), ttl_days=1)
+    conn = cache._get_conn()
+    writes = conn.total_changes
+
+    for _ in range(10):
+        clock.now += 1
+        assert cache.get("k0") is not None
+    assert conn.total_changes == writes
+
+    cache.flush()
+    (last_access,) = conn.execute("SELECT last_access FROM catalog_cache WHERE cache_key = 'k0'").fetchone()
+    assert last_access == clock.now
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_registry_serves_stale_and_refreshes_in_background(cache, clock, monkeypatch):
+    calls = []
+
+    async def fake_fetch(system, reference, context=None):
+        calls.append(reference)
+        return _success(f"ric.v{len(calls)}")
+
+    monkeypatch.setattr(CatalogRegistry, "_fetch_lookup", classmethod(lambda cls, *a: fake_fetch(*a)))
+    CatalogRegistry.set_result_cache(cache)
+    try:
+        first = await CatalogRegistry.lookup("ric", "RIC II 128")
+        again = await CatalogRegistry.lookup("ric", "RIC II 128")
+        assert first.external_id == again.external_id == "ric.v1"
+        assert len(calls) == 1
+
+        clock.now += 181 * DAY
+        stale = await CatalogRegistry.lookup("ric", "RIC II 128")
+        assert stale.external_id == "ric.v1"
+        await asyncio.gather(*list(CatalogRegistry._refreshing.values()))
+
+        refreshed = await CatalogRegistry.lookup("ric", "RIC II 128")
+        assert refreshed.external_id == "ric.v2"
+        assert len(calls) == 2
+    finally:
+        CatalogRegistry.set_result_cache(None)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_refresh_without_type_data_keeps_complete_stale_match(cache, clock, monkeypatch):
+    results = iter([_success("ric.v1"), CatalogResult(status="success", external_id="ric.v2")])
+
+    async def fake_fetch(system, reference, context=None):
+        return next(results)
+
+    monkeypatch.setattr(CatalogRegistry, "_fetch_lookup", classmethod(lambda cls, *a: fake_fetch(*a)))
+    CatalogRegistry.set_result_cache(cache)
+    try:
+        await CatalogRegistry.lookup("ric", "RIC II 128")
+        clock.now += 181 * DAY
+        await CatalogRegistry.lookup("ric", "RIC II 128")
+        await asyncio.gather(*list(CatalogRegistry._refreshing.values()))
+
+        kept = cache.get(cache.make_key("lookup", "ric", "RIC II 128"))
+        assert kept.result.external_id == "ric.v1" and kept.result.payload == {"mint": "Rome"}
+    finally:
+        CatalogRegistry.set_result_cache(None)
@@ -0,0 +1,129 @@
+"""Unit tests for the local OCRE/CRRO type mirror and its importer."""
+import copy
+import json
+
+import httpx
+import pytest
+
+from src.infrastructure.services.catalogs.crro import CRROService
+from src.infrastructure.services.catalogs.http_pool import CatalogHTTPPool
+from src.infrastructure.services.catalogs.ocre import OCREService
+from src.infrastructure.services.catalogs.registry import CatalogRegistry
+from src.infrastructure.services.catalogs.result_cache import CatalogResultCache
+from src.infrastructure.services.catalogs.type_import import import_type_dump
+from src.infrastructure.services.catalogs.type_store import LocalTypeStore
+
+OCRE_ID = "http://numismatics.org/ocre/id/"
+
+
+def _type_nodes(external_id: str, authority: str, legend: str) -> list:
+    uri = OCRE_ID + external_id
+    return [
+        {"@id": uri + "#obverse", "nmo:hasLegend": {"@value": legend}},
+        {
+            "@id": uri,
+            "skos:prefLabel": [{"@value": f"RIC {external_id}", "@language": "en"}],
+            "nmo:hasAuthority": {"@id": f"http://nomisma.org/id/{authority}"},
+            "nmo:hasMint": {"@id": "http://nomisma.org/id/rome"},
+            "nmo:hasStartDate": {"@value": "0103"},
+            "nmo:hasObverse": {"@id": uri + "#obverse"},
+        },
+    ]
+
+
+@pytest.fixture
+def dump(tmp_path):
+    graph = (
+        _type_nodes("ric.2.tr.128", "trajan", "IMP TRAIANO AVG")
+        + _type_nodes("ric.2.hdn.128", "hadrian", "HADRIANVS AVG")
+        + _type_nodes("ric.1(2).aug.207", "augustus", "CAESAR AVGVSTVS")
+        + [{"@id": "http://nomisma.org/id/trajan", "skos:prefLabel": "Trajan"}]
+    )
+    document = {"@context": {"nmo": "http://nomisma.org/ontology#"}, "@graph": graph}
+    path = tmp_path / "ocre.jsonld"
+    path.write_text(json.dumps(document))
+    return path, document
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalTypeStore(str(tmp_path / "types.sqlite"))
+
+
+@pytest.mark.unit
+def test_import_is_incremental(tmp_path, dump, store):
+    path, document = dump
+    first = import_type_dump(store, OCREService(), [path])
+    assert (first.added, first.updated, first.unchanged) == (3, 0, 0)
+    payload = OCREService().parse_payload(store.get("ric", "ric.2.tr.128"))
+    assert payload.authority == "Trajan" and payload.obverse_legend == "IMP TRAIANO AVG"
+
+    changed = copy.deepcopy(document)
+    changed["@graph"][0]["nmo:hasLegend"] = {"@value": "IMP CAES NERVA TRAIANO"}
+    path.write_text(json.dumps(changed))
+    second = import_type_dump(store, OCREService(), [path])
+    assert (second.added, second.updated, second.unchanged) == (0, 1, 2)
+    assert second.changed_ids == ["ric.2.tr.128"]
+
+    changed["@graph"] = changed["@graph"][:2]
+    path.write_text(json.dumps(changed))
+    pruned = import_type_dump(store, OCREService(), [path], prune=True)
+    assert (pruned.unchanged, pruned.removed) == (1, 2)
+    assert store.count("ric") == 1
+
+
+@pytest.mark.unit
+def test_reference_keys_match_type_ids():
+    ocre, crro = OCREService(), CRROService()
+    assert ocre.local_type_key("ric.1(2).aug.207") == ("1(2)", "207")
+    assert ocre.local_reference_key("RIC I² 207") == ("1(2)", "207")
+    # RIC I first and second edition types must not share a key
+    assert ocre.local_type_key("ric.1.aug.207") == ("1", "207")
+    assert ocre.local_reference_key("RIC I 207") == ("1", "207")
+    assert ocre.local_type_key("ric.2_1(2).ves.1") == ("2_1(2)", "1")
+    assert ocre.local_reference_key("RIC II 128 - Trajan") == ("2", "128")
+    assert crro.local_type_key("rrc-335.1c") == (None, "335.1c")
+    assert crro.local_reference_key("RRC 335/1c") == (None, "335.1c")
+    assert crro.local_type_key("ric.2.tr.128") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_registry_resolves_locally_and_falls_back_on_miss(tmp_path, dump, store, monkeypatch):
+    import_type_dump(store, OCREService(), [dump[0]])
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"q0": {"result": []}})
+
+    pool = CatalogHTTPPool()
+    pool._clients["http://numismatics.org"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(CatalogRegistry, "_rate_limit_timestamps", [])
+    CatalogRegistry.set_http_pool(pool)
+    CatalogRegistry.set_type_store(store)
+    CatalogRegistry.set_result_cache(CatalogResultCache(str(tmp_path / "catalog.sqlite")))
+    try:
+        exact = await CatalogRegistry.lookup("ric", "RIC I² 207")
+        assert exact.status == "success" and exact.external_id == "ric.1(2).aug.207"
+        assert exact.payload["authority"] == "Augustus"
+
+        ambiguous, narrowed = await CatalogRegistry.lookup_many(
+            "ric", ["RIC II 128", "RIC II 128 - Trajan"], [None, None]
+        )
+        assert ambiguous.status == "ambiguous" and len(ambiguous.candidates) == 2
+        assert narrowed.external_id == "ric.2.tr.128"
+
+        by_id = await CatalogRegistry.get_by_id("ric", "ric.2.hdn.128")
+        assert by_id.payload["obverse_legend"] == "HADRIANVS AVG"
+        assert requests == []
+        assert CatalogRegistry._rate_limit_timestamps == []
+
+        miss = await CatalogRegistry.lookup("ric", "RIC III 5")
+        assert miss.status == "not_found"
+        assert len(requests) == 1
+    finally:
+        CatalogRegistry.set_http_pool(None)
+        CatalogRegistry.set_type_store(None)
+        CatalogRegistry.set_result_cache(None)
+        await pool.aclose()
@@ -0,0 +1,79 @@
+"""Unit tests for WebP image renditions and the /images static app."""
+import io
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from src.infrastructure.services.image_derivatives import (
+    ImageDerivativeService,
+    parse_rendition,
+    rendition_urls,
+    set_image_derivatives,
+)
+from src.infrastructure.web.static_images import CoinImageFiles
+
+
+def _write_image(path, size, mode="RGB", fmt="JPEG"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new(mode, size, "gold").save(path, fmt)
+    return path
+
+
+@pytest.fixture
+def service():
+    service = ImageDerivativeService(workers=2)
+    set_image_derivatives(service)
+    yield service
+    set_image_derivatives(None)
+    service.shutdown(wait=True)
+
+
+@pytest.mark.unit
+def test_rendition_urls_only_for_local_originals():
+    assert rendition_urls("/images/sha256/ab/abc.jpg") == {
+        "thumb": "/images/sha256/ab/abc.thumb.webp",
+        "medium": "/images/sha256/ab/abc.medium.webp",
+        "large": "/images/sha256/ab/abc.large.webp",
+    }
+    assert rendition_urls("/images/coin.png")["thumb"] == "/images/coin.thumb.webp"
+    assert rendition_urls("https://cdn.example/coin.jpg") == {}
+    assert rendition_urls("/images/abc.thumb.webp") == {}
+    assert rendition_urls(None) == {}
+    assert parse_rendition("abc.medium.webp") == ("abc", "medium")
+    assert parse_rendition("abc.webp") is None
+
+
+@pytest.mark.unit
+def test_generate_scales_down_never_up_and_skips_existing(tmp_path, service):
+    original = _write_image(tmp_path / "obverse.jpg", (2400, 1200))
+    small = _write_image(tmp_path / "reverse.png", (300, 150), mode="RGBA", fmt="PNG")
+
+    paths = service.generate(original)
+
+    sizes = {name: Image.open(path).size for name, path in paths.items()}
+    assert sizes == {"thumb": (256, 128), "medium": (800, 400), "large": (1600, 800)}
+    assert all(Image.open(path).format == "WEBP" for path in paths.values())
+    assert Image.open(service.generate(small)["large"]).size == (300, 150)
+
+    before = paths["thumb"].stat().st_mtime_ns
+    service.submit(original).result()
+    assert paths["thumb"].stat().st_mtime_ns == before
+
+
+@pytest.mark.unit
+def test_missing_rendition_is_created_on_first_request(tmp_path, service):
+    _write_image(tmp_path / "sha256" / "ab" / "abc.jpg", (1000, 500))
+    app = FastAPI()
+    app.mount("/images", CoinImageFiles(directory=str(tmp_path)), name="images")
+    client = TestClient(app)
+
+    response = client.get("/images/sha256/ab/abc.thumb.webp")
+
+    assert response.status_code == 200
+    assert Image.open(io.BytesIO(response.content)).size == (256, 128)
+    assert (tmp_path / "sha256" / "ab" / "abc.medium.webp").exists()
+    assert client.get("/images/sha256/ab/missing.thumb.webp").status_code == 404
+    assert client.get("/images/sha256/ab/abc.tiny.webp").status_code == 404
+    assert client.get("/images/sha256/ab/abc.jpg").status_code == 200
@@ -0,0 +1,143 @@
+"""Unit tests for batching small LLM prompts into one call."""
+import asyncio
+import json
+
+import pytest
+
+from src.domain.llm import LLMCapability, LLMError
+from src.infrastructure.services.llm.base_client import BaseLLMClient, CostTracker, LLMCache
+from src.infrastructure.services.llm.batching import (
+    BatchConfig,
+    PromptBatcher,
+    build_batch_prompt,
+    split_batch_response,
+)
+from src.infrastructure.services.llm.model_health import reset_model_health_tracker
+from src.infrastructure.services.llm.stub_provider import get_stub_provider
+
+
+@pytest.fixture
+def stub_client(tmp_path, monkeypatch):
+    """Loadtest-profile client whose stub model records every call it receives."""
+    monkeypatch.setenv("LLM_PROFILE", "loadtest")
+    monkeypatch.chdir(tmp_path)
+    reset_model_health_tracker()
+    client = BaseLLMClient()
+    client.cache = LLMCache(str(tmp_path / "cache.sqlite"))
+    client.cost_tracker = CostTracker(str(tmp_path / "costs.sqlite"))
+    model = client.config.get_model("local-stub")
+    model.stub_options = {**model.stub_options, "time_scale": 0, "error_rate": 0.0, "timeout_rate": 0.0}
+
+    provider = get_stub_provider(model.name, model.stub_options)
+    prompts = []
+    original = provider.acompletion
+
+    async def recording_acompletion(capability, messages):
+        prompts.append(messages[-1]["content"])
+        return await original(capability, messages)
+
+    monkeypatch.setattr(provider, "acompletion", recording_acompletion)
+    client.stub_prompts = prompts
+    yield client
+    reset_model_health_tracker()
+
+
+def _vocab(raw: str) -> str:
+    return f'Vocab type: issuer\nRaw text: "{raw}"'
+
+
+@pytest.mark.unit
+def test_split_batch_response_maps_ids_and_drops_malformed():
+    content = {"results": [
+        {"id": 2, "result": {"canonical_name": "Hadrian"}},
+        {"id": 1, "result": '{"canonical_name": "Trajan"}'},
+        {"id": 3, "result": "not json"},
+        {"id": 9, "result": {"canonical_name": "Out of range"}},
+    ]}
+    parts = split_batch_response(content, 3, requires_json=True)
+    assert parts == [{"canonical_name": "Trajan"}, {"canonical_name": "Hadrian"}, None]
+
+    text = split_batch_response('```json\n{"results": ["Senatus Consulto", "Augustus"]}\n```', 2, requires_json=False)
+    assert text == ["Senatus Consulto", "Augustus"]
+    assert split_batch_response("garbage", 2, requires_json=False) == [None, None]
+
+
+@pytest.mark.unit
+def test_build_batch_prompt_numbers_items():
+    system, user = build_batch_prompt("Normalize.", ["a", "b"], requires_json=True)
+    assert system.startswith("Normalize.")
+    assert '"results"' in system
+    assert user == "### ITEM 1\na\n\n### ITEM 2\nb"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_items_share_one_call_and_cache_individually(stub_client):
+    raws = ["TRAIANVS", "HADRIANVS", "ANTONINVS", "DIVVS AVGVSTVS"]
+    results = await asyncio.gather(*(
+        stub_client.execute_prompt(LLMCapability.VOCAB_NORMALIZE, _vocab(raw)) for raw in raws
+    ))
+
+    assert len(stub_client.stub_prompts) == 1
+    assert all(r["batch_size"] == 4 and isinstance(r["content"], dict) for r in results)
+    assert results[0]["content"]["canonical_name"] == "Trajan"
+    assert sum(r["cost"] for r in results) == pytest.approx(stub_client.cost_tracker.get_monthly_cost())
+
+    again = await stub_client.execute_prompt(LLMCapability.VOCAB_NORMALIZE, _vocab("HADRIANVS"))
+    assert again["cached"] is True
+    assert again["content"] == results[1]["content"]
+    assert len(stub_client.stub_prompts) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_missing_answers_retried_individually(stub_client, monkeypatch):
+    provider = get_stub_provider("local-stub")
+
+    def first_item_only(capability, prompt):
+        return json.dumps({"results": [{"id": 1, "result": "Senatus Consulto"}]}) if "### ITEM" in prompt else None
+
+    monkeypatch.setattr(provider, "render_batch", first_item_only)
+    results = await asyncio.gather(*(
+        stub_client.execute_prompt(LLMCapability.LEGEND_EXPAND, f"Expand: S C {i}") for i in range(3)
+    ))
+
+    assert [r["content"] for r in results][0] == "Senatus Consulto"
+    assert all(isinstance(r["content"], str) for r in results)
+    assert "batch_size" not in results[1] and "batch_size" not in results[2]
+    assert len(stub_client.stub_prompts) == 3  # one batch + two single retries
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_batch_fails_every_item(stub_client):
+    model = stub_client.config.get_model("local-stub")
+    model.stub_options = {**model.stub_options, "error_rate": 1.0}
+
+    results = await asyncio.gather(*(
+        stub_client.execute_prompt(LLMCapability.CATALOG_PARSE, f"Parse: RIC II {n}") for n in (1, 2)
+    ), return_exceptions=True)
+
+    assert all(isinstance(r, LLMError) for r in results)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cancelled_batch_cancels_every_waiting_item():
+    started = asyncio.Event()
+
+    class HangingClient:
+        async def execute_batch(self, capability, messages):
+            started.set()
+            await asyncio.sleep(10)
+
+    batcher = PromptBatcher("catalog_parse", BatchConfig(enabled=True, max_batch_size=2), asyncio.get_running_loop())
+    client = HangingClient()
+    waiters = [asyncio.create_task(batcher.submit(client, f"Parse: RIC II {n}")) for n in (1, 2)]
+    await started.wait()
+    for task in list(batcher._tasks):
+        task.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*waiters, return_exceptions=True), timeout=1)
+
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
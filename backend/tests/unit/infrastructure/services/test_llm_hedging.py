@@ -0,0 +1,123 @@
+"""Unit tests for hedged LLM requests in BaseLLMClient."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("litellm")
+
+from src.domain.llm import LLMCapability
+from src.infrastructure.services.llm import base_client
+from src.infrastructure.services.llm.base_client import BaseLLMClient, CostTracker
+from src.infrastructure.services.llm.model_health import reset_model_health_tracker
+
+
+def _response(content: str):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5),
+    )
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    reset_model_health_tracker()
+    monkeypatch.setattr(base_client.litellm, "completion_cost", lambda **kw: 0.001)
+    monkeypatch.setattr(base_client.litellm, "token_counter", lambda **kw: 42)
+    c = BaseLLMClient()
+    c.cache = None
+    c.cost_tracker = CostTracker(str(tmp_path / "costs.sqlite"))
+    c.config.get_capability("vocab_normalize").hedging = {
+        "enabled": True, "default_delay_ms": 20, "min_delay_ms": 10, "max_delay_ms": 50,
+    }
+    yield c
+    reset_model_health_tracker()
+
+
+def _models(client):
+    primary, fallbacks = client.config.get_model_for_capability("vocab_normalize")
+    backup = client.config.get_model(fallbacks[0])
+    return primary, backup
+
+
+def _cost_rows(client):
+    conn = client.cost_tracker._get_conn()
+    return conn.execute("SELECT model, request_id FROM llm_costs ORDER BY id").fetchall()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_loser_cost_recorded(client, monkeypatch):
+    primary, backup = _models(client)
+    delays = {primary.model_id: 1.0, backup.model_id: 0.0}
+
+    async def fake_acompletion(model, messages, **kwargs):
+        await asyncio.sleep(delays[model])
+        return _response('{"canonical_name": "Trajan"}')
+
+    monkeypatch.setattr(base_client, "acompletion", fake_acompletion)
+    result = await client.execute_prompt(LLMCapability.VOCAB_NORMALIZE, "Traianus")
+
+    assert result["model"] == backup.name
+    assert result["content"] == {"canonical_name": "Trajan"}
+    rows = _cost_rows(client)
+    assert (backup.name, None) in rows
+    assert (primary.name, "hedge_cancelled") in rows
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged(client, monkeypatch):
+    primary, backup = _models(client)
+    calls = []
+
+    async def fake_acompletion(model, messages, **kwargs):
+        calls.append(model)
+        return _response('{"canonical_name": "Trajan"}')
+
+    monkeypatch.setattr(base_client, "acompletion", fake_acompletion)
+    result = await client.execute_prompt(LLMCapability.VOCAB_NORMALIZE, "Traianus")
+
+    assert result["model"] == primary.name
+    assert calls == [primary.model_id]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_invalid_hedge_response_does_not_win(client, monkeypatch):
+    primary, backup = _models(client)
+    delays = {primary.model_id: 0.1, backup.model_id: 0.0}
+    contents = {primary.model_id: '{"canonical_name": "Trajan"}', backup.model_id: "not json"}
+
+    async def fake_acompletion(model, messages, **kwargs):
+        await asyncio.sleep(delays[model])
+        return _response(contents[model])
+
+    monkeypatch.setattr(base_client, "acompletion", fake_acompletion)
+    result = await client.execute_prompt(LLMCapability.VOCAB_NORMALIZE, "Traianus")
+
+    assert result["model"] == primary.name
+    assert result["content"] == {"canonical_name": "Trajan"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_caller_cancellation_is_not_recorded_as_hedge_cost(client, monkeypatch):
+    started = []
+
+    async def fake_acompletion(model, messages, **kwargs):
+        started.append(model)
+        await asyncio.sleep(10)
+        return _response('{"canonical_name": "Trajan"}')
+
+    monkeypatch.setattr(base_client, "acompletion", fake_acompletion)
+    task = asyncio.create_task(client.execute_prompt(LLMCapability.VOCAB_NORMALIZE, "Traianus"))
+    while len(started) < 2:
+        await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert _cost_rows(client) == []
+    assert client._hedge_losers == set()
@@ -0,0 +1,98 @@
+"""Unit tests for LLM metrics hourly rollups and latency sketches."""
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.infrastructure.services.llm_metrics import LatencySketch, LLMMetrics
+
+
+@pytest.fixture
+def metrics(tmp_path):
+    return LLMMetrics(db_path=str(tmp_path / "metrics.sqlite"))
+
+
+@pytest.mark.unit
+def test_sketch_quantiles_within_relative_accuracy():
+    sketch = LatencySketch()
+    values = [float(v) for v in range(1, 1001)]
+    for v in values:
+        sketch.add(v)
+    for q, exact in ((0.5, 501.0), (0.95, 951.0), (0.99, 991.0)):
+        assert sketch.quantile(q) == pytest.approx(exact, rel=2 * LatencySketch.RELATIVE_ACCURACY)
+
+
+@pytest.mark.unit
+def test_sketch_merge_equals_combined():
+    a, b, combined = LatencySketch(), LatencySketch(), LatencySketch()
+    for v in (10, 20, 30):
+        a.add(v)
+        combined.add(v)
+    for v in (4000, 5000):
+        b.add(v)
+        combined.add(v)
+    a.merge(b)
+    assert a.buckets == combined.buckets
+    assert a.count == 5
+    assert LatencySketch().quantile(0.95) == 0.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_summary_reads_rollups(metrics):
+    for latency in (100, 200, 300, 400):
+        await metrics.record_call("vocab_normalize", "phi3", latency, True, False, 0.01, 10, 5)
+    await metrics.record_call("vocab_normalize", "phi3", 5, True, True)
+    await metrics.record_call("auction_parse", "llama", 900, False, False, error_type="Timeout")
+    await metrics.record_parse_failure("auction_parse", "llama", "not json")
+
+    summary = metrics.get_summary(24)
+    assert summary.total_calls == 6
+    assert summary.failed_calls == 1
+    assert summary.cached_calls == 1
+    assert summary.total_input_tokens == 40
+    assert summary.calls_by_model == {"phi3": 5, "llama": 1}
+    assert summary.errors_by_type == {"Timeout": 1}
+    # Cached call excluded from percentiles
+    assert summary.p50_latency_ms == pytest.approx(300, rel=0.02)
+    assert summary.p99_latency_ms == pytest.approx(900, rel=0.02)
+
+    cap = metrics.get_capability_metrics("auction_parse", 24)
+    assert cap.total_calls == 1
+    assert cap.errors == 1
+    assert cap.parse_failures == 1
+    assert cap.success_rate == 0.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cleanup_keeps_rollup_history(metrics):
+    await metrics.record_call("legend_expand", "phi3", 120, True, False)
+    metrics.cleanup_old_data(days=0)
+
+    conn = metrics._get_conn()
+    assert conn.execute("SELECT COUNT(*) FROM llm_metrics").fetchone()[0] == 0
+    assert metrics.get_summary(24).total_calls == 1
+
+
+@pytest.mark.unit
+def test_rollups_backfilled_from_existing_raw_rows(tmp_path):
+    db_path = tmp_path / "legacy.sqlite"
+    ts = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+    conn = sqlite3.connect(str(db_path))
+    conn.execute(
+        "CREATE TABLE llm_metrics (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, "
+        "capability TEXT NOT NULL, model TEXT NOT NULL, latency_ms REAL NOT NULL, success INTEGER NOT NULL, "
+        "cached INTEGER NOT NULL, cost_usd REAL DEFAULT 0.0, input_tokens INTEGER DEFAULT 0, "
+        "output_tokens INTEGER DEFAULT 0, error_type TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO llm_metrics (timestamp, capability, model, latency_ms, success, cached) VALUES (?, ?, ?, ?, ?, ?)",
+        (ts, "catalog_parse", "phi3", 250.0, 1, 0),
+    )
+    conn.commit()
+    conn.close()
+
+    summary = LLMMetrics(db_path=str(db_path)).get_summary(24)
+    assert summary.total_calls == 1
+    assert summary.p95_latency_ms == pytest.approx(250, rel=0.02)
@@ -0,0 +1,123 @@
+"""Unit tests for LLM model health tracking and circuit breakers."""
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.services.llm.model_health import (
+    BreakerConfig,
+    CircuitState,
+    ModelHealthTracker,
+    percentile,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def tracker(clock):
+    config = BreakerConfig(window_size=10, min_calls=4, error_rate_threshold=0.5, cooldown_seconds=30)
+    return ModelHealthTracker(config, clock=clock)
+
+
+@pytest.mark.unit
+def test_percentile_nearest_rank():
+    assert percentile([], 95) is None
+    assert percentile([100.0], 95) == 100.0
+    assert percentile([float(i) for i in range(1, 101)], 95) == 96.0
+
+
+@pytest.mark.unit
+def test_breaker_trips_on_error_rate(tracker):
+    tracker.record_success("a", 100)
+    tracker.record_failure("a", 100, "Timeout")
+    tracker.record_failure("a", 100, "Timeout")
+    assert tracker.get_state("a") == CircuitState.CLOSED  # below min_calls
+    tracker.record_failure("a", 100, "Timeout")
+    assert tracker.get_state("a") == CircuitState.OPEN
+    assert tracker.allow_request("a") is False
+
+
+@pytest.mark.unit
+def test_breaker_trips_on_p95_latency(clock):
+    config = BreakerConfig(window_size=10, min_calls=3, p95_latency_threshold_ms=5000)
+    tracker = ModelHealthTracker(config, clock=clock)
+    for _ in range(3):
+        tracker.record_success("slow", 8000)
+    assert tracker.get_state("slow") == CircuitState.OPEN
+
+
+@pytest.mark.unit
+def test_half_open_allows_single_probe_then_closes(tracker, clock):
+    for _ in range(4):
+        tracker.record_failure("a", 100)
+    assert tracker.allow_request("a") is False
+
+    clock.now += 31
+    assert tracker.allow_request("a") is True
+    assert tracker.get_state("a") == CircuitState.HALF_OPEN
+    assert tracker.allow_request("a") is False  # probe already in flight
+
+    tracker.record_success("a", 120)
+    assert tracker.get_state("a") == CircuitState.CLOSED
+    assert tracker.allow_request("a") is True
+
+
+@pytest.mark.unit
+def test_failed_probe_reopens(tracker, clock):
+    for _ in range(4):
+        tracker.record_failure("a", 100)
+    clock.now += 31
+    assert tracker.allow_request("a") is True
+    tracker.record_failure("a", 100)
+    assert tracker.get_state("a") == CircuitState.OPEN
+    assert tracker.snapshot()[0]["trips"] == 2
+
+
+@pytest.mark.unit
+def test_order_models_prefers_fastest(tracker):
+    models = [SimpleNamespace(name=n) for n in ("primary", "fast", "unknown")]
+    tracker.record_success("primary", 900)
+    tracker.record_success("fast", 150)
+
+    assert [m.name for m in tracker.order_models(models)] == ["primary", "fast", "unknown"]
+    ordered = tracker.order_models(models, prefer_fastest=True)
+    assert [m.name for m in ordered] == ["fast", "primary", "unknown"]
+
+
+@pytest.mark.unit
+def test_order_models_keeps_unmeasured_primary_first(tracker):
+    models = [SimpleNamespace(name=n) for n in ("primary", "slow", "fast")]
+    tracker.record_success("slow", 900)
+    tracker.record_success("fast", 150)
+
+    ordered = tracker.order_models(models, prefer_fastest=True)
+    assert [m.name for m in ordered] == ["primary", "fast", "slow"]
+
+
+@pytest.mark.unit
+def test_disabled_breaker_never_blocks(clock):
+    tracker = ModelHealthTracker(BreakerConfig(enabled=False, min_calls=1), clock=clock)
+    for _ in range(5):
+        tracker.record_failure("a", 100)
+    assert tracker.allow_request("a") is True
+
+
+@pytest.mark.unit
+def test_snapshot_reports_state(tracker):
+    tracker.record_success("a", 200)
+    snap = tracker.snapshot()
+    assert snap[0]["model"] == "a"
+    assert snap[0]["state"] == "closed"
+    assert snap[0]["p95_latency_ms"] == 200
+    assert snap[0]["retry_in_seconds"] is None
@@ -0,0 +1,80 @@
+"""Unit tests for ReferenceParser prefix dispatch, memo and parse_many."""
+import time
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.services.catalogs.parser import (
+    ParseResult,
+    ReferenceParser,
+    _looks_like_reference,
+    _parsed_ref_to_result,
+)
+from src.infrastructure.services.catalogs.parsers import SYSTEM_PARSERS, SYSTEM_PREFIXES
+
+CORPUS_PATH = Path(__file__).resolve().parents[3] / "fixtures" / "reference_corpus.txt"
+
+
+def _corpus():
+    lines = CORPUS_PATH.read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+
+
+def _parse_sequential(raw: str) -> ParseResult:
+    """Every SYSTEM_PARSERS entry in precedence order (behaviour before dispatch)."""
+    text = ReferenceParser._normalize(raw)
+    for parse_fn in SYSTEM_PARSERS.values():
+        parsed = parse_fn(text)
+        if parsed is not None:
+            return _parsed_ref_to_result(parsed, raw)
+    if _looks_like_reference(text):
+        return ParseResult(raw=raw, confidence=0.2, needs_llm=True)
+    return ParseResult(raw=raw, confidence=0.0, needs_llm=False)
+
+
+@pytest.mark.unit
+def test_every_system_has_prefixes():
+    assert set(SYSTEM_PREFIXES) == set(SYSTEM_PARSERS)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("raw", _corpus())
+def test_dispatch_matches_sequential_parse(raw):
+    assert ReferenceParser(cache_size=0).parse(raw).model_dump() == _parse_sequential(raw).model_dump()
+
+
+@pytest.mark.unit
+def test_memo_returns_independent_results():
+    parser = ReferenceParser()
+    first = parser.parse("Crawford 235/1a-c")
+    first.warnings.append("mutated by caller")
+    again = parser.parse("  Crawford   235/1a-c ")
+
+    assert parser.cache_info().hits == 1
+    assert "mutated by caller" not in again.warnings
+    assert again.raw == "  Crawford   235/1a-c "
+    assert again.number == first.number
+
+
+@pytest.mark.unit
+def test_parse_many_keeps_order():
+    refs = ["RIC II 756", "Sear 1234", "RIC II 756", "not a reference"]
+    results = ReferenceParser().parse_many(refs)
+    assert [r.system for r in results] == ["ric", "sear", "ric", None]
+    assert [r.raw for r in results] == refs
+
+
+@pytest.mark.unit
+def test_memoized_throughput_over_corpus():
+    corpus = _corpus() * 20
+
+    def elapsed(fn):
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            for raw in corpus:
+                fn(raw)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    assert elapsed(ReferenceParser().parse) * 1.5 < elapsed(_parse_sequential)
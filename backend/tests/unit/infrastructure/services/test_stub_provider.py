@@ -0,0 +1,88 @@
+"""Unit tests for the deterministic local LLM stub provider."""
+import json
+from pathlib import Path
+
+import pytest
+
+from src.domain.llm import LLMCapability
+from src.infrastructure.services.llm.base_client import BaseLLMClient, CostTracker
+from src.infrastructure.services.llm.model_health import reset_model_health_tracker
+from src.infrastructure.services.llm.stub_provider import (
+    LocalStubProvider,
+    StubProviderError,
+)
+
+FIXTURES_DIR = str(Path(__file__).resolve().parents[3] / "fixtures" / "llm_responses")
+
+
+def _messages(text: str):
+    return [{"role": "system", "content": "sys"}, {"role": "user", "content": text}]
+
+
+@pytest.mark.unit
+def test_render_prefers_matching_fixture():
+    provider = LocalStubProvider("stub", {"fixtures_dir": FIXTURES_DIR})
+    content = provider.render("vocab_normalize", 'Vocab type: issuer\nRaw text: "TRAIANVS"')
+    assert json.loads(content)["canonical_name"] == "Trajan"
+
+
+@pytest.mark.unit
+def test_render_falls_back_to_synthetic_json():
+    provider = LocalStubProvider("stub")
+    content = json.loads(provider.render("catalog_parse", "Parse: nothing matching"))
+    assert content["catalog_system"] == "RIC"
+    assert "number" in content
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_seeded_latency_and_errors_are_reproducible():
+    options = {"seed": 7, "latency_ms": {"distribution": "uniform", "min": 10, "max": 500},
+               "error_rate": 0.3, "time_scale": 0}
+
+    async def outcomes():
+        provider = LocalStubProvider("stub", options)
+        results = []
+        for i in range(20):
+            try:
+                await provider.acompletion("legend_expand", _messages(f"Expand: S C {i}"))
+                results.append("ok")
+            except StubProviderError:
+                results.append("err")
+        return results
+
+    first, second = await outcomes(), await outcomes()
+    assert first == second
+    assert "err" in first and "ok" in first
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_token_counts_configurable():
+    provider = LocalStubProvider("stub", {"input_tokens": 100, "output_tokens": 25, "fixtures_dir": FIXTURES_DIR})
+    response = await provider.acompletion("legend_expand", _messages("Expand: S C"))
+    assert response.usage.prompt_tokens == 100
+    assert response.usage.completion_tokens == 25
+    assert response.choices[0].message.content == "Senatus Consulto"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_loadtest_profile_routes_through_stub(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_PROFILE", "loadtest")
+    monkeypatch.chdir(tmp_path)
+    reset_model_health_tracker()
+    client = BaseLLMClient()
+    client.cache = None
+    client.cost_tracker = CostTracker(str(tmp_path / "costs.sqlite"))
+    model = client.config.get_model("local-stub")
+    model.stub_options = {**model.stub_options, "time_scale": 0, "error_rate": 0.0}
+
+    assert client.is_capability_available(LLMCapability.AUCTION_PARSE)
+    result = await client.execute_prompt(LLMCapability.AUCTION_PARSE, "Parse this auction lot description:\n\nDenarius")
+
+    assert result["model"] == "local-stub"
+    assert isinstance(result["content"], dict)
+    assert result["cost"] > 0
+    assert client.cost_tracker.get_monthly_cost() == pytest.approx(result["cost"])
+    reset_model_health_tracker()
@@ -0,0 +1,37 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.domain.services.scraper_orchestrator import ScraperOrchestrator
+from src.infrastructure.web.routers.scrape_v2 import get_scraper_orchestrator, router
+
+
+@pytest.mark.unit
+def test_batch_endpoint_streams_sse_results(slow_house):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_scraper_orchestrator] = lambda: ScraperOrchestrator([slow_house("cng", 0.01)])
+    client = TestClient(app)
+
+    response = client.post("/api/v2/scrape/batch", json={"urls": ["https://cng/1", "https://cng/missing"]})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        (block.split("\n")[0].removeprefix("event: "), json.loads(block.split("data: ", 1)[1]))
+        for block in response.text.replace("\r\n", "\n").strip().split("\n\n")
+    ]
+    assert [name for name, _ in events] == ["result", "result", "done"]
+    assert events[0][1]["lot"]["lot_id"] == "1"
+    assert events[1][1]["status"] == "not_found"
+    assert events[2][1]["by_status"] == {"success": 1, "not_found": 1}
+
+
+@pytest.mark.unit
+def test_batch_endpoint_rejects_empty_batch():
+    app = FastAPI()
+    app.include_router(router)
+    response = TestClient(app).post("/api/v2/scrape/batch", json={"urls": []})
+    assert response.status_code == 422
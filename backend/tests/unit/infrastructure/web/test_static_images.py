@@ -0,0 +1,71 @@
+"""Unit tests for /images caching headers, conditional and range requests."""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.web.static_images import IMMUTABLE, REVALIDATE, CoinImageFiles
+
+SHA = "ab" + "0" * 62
+BLOB = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def client(tmp_path):
+    (tmp_path / "sha256" / "ab").mkdir(parents=True)
+    (tmp_path / "sha256" / "ab" / f"{SHA}.jpg").write_bytes(BLOB)
+    (tmp_path / "sha256" / "ab" / f"{SHA}.thumb.webp").write_bytes(BLOB[:100])
+    (tmp_path / "legacy.jpg").write_bytes(BLOB)
+    app = FastAPI()
+    app.mount("/images", CoinImageFiles(directory=str(tmp_path)), name="images")
+    return TestClient(app)
+
+
+@pytest.mark.unit
+def test_content_addressed_files_are_immutable_with_hash_etag(client):
+    response = client.get(f"/images/sha256/ab/{SHA}.jpg")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == IMMUTABLE
+    assert response.headers["etag"] == f'"{SHA}"'
+    assert response.headers["accept-ranges"] == "bytes"
+
+    thumb = client.get(f"/images/sha256/ab/{SHA}.thumb.webp")
+    assert thumb.headers["etag"] == f'"{SHA}-thumb"'
+    assert thumb.headers["cache-control"] == IMMUTABLE
+
+
+@pytest.mark.unit
+def test_conditional_requests_get_304_with_cache_headers(client):
+    url = f"/images/sha256/ab/{SHA}.jpg"
+    for tag in (f'"{SHA}"', f'W/"{SHA}"', f'"other", "{SHA}"'):
+        response = client.get(url, headers={"If-None-Match": tag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == f'"{SHA}"'
+        assert response.headers["cache-control"] == IMMUTABLE
+    assert client.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
+
+    legacy = client.get("/images/legacy.jpg")
+    assert legacy.headers["cache-control"] == REVALIDATE
+    assert client.get("/images/legacy.jpg", headers={"If-None-Match": legacy.headers["etag"]}).status_code == 304
+
+
+@pytest.mark.unit
+def test_byte_ranges(client):
+    url = f"/images/sha256/ab/{SHA}.jpg"
+
+    partial = client.get(url, headers={"Range": "bytes=10-19"})
+    assert partial.status_code == 206
+    assert partial.content == BLOB[10:20]
+    assert partial.headers["content-range"] == f"bytes 10-19/{len(BLOB)}"
+
+    suffix = client.get(url, headers={"Range": "bytes=-4"})
+    assert suffix.content == BLOB[-4:]
+
+    unsatisfiable = client.get(url, headers={"Range": f"bytes={len(BLOB)}-"})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{len(BLOB)}"
+
+    assert client.get(url, headers={"Range": "bytes=0-3", "If-Range": f'"{SHA}"'}).status_code == 206
+    stale = client.get(url, headers={"Range": "bytes=0-3", "If-Range": '"old"'})
+    assert stale.status_code == 200
+    assert stale.content == BLOB